@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Diálogo de renombrado masivo con vista previa en vivo
+"""
+
+import os
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel,
+                             QLineEdit, QCheckBox, QSpinBox, QPushButton, QTableView,
+                             QHeaderView, QAbstractItemView)
+from PyQt6.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor
+
+from core.bulk_rename import RenameRule, RenamePlan, validate_name
+
+
+class RenamePreviewModel(QAbstractTableModel):
+    """Tabla "nombre actual → nombre nuevo" calculada solo para las filas visibles
+    
+    La vista solo pide data() de las filas que dibuja, así que con miles de
+    elementos cambiar el patrón cuesta lo mismo que con unos pocos.
+    """
+    HEADERS = ("Nombre actual", "Nombre nuevo")
+    
+    def __init__(self, paths, parent=None):
+        super().__init__(parent)
+        self.paths = list(paths)
+        self.plan = None
+        self.conflicts = {}
+        self.error_color = QColor("#e5534b")
+        self.changed_color = None
+    
+    def set_plan(self, plan):
+        """Mostrar los nombres de una nueva regla"""
+        self.beginResetModel()
+        self.plan = plan
+        self.conflicts = {}
+        self.endResetModel()
+    
+    def set_conflicts(self, conflicts):
+        """Marcar las filas que no se pueden renombrar"""
+        self.conflicts = conflicts
+        if self.paths:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.paths) - 1, 1))
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.paths)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def _row_state(self, row):
+        """Nombre nuevo de una fila y su error (si lo hay)"""
+        name = os.path.basename(self.paths[row])
+        if self.plan is None:
+            return name, None
+        try:
+            new_name = self.plan.new_name(row)
+        except ValueError as e:
+            return name, str(e)
+        return new_name, self.conflicts.get(row) or validate_name(new_name)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if index.column() == 0:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return os.path.basename(self.paths[row])
+            return None
+        
+        new_name, error = self._row_state(row)
+        if role == Qt.ItemDataRole.DisplayRole:
+            return new_name
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return error
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if error:
+                return self.error_color
+            if new_name != os.path.basename(self.paths[row]):
+                return self.changed_color
+        return None
+
+
+class BulkRenameDialog(QDialog):
+    """Configura una regla de renombrado para varios elementos
+    
+    Al aceptar, renames() devuelve los pares (origen, destino) ya
+    comprobados: ningún destino choca con otro ni con un elemento existente.
+    """
+    
+    def __init__(self, paths, existing_paths, theme, parent=None):
+        super().__init__(parent)
+        self.paths = list(paths)
+        self.existing_paths = set(existing_paths)
+        self.theme = theme
+        self.plan = None
+        self._renames = []
+        
+        self.setObjectName("bulkRenameDialog")
+        self.setWindowTitle(f"Renombrar {len(self.paths)} elementos")
+        self.resize(720, 520)
+        
+        # Recalcular como mucho una vez por pausa al escribir
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(120)
+        self.update_timer.timeout.connect(self.update_rule)
+        
+        self.setup_ui()
+        self.apply_theme()
+        self.update_rule()
+    
+    def setup_ui(self):
+        """Crear los controles del patrón y la tabla de vista previa"""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(8)
+        
+        form = QGridLayout()
+        form.setHorizontalSpacing(8)
+        
+        self.find_edit = QLineEdit()
+        self.find_edit.setPlaceholderText("Texto o expresión a buscar")
+        form.addWidget(QLabel("🔍 Buscar:"), 0, 0)
+        form.addWidget(self.find_edit, 0, 1)
+        
+        self.replace_edit = QLineEdit()
+        self.replace_edit.setPlaceholderText("Reemplazo (\\1, \\g<nombre> con expresiones regulares)")
+        form.addWidget(QLabel("✏️ Reemplazar:"), 1, 0)
+        form.addWidget(self.replace_edit, 1, 1)
+        
+        options = QHBoxLayout()
+        self.regex_check = QCheckBox("Expresión regular")
+        self.case_check = QCheckBox("Ignorar mayúsculas")
+        options.addWidget(self.regex_check)
+        options.addWidget(self.case_check)
+        options.addStretch()
+        form.addLayout(options, 2, 1)
+        
+        self.template_edit = QLineEdit("{name}")
+        self.template_edit.setToolTip("{name} nombre tras reemplazar, {stem} sin extensión, "
+                                      "{ext} extensión con punto, {n} contador ({n:03} con ceros)")
+        form.addWidget(QLabel("🧩 Plantilla:"), 3, 0)
+        form.addWidget(self.template_edit, 3, 1)
+        
+        counter = QHBoxLayout()
+        self.start_spin = QSpinBox()
+        self.start_spin.setRange(0, 1000000)
+        self.start_spin.setValue(1)
+        self.step_spin = QSpinBox()
+        self.step_spin.setRange(1, 1000)
+        counter.addWidget(QLabel("Inicio:"))
+        counter.addWidget(self.start_spin)
+        counter.addWidget(QLabel("Paso:"))
+        counter.addWidget(self.step_spin)
+        counter.addStretch()
+        form.addWidget(QLabel("🔢 Contador:"), 4, 0)
+        form.addLayout(counter, 4, 1)
+        layout.addLayout(form)
+        
+        self.model = RenamePreviewModel(self.paths, self)
+        self.table = QTableView()
+        self.table.setObjectName("renamePreview")
+        self.table.setModel(self.model)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.table.verticalHeader().setVisible(False)
+        # Sin ResizeToContents: obligaría a calcular todas las filas
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table.verticalHeader().setDefaultSectionSize(24)
+        layout.addWidget(self.table, 1)
+        
+        self.status_label = QLabel("")
+        self.status_label.setObjectName("renameStatus")
+        self.status_label.setWordWrap(True)
+        layout.addWidget(self.status_label)
+        
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        cancel_button = QPushButton("Cancelar")
+        cancel_button.setObjectName("actionButton")
+        cancel_button.clicked.connect(self.reject)
+        self.rename_button = QPushButton("✏️ Renombrar")
+        self.rename_button.setObjectName("primaryButton")
+        self.rename_button.setDefault(True)
+        self.rename_button.clicked.connect(self.try_accept)
+        buttons.addWidget(cancel_button)
+        buttons.addWidget(self.rename_button)
+        layout.addLayout(buttons)
+        
+        for edit in (self.find_edit, self.replace_edit, self.template_edit):
+            edit.textChanged.connect(self.update_timer.start)
+        for check in (self.regex_check, self.case_check):
+            check.toggled.connect(self.update_timer.start)
+        for spin in (self.start_spin, self.step_spin):
+            spin.valueChanged.connect(self.update_timer.start)
+    
+    def apply_theme(self):
+        """Aplicar los estilos del tema actual"""
+        from styles.mode_styles import get_form_styles, get_bulk_rename_styles
+        self.setStyleSheet(get_form_styles(self.theme) + get_bulk_rename_styles(self.theme))
+        self.model.changed_color = QColor(self.theme['accent'])
+    
+    def update_rule(self):
+        """Construir la regla con los campos actuales y refrescar la vista previa"""
+        try:
+            rule = RenameRule(self.find_edit.text(), self.replace_edit.text(),
+                              self.regex_check.isChecked(), self.case_check.isChecked(),
+                              self.template_edit.text(), self.start_spin.value(),
+                              self.step_spin.value())
+        except ValueError as e:
+            self.plan = None
+            self.status_label.setText(f"⚠️ {e}")
+            self.rename_button.setEnabled(False)
+            return
+        self.plan = RenamePlan(self.paths, rule)
+        self.model.set_plan(self.plan)
+        self.status_label.setText(f"{len(self.paths)} elementos seleccionados")
+        self.rename_button.setEnabled(True)
+    
+    def try_accept(self):
+        """Comprobar colisiones de todo el lote y aceptar si no hay ninguna"""
+        if self.update_timer.isActive():
+            self.update_timer.stop()
+            self.update_rule()
+        if self.plan is None:
+            return
+        try:
+            renames, conflicts = self.plan.check(self.existing_paths)
+        except ValueError as e:
+            self.status_label.setText(f"⚠️ {e}")
+            return
+        if conflicts:
+            self.model.set_conflicts(conflicts)
+            first = min(conflicts)
+            self.table.scrollTo(self.model.index(first, 1))
+            self.status_label.setText(f"⚠️ {len(conflicts)} elemento(s) con conflictos "
+                                      f"(primero: {conflicts[first]}). No se ha renombrado nada.")
+            return
+        if not renames:
+            self.status_label.setText("Ningún nombre cambia con este patrón")
+            return
+        self._renames = renames
+        self.accept()
+    
+    def renames(self):
+        """Pares (origen, destino) comprobados al aceptar"""
+        return self._renames
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Diálogo de sumas de comprobación: cálculo en paralelo y verificación
+"""
+
+import os
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
+                             QPushButton, QProgressBar, QTreeWidget, QTreeWidgetItem,
+                             QHeaderView)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont, QGuiApplication
+
+from core.checksums import (ALGORITHMS, ChecksumWorker, checksum_status,
+                            MATCH, MISMATCH, UNVERIFIED)
+
+
+STATUS_TEXT = {
+    MATCH: "✅ Coincide",
+    MISMATCH: "❌ No coincide",
+    UNVERIFIED: "➖ Sin suma publicada",
+}
+
+
+def _format_bytes(size):
+    """Formatear un tamaño en bytes de forma compacta"""
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if size < 1024 or unit == "TB":
+            return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} {unit}"
+        size /= 1024
+
+
+class ChecksumDialog(QDialog):
+    """Calcular las sumas de los archivos elegidos y compararlas con las publicadas
+    
+    No es modal: el cálculo va en un ChecksumWorker y el explorador se
+    puede seguir usando mientras tanto. Cerrar el diálogo cancela el
+    cálculo.
+    """
+    
+    def __init__(self, paths, algorithm, theme, parent=None):
+        super().__init__(parent)
+        self.paths = list(paths)
+        self.theme = theme
+        self.worker = None
+        # Hilos cancelados que aún no han terminado: son hijos del diálogo
+        # y hay que esperarlos antes de destruirlo
+        self.cancelled_workers = set()
+        self.items_by_path = {}
+        self.setObjectName("checksumDialog")
+        self.setWindowTitle("Sumas de comprobación")
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        self.resize(720, 420)
+        
+        self.setup_ui(algorithm)
+        self.apply_theme()
+    
+    def setup_ui(self, algorithm):
+        """Crear los controles y la tabla de resultados"""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(8)
+        
+        controls = QHBoxLayout()
+        count = len(self.paths)
+        title = QLabel(f"🔐 {count} archivo{'s' if count != 1 else ''}")
+        title.setObjectName("sectionTitle")
+        title.setFont(QFont("Roboto", 12, QFont.Weight.Bold))
+        controls.addWidget(title)
+        controls.addStretch()
+        
+        self.algorithm_combo = QComboBox()
+        for key, info in ALGORITHMS.items():
+            self.algorithm_combo.addItem(info.label, key)
+        self.algorithm_combo.setCurrentIndex(self.algorithm_combo.findData(algorithm))
+        controls.addWidget(self.algorithm_combo)
+        
+        self.start_button = QPushButton("▶ Calcular")
+        self.start_button.setObjectName("primaryButton")
+        self.start_button.clicked.connect(self.toggle_checksums)
+        controls.addWidget(self.start_button)
+        layout.addLayout(controls)
+        
+        self.status_label = QLabel("Elige el algoritmo y pulsa Calcular.")
+        self.status_label.setObjectName("toolStatus")
+        self.status_label.setFont(QFont("JetBrains Mono", 10))
+        layout.addWidget(self.status_label)
+        
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setObjectName("toolProgress")
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setFixedHeight(10)
+        # Por mil: los bytes no caben en el entero de QProgressBar
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.hide()
+        layout.addWidget(self.progress_bar)
+        
+        self.tree = QTreeWidget()
+        self.tree.setObjectName("toolTree")
+        self.tree.setFont(QFont("JetBrains Mono", 10))
+        self.tree.setRootIsDecorated(False)
+        self.tree.setHeaderLabels(["Archivo", "Estado", "Suma"])
+        self.tree.header().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        self.tree.header().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        self.tree.header().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        for path in self.paths:
+            item = QTreeWidgetItem([os.path.basename(path), "⏳ Pendiente", ""])
+            item.setToolTip(0, path)
+            self.tree.addTopLevelItem(item)
+            self.items_by_path[path] = item
+        layout.addWidget(self.tree, 1)
+        
+        buttons = QHBoxLayout()
+        self.copy_button = QPushButton("📋 Copiar sumas")
+        self.copy_button.setObjectName("actionButton")
+        self.copy_button.setToolTip("Copiar en el formato de sha256sum y compañía")
+        self.copy_button.clicked.connect(self.copy_checksums)
+        self.copy_button.setEnabled(False)
+        buttons.addWidget(self.copy_button)
+        buttons.addStretch()
+        close_button = QPushButton("Cerrar")
+        close_button.setObjectName("actionButton")
+        close_button.clicked.connect(self.close)
+        buttons.addWidget(close_button)
+        layout.addLayout(buttons)
+    
+    def toggle_checksums(self):
+        """Empezar el cálculo o cancelar el que está en curso"""
+        if self.worker is not None:
+            self.stop_worker()
+            self.status_label.setText("Cálculo cancelado.")
+            return
+        
+        algorithm = self.algorithm_combo.currentData()
+        for path, item in self.items_by_path.items():
+            item.setText(1, "⏳ Pendiente")
+            item.setText(2, "")
+            item.setData(0, Qt.ItemDataRole.UserRole, None)
+        self.copy_button.setEnabled(False)
+        
+        self.worker = ChecksumWorker(self.paths, algorithm, parent=self)
+        self.worker.progress_changed.connect(self.on_progress_changed)
+        self.worker.file_finished.connect(self.on_file_finished)
+        self.worker.checksums_finished.connect(self.on_checksums_finished)
+        self.worker.finished.connect(self.on_worker_finished)
+        self.worker.start()
+        
+        self.start_button.setText("⛔ Cancelar")
+        self.algorithm_combo.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.status_label.setText(f"Calculando {ALGORITHMS[algorithm].label}...")
+    
+    def stop_worker(self):
+        """Cancelar el cálculo (el hilo termina en segundo plano)"""
+        if self.worker is not None:
+            self.worker.progress_changed.disconnect(self.on_progress_changed)
+            self.worker.file_finished.disconnect(self.on_file_finished)
+            self.worker.checksums_finished.disconnect(self.on_checksums_finished)
+            self.worker.cancel()
+            self.cancelled_workers.add(self.worker)
+            self.worker = None
+        self.start_button.setText("▶ Calcular")
+        self.algorithm_combo.setEnabled(True)
+        self.progress_bar.hide()
+    
+    def on_worker_finished(self):
+        """Liberar el hilo cuando termina"""
+        worker = self.sender()
+        if worker is self.worker:
+            self.stop_worker()
+        self.cancelled_workers.discard(worker)
+        worker.deleteLater()
+    
+    def on_progress_changed(self, done, total, speed):
+        """Mostrar bytes leídos y velocidad media"""
+        self.progress_bar.setValue(int(1000 * done / total) if total else 0)
+        self.status_label.setText(f"{_format_bytes(done)} de {_format_bytes(total)} · "
+                                  f"{_format_bytes(speed)}/s")
+    
+    def on_file_finished(self, result):
+        """Mostrar el resultado de un archivo"""
+        item = self.items_by_path[result.path]
+        status = checksum_status(result)
+        item.setData(0, Qt.ItemDataRole.UserRole, result)
+        if result.digest is None:
+            item.setText(1, "⚠️ Error")
+            item.setText(2, result.error)
+            return
+        item.setText(1, STATUS_TEXT[status])
+        item.setText(2, result.digest)
+        item.setToolTip(2, result.digest)
+        if result.source is not None:
+            tooltip = f"Comparado con {os.path.basename(result.source)}"
+            if status == MISMATCH:
+                tooltip += f"\nEsperada: {result.expected}"
+            item.setToolTip(1, tooltip)
+        self.copy_button.setEnabled(True)
+    
+    def on_checksums_finished(self, files, seconds):
+        """Resumir el resultado de la verificación"""
+        results = [item.data(0, Qt.ItemDataRole.UserRole) for item in self.items_by_path.values()]
+        statuses = [checksum_status(result) for result in results if result is not None]
+        summary = f"{files} archivo{'s' if files != 1 else ''} en {seconds:.1f} s"
+        if MISMATCH in statuses:
+            summary += f" · ❌ {statuses.count(MISMATCH)} no coinciden"
+        elif MATCH in statuses:
+            summary += f" · ✅ {statuses.count(MATCH)} verificados"
+        self.status_label.setText(summary)
+    
+    def copy_checksums(self):
+        """Copiar las sumas calculadas como "suma  nombre", una por línea"""
+        lines = []
+        for item in self.items_by_path.values():
+            result = item.data(0, Qt.ItemDataRole.UserRole)
+            if result is not None and result.digest is not None:
+                lines.append(f"{result.digest}  {os.path.basename(result.path)}")
+        QGuiApplication.clipboard().setText("\n".join(lines) + "\n")
+    
+    def done(self, result):
+        # Cerrar, Escape y la X pasan por aquí; los hilos son hijos del
+        # diálogo y hay que esperarlos antes de destruirlo, también los ya
+        # cancelados que no han terminado (cancelado acaba enseguida)
+        self.stop_worker()
+        for worker in list(self.cancelled_workers):
+            worker.wait()
+        super().done(result)
+    
+    def apply_theme(self):
+        """Aplicar los estilos del tema actual"""
+        from styles.mode_styles import get_tool_page_styles, get_checksum_styles
+        self.setStyleSheet(get_tool_page_styles(self.theme) + get_checksum_styles(self.theme))
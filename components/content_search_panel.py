@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Panel de búsqueda dentro del contenido de los archivos del explorador
+"""
+
+import os
+from PyQt6.QtWidgets import (QFrame, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+                             QPushButton, QTreeWidget, QTreeWidgetItem, QHeaderView)
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QFont
+
+from core.content_search import ContentSearcher, compile_pattern, MAX_MATCHES, SKIPPED_DIRS
+
+
+class ContentSearchPanel(QFrame):
+    """Buscar texto en los archivos bajo la carpeta mostrada
+    
+    Las coincidencias llegan por lotes desde un ContentSearcher y se
+    agrupan por archivo según aparecen. Pulsar una línea emite
+    match_activated para que el explorador la muestre en la vista previa.
+    """
+    
+    match_activated = pyqtSignal(str, int)  # ruta, número de línea
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.root = None
+        self.searcher = None
+        self.file_items = {}
+        self.setup_ui()
+    
+    def setup_ui(self):
+        """Crear la interfaz del panel"""
+        self.setObjectName("contentSearchFrame")
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(6, 6, 6, 6)
+        layout.setSpacing(5)
+        
+        query_layout = QHBoxLayout()
+        query_layout.setSpacing(5)
+        
+        self.query_edit = QLineEdit()
+        self.query_edit.setObjectName("contentSearchEdit")
+        self.query_edit.setPlaceholderText("🔎 Buscar en el contenido de los archivos…")
+        self.query_edit.returnPressed.connect(self.start_search)
+        query_layout.addWidget(self.query_edit, 1)
+        
+        self.case_button = self._option_button("Aa", "Distinguir mayúsculas y minúsculas")
+        query_layout.addWidget(self.case_button)
+        self.regex_button = self._option_button(".*", "Expresión regular")
+        query_layout.addWidget(self.regex_button)
+        
+        self.search_button = QPushButton("🔍")
+        self.search_button.setObjectName("navButton")
+        self.search_button.setFixedSize(32, 28)
+        self.search_button.setToolTip("Buscar (Enter)")
+        self.search_button.clicked.connect(self.toggle_search)
+        query_layout.addWidget(self.search_button)
+        layout.addLayout(query_layout)
+        
+        self.status_label = QLabel("")
+        self.status_label.setObjectName("contentSearchStatus")
+        self.status_label.setFont(QFont("JetBrains Mono", 9))
+        self.status_label.setToolTip("No se buscan archivos ni carpetas ocultos, ni estas carpetas: "
+                                     + ", ".join(sorted(SKIPPED_DIRS)))
+        layout.addWidget(self.status_label)
+        
+        self.results_tree = QTreeWidget()
+        self.results_tree.setObjectName("contentSearchResults")
+        self.results_tree.setFont(QFont("JetBrains Mono", 10))
+        self.results_tree.setHeaderHidden(True)
+        self.results_tree.setUniformRowHeights(True)
+        self.results_tree.header().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.results_tree.header().setStretchLastSection(False)
+        self.results_tree.itemClicked.connect(self.on_item_activated)
+        self.results_tree.itemActivated.connect(self.on_item_activated)
+        layout.addWidget(self.results_tree, 1)
+    
+    def _option_button(self, text, tooltip):
+        """Botón conmutable para una opción de búsqueda"""
+        button = QPushButton(text)
+        button.setObjectName("navButton")
+        button.setCheckable(True)
+        button.setFixedSize(32, 28)
+        button.setToolTip(tooltip)
+        return button
+    
+    def set_root(self, path):
+        """Carpeta donde se buscará (None: no se puede buscar, p. ej. en un comprimido)"""
+        self.root = str(path) if path is not None else None
+        self.query_edit.setEnabled(self.root is not None)
+        self.search_button.setEnabled(self.root is not None or self.searcher is not None)
+        if self.searcher is None:
+            self.status_label.setText(f"📍 {self.root}" if self.root else
+                                      "No se puede buscar dentro de un archivo comprimido")
+    
+    def focus_query(self):
+        """Pasar a escribir lo que se busca"""
+        self.query_edit.setFocus(Qt.FocusReason.ShortcutFocusReason)
+        self.query_edit.selectAll()
+    
+    def toggle_search(self):
+        if self.searcher is not None:
+            self.stop_search()
+            self.status_label.setText("Búsqueda cancelada.")
+        else:
+            self.start_search()
+    
+    def start_search(self):
+        """Buscar lo escrito bajo la carpeta actual"""
+        text = self.query_edit.text()
+        if not text or self.root is None:
+            return
+        try:
+            pattern = compile_pattern(text, self.regex_button.isChecked(),
+                                      self.case_button.isChecked())
+        except ValueError as e:
+            self.status_label.setText(f"⚠️ {e}")
+            return
+        
+        self.stop_search()
+        self.results_tree.clear()
+        self.file_items = {}
+        self.searcher = ContentSearcher(self.root, pattern, parent=self)
+        self.searcher.matches_found.connect(self.on_matches_found)
+        self.searcher.progress_changed.connect(self.on_progress_changed)
+        self.searcher.search_finished.connect(self.on_search_finished)
+        self.searcher.finished.connect(self.on_searcher_finished)
+        self.searcher.start()
+        self.search_button.setText("⛔")
+        self.search_button.setToolTip("Cancelar la búsqueda")
+        self.status_label.setText("Buscando...")
+    
+    def stop_search(self):
+        """Cancelar la búsqueda en curso (el hilo termina en segundo plano)"""
+        if self.searcher is not None:
+            self.searcher.matches_found.disconnect(self.on_matches_found)
+            self.searcher.progress_changed.disconnect(self.on_progress_changed)
+            self.searcher.search_finished.disconnect(self.on_search_finished)
+            self.searcher.cancel()
+            self.searcher = None
+        self.search_button.setText("🔍")
+        self.search_button.setToolTip("Buscar (Enter)")
+        self.search_button.setEnabled(self.root is not None)
+    
+    def on_searcher_finished(self):
+        """Liberar el hilo de búsqueda cuando termina"""
+        searcher = self.sender()
+        if searcher is self.searcher:
+            self.stop_search()
+        searcher.deleteLater()
+    
+    def on_matches_found(self, matches):
+        """Añadir un lote de coincidencias agrupadas por archivo"""
+        for match in matches:
+            file_item = self.file_items.get(match.path)
+            if file_item is None:
+                file_item = QTreeWidgetItem([os.path.relpath(match.path, self.searcher.root)])
+                file_item.setToolTip(0, match.path)
+                file_item.setData(0, Qt.ItemDataRole.UserRole, (match.path, 1))
+                self.results_tree.addTopLevelItem(file_item)
+                file_item.setExpanded(True)
+                self.file_items[match.path] = file_item
+            line_item = QTreeWidgetItem([f"{match.line_number:>6}: {match.line.strip()}"])
+            line_item.setData(0, Qt.ItemDataRole.UserRole, (match.path, match.line_number))
+            # Contexto de la línea en el tooltip, con la encontrada marcada
+            context = ([f"  {line}" for line in match.before] + [f"▶ {match.line}"]
+                       + [f"  {line}" for line in match.after])
+            line_item.setToolTip(0, "\n".join(context))
+            file_item.addChild(line_item)
+    
+    def on_progress_changed(self, files, matches):
+        self.status_label.setText(f"Buscando... {files} archivos · {matches} coincidencias "
+                                  f"en {len(self.file_items)} archivos")
+    
+    def on_search_finished(self, files, matches, truncated, seconds):
+        """Resumir la búsqueda terminada"""
+        summary = (f"{matches} coincidencias en {len(self.file_items)} archivos "
+                   f"({files} revisados, {seconds:.1f} s; sin ocultos, control de "
+                   f"versiones ni cachés)")
+        if truncated:
+            summary = f"⚠️ Se muestran las primeras {MAX_MATCHES}: afina la búsqueda · " + summary
+        self.status_label.setText(summary)
+    
+    def on_item_activated(self, item, column=0):
+        """Mostrar la coincidencia en la vista previa"""
+        data = item.data(0, Qt.ItemDataRole.UserRole)
+        if data is not None:
+            self.match_activated.emit(*data)
+    
+    def cleanup(self):
+        """Detener la búsqueda en curso"""
+        searcher = self.searcher
+        self.stop_search()
+        if searcher is not None:
+            searcher.wait()
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Herramienta de uso de disco para el modo Easy: treemap y archivos más grandes
+"""
+
+import os
+import subprocess
+from pathlib import Path
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                           QPushButton, QFrame, QTreeWidget, QTreeWidgetItem,
+                           QProgressBar, QFileDialog, QMessageBox, QHeaderView,
+                           QSplitter, QToolTip)
+from PyQt6.QtCore import Qt, QRectF, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont, QColor, QPainter, QPen
+
+from core.disk_usage import DiskUsageScanner, squarify
+from components.file_explorer import format_size
+
+
+# Máximo de rectángulos por nivel; el resto se agrupa en "otros"
+MAX_TREEMAP_ITEMS = 150
+
+# Marcadores de los rectángulos que no son subcarpetas
+FILES_KEY = ":files"
+OTHERS_KEY = ":others"
+
+
+class TreemapView(QWidget):
+    """Treemap squarificado del contenido de una carpeta
+    
+    Solo dibuja el nivel mostrado y lee los tamaños del DiskUsageTree del
+    análisis, así que se puede redibujar mientras el análisis avanza y
+    entrar en una subcarpeta no requiere volver a recorrerla.
+    """
+    directory_activated = pyqtSignal(str)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tree = None
+        self.path = None
+        self.rects = []
+        self.colors = [QColor("#4fc3f7")]
+        self.border_color = QColor("#000000")
+        self.files_color = QColor("#607d8b")
+        self.setMouseTracking(True)
+        self.setMinimumSize(300, 200)
+    
+    def set_theme(self, theme):
+        """Colores de los rectángulos derivados del color de acento"""
+        accent = QColor(theme['accent'])
+        hue = max(accent.hsvHue(), 0)
+        self.colors = [QColor.fromHsv((hue + step * 37) % 360, 150, 200) for step in range(8)]
+        self.border_color = QColor(theme['bg'])
+        self.files_color = QColor(theme['border_color'])
+        self.update()
+    
+    def set_directory(self, tree, path):
+        """Mostrar una carpeta del árbol de uso"""
+        self.tree = tree
+        self.path = path
+        self.refresh()
+    
+    def refresh(self):
+        """Recalcular la disposición con los tamaños actuales"""
+        self.rects = []
+        if self.tree is not None and self.path is not None:
+            subdirs, own_size, _ = self.tree.children(self.path)
+            items = sorted(((size, path) for path, size in subdirs if size > 0), reverse=True)
+            if len(items) > MAX_TREEMAP_ITEMS:
+                others = sum(size for size, _ in items[MAX_TREEMAP_ITEMS:])
+                items = items[:MAX_TREEMAP_ITEMS] + [(others, OTHERS_KEY)]
+            if own_size > 0:
+                items.append((own_size, FILES_KEY))
+                items.sort(reverse=True)
+            
+            sizes = {key: size for size, key in items}
+            area = self.rect().adjusted(2, 2, -2, -2)
+            layout = squarify([(key, size) for size, key in items],
+                              area.x(), area.y(), area.width(), area.height())
+            self.rects = [(QRectF(x, y, width, height), key, sizes[key])
+                          for key, x, y, width, height in layout]
+        self.update()
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.refresh()
+    
+    def _label(self, key):
+        """Texto de un rectángulo"""
+        if key == FILES_KEY:
+            return "📄 archivos"
+        if key == OTHERS_KEY:
+            return "… otros"
+        return f"📁 {os.path.basename(key)}"
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setFont(QFont("Roboto", 9))
+        metrics = painter.fontMetrics()
+        painter.setPen(QPen(self.border_color, 2))
+        for index, (rect, key, size) in enumerate(self.rects):
+            if key in (FILES_KEY, OTHERS_KEY):
+                color = self.files_color
+            else:
+                color = self.colors[index % len(self.colors)]
+            painter.setBrush(color)
+            painter.drawRect(rect)
+            
+            # Etiqueta solo si cabe
+            if rect.width() > 60 and rect.height() > 2 * metrics.height() + 4:
+                # Texto claro u oscuro según el fondo del rectángulo
+                painter.setPen(QColor("#000000") if color.lightness() > 140 else QColor("#ffffff"))
+                text_rect = rect.adjusted(4, 2, -4, -2)
+                name = metrics.elidedText(self._label(key), Qt.TextElideMode.ElideRight,
+                                          int(text_rect.width()))
+                painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
+                                 f"{name}\n{format_size(size)}")
+                painter.setPen(QPen(self.border_color, 2))
+        painter.end()
+    
+    def _item_at(self, position):
+        """Rectángulo bajo una posición del ratón"""
+        for rect, key, size in self.rects:
+            if rect.contains(position):
+                return key, size
+        return None, 0
+    
+    def mouseMoveEvent(self, event):
+        key, size = self._item_at(event.position())
+        if key is None:
+            QToolTip.hideText()
+            return
+        name = key if not key.startswith(":") else self._label(key)
+        QToolTip.showText(event.globalPosition().toPoint(), f"{name}\n{format_size(size)}", self)
+    
+    def mouseReleaseEvent(self, event):
+        if event.button() != Qt.MouseButton.LeftButton:
+            return
+        key, _ = self._item_at(event.position())
+        if key is not None and not key.startswith(":"):
+            self.directory_activated.emit(key)
+
+
+class DiskUsageWidget(QWidget):
+    """Muestra qué ocupa espacio en una carpeta
+    
+    El treemap y la lista de archivos más grandes se actualizan durante el
+    análisis; al entrar en una subcarpeta se reutilizan los tamaños ya
+    acumulados.
+    """
+    
+    def __init__(self, theme_manager, current_theme, parent=None):
+        super().__init__(parent)
+        self.theme_manager = theme_manager
+        self.current_theme = current_theme
+        self.root_path = Path.home()
+        self.scanner = None
+        self.usage_tree = None
+        self.current_path = None
+        
+        # El treemap se redibuja con el progreso, como máximo unas veces por segundo
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(300)
+        self.refresh_timer.timeout.connect(self.refresh_views)
+        
+        self.setup_ui()
+        self.apply_theme()
+    
+    def setup_ui(self):
+        """Crear la interfaz de la herramienta"""
+        self.setObjectName("modeWidget")
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(30, 30, 30, 30)
+        layout.setSpacing(15)
+        
+        # Título
+        title_frame = QFrame()
+        title_frame.setObjectName("titleFrame")
+        title_layout = QVBoxLayout(title_frame)
+        title_layout.setContentsMargins(20, 15, 20, 15)
+        
+        title = QLabel("📊 USO DE DISCO")
+        title.setObjectName("easyTitle")
+        title.setFont(QFont("Roboto", 18, QFont.Weight.Bold))
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title_layout.addWidget(title)
+        
+        subtitle = QLabel("Descubre qué carpetas y archivos ocupan más espacio")
+        subtitle.setObjectName("subtitle")
+        subtitle.setFont(QFont("Roboto", 12, QFont.Weight.Normal))
+        subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title_layout.addWidget(subtitle)
+        
+        layout.addWidget(title_frame)
+        
+        # Panel principal
+        panel = QFrame()
+        panel.setObjectName("toolPanel")
+        panel_layout = QVBoxLayout(panel)
+        panel_layout.setContentsMargins(15, 15, 15, 15)
+        panel_layout.setSpacing(10)
+        
+        # Carpeta a analizar y análisis
+        controls_layout = QHBoxLayout()
+        controls_layout.setSpacing(10)
+        
+        self.path_label = QLabel(f"📍 {self.root_path}")
+        self.path_label.setObjectName("toolPath")
+        controls_layout.addWidget(self.path_label, 1)
+        
+        self.choose_button = QPushButton("📂 Elegir carpeta")
+        self.choose_button.setObjectName("actionButton")
+        self.choose_button.setFont(QFont("Roboto", 12, QFont.Weight.Bold))
+        self.choose_button.clicked.connect(self.choose_folder)
+        controls_layout.addWidget(self.choose_button)
+        
+        self.scan_button = QPushButton("📊 Analizar")
+        self.scan_button.setObjectName("primaryButton")
+        self.scan_button.setFont(QFont("Roboto", 12, QFont.Weight.Bold))
+        self.scan_button.clicked.connect(self.toggle_scan)
+        controls_layout.addWidget(self.scan_button)
+        
+        panel_layout.addLayout(controls_layout)
+        
+        # Estado del análisis
+        self.status_label = QLabel("Elige una carpeta y pulsa Analizar.")
+        self.status_label.setObjectName("toolStatus")
+        self.status_label.setFont(QFont("JetBrains Mono", 10))
+        panel_layout.addWidget(self.status_label)
+        
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setObjectName("toolProgress")
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setFixedHeight(10)
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.hide()
+        panel_layout.addWidget(self.progress_bar)
+        
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        
+        # Treemap con navegación hacia la carpeta superior
+        treemap_panel = QWidget()
+        treemap_layout = QVBoxLayout(treemap_panel)
+        treemap_layout.setContentsMargins(0, 0, 0, 0)
+        treemap_layout.setSpacing(5)
+        
+        location_layout = QHBoxLayout()
+        self.up_button = QPushButton("⬆️ Subir")
+        self.up_button.setObjectName("actionButton")
+        self.up_button.clicked.connect(self.go_up)
+        location_layout.addWidget(self.up_button)
+        
+        self.location_label = QLabel("")
+        self.location_label.setObjectName("toolStatus")
+        self.location_label.setFont(QFont("JetBrains Mono", 10))
+        location_layout.addWidget(self.location_label, 1)
+        treemap_layout.addLayout(location_layout)
+        
+        self.treemap = TreemapView()
+        self.treemap.directory_activated.connect(self.show_directory)
+        treemap_layout.addWidget(self.treemap, 1)
+        splitter.addWidget(treemap_panel)
+        
+        # Archivos más grandes de todo el análisis
+        self.files_tree = QTreeWidget()
+        self.files_tree.setObjectName("toolTree")
+        self.files_tree.setFont(QFont("JetBrains Mono", 10))
+        self.files_tree.setRootIsDecorated(False)
+        self.files_tree.setHeaderLabels(["Archivos más grandes", "Tamaño"])
+        self.files_tree.header().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.files_tree.header().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        self.files_tree.itemDoubleClicked.connect(self.open_item_location)
+        splitter.addWidget(self.files_tree)
+        splitter.setSizes([600, 400])
+        
+        panel_layout.addWidget(splitter, 1)
+        layout.addWidget(panel, 1)
+        
+        self.update_location()
+    
+    def apply_theme(self):
+        """Aplicar estilos según el tema seleccionado"""
+        from styles.mode_styles import get_tool_page_styles
+        theme = self.theme_manager.get_theme(self.current_theme)
+        self.setStyleSheet(get_tool_page_styles(theme))
+        self.treemap.set_theme(theme)
+    
+    def change_theme(self, theme_name):
+        """Cambiar tema del widget"""
+        self.current_theme = theme_name
+        self.apply_theme()
+    
+    def choose_folder(self):
+        """Elegir la carpeta que se analizará"""
+        folder = QFileDialog.getExistingDirectory(self, "Carpeta a analizar", str(self.root_path))
+        if folder:
+            self.root_path = Path(folder)
+            self.path_label.setText(f"📍 {self.root_path}")
+    
+    def toggle_scan(self):
+        """Iniciar el análisis o cancelar el que está en curso"""
+        if self.scanner is not None:
+            self.stop_scan()
+            self.status_label.setText("Análisis cancelado.")
+            return
+        
+        self.scanner = DiskUsageScanner(self.root_path, parent=self)
+        self.scanner.progress_changed.connect(self.on_progress_changed)
+        self.scanner.scan_finished.connect(self.on_scan_finished)
+        self.scanner.finished.connect(self.on_scanner_finished)
+        self.usage_tree = self.scanner.tree
+        self.files_tree.clear()
+        self.show_directory(self.usage_tree.root)
+        self.scanner.start()
+        
+        self.scan_button.setText("⛔ Cancelar")
+        self.choose_button.setEnabled(False)
+        self.progress_bar.show()
+        self.status_label.setText("Analizando...")
+    
+    def stop_scan(self):
+        """Cancelar el análisis (el hilo termina en segundo plano)
+        
+        Los tamaños acumulados hasta ese momento siguen navegables.
+        """
+        if self.scanner is not None:
+            self.scanner.progress_changed.disconnect(self.on_progress_changed)
+            self.scanner.scan_finished.disconnect(self.on_scan_finished)
+            self.scanner.cancel()
+            self.scanner = None
+        self.refresh_timer.stop()
+        self.scan_button.setText("📊 Analizar")
+        self.choose_button.setEnabled(True)
+        self.progress_bar.hide()
+    
+    def on_scanner_finished(self):
+        """Liberar el hilo de análisis cuando termina"""
+        scanner = self.sender()
+        if scanner is self.scanner:
+            self.refresh_views()
+            self.stop_scan()
+        scanner.deleteLater()
+    
+    def on_progress_changed(self, files, total_bytes):
+        """Mostrar el avance y programar el redibujado"""
+        self.status_label.setText(f"Analizando... {files} archivos · {format_size(total_bytes)}")
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start()
+    
+    def on_scan_finished(self, files, total_bytes):
+        """Resumen al terminar el análisis"""
+        self.status_label.setText(f"✅ {files} archivos · {format_size(total_bytes)} en total")
+    
+    def refresh_views(self):
+        """Actualizar treemap y lista de archivos con los datos acumulados"""
+        self.treemap.refresh()
+        self.update_location()
+        if self.scanner is not None:
+            self.update_largest_files(self.scanner.top_files())
+    
+    def update_largest_files(self, top_files):
+        """Rellenar la lista de los archivos más grandes"""
+        self.files_tree.setUpdatesEnabled(False)
+        self.files_tree.clear()
+        for size, path in top_files:
+            item = QTreeWidgetItem([path, format_size(size)])
+            item.setData(0, Qt.ItemDataRole.UserRole, path)
+            self.files_tree.addTopLevelItem(item)
+        self.files_tree.setUpdatesEnabled(True)
+    
+    def show_directory(self, path):
+        """Entrar en una carpeta del treemap usando los tamaños ya calculados"""
+        if self.usage_tree is None or not self.usage_tree.contains(path):
+            return
+        self.current_path = path
+        self.treemap.set_directory(self.usage_tree, path)
+        self.update_location()
+    
+    def go_up(self):
+        """Volver a la carpeta superior dentro del análisis"""
+        if self.current_path is not None and self.current_path != self.usage_tree.root:
+            self.show_directory(os.path.dirname(self.current_path))
+    
+    def update_location(self):
+        """Carpeta mostrada en el treemap y su tamaño"""
+        if self.current_path is None:
+            self.location_label.setText("")
+            self.up_button.setEnabled(False)
+            return
+        total = self.usage_tree.total(self.current_path)
+        self.location_label.setText(f"{self.current_path}  ·  {format_size(total)}")
+        self.up_button.setEnabled(self.current_path != self.usage_tree.root)
+    
+    def open_item_location(self, item, column=0):
+        """Abrir la carpeta que contiene un archivo"""
+        if item is None:
+            return
+        folder = os.path.dirname(item.data(0, Qt.ItemDataRole.UserRole))
+        try:
+            subprocess.Popen(['xdg-open', folder],
+                             stdin=subprocess.DEVNULL,
+                             stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL,
+                             start_new_session=True)
+        except FileNotFoundError:
+            QMessageBox.information(self, "Abrir ubicación", f"No se pudo abrir la carpeta:\n{folder}")
+    
+    def cleanup(self):
+        """Detener el análisis en curso"""
+        scanner = self.scanner
+        self.stop_scan()
+        if scanner is not None:
+            scanner.wait()
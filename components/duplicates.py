@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Herramienta de archivos duplicados para el modo Easy
+"""
+
+import os
+import subprocess
+from pathlib import Path
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                           QPushButton, QFrame, QTreeWidget, QTreeWidgetItem,
+                           QProgressBar, QFileDialog, QMessageBox, QHeaderView)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
+
+from core.duplicates import DuplicateFinder, SCANNING
+from core.file_operations import FileOperationQueue, DeleteOperation
+from components.file_explorer import format_size
+from components.file_operations_panel import FileOperationsPanel
+
+
+class DuplicatesWidget(QWidget):
+    """Busca archivos repetidos en una carpeta y permite eliminar las copias
+    
+    Los grupos aparecen en cuanto se confirman; el análisis continúa en
+    segundo plano con DuplicateFinder.
+    """
+    
+    def __init__(self, theme_manager, current_theme, parent=None):
+        super().__init__(parent)
+        self.theme_manager = theme_manager
+        self.current_theme = current_theme
+        self.root_path = Path.home()
+        self.finder = None
+        self.group_items = {}
+        
+        # Las copias marcadas se eliminan con la misma cola que el explorador usa
+        self.operation_queue = FileOperationQueue(self)
+        self.operation_queue.job_finished.connect(self.on_delete_finished)
+        
+        self.setup_ui()
+        self.apply_theme()
+    
+    def setup_ui(self):
+        """Crear la interfaz de la herramienta"""
+        self.setObjectName("modeWidget")
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(30, 30, 30, 30)
+        layout.setSpacing(15)
+        
+        # Título
+        title_frame = QFrame()
+        title_frame.setObjectName("titleFrame")
+        title_layout = QVBoxLayout(title_frame)
+        title_layout.setContentsMargins(20, 15, 20, 15)
+        
+        title = QLabel("👯 ARCHIVOS DUPLICADOS")
+        title.setObjectName("easyTitle")
+        title.setFont(QFont("Roboto", 18, QFont.Weight.Bold))
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title_layout.addWidget(title)
+        
+        subtitle = QLabel("Encuentra copias idénticas y libera espacio en disco")
+        subtitle.setObjectName("subtitle")
+        subtitle.setFont(QFont("Roboto", 12, QFont.Weight.Normal))
+        subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title_layout.addWidget(subtitle)
+        
+        layout.addWidget(title_frame)
+        
+        # Panel principal
+        panel = QFrame()
+        panel.setObjectName("toolPanel")
+        panel_layout = QVBoxLayout(panel)
+        panel_layout.setContentsMargins(15, 15, 15, 15)
+        panel_layout.setSpacing(10)
+        
+        # Carpeta a analizar y búsqueda
+        controls_layout = QHBoxLayout()
+        controls_layout.setSpacing(10)
+        
+        self.path_label = QLabel(f"📍 {self.root_path}")
+        self.path_label.setObjectName("toolPath")
+        controls_layout.addWidget(self.path_label, 1)
+        
+        self.choose_button = QPushButton("📂 Elegir carpeta")
+        self.choose_button.setObjectName("actionButton")
+        self.choose_button.setFont(QFont("Roboto", 12, QFont.Weight.Bold))
+        self.choose_button.clicked.connect(self.choose_folder)
+        controls_layout.addWidget(self.choose_button)
+        
+        self.search_button = QPushButton("🔍 Buscar")
+        self.search_button.setObjectName("primaryButton")
+        self.search_button.setFont(QFont("Roboto", 12, QFont.Weight.Bold))
+        self.search_button.clicked.connect(self.toggle_search)
+        controls_layout.addWidget(self.search_button)
+        
+        panel_layout.addLayout(controls_layout)
+        
+        # Estado del análisis
+        self.status_label = QLabel("Elige una carpeta y pulsa Buscar.")
+        self.status_label.setObjectName("toolStatus")
+        self.status_label.setFont(QFont("JetBrains Mono", 10))
+        panel_layout.addWidget(self.status_label)
+        
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setObjectName("toolProgress")
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setFixedHeight(10)
+        self.progress_bar.hide()
+        panel_layout.addWidget(self.progress_bar)
+        
+        # Grupos de duplicados: un nodo por grupo y una fila por copia
+        self.tree = QTreeWidget()
+        self.tree.setObjectName("toolTree")
+        self.tree.setFont(QFont("JetBrains Mono", 11))
+        self.tree.setHeaderLabels(["Archivo", "Tamaño"])
+        self.tree.header().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.tree.header().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        self.tree.itemChanged.connect(self.update_action_buttons)
+        self.tree.currentItemChanged.connect(self.update_action_buttons)
+        self.tree.itemDoubleClicked.connect(self.open_item_location)
+        panel_layout.addWidget(self.tree, 1)
+        
+        # Acciones sobre las copias
+        buttons_layout = QHBoxLayout()
+        buttons_layout.setSpacing(10)
+        
+        self.mark_button = QPushButton("✅ Marcar copias")
+        self.mark_button.setObjectName("actionButton")
+        self.mark_button.setToolTip("Marca todas las copias menos la primera de cada grupo")
+        self.mark_button.clicked.connect(self.mark_copies)
+        buttons_layout.addWidget(self.mark_button)
+        
+        self.open_button = QPushButton("📂 Abrir ubicación")
+        self.open_button.setObjectName("actionButton")
+        self.open_button.clicked.connect(lambda: self.open_item_location(self.tree.currentItem()))
+        buttons_layout.addWidget(self.open_button)
+        
+        buttons_layout.addStretch()
+        
+        self.delete_button = QPushButton("🗑️ Eliminar marcados")
+        self.delete_button.setObjectName("primaryButton")
+        self.delete_button.clicked.connect(self.delete_marked)
+        buttons_layout.addWidget(self.delete_button)
+        
+        panel_layout.addLayout(buttons_layout)
+        layout.addWidget(panel, 1)
+        
+        self.operations_panel = FileOperationsPanel(self.operation_queue)
+        layout.addWidget(self.operations_panel)
+        
+        self.update_action_buttons()
+    
+    def apply_theme(self):
+        """Aplicar estilos según el tema seleccionado"""
+        from styles.mode_styles import get_tool_page_styles
+        theme = self.theme_manager.get_theme(self.current_theme)
+        self.setStyleSheet(get_tool_page_styles(theme))
+    
+    def change_theme(self, theme_name):
+        """Cambiar tema del widget"""
+        self.current_theme = theme_name
+        self.apply_theme()
+    
+    def choose_folder(self):
+        """Elegir la carpeta que se analizará"""
+        folder = QFileDialog.getExistingDirectory(self, "Carpeta a analizar", str(self.root_path))
+        if folder:
+            self.root_path = Path(folder)
+            self.path_label.setText(f"📍 {self.root_path}")
+    
+    def toggle_search(self):
+        """Iniciar la búsqueda o cancelar la que está en curso"""
+        if self.finder is not None:
+            self.stop_search()
+            self.status_label.setText("Búsqueda cancelada.")
+            return
+        
+        self.tree.clear()
+        self.group_items = {}
+        self.finder = DuplicateFinder(self.root_path, parent=self)
+        self.finder.progress_changed.connect(self.on_progress_changed)
+        self.finder.group_found.connect(self.on_group_found)
+        self.finder.scan_finished.connect(self.on_scan_finished)
+        self.finder.finished.connect(self.on_finder_finished)
+        self.finder.start()
+        
+        self.search_button.setText("⛔ Cancelar")
+        self.choose_button.setEnabled(False)
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.show()
+        self.status_label.setText("Buscando archivos...")
+    
+    def stop_search(self):
+        """Cancelar la búsqueda (el hilo termina en segundo plano)"""
+        if self.finder is not None:
+            self.finder.group_found.disconnect(self.on_group_found)
+            self.finder.progress_changed.disconnect(self.on_progress_changed)
+            self.finder.cancel()
+            self.finder = None
+        self.search_button.setText("🔍 Buscar")
+        self.choose_button.setEnabled(True)
+        self.progress_bar.hide()
+    
+    def on_finder_finished(self):
+        """Liberar el hilo de búsqueda cuando termina"""
+        finder = self.sender()
+        if finder is self.finder:
+            self.stop_search()
+        finder.deleteLater()
+    
+    def on_progress_changed(self, phase, done, total):
+        """Mostrar el avance de cada fase"""
+        if phase == SCANNING:
+            self.status_label.setText(f"Buscando archivos... {done} revisados")
+            return
+        self.progress_bar.setRange(0, max(total, 1))
+        self.progress_bar.setValue(done)
+        self.status_label.setText(f"Comparando contenido... {done}/{total} · "
+                                  f"{len(self.group_items)} grupos encontrados")
+    
+    def on_group_found(self, group):
+        """Añadir un grupo confirmado a la lista"""
+        group_item = QTreeWidgetItem()
+        group_item.setData(0, Qt.ItemDataRole.UserRole, group)
+        group_item.setFont(0, QFont("Roboto", 11, QFont.Weight.Bold))
+        for path in group.paths:
+            child = QTreeWidgetItem([path, format_size(group.size)])
+            child.setData(0, Qt.ItemDataRole.UserRole, path)
+            child.setFlags(child.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            child.setCheckState(0, Qt.CheckState.Unchecked)
+            group_item.addChild(child)
+        self._update_group_label(group_item)
+        self.tree.addTopLevelItem(group_item)
+        group_item.setExpanded(True)
+        self.group_items[group.digest] = group_item
+    
+    def _update_group_label(self, group_item):
+        """Texto del grupo: número de copias y espacio recuperable"""
+        group = group_item.data(0, Qt.ItemDataRole.UserRole)
+        copies = group_item.childCount()
+        group_item.setText(0, f"👯 {copies} copias idénticas")
+        group_item.setText(1, f"{format_size(group.size * (copies - 1))} recuperables")
+    
+    def on_scan_finished(self, files_scanned, groups_found, wasted_bytes):
+        """Resumen al terminar el análisis"""
+        if groups_found:
+            self.status_label.setText(f"✅ {files_scanned} archivos revisados · {groups_found} grupos · "
+                                      f"{format_size(wasted_bytes)} recuperables")
+        else:
+            self.status_label.setText(f"✅ {files_scanned} archivos revisados · No hay duplicados")
+    
+    def marked_paths(self):
+        """Rutas marcadas, agrupadas por grupo"""
+        marked = []
+        for index in range(self.tree.topLevelItemCount()):
+            group_item = self.tree.topLevelItem(index)
+            paths = [group_item.child(row).data(0, Qt.ItemDataRole.UserRole)
+                     for row in range(group_item.childCount())
+                     if group_item.child(row).checkState(0) == Qt.CheckState.Checked]
+            marked.append((group_item, paths))
+        return marked
+    
+    def update_action_buttons(self, *args):
+        """Habilitar acciones según las marcas y la selección"""
+        current = self.tree.currentItem()
+        self.open_button.setEnabled(current is not None and current.parent() is not None)
+        self.mark_button.setEnabled(self.tree.topLevelItemCount() > 0)
+        self.delete_button.setEnabled(any(paths for _, paths in self.marked_paths()))
+    
+    def mark_copies(self):
+        """Marcar todas las copias salvo la primera de cada grupo"""
+        self.tree.blockSignals(True)
+        for index in range(self.tree.topLevelItemCount()):
+            group_item = self.tree.topLevelItem(index)
+            for row in range(group_item.childCount()):
+                state = Qt.CheckState.Unchecked if row == 0 else Qt.CheckState.Checked
+                group_item.child(row).setCheckState(0, state)
+        self.tree.blockSignals(False)
+        self.update_action_buttons()
+    
+    def open_item_location(self, item, column=0):
+        """Abrir la carpeta que contiene una copia"""
+        if item is None or item.parent() is None:
+            return
+        folder = os.path.dirname(item.data(0, Qt.ItemDataRole.UserRole))
+        try:
+            subprocess.Popen(['xdg-open', folder],
+                             stdin=subprocess.DEVNULL,
+                             stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL,
+                             start_new_session=True)
+        except FileNotFoundError:
+            QMessageBox.information(self, "Abrir ubicación", f"No se pudo abrir la carpeta:\n{folder}")
+    
+    def delete_marked(self):
+        """Eliminar las copias marcadas dejando al menos una por grupo"""
+        marked = self.marked_paths()
+        if any(paths and len(paths) == group_item.childCount() for group_item, paths in marked):
+            QMessageBox.warning(self, "Eliminar copias",
+                                "Hay grupos con todas las copias marcadas.\n"
+                                "Deja al menos una copia sin marcar en cada grupo.")
+            return
+        
+        paths = [path for _, group_paths in marked for path in group_paths]
+        if not paths:
+            return
+        reply = QMessageBox.question(self, "Confirmar eliminación",
+                                     f"¿Eliminar {len(paths)} copias duplicadas?\n\n"
+                                     "Esta acción no se puede deshacer.",
+                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if reply == QMessageBox.StandardButton.Yes:
+            self.operation_queue.submit(DeleteOperation(paths))
+    
+    def on_delete_finished(self, job):
+        """Quitar de la lista las copias que ya no existen"""
+        for index in reversed(range(self.tree.topLevelItemCount())):
+            group_item = self.tree.topLevelItem(index)
+            for row in reversed(range(group_item.childCount())):
+                if not os.path.lexists(group_item.child(row).data(0, Qt.ItemDataRole.UserRole)):
+                    group_item.removeChild(group_item.child(row))
+            if group_item.childCount() < 2:
+                group = group_item.data(0, Qt.ItemDataRole.UserRole)
+                self.group_items.pop(group.digest, None)
+                self.tree.takeTopLevelItem(index)
+            else:
+                self._update_group_label(group_item)
+        self.update_action_buttons()
+    
+    def cleanup(self):
+        """Detener la búsqueda y la cola de operaciones"""
+        finder = self.finder
+        self.stop_search()
+        if finder is not None:
+            finder.wait()
+        self.operation_queue.stop()
@@ -4,7 +4,9 @@ Easy Mode widget para la aplicación Linux GUI
 Menú con opciones: Files, Scripts, Play
 """
 
+import html
 import os
+import shlex
 import shutil
 from pathlib import Path
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
@@ -12,9 +14,12 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                            QInputDialog, QMessageBox, QSplitter,
                            QFrame, QTextEdit, QScrollArea, QStackedWidget,
                            QSizePolicy, QLineEdit, QGridLayout)
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QFileSystemWatcher, pyqtSignal
 from PyQt6.QtGui import QFont, QIcon, QPixmap
 
+from core.script_metadata import (ScriptScanner, script_directories, user_scripts_dir,
+                                  script_metadata_cache)
+
 
 class FileExplorerItem(QListWidgetItem):
     """Item personalizado para el explorador de archivos con mejor visualización"""
@@ -517,6 +522,24 @@ class ScriptsWidget(QWidget):
         self.theme_manager = theme_manager
         self.current_theme = current_theme
         self.scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts")
+        self.script_dirs = []
+        self.scanner = None
+        # Scripts mostrados por ruta y aviso de lista vacía
+        self.script_items = {}
+        self.placeholder_item = None
+        
+        # Las carpetas y los scripts se vigilan con inotify: los cambios se
+        # aplican a la lista sin reiniciar ni volver a leerlo todo
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.schedule_scan)
+        self.watcher.fileChanged.connect(self.on_watched_file_changed)
+        self.pending_dirs = set()
+        # Copiar o descomprimir varios scripts genera una ráfaga de avisos
+        self.scan_timer = QTimer(self)
+        self.scan_timer.setSingleShot(True)
+        self.scan_timer.setInterval(100)
+        self.scan_timer.timeout.connect(self.start_pending_scan)
+        
         self.setup_ui()
         self.load_scripts()
     
@@ -570,6 +593,8 @@ class ScriptsWidget(QWidget):
         self.scripts_list = QListWidget()
         self.scripts_list.setObjectName("scriptsList")
         self.scripts_list.setFont(QFont("JetBrains Mono", 12))
+        # Los scripts que aparecen se colocan en su sitio por nombre
+        self.scripts_list.setSortingEnabled(True)
         self.scripts_list.itemClicked.connect(self.on_script_selected)
         scripts_layout.addWidget(self.scripts_list)
         
@@ -709,65 +734,157 @@ class ScriptsWidget(QWidget):
         """)
     
     def load_scripts(self):
-        """Cargar la lista de scripts disponibles"""
-        # Limpiar lista
-        self.scripts_list.clear()
-        self.output_area.clear()
-        self.script_info.setText("Selecciona un script para ver su información.")
-        self.execute_button.setEnabled(False)
-        
-        # Verificar si el directorio existe
-        if not os.path.exists(self.scripts_path):
-            try:
-                os.makedirs(self.scripts_path)
-                self.scripts_list.addItem("¡No hay scripts disponibles!")
-                return
-            except Exception as e:
-                self.scripts_list.addItem(f"Error: No se pudo crear el directorio de scripts: {e}")
-                return
-        
-        # Listar scripts
-        try:
-            scripts = [f for f in os.listdir(self.scripts_path) if os.path.isfile(os.path.join(self.scripts_path, f)) and f.endswith(".sh")]
+        """Listar los scripts de todas las carpetas y empezar a vigilarlas
+        
+        La lista no se vacía: el resultado se aplica como diferencias, igual
+        que los cambios que avisa el vigilante.
+        """
+        self.script_dirs = script_directories(self.scripts_path)
+        
+        # Crear las carpetas que falten (la de la aplicación y la del usuario)
+        for directory in (self.scripts_path, user_scripts_dir()):
+            if not os.path.exists(directory):
+                try:
+                    os.makedirs(directory)
+                except OSError as e:
+                    self.show_placeholder(f"Error: No se pudo crear el directorio de scripts: {e}")
             
-            if not scripts:
-                self.scripts_list.addItem("¡No hay scripts disponibles!")
-                return
+        watched = set(self.watcher.directories())
+        missing = [directory for directory in self.script_dirs
+                   if directory not in watched and os.path.isdir(directory)]
+        if missing:
+            self.watcher.addPaths(missing)
+        for directory in self.script_dirs:
+            self.schedule_scan(directory)
             
-            # Agregar scripts a la lista
-            for script in sorted(scripts):
-                item = QListWidgetItem(f"📜 {script}")
-                item.script_path = os.path.join(self.scripts_path, script)
+    def schedule_scan(self, directory):
+        """Volver a listar una carpeta en cuanto se calmen los cambios"""
+        self.pending_dirs.add(directory)
+        self.scan_timer.start()
+    
+    def on_watched_file_changed(self, path):
+        # Un script editado en su sitio solo avisa por su archivo
+        self.schedule_scan(os.path.dirname(path))
+    
+    def start_pending_scan(self):
+        """Listar en segundo plano las carpetas con cambios pendientes"""
+        if self.scanner is not None or not self.pending_dirs:
+            return
+        directories = [directory for directory in self.script_dirs if directory in self.pending_dirs]
+        self.pending_dirs.clear()
+        # Solo se leen los scripts nuevos o modificados
+        self.scanner = ScriptScanner(directories, parent=self)
+        self.scanner.scripts_ready.connect(self.on_scripts_ready)
+        self.scanner.scan_failed.connect(self.on_scan_failed)
+        self.scanner.finished.connect(self.on_scanner_finished)
+        self.scanner.start()
+    
+    def stop_scanner(self):
+        """Descartar el listado en curso (el hilo termina en segundo plano)"""
+        if self.scanner is not None:
+            self.scanner.scripts_ready.disconnect(self.on_scripts_ready)
+            self.scanner.scan_failed.disconnect(self.on_scan_failed)
+            self.scanner = None
+    
+    def on_scanner_finished(self):
+        """Liberar el hilo de listado y atender los cambios llegados mientras tanto"""
+        scanner = self.sender()
+        if scanner is self.scanner:
+            self.scanner = None
+            self.start_pending_scan()
+        scanner.deleteLater()
+    
+    def on_scripts_ready(self, directory, scripts):
+        """Aplicar a la lista las altas, bajas y cambios de una carpeta"""
+        current = {path: item for path, item in self.script_items.items()
+                   if os.path.dirname(path) == directory}
+        selected = self.scripts_list.currentItem()
+        # Guardar con "escribir aparte y renombrar" hace que inotify pierda
+        # la vigilancia del script: se recupera en cada pasada
+        watched = set(self.watcher.files())
+        unwatched = []
+        
+        for info in scripts:
+            item = current.pop(info.path, None)
+            if item is None:
+                item = QListWidgetItem(f"📜 {info.name}")
+                item.setToolTip(info.path)
+                item.script_path = info.path
+                item.script_info = info
                 self.scripts_list.addItem(item)
+                self.script_items[info.path] = item
+            elif item.script_info != info:
+                item.script_info = info
+                if item is selected:
+                    self.on_script_selected(item)
+            if info.path not in watched:
+                unwatched.append(info.path)
             
-        except Exception as e:
-            self.scripts_list.addItem(f"Error: {str(e)}")
+        if unwatched:
+            self.watcher.addPaths(unwatched)
+        
+        # Los que quedan ya no existen
+        for path, item in current.items():
+            if item is selected:
+                self.script_info.setText("Selecciona un script para ver su información.")
+                self.execute_button.setEnabled(False)
+            self.scripts_list.takeItem(self.scripts_list.row(item))
+            del self.script_items[path]
+        gone = [path for path in current if path in watched]
+        if gone:
+            self.watcher.removePaths(gone)
+        
+        self.show_placeholder(None if self.script_items else "¡No hay scripts disponibles!")
+    
+    def on_scan_failed(self, directory, message):
+        """Una carpeta que no se puede leer deja de aportar scripts"""
+        self.on_scripts_ready(directory, [])
+        if not self.script_items:
+            self.show_placeholder(f"Error: {message}")
+    
+    def show_placeholder(self, message):
+        """Mostrar un aviso en lugar de scripts (None lo quita)"""
+        if self.placeholder_item is not None:
+            self.scripts_list.takeItem(self.scripts_list.row(self.placeholder_item))
+            self.placeholder_item = None
+        if message is not None:
+            self.placeholder_item = QListWidgetItem(message)
+            self.scripts_list.addItem(self.placeholder_item)
+    
+    def cleanup(self):
+        """Dejar de vigilar las carpetas y esperar al hilo de listado"""
+        self.scan_timer.stop()
+        self.pending_dirs.clear()
+        self.watcher.directoryChanged.disconnect(self.schedule_scan)
+        self.watcher.fileChanged.disconnect(self.on_watched_file_changed)
+        scanner = self.scanner
+        self.stop_scanner()
+        if scanner is not None:
+            scanner.wait()
     
     def on_script_selected(self, item):
         """Cuando se selecciona un script de la lista"""
-        if hasattr(item, 'script_path') and os.path.exists(item.script_path):
-            # Mostrar información del script
+        if hasattr(item, 'script_info'):
+            # Mostrar información del script (ya leída al listar)
             try:
-                script_name = os.path.basename(item.script_path)
-                script_size = os.path.getsize(item.script_path)
-                script_size_str = self._format_size(script_size)
-                
-                # Leer las primeras líneas del script para mostrar descripción
-                with open(item.script_path, 'r') as f:
-                    lines = [line.strip() for line in f.readlines()[:10]]
+                info = item.script_info
+                script_size_str = self._format_size(info.size)
+                description = html.escape(info.description or "Sin descripción disponible")
                 
-                # Buscar descripción o comentarios en las primeras líneas
-                description = "Sin descripción disponible"
-                for line in lines:
-                    if line.startswith('#') and len(line) > 2:
-                        description = line[1:].strip()
-                        break
+                extra = ""
+                if info.requires_sudo:
+                    extra += "<b>Permisos:</b> requiere sudo\n"
+                if info.timeout is not None:
+                    extra += f"<b>Tiempo límite:</b> {info.timeout} s\n"
+                if info.params:
+                    params = ", ".join(html.escape(name) for name, _ in info.params)
+                    extra += f"<b>Parámetros:</b> {params}\n"
                 
-                info_text = f"""<b>Nombre:</b> {script_name}
-<b>Ruta:</b> {item.script_path}
+                info_text = f"""<b>Nombre:</b> {html.escape(info.name)}
+<b>Ruta:</b> {html.escape(info.path)}
 <b>Tamaño:</b> {script_size_str}
 <b>Descripción:</b> {description}
-
+{extra}
 <i>Haz clic en 'Ejecutar' para iniciar este script.</i>"""
                 
                 self.script_info.setText(info_text)
@@ -799,10 +916,23 @@ class ScriptsWidget(QWidget):
             return
         
         script_path = item.script_path
-        if not os.path.exists(script_path):
+        try:
+            # Un stat: la cabecera solo se vuelve a leer si el script cambió
+            info = script_metadata_cache.get(script_path)
+        except OSError:
             self.output_area.setText("Error: El script seleccionado no existe.")
             return
         
+        # Pedir los parámetros que declara la cabecera
+        arguments = []
+        for name, help_text in info.params:
+            value, ok = QInputDialog.getText(self, f"Parámetro {name}", help_text or name)
+            if not ok:
+                self.output_area.setText("Ejecución cancelada.")
+                return
+            arguments.append(shlex.quote(value))
+        command = " ".join([shlex.quote(script_path)] + arguments)
+        
         # Verificar permisos de ejecución
         if not os.access(script_path, os.X_OK):
             try:
@@ -813,18 +943,8 @@ class ScriptsWidget(QWidget):
                 self.output_area.setText(f"Error: No se pueden establecer permisos de ejecución: {str(e)}")
                 return
         
-        # Verificar si el script usa sudo (comprobando el contenido)
-        requires_sudo = False
-        try:
-            with open(script_path, 'r') as f:
-                content = f.read()
-                if 'sudo ' in content:
-                    requires_sudo = True
-        except:
-            pass
-        
-        # Si requiere sudo, solicitar contraseña
-        if requires_sudo:
+        # Si requiere sudo (declarado en la cabecera o usado), solicitar contraseña
+        if info.requires_sudo:
             password, ok = QInputDialog.getText(
                 self, 
                 "Contraseña requerida", 
@@ -843,7 +963,8 @@ class ScriptsWidget(QWidget):
             # Crear y ejecutar el runner con contraseña
             from core.command_runner import CommandRunner
             # Ejecutar con echo y pipe para enviar la contraseña
-            self.runner = CommandRunner(f"echo '{password}' | sudo -S {script_path}")
+            self.runner = CommandRunner(f"echo '{password}' | sudo -S {command}",
+                                        time_limit=info.timeout)
             self.runner.output_ready.connect(self.handle_script_output)
             self.runner.finished_execution.connect(self.handle_script_finished)
             self.runner.start()
@@ -854,7 +975,7 @@ class ScriptsWidget(QWidget):
             
             # Crear y ejecutar el runner
             from core.command_runner import CommandRunner
-            self.runner = CommandRunner(script_path)
+            self.runner = CommandRunner(command, time_limit=info.timeout)
             self.runner.output_ready.connect(self.handle_script_output)
             self.runner.finished_execution.connect(self.handle_script_finished)
             self.runner.start()
@@ -1670,6 +1791,30 @@ class EasyWidget(QWidget):
         play_button.clicked.connect(self.show_play)
         buttons_layout.addWidget(play_button)
         
+        # Botón Duplicates
+        duplicates_button = QPushButton("👯 duplicates")
+        duplicates_button.setObjectName("menuButton")
+        duplicates_button.setFont(self.menu_font)
+        duplicates_button.setFixedSize(400, 80)
+        duplicates_button.clicked.connect(self.show_duplicates)
+        buttons_layout.addWidget(duplicates_button)
+        
+        # Botón Disk usage
+        disk_usage_button = QPushButton("📊 disk usage")
+        disk_usage_button.setObjectName("menuButton")
+        disk_usage_button.setFont(self.menu_font)
+        disk_usage_button.setFixedSize(400, 80)
+        disk_usage_button.clicked.connect(self.show_disk_usage)
+        buttons_layout.addWidget(disk_usage_button)
+        
+        # Botón Sync
+        sync_button = QPushButton("🔄 sync folders")
+        sync_button.setObjectName("menuButton")
+        sync_button.setFont(self.menu_font)
+        sync_button.setFixedSize(400, 80)
+        sync_button.clicked.connect(self.show_sync)
+        buttons_layout.addWidget(sync_button)
+        
         # Botón para regresar al menú principal
         back_button = QPushButton("⬅️ Regresar")
         back_button.setObjectName("backButton")
@@ -1736,6 +1881,21 @@ class EasyWidget(QWidget):
         if self.parent_window:
             self.parent_window.show_easy_play()
     
+    def show_duplicates(self):
+        """Mostrar la herramienta de archivos duplicados"""
+        if self.parent_window:
+            self.parent_window.show_easy_duplicates()
+    
+    def show_disk_usage(self):
+        """Mostrar la herramienta de uso de disco"""
+        if self.parent_window:
+            self.parent_window.show_easy_disk_usage()
+    
+    def show_sync(self):
+        """Mostrar la herramienta de sincronización de carpetas"""
+        if self.parent_window:
+            self.parent_window.show_easy_sync()
+    
     def apply_theme(self):
         """Aplicar tema al widget"""
         from styles.menu_styles import get_menu_styles
@@ -9,68 +9,168 @@ Explorador de archivos independiente y reutil        # Icono de ubicación más
 """
 
 import os
-import shutil
+import subprocess
 from pathlib import Path
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                           QListWidget, QListWidgetItem, QPushButton, 
+                           QListView, QPushButton, 
                            QInputDialog, QMessageBox, QSplitter,
-                           QFrame, QTextEdit, QScrollArea, QGridLayout)
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QIcon, QPixmap
+                           QFrame, QTextEdit, QScrollArea, QGridLayout,
+                           QComboBox)
+from PyQt6.QtCore import (Qt, QThread, QTimer, QSize, QMimeData, QUrl, pyqtSignal,
+                          QItemSelectionModel)
+from PyQt6.QtGui import QFont, QIcon, QPixmap, QGuiApplication, QKeySequence, QShortcut
 
+from core.archives import ArchiveError, MemberExtractor, is_browsable_archive
+from core.dir_size import DirSizeWorker, dir_size_cache
+from core.directory_cache import (directory_cache, ViewState, ListingPrefetcher,
+                                  ListingWorker)
+from core.fs_guard import fs_guard, MountUnresponsive
+from core.thumbnails import ThumbnailLoader, THUMBNAIL_EXTENSIONS, THUMBNAIL_MIME_TYPES
+from core.file_types import (FileType, FileTypeWorker, file_type_cache,
+                             guess_type_from_name, CATEGORY_ICONS, CATEGORY_LABELS)
+from core.file_operations import (FileOperationQueue, DeleteOperation, TrashOperation,
+                                  RenameOperation, CopyOperation, MoveOperation,
+                                  CompressOperation, ExtractOperation, BulkRenameOperation,
+                                  undo_operation, redo_operation, unique_destination, FAILED)
+from core.journal import operation_journal
+from core.checksums import detect_algorithm
+from core.desktop_apps import AppIndexLoader, desktop_app_index, launch
+from components.file_list_view import FileListView
+from components.file_operations_panel import FileOperationsPanel
+from components.places_sidebar import PlacesSidebar
+from components.preview_pane import PreviewPane
+from components.bulk_rename_dialog import BulkRenameDialog
+from components.checksum_dialog import ChecksumDialog
+from components.open_with_dialog import OpenWithDialog
+from components.path_bar import PathBar
+from components.content_search_panel import ContentSearchPanel
 
-class FileExplorerItem(QListWidgetItem):
-    """Item personalizado para el explorador de archivos con mejor visualización"""
+
+def format_size(size):
+    """Formatear un tamaño en bytes de forma legible"""
+    if size < 1024:
+        return f"{size} bytes"
+    elif size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    elif size < 1024 * 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MB"
+    else:
+        return f"{size / (1024 * 1024 * 1024):.1f} GB"
+
+
+DIRECTORY_TYPE = FileType("folder", "inode/directory", True)
+
+# Carpetas recordadas en cada dirección del historial de navegación
+MAX_HISTORY = 100
+
+
+class FileExplorerItem:
+    """Entrada del explorador: lo que muestra FileListView y sus claves de orden"""
     
-    def __init__(self, name, path, is_directory=False):
-        super().__init__()
+    def __init__(self, name, path, is_directory=False, size_bytes=None, stat_result=None,
+                 virtual=False):
         self.file_name = name
+        self.name_key = name.casefold()
+        self.dir_rank = 0 if is_directory else 1
+        self.text = ""
+        self.tool_tip = ""
+        self.icon = None
         self.file_path = path
         self.is_directory = is_directory
+        self.size_bytes = size_bytes
+        self.mtime = None
+        self.stat_key = None
+        # Miembro de un archivo comprimido: no existe en disco
+        self.virtual = virtual
         
-        # Configurar icono y texto con mejor formato
+        # Tipo por extensión (una búsqueda en tabla); el tipo por contenido
+        # sale de la caché o llega después desde FileTypeWorker
         if is_directory:
-            self.setText(f"📁  {name}")
+            self.file_type = DIRECTORY_TYPE
+            if stat_result is not None:
+                self.mtime = stat_result.st_mtime
         else:
-            # Detectar tipo de archivo para mejor iconografía
-            extension = Path(name).suffix.lower()
-            if extension in ['.txt', '.md', '.readme']:
-                icon = "📄"
-            elif extension in ['.py', '.js', '.html', '.css', '.json']:
-                icon = "💻"
-            elif extension in ['.jpg', '.jpeg', '.png', '.gif', '.bmp']:
-                icon = "🖼️"
-            elif extension in ['.mp3', '.wav', '.flac', '.ogg']:
-                icon = "🎵"
-            elif extension in ['.mp4', '.avi', '.mkv', '.mov']:
-                icon = "🎬"
-            elif extension in ['.zip', '.tar', '.gz', '.rar']:
-                icon = "📦"
-            elif extension in ['.pdf']:
-                icon = "📋"
+            self.file_type = guess_type_from_name(name)
+            if stat_result is None:
+                self._read_file_stat(Path(path))
             else:
-                icon = "📄"
-            
-            self.setText(f"{icon}  {name}")
+                self._apply_stat(stat_result)
+            if self.stat_key is not None:
+                self.file_type = file_type_cache.cached_type(path, self.stat_key) or self.file_type
+        self.icon_text = CATEGORY_ICONS[self.file_type.category]
+        
+        self._update_display()
+        self._update_sort_keys()
+    
+    def _read_file_stat(self, path):
+        """Leer tamaño y fecha de modificación de un archivo"""
+        try:
+            stat_result = path.stat()
+        except OSError:
+            return
+        self._apply_stat(stat_result)
+    
+    def _apply_stat(self, stat_result):
+        """Tomar tamaño, fecha y clave de validez de un stat ya leído"""
+        if self.size_bytes is None:
+            self.size_bytes = stat_result.st_size
+        self.mtime = stat_result.st_mtime
+        # Sin clave no se detecta el tipo por contenido de un miembro virtual
+        self.stat_key = None if self.virtual else file_type_cache.stat_key(stat_result)
+    
+    def has_thumbnail_support(self):
+        """Indica si se puede generar una miniatura para este archivo"""
+        return (not self.is_directory and not self.virtual and self.mtime is not None
+                and (self.file_type.mime in THUMBNAIL_MIME_TYPES
+                     or (not self.file_type.sniffed
+                         and Path(self.file_name).suffix.lower() in THUMBNAIL_EXTENSIONS)))
+    
+    def needs_type_detection(self):
+        """Indica si falta detectar el tipo leyendo el contenido"""
+        return not self.is_directory and self.stat_key is not None and not self.file_type.sniffed
+    
+    def set_file_type(self, file_type):
+        """Actualizar el tipo con el resultado de la detección por contenido"""
+        self.file_type = file_type
+        self.icon_text = CATEGORY_ICONS[file_type.category]
+        self._update_display()
+        self._update_sort_keys()
+    
+    def set_size(self, size_bytes):
+        """Actualizar el tamaño (usado al terminar el cálculo de una carpeta)"""
+        self.size_bytes = size_bytes
+        self._update_display()
+        self._update_sort_keys()
+    
+    def _update_sort_keys(self):
+        """Claves de orden por tamaño, fecha y tipo (las desconocidas al final)"""
+        # Mayor tamaño y fecha más reciente primero
+        self.size_rank = 1 if self.size_bytes is None else -self.size_bytes
+        self.mtime_rank = float("inf") if self.mtime is None else -self.mtime
+        self.type_key = (f"{CATEGORY_LABELS[self.file_type.category].casefold()}\0"
+                         f"{Path(self.file_name).suffix.casefold()}")
+    
+    def _update_display(self):
+        """Actualizar texto y tooltip con la información actual"""
+        if self.is_directory and self.size_bytes is not None:
+            self.text = f"{self.icon_text}  {self.file_name}    ({format_size(self.size_bytes)})"
+        else:
+            self.text = f"{self.icon_text}  {self.file_name}"
         
         # Tooltip con información detallada del archivo
-        size_info = self._get_size_info(Path(path))
-        self.setToolTip(f"📍 Ruta: {path}\n🔖 Tipo: {'Carpeta' if is_directory else 'Archivo'}\n📏 {size_info}")
+        size_info = self._get_size_info()
+        type_info = CATEGORY_LABELS[self.file_type.category]
+        if not self.is_directory:
+            type_info += f" ({self.file_type.mime})"
+        self.tool_tip = f"📍 Ruta: {self.file_path}\n🔖 Tipo: {type_info}\n📏 {size_info}"
     
-    def _get_size_info(self, path):
+    def _get_size_info(self):
         """Obtener información de tamaño del archivo"""
-        try:
-            if path.is_file():
-                size = path.stat().st_size
-                if size < 1024:
-                    return f"Tamaño: {size} bytes"
-                elif size < 1024 * 1024:
-                    return f"Tamaño: {size / 1024:.1f} KB"
-                else:
-                    return f"Tamaño: {size / (1024 * 1024):.1f} MB"
-            else:
-                return "Tamaño: Carpeta"
-        except:
+        if self.size_bytes is not None:
+            return f"Tamaño: {format_size(self.size_bytes)}"
+        elif self.is_directory and not self.virtual:
+            return "Tamaño: Calculando..."
+        else:
             return "Tamaño: No disponible"
 
 
@@ -87,6 +187,77 @@ class FileExplorerWidget(QWidget):
         self.theme_manager = theme_manager
         self.current_theme = current_theme
         self.current_path = Path(start_path) if start_path else Path.home()
+        self.listing_worker = None
+        self.size_worker = None
+        self.type_worker = None
+        self.items_by_path = {}
+        
+        # Dentro de un archivo comprimido: ruta del archivo (solo lectura)
+        self.archive_path = None
+        self.member_extractor = None
+        
+        # Historial de navegación al estilo de un navegador; el listado, el
+        # scroll y la selección de cada carpeta se guardan en directory_cache
+        self.back_history = []
+        self.forward_history = []
+        self.displayed_path = None
+        
+        # Miniaturas: solo se piden para los items visibles en la vista de cuadrícula
+        self.grid_view = False
+        self.thumbnail_loader = ThumbnailLoader(parent=self)
+        self.thumbnail_loader.thumbnail_ready.connect(self.on_thumbnail_ready)
+        self.thumbnail_timer = QTimer(self)
+        self.thumbnail_timer.setSingleShot(True)
+        self.thumbnail_timer.setInterval(80)
+        self.thumbnail_timer.timeout.connect(self.request_visible_thumbnails)
+        
+        # Cola de operaciones de archivos (eliminar, copiar, mover, renombrar)
+        self.operation_queue = FileOperationQueue(self)
+        self.operation_queue.job_finished.connect(self.on_operation_finished)
+        
+        # Deshacer/rehacer en curso (uno cada vez: la entrada del diario
+        # solo cambia de estado cuando termina)
+        self.history_job = None
+        
+        # Las recargas provocadas por operaciones se agrupan en una sola
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(150)
+        self.reload_timer.timeout.connect(self.refresh_directory)
+        
+        # La vista previa espera a que la selección se estabilice (p. ej. al
+        # recorrer la lista con las flechas)
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(120)
+        self.preview_timer.timeout.connect(self.update_preview)
+        
+        # Los tamaños y tipos que llegan en ráfaga se reordenan de una vez
+        self.resort_timer = QTimer(self)
+        self.resort_timer.setSingleShot(True)
+        self.resort_timer.setInterval(300)
+        self.resort_timer.timeout.connect(self.resort_items)
+        
+        # Aviso de "leyendo carpeta" solo si el listado tarda
+        self.loading_timer = QTimer(self)
+        self.loading_timer.setSingleShot(True)
+        self.loading_timer.setInterval(200)
+        self.loading_timer.timeout.connect(self.show_loading)
+        
+        # Lectura anticipada de las carpetas que probablemente se abran
+        # después: la seleccionada, la que está bajo el ratón y la superior
+        self.prefetcher = ListingPrefetcher(parent=self)
+        self.prefetcher.start(QThread.Priority.LowestPriority)
+        self.preview_timer.timeout.connect(self.prefetch_selected_folder)
+        self.hovered_path = None
+        self.hover_timer = QTimer(self)
+        self.hover_timer.setSingleShot(True)
+        self.hover_timer.setInterval(150)
+        self.hover_timer.timeout.connect(self.prefetch_hovered_folder)
+        
+        # Índice de aplicaciones (.desktop) para abrir archivos sin xdg-open
+        self.app_index_loader = AppIndexLoader(parent=self)
+        self.app_index_loader.start(QThread.Priority.LowPriority)
         
         self.setup_fonts()
         self.setup_ui()
@@ -121,10 +292,24 @@ class FileExplorerWidget(QWidget):
         self.back_button = QPushButton("←")
         self.back_button.setObjectName("navButton")
         self.back_button.setFixedSize(32, 32)
-        self.back_button.setToolTip("Directorio anterior")
+        self.back_button.setToolTip("Atrás (Alt+←)")
         self.back_button.clicked.connect(self.go_back)
         nav_layout.addWidget(self.back_button)
         
+        self.forward_button = QPushButton("→")
+        self.forward_button.setObjectName("navButton")
+        self.forward_button.setFixedSize(32, 32)
+        self.forward_button.setToolTip("Adelante (Alt+→)")
+        self.forward_button.clicked.connect(self.go_forward)
+        nav_layout.addWidget(self.forward_button)
+        
+        self.up_button = QPushButton("↑")
+        self.up_button.setObjectName("navButton")
+        self.up_button.setFixedSize(32, 32)
+        self.up_button.setToolTip("Carpeta superior (Alt+↑)")
+        self.up_button.clicked.connect(self.go_up)
+        nav_layout.addWidget(self.up_button)
+        
         self.home_button = QPushButton("🏠")
         self.home_button.setObjectName("navButton")
         self.home_button.setFixedSize(32, 32)
@@ -146,16 +331,55 @@ class FileExplorerWidget(QWidget):
         path_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
         path_container_layout.addWidget(path_icon)
         
-        # Label de ruta - CORREGIDO
-        self.path_label = QLabel()
-        self.path_label.setObjectName("pathLabel")
-        self.path_label.setFont(QFont("Roboto", 13, QFont.Weight.Bold))
-        self.path_label.setWordWrap(False)
-        self.path_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-        self.path_label.setMinimumWidth(200)  # Asegurar espacio mínimo para la ruta
-        path_container_layout.addWidget(self.path_label, 1)
+        # Ruta editable con completado de carpetas (Ctrl+L para escribirla)
+        self.path_bar = PathBar()
+        self.path_bar.setFont(QFont("Roboto", 13, QFont.Weight.Bold))
+        self.path_bar.setMinimumWidth(200)  # Asegurar espacio mínimo para la ruta
+        self.path_bar.setToolTip("Escribe una ruta; Tab completa las carpetas (Ctrl+L)")
+        self.path_bar.path_activated.connect(self.navigate_to)
+        path_container_layout.addWidget(self.path_bar, 1)
         
         nav_layout.addWidget(path_container, 1)
+        
+        # Selector de orden (usa los tamaños ya calculados, sin volver a escanear)
+        self.sort_combo = QComboBox()
+        self.sort_combo.setObjectName("sortCombo")
+        self.sort_combo.addItem("🔤 Nombre", "name")
+        self.sort_combo.addItem("📏 Tamaño", "size")
+        self.sort_combo.addItem("🕒 Fecha", "mtime")
+        self.sort_combo.addItem("🔖 Tipo", "type")
+        self.sort_combo.setToolTip("Ordenar contenido")
+        self.sort_combo.currentIndexChanged.connect(self.on_sort_changed)
+        nav_layout.addWidget(self.sort_combo)
+        
+        # Cambiar entre vista de lista y cuadrícula con miniaturas
+        self.view_button = QPushButton("🔲")
+        self.view_button.setObjectName("navButton")
+        self.view_button.setFixedSize(32, 32)
+        self.view_button.setToolTip("Vista de cuadrícula con miniaturas")
+        self.view_button.setCheckable(True)
+        self.view_button.toggled.connect(self.set_grid_view)
+        nav_layout.addWidget(self.view_button)
+        
+        # Mostrar u ocultar el panel de vista previa
+        self.preview_button = QPushButton("👁️")
+        self.preview_button.setObjectName("navButton")
+        self.preview_button.setFixedSize(32, 32)
+        self.preview_button.setToolTip("Vista previa del archivo seleccionado")
+        self.preview_button.setCheckable(True)
+        self.preview_button.setChecked(True)
+        self.preview_button.toggled.connect(self.set_preview_visible)
+        nav_layout.addWidget(self.preview_button)
+        
+        # Mostrar u ocultar la búsqueda dentro de los archivos
+        self.content_search_button = QPushButton("🔎")
+        self.content_search_button.setObjectName("navButton")
+        self.content_search_button.setFixedSize(32, 32)
+        self.content_search_button.setToolTip("Buscar en el contenido de los archivos (Ctrl+Shift+F)")
+        self.content_search_button.setCheckable(True)
+        self.content_search_button.toggled.connect(self.set_content_search_visible)
+        nav_layout.addWidget(self.content_search_button)
+        
         main_layout.addWidget(nav_frame)
         
         # Contenedor principal
@@ -169,6 +393,11 @@ class FileExplorerWidget(QWidget):
         splitter = QSplitter(Qt.Orientation.Horizontal)
         splitter.setChildrenCollapsible(False)
         
+        # Lugares: carpetas del usuario y unidades con su espacio libre
+        self.places_sidebar = PlacesSidebar()
+        self.places_sidebar.place_activated.connect(self.navigate_to)
+        splitter.addWidget(self.places_sidebar)
+        
         # Lista de archivos
         files_container = QFrame()
         files_container.setObjectName("filesContainer")
@@ -181,14 +410,56 @@ class FileExplorerWidget(QWidget):
         files_title.setObjectName("sectionTitle")
         files_layout.addWidget(files_title)
         
-        self.file_list = QListWidget()
+        # Aviso de carpeta lenta o de unidad que no responde
+        self.mount_banner = QFrame()
+        self.mount_banner.setObjectName("mountBanner")
+        banner_layout = QHBoxLayout(self.mount_banner)
+        banner_layout.setContentsMargins(10, 6, 10, 6)
+        banner_layout.setSpacing(8)
+        
+        self.banner_label = QLabel("")
+        self.banner_label.setObjectName("mountBannerLabel")
+        self.banner_label.setFont(QFont("Roboto", 10, QFont.Weight.Bold))
+        self.banner_label.setWordWrap(True)
+        banner_layout.addWidget(self.banner_label, 1)
+        
+        self.retry_button = QPushButton("🔄 Reintentar")
+        self.retry_button.setObjectName("retryButton")
+        self.retry_button.setFixedHeight(28)
+        self.retry_button.clicked.connect(self.retry_listing)
+        banner_layout.addWidget(self.retry_button)
+        
+        self.mount_banner.hide()
+        files_layout.addWidget(self.mount_banner)
+        
+        # Lista sobre un modelo propio: ordenar y buscar al teclear no
+        # recrean filas aunque la carpeta tenga cien mil entradas
+        self.file_list = FileListView()
         self.file_list.setObjectName("fileList")
-        self.file_list.itemDoubleClicked.connect(self.on_item_double_clicked)
-        self.file_list.itemClicked.connect(self.on_item_clicked)
+        self.file_list.setProperty("viewMode", "list")
+        self.file_list.setUniformItemSizes(True)
+        self.file_list.setSelectionMode(QListView.SelectionMode.ExtendedSelection)
+        self.file_list.selection_changed.connect(self.update_action_buttons)
+        self.file_list.selection_changed.connect(self.preview_timer.start)
+        self.file_list.verticalScrollBar().valueChanged.connect(self.schedule_thumbnails)
+        self.file_list.item_double_clicked.connect(self.on_item_double_clicked)
+        self.file_list.item_clicked.connect(self.on_item_clicked)
+        self.file_list.setMouseTracking(True)
+        self.file_list.item_entered.connect(self.on_item_hovered)
         files_layout.addWidget(self.file_list)
         
+        # Búsqueda de texto bajo la carpeta mostrada, oculta hasta que se pide
+        self.content_search_panel = ContentSearchPanel()
+        self.content_search_panel.match_activated.connect(self.show_search_match)
+        self.content_search_panel.hide()
+        files_layout.addWidget(self.content_search_panel)
+        
         splitter.addWidget(files_container)
         
+        # Vista previa del archivo seleccionado
+        self.preview_pane = PreviewPane()
+        splitter.addWidget(self.preview_pane)
+        
         # Panel de herramientas - REORGANIZADO
         actions_frame = QFrame()
         actions_frame.setObjectName("actionsFrame")
@@ -249,105 +520,643 @@ class FileExplorerWidget(QWidget):
         self.refresh_btn = QPushButton("🔄\nActualizar")
         self.refresh_btn.setObjectName("compactActionButton")
         self.refresh_btn.setFixedSize(95, 55)
-        self.refresh_btn.clicked.connect(self.load_directory)
+        self.refresh_btn.clicked.connect(self.refresh_directory)
         buttons_grid.addWidget(self.refresh_btn, 2, 1)
         
+        self.copy_btn = QPushButton("📋\nCopiar")
+        self.copy_btn.setObjectName("compactActionButton")
+        self.copy_btn.setFixedSize(95, 55)
+        self.copy_btn.clicked.connect(self.copy_selected)
+        self.copy_btn.setEnabled(False)
+        buttons_grid.addWidget(self.copy_btn, 3, 0)
+        
+        self.cut_btn = QPushButton("✂️\nCortar")
+        self.cut_btn.setObjectName("compactActionButton")
+        self.cut_btn.setFixedSize(95, 55)
+        self.cut_btn.clicked.connect(self.cut_selected)
+        self.cut_btn.setEnabled(False)
+        buttons_grid.addWidget(self.cut_btn, 3, 1)
+        
+        self.paste_btn = QPushButton("📥\nPegar")
+        self.paste_btn.setObjectName("compactActionButton")
+        self.paste_btn.setFixedSize(95, 55)
+        self.paste_btn.clicked.connect(self.paste_clipboard)
+        buttons_grid.addWidget(self.paste_btn, 4, 0)
+        
+        self.compress_btn = QPushButton("🗜️\nComprimir")
+        self.compress_btn.setObjectName("compactActionButton")
+        self.compress_btn.setFixedSize(95, 55)
+        self.compress_btn.clicked.connect(self.compress_selected)
+        self.compress_btn.setEnabled(False)
+        buttons_grid.addWidget(self.compress_btn, 4, 1)
+        
+        self.extract_btn = QPushButton("📦\nExtraer")
+        self.extract_btn.setObjectName("compactActionButton")
+        self.extract_btn.setFixedSize(95, 55)
+        self.extract_btn.clicked.connect(self.extract_selected)
+        self.extract_btn.setEnabled(False)
+        buttons_grid.addWidget(self.extract_btn, 5, 0)
+        
+        self.undo_btn = QPushButton("↩️\nDeshacer")
+        self.undo_btn.setObjectName("compactActionButton")
+        self.undo_btn.setFixedSize(95, 55)
+        self.undo_btn.clicked.connect(self.undo_last_operation)
+        self.undo_btn.setEnabled(False)
+        buttons_grid.addWidget(self.undo_btn, 5, 1)
+        
+        self.redo_btn = QPushButton("↪️\nRehacer")
+        self.redo_btn.setObjectName("compactActionButton")
+        self.redo_btn.setFixedSize(95, 55)
+        self.redo_btn.clicked.connect(self.redo_last_operation)
+        self.redo_btn.setEnabled(False)
+        buttons_grid.addWidget(self.redo_btn, 6, 0)
+        
+        self.open_with_btn = QPushButton("🧰\nAbrir con…")
+        self.open_with_btn.setObjectName("compactActionButton")
+        self.open_with_btn.setFixedSize(95, 55)
+        self.open_with_btn.clicked.connect(self.open_selected_with)
+        self.open_with_btn.setEnabled(False)
+        buttons_grid.addWidget(self.open_with_btn, 6, 1)
+        
+        self.checksum_btn = QPushButton("🔐\nChecksum")
+        self.checksum_btn.setObjectName("compactActionButton")
+        self.checksum_btn.setFixedSize(95, 55)
+        self.checksum_btn.setToolTip("Calcular y verificar sumas SHA-256, SHA-512 o BLAKE2")
+        self.checksum_btn.clicked.connect(self.checksum_selected)
+        self.checksum_btn.setEnabled(False)
+        buttons_grid.addWidget(self.checksum_btn, 7, 0)
+        self.update_undo_buttons()
+        
+        # Atajos de teclado para copiar, cortar, pegar, eliminar y deshacer
+        for sequence, slot in ((QKeySequence.StandardKey.Copy, self.copy_selected),
+                               (QKeySequence.StandardKey.Cut, self.cut_selected),
+                               (QKeySequence.StandardKey.Paste, self.paste_clipboard),
+                               (QKeySequence.StandardKey.Delete, self.delete_selected),
+                               ("Shift+Del", self.delete_selected_permanently),
+                               (QKeySequence.StandardKey.Undo, self.undo_last_operation),
+                               (QKeySequence.StandardKey.Redo, self.redo_last_operation)):
+            shortcut = QShortcut(QKeySequence(sequence), self)
+            shortcut.setContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+            shortcut.activated.connect(slot)
+        
+        # Atajos del historial de navegación
+        for sequence, slot in ((QKeySequence(QKeySequence.StandardKey.Back), self.go_back),
+                               (QKeySequence(QKeySequence.StandardKey.Forward), self.go_forward),
+                               (QKeySequence("Alt+Up"), self.go_up),
+                               (QKeySequence("Ctrl+L"), self.focus_path_bar),
+                               (QKeySequence("Ctrl+Shift+F"), self.focus_content_search)):
+            shortcut = QShortcut(sequence, self)
+            shortcut.setContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+            shortcut.activated.connect(slot)
+        
         actions_layout.addWidget(buttons_container)
         
         splitter.addWidget(actions_frame)
-        splitter.setSizes([600, 210])  # Ajustado para mejor proporción
+        splitter.setSizes([170, 450, 350, 210])  # Ajustado para mejor proporción
         
         content_layout.addWidget(splitter)
         main_layout.addWidget(content_frame)
+        
+        # Panel de progreso de operaciones en segundo plano
+        self.operations_panel = FileOperationsPanel(self.operation_queue)
+        main_layout.addWidget(self.operations_panel)
+    
+    def load_directory(self, refresh=False):
+        """Cargar el contenido del directorio actual
+        
+        El listado se obtiene en un ListingWorker para que un montaje lento
+        o colgado no congele la interfaz. Si la carpeta no cambió desde la
+        última visita, sale de directory_cache (basta un stat de la carpeta)
+        y se recuperan el scroll y la selección; refresh obliga a releerla.
+        """
+        if self.displayed_path is not None:
+            self.remember_view_state()
+            self.displayed_path = None
+        # Lo pedido para la carpeta anterior ya no es probable
+        self.prefetcher.clear()
+        self.prefetcher.pause()
+        self.stop_listing_worker()
+        self.stop_size_worker()
+        self.stop_type_worker()
+        self.thumbnail_loader.cancel_all()
+        
+        # La barra muestra la ruta entera con su final a la vista
+        self.path_bar.set_path(self.current_path)
+        self.update_history_buttons()
+        
+        # La lista anterior queda inactiva hasta que llega el nuevo listado;
+        # si tarda, se vacía y se avisa de que se está leyendo
+        self.file_list.setEnabled(False)
+        self.loading_timer.start()
+        self.listing_worker = ListingWorker(self.current_path, refresh, parent=self)
+        self.listing_worker.listing_ready.connect(self.on_listing_ready)
+        self.listing_worker.listing_failed.connect(self.on_listing_failed)
+        self.listing_worker.finished.connect(self.on_listing_worker_finished)
+        self.listing_worker.start()
+    
+    def stop_listing_worker(self):
+        """Descartar el listado en curso (el hilo deja de esperar enseguida)"""
+        self.loading_timer.stop()
+        if self.listing_worker is not None:
+            self.listing_worker.listing_ready.disconnect(self.on_listing_ready)
+            self.listing_worker.listing_failed.disconnect(self.on_listing_failed)
+            self.listing_worker.cancel()
+            self.listing_worker = None
+    
+    def on_listing_worker_finished(self):
+        """Liberar el hilo de listado cuando termina"""
+        worker = self.sender()
+        if worker is self.listing_worker:
+            self.listing_worker = None
+        worker.deleteLater()
     
-    def load_directory(self):
-        """Cargar el contenido del directorio actual"""
+    def show_loading(self):
+        """Vaciar la lista mientras una carpeta lenta termina de leerse"""
         self.file_list.clear()
+        self.items_by_path = {}
+        self.show_banner("⏳ Leyendo carpeta...", retry=False)
+    
+    def show_banner(self, text, retry):
+        """Mostrar un aviso sobre la lista, con o sin botón de reintentar"""
+        self.banner_label.setText(text)
+        self.retry_button.setVisible(retry)
+        self.mount_banner.show()
+    
+    def on_listing_ready(self, listing, from_cache):
+        """Mostrar el listado recibido del ListingWorker"""
+        self.loading_timer.stop()
+        self.mount_banner.hide()
+        self.file_list.clear()
+        self.items_by_path = {}
+        self.file_list.setEnabled(True)
+        self.archive_path = listing.archive
+        virtual = self.archive_path is not None
+        self.update_location_actions()
         
-        # Mostrar ruta de forma más atractiva
-        path_str = str(self.current_path)
-        if len(path_str) > 50:
-            # Si la ruta es muy larga, mostrar solo las últimas partes
-            parts = self.current_path.parts
-            if len(parts) > 3:
-                short_path = ".../" + "/".join(parts[-2:])
-            else:
-                short_path = path_str
-        else:
-            short_path = path_str
-            
-        self.path_label.setText(short_path)
+        # Agregar a la lista (los tamaños de carpeta ya conocidos salen de la caché)
+        items = []
+        pending_dirs = []
+        for entry in listing.entries:
+            cached_size = dir_size_cache.cached_size(entry.path) if entry.is_dir and not virtual else None
+            list_item = FileExplorerItem(entry.name, entry.path, entry.is_dir,
+                                         cached_size, entry.stat, virtual)
+            items.append(list_item)
+            self.items_by_path[entry.path] = list_item
+            # Al volver a una carpeta sin cambios solo se calculan los tamaños que faltan
+            if entry.is_dir and not virtual and not (from_cache and cached_size is not None):
+                pending_dirs.append(entry.path)
         
-        try:
-            # Obtener lista de archivos y carpetas
-            items = []
-            
-            # Agregar carpetas primero
-            for item in self.current_path.iterdir():
-                if item.is_dir() and not item.name.startswith('.'):
-                    items.append((item.name, item, True))
-            
-            # Luego agregar archivos
-            for item in self.current_path.iterdir():
-                if item.is_file() and not item.name.startswith('.'):
-                    items.append((item.name, item, False))
-            
-            # Ordenar por nombre
-            items.sort(key=lambda x: x[0].lower())
-            
-            # Agregar a la lista
-            for name, path, is_dir in items:
-                list_item = FileExplorerItem(name, str(path), is_dir)
-                self.file_list.addItem(list_item)
-                
-        except PermissionError:
-            QMessageBox.warning(self, "Sin permisos", 
-                              "No tienes permisos para acceder a esta carpeta.")
-            self.go_back()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error al cargar directorio: {str(e)}")
+        self.file_list.set_items(items)
+        self.displayed_path = self.current_path
+        self.places_sidebar.set_current_path(self.current_path)
+        self.content_search_panel.set_root(None if virtual else self.current_path)
+        self.restore_view_state()
+        self.start_size_worker(pending_dirs)
+        self.start_type_worker([path for path, item in self.items_by_path.items()
+                                if item.needs_type_detection()])
+        self.schedule_thumbnails()
+        
+        self.prefetcher.resume()
+        if not virtual and self.current_path != self.current_path.parent:
+            self.prefetcher.request(self.current_path.parent)
         
         # Emitir señal de que se abrió una carpeta
         self.folder_opened.emit(str(self.current_path))
     
+    def on_listing_failed(self, error):
+        """Informar de una carpeta que no se pudo listar"""
+        self.loading_timer.stop()
+        self.prefetcher.resume()
+        if isinstance(error, MountUnresponsive):
+            # La unidad no contesta: la lista queda vacía hasta reintentar
+            self.file_list.clear()
+            self.items_by_path = {}
+            self.file_list.setEnabled(True)
+            self.show_banner(f"⚠️ La unidad {error.mount_point} no responde", retry=True)
+            return
+        
+        self.mount_banner.hide()
+        self.file_list.setEnabled(True)
+        if isinstance(error, PermissionError):
+            QMessageBox.warning(self, "Sin permisos", 
+                              "No tienes permisos para acceder a esta carpeta.")
+            self.return_from_failed_navigation()
+        elif isinstance(error, ArchiveError):
+            QMessageBox.warning(self, "Error", f"No se pudo abrir el archivo comprimido: {error}")
+            self.return_from_failed_navigation()
+        elif isinstance(error, (FileNotFoundError, NotADirectoryError)):
+            QMessageBox.warning(self, "Error",
+                                f"La ruta no existe o no es un directorio: {self.current_path}")
+            self.return_from_failed_navigation()
+        else:
+            QMessageBox.critical(self, "Error", f"Error al cargar directorio: {str(error)}")
+    
+    def retry_listing(self):
+        """Volver a intentar leer una carpeta de una unidad que no respondía"""
+        fs_guard.retry(self.current_path)
+        self.refresh_directory()
+    
+    def on_item_hovered(self, item):
+        """Programar la lectura anticipada de la carpeta bajo el ratón"""
+        if isinstance(item, FileExplorerItem) and item.is_directory and not item.virtual:
+            self.hovered_path = item.file_path
+            self.hover_timer.start()
+    
+    def prefetch_hovered_folder(self):
+        """Leer por adelantado la carpeta sobre la que se detuvo el ratón"""
+        if self.hovered_path in self.items_by_path:
+            self.prefetcher.request(self.hovered_path)
+    
+    def prefetch_selected_folder(self):
+        """Leer por adelantado la carpeta seleccionada"""
+        selected = self.selected_file_items()
+        if len(selected) == 1 and selected[0].is_directory and not selected[0].virtual:
+            self.prefetcher.request(selected[0].file_path)
+    
+    def refresh_directory(self):
+        """Volver a leer la carpeta actual ignorando la caché"""
+        self.load_directory(refresh=True)
+    
+    def remember_view_state(self):
+        """Guardar scroll y selección de la carpeta mostrada"""
+        current = self.file_list.current_item()
+        directory_cache.save_view_state(self.displayed_path, ViewState(
+            self.file_list.verticalScrollBar().value(),
+            tuple(self.get_selected_paths()),
+            current.file_path if isinstance(current, FileExplorerItem) else None))
+    
+    def restore_view_state(self):
+        """Recuperar scroll y selección de la última visita a la carpeta"""
+        state = directory_cache.view_state(self.current_path)
+        if state is None:
+            return
+        # Una sola actualización de botones y vista previa para toda la selección
+        self.file_list.blockSignals(True)
+        current = self.items_by_path.get(state.current)
+        if current is not None:
+            self.file_list.set_current_item(current, QItemSelectionModel.SelectionFlag.NoUpdate)
+        for path in state.selected:
+            item = self.items_by_path.get(path)
+            if item is not None:
+                self.file_list.select_item(item)
+        self.file_list.blockSignals(False)
+        self.file_list.doItemsLayout()
+        self.file_list.verticalScrollBar().setValue(state.scroll)
+        self.update_action_buttons()
+        self.preview_timer.start()
+    
+    def start_size_worker(self, dir_paths):
+        """Calcular en segundo plano el tamaño de las carpetas listadas"""
+        if not dir_paths:
+            return
+        self.size_worker = DirSizeWorker(dir_paths, parent=self)
+        self.size_worker.size_ready.connect(self.on_dir_size_ready)
+        self.size_worker.finished.connect(self.on_size_worker_finished)
+        self.size_worker.start(QThread.Priority.LowPriority)
+    
+    def on_size_worker_finished(self):
+        """Liberar el hilo de cálculo de tamaños cuando termina"""
+        worker = self.sender()
+        if worker is self.size_worker:
+            self.size_worker = None
+        worker.deleteLater()
+    
+    def stop_size_worker(self):
+        """Cancelar el cálculo de tamaños en curso (termina en segundo plano)"""
+        if self.size_worker is not None:
+            self.size_worker.size_ready.disconnect(self.on_dir_size_ready)
+            self.size_worker.cancel()
+            self.size_worker = None
+    
+    def on_dir_size_ready(self, path, size):
+        """Mostrar el tamaño de una carpeta en cuanto se conoce"""
+        item = self.items_by_path.get(path)
+        if item is None:
+            return
+        item.set_size(size)
+        self.file_list.file_model.refresh_item(item)
+        if self.file_list.file_model.discard_order("size"):
+            self.resort_timer.start()
+    
+    def start_type_worker(self, file_paths):
+        """Detectar en segundo plano el tipo de los archivos por su contenido"""
+        if not file_paths:
+            return
+        self.type_worker = FileTypeWorker(file_paths, parent=self)
+        self.type_worker.type_ready.connect(self.on_file_type_ready)
+        self.type_worker.finished.connect(self.on_type_worker_finished)
+        self.type_worker.start(QThread.Priority.LowPriority)
+    
+    def on_type_worker_finished(self):
+        """Liberar el hilo de detección de tipos cuando termina"""
+        worker = self.sender()
+        if worker is self.type_worker:
+            self.type_worker = None
+        worker.deleteLater()
+    
+    def stop_type_worker(self):
+        """Cancelar la detección de tipos en curso (termina en segundo plano)"""
+        if self.type_worker is not None:
+            self.type_worker.type_ready.disconnect(self.on_file_type_ready)
+            self.type_worker.cancel()
+            self.type_worker = None
+    
+    def on_file_type_ready(self, path, file_type):
+        """Actualizar icono y tipo de un archivo con el resultado por contenido"""
+        item = self.items_by_path.get(path)
+        if item is None or item.file_type == file_type:
+            return
+        had_thumbnail_support = item.has_thumbnail_support()
+        item.set_file_type(file_type)
+        self.file_list.file_model.refresh_item(item)
+        if self.file_list.file_model.discard_order("type"):
+            self.resort_timer.start()
+        if self.grid_view and item.has_thumbnail_support() != had_thumbnail_support:
+            self.schedule_thumbnails()
+    
+    def on_sort_changed(self, index):
+        """Reordenar la lista con el criterio elegido"""
+        self.resort_timer.stop()
+        self.file_list.sort_by(self.sort_combo.itemData(index))
+    
+    def resort_items(self):
+        """Reordenar con las claves que cambiaron desde el último orden"""
+        self.file_list.resort()
+    
+    def set_grid_view(self, enabled):
+        """Alternar entre la vista de lista y la cuadrícula de miniaturas"""
+        self.grid_view = enabled
+        if enabled:
+            self.file_list.setViewMode(QListView.ViewMode.IconMode)
+            self.file_list.setIconSize(QSize(128, 128))
+            self.file_list.setGridSize(QSize(160, 180))
+            self.file_list.setResizeMode(QListView.ResizeMode.Adjust)
+            self.file_list.setMovement(QListView.Movement.Static)
+            self.file_list.setWordWrap(True)
+            self.file_list.setProperty("viewMode", "grid")
+        else:
+            self.thumbnail_loader.cancel_all()
+            for item in self.items_by_path.values():
+                item.icon = None
+            self.file_list.file_model.refresh_all()
+            self.file_list.setViewMode(QListView.ViewMode.ListMode)
+            self.file_list.setIconSize(QSize())
+            self.file_list.setGridSize(QSize())
+            self.file_list.setWordWrap(False)
+            self.file_list.setProperty("viewMode", "list")
+        
+        # Reaplicar estilos dependientes de la propiedad viewMode
+        self.file_list.style().unpolish(self.file_list)
+        self.file_list.style().polish(self.file_list)
+        self.schedule_thumbnails()
+    
+    def schedule_thumbnails(self):
+        """Agrupar eventos de scroll antes de pedir miniaturas"""
+        if self.grid_view:
+            self.thumbnail_timer.start()
+    
+    def visible_items(self):
+        """Items dentro del área visible de la lista
+        
+        Las filas están ordenadas de arriba abajo, así que se busca la primera
+        visible por bisección y se recorre solo hasta salir de la vista.
+        """
+        count = self.file_list.count()
+        viewport = self.file_list.viewport().rect()
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if self.file_list.row_rect(middle).bottom() < viewport.top():
+                low = middle + 1
+            else:
+                high = middle
+        
+        visible = []
+        for row in range(low, count):
+            if self.file_list.row_rect(row).top() > viewport.bottom():
+                break
+            visible.append(self.file_list.item(row))
+        return visible
+    
+    def request_visible_thumbnails(self):
+        """Pedir miniaturas solo para las imágenes visibles"""
+        if not self.grid_view:
+            return
+        wanted = []
+        for item in self.visible_items():
+            if not isinstance(item, FileExplorerItem) or not item.has_thumbnail_support():
+                continue
+            wanted.append(item.file_path)
+            if item.icon is None:
+                cached = self.thumbnail_loader.request(item.file_path, item.mtime)
+                if cached:
+                    item.icon = QIcon(cached)
+                    self.file_list.file_model.refresh_item(item)
+        self.thumbnail_loader.retain_only(wanted)
+    
+    def on_thumbnail_ready(self, path, thumb_path):
+        """Mostrar una miniatura recién generada"""
+        item = self.items_by_path.get(path)
+        if item is not None and self.grid_view:
+            item.icon = QIcon(thumb_path)
+            self.file_list.file_model.refresh_item(item)
+    
+    def resizeEvent(self, event):
+        """Al cambiar de tamaño pueden quedar visibles nuevos items"""
+        super().resizeEvent(event)
+        self.schedule_thumbnails()
+    
+    def cleanup(self):
+        """Liberar hilos y procesos en segundo plano"""
+        # Esperar a los hilos cancelados para que no sigan vivos al cerrar
+        workers = [worker for worker in (self.size_worker, self.type_worker) if worker is not None]
+        self.stop_size_worker()
+        self.stop_type_worker()
+        for worker in workers:
+            worker.wait()
+        listing_worker = self.listing_worker
+        self.stop_listing_worker()
+        if listing_worker is not None:
+            listing_worker.wait()
+        member_extractor = self.member_extractor
+        self.stop_member_extractor()
+        if member_extractor is not None:
+            member_extractor.wait()
+        self.hover_timer.stop()
+        self.prefetcher.cancel()
+        self.prefetcher.wait()
+        self.preview_timer.stop()
+        self.preview_pane.cleanup()
+        self.places_sidebar.cleanup()
+        self.app_index_loader.wait()
+        self.path_bar.cleanup()
+        self.content_search_panel.cleanup()
+        for dialog in self.findChildren(ChecksumDialog):
+            dialog.close()
+        self.thumbnail_loader.shutdown()
+        self.operation_queue.stop()
+    
     def on_item_double_clicked(self, item):
         """Manejar doble clic en un item"""
         if isinstance(item, FileExplorerItem):
             if item.is_directory:
-                self.current_path = Path(item.file_path)
-                self.load_directory()
+                self.navigate_to(item.file_path)
             else:
                 # Si es un archivo, intentar abrirlo
-                self.open_file(item.file_path)
+                self.open_item(item)
     
     def on_item_clicked(self, item):
         """Manejar clic simple en un item"""
         if isinstance(item, FileExplorerItem):
-            # Habilitar botones de acción
-            self.delete_btn.setEnabled(True)
-            self.rename_btn.setEnabled(True)
-            
-            # Habilitar botón de abrir archivo si es un archivo
-            if not item.is_directory:
-                self.open_file_btn.setEnabled(True)
-            else:
-                self.open_file_btn.setEnabled(False)
-            
             # Emitir señal de que se seleccionó un archivo
             self.file_selected.emit(item.file_path)
     
+    def selected_file_items(self):
+        """Items seleccionados, en el orden de la lista"""
+        return [item for item in self.file_list.selected_items() if isinstance(item, FileExplorerItem)]
+    
+    def get_selected_paths(self):
+        """Rutas de todos los items seleccionados"""
+        return [item.file_path for item in self.selected_file_items()]
+    
+    def update_action_buttons(self):
+        """Habilitar las acciones según la selección actual"""
+        selected = self.selected_file_items()
+        # Lo que hay dentro de un archivo comprimido solo se puede abrir
+        has_selection = bool(selected) and self.archive_path is None
+        self.delete_btn.setEnabled(has_selection)
+        self.copy_btn.setEnabled(has_selection)
+        self.cut_btn.setEnabled(has_selection)
+        self.compress_btn.setEnabled(has_selection)
+        self.extract_btn.setEnabled(has_selection and all(
+            not item.is_directory and is_browsable_archive(item.file_name, item.file_type.mime)
+            for item in selected))
+        
+        # Abrir trabaja sobre un único elemento; renombrar varios abre el renombrado masivo
+        single = selected[0] if len(selected) == 1 else None
+        self.rename_btn.setEnabled(has_selection)
+        self.open_file_btn.setEnabled(single is not None and not single.is_directory)
+        self.open_with_btn.setEnabled(single is not None and not single.is_directory
+                                      and not single.virtual)
+        self.checksum_btn.setEnabled(has_selection and not any(item.is_directory for item in selected))
+    
+    def update_location_actions(self):
+        """Habilitar crear y pegar según si la carpeta actual se puede modificar"""
+        writable = self.archive_path is None
+        self.create_folder_btn.setEnabled(writable)
+        self.create_file_btn.setEnabled(writable)
+        self.paste_btn.setEnabled(writable)
+    
+    def is_read_only_location(self):
+        """Avisar si la carpeta actual está dentro de un archivo comprimido"""
+        if self.archive_path is None:
+            return False
+        QMessageBox.information(self, "Solo lectura",
+                                "El contenido de un archivo comprimido no se puede modificar.")
+        return True
+    
+    def set_preview_visible(self, visible):
+        """Mostrar u ocultar el panel de vista previa"""
+        self.preview_pane.setVisible(visible)
+        if visible:
+            self.update_preview()
+        else:
+            self.preview_pane.clear()
+    
+    def set_content_search_visible(self, visible):
+        """Mostrar u ocultar el panel de búsqueda en el contenido"""
+        self.content_search_panel.setVisible(visible)
+        if visible:
+            self.content_search_panel.focus_query()
+        else:
+            self.content_search_panel.stop_search()
+    
+    def focus_content_search(self):
+        """Abrir la búsqueda en el contenido y pasar a escribir"""
+        if self.content_search_button.isChecked():
+            self.content_search_panel.focus_query()
+        else:
+            self.content_search_button.setChecked(True)
+    
+    def show_search_match(self, path, line_number):
+        """Mostrar una coincidencia de la búsqueda en la vista previa"""
+        self.preview_button.setChecked(True)
+        self.preview_timer.stop()
+        self.preview_pane.show_file_at_line(path, line_number)
+    
+    def update_preview(self):
+        """Previsualizar el archivo seleccionado (solo con un único archivo)"""
+        if not self.preview_pane.isVisible():
+            return
+        selected = self.selected_file_items()
+        if len(selected) == 1 and selected[0].virtual:
+            # Previsualizar obligaría a extraer el miembro
+            self.preview_pane.clear()
+            self.preview_pane.show_message("📦 Archivo dentro de un comprimido: ábrelo con doble clic "
+                                           "para extraerlo y verlo")
+        elif len(selected) == 1 and not selected[0].is_directory:
+            if selected[0].file_path != self.preview_pane.current_path:
+                self.preview_pane.show_file(selected[0].file_path)
+        elif self.preview_pane.current_path is not None:
+            self.preview_pane.clear()
+    
+    def navigate_to(self, path):
+        """Abrir una carpeta guardando la actual en el historial"""
+        path = Path(path)
+        if path == self.current_path:
+            self.load_directory()
+            return
+        self.back_history.append(self.current_path)
+        del self.back_history[:-MAX_HISTORY]
+        self.forward_history.clear()
+        self.current_path = path
+        self.load_directory()
+    
     def go_back(self):
+        """Volver a la carpeta visitada anteriormente"""
+        if self.back_history:
+            self.forward_history.append(self.current_path)
+            del self.forward_history[:-MAX_HISTORY]
+            self.current_path = self.back_history.pop()
+            self.load_directory()
+    
+    def go_forward(self):
+        """Rehacer la navegación deshecha con Atrás"""
+        if self.forward_history:
+            self.back_history.append(self.current_path)
+            del self.back_history[:-MAX_HISTORY]
+            self.current_path = self.forward_history.pop()
+            self.load_directory()
+    
+    def go_up(self):
         """Ir al directorio padre"""
         if self.current_path != self.current_path.parent:
-            self.current_path = self.current_path.parent
-            self.load_directory()
-            self.clear_selection()
+            self.navigate_to(self.current_path.parent)
+    
+    def focus_path_bar(self):
+        """Pasar a escribir la ruta"""
+        self.path_bar.setFocus(Qt.FocusReason.ShortcutFocusReason)
+        self.path_bar.selectAll()
     
     def go_home(self):
         """Ir al directorio home"""
-        self.current_path = Path.home()
+        self.navigate_to(Path.home())
+    
+    def return_from_failed_navigation(self):
+        """Volver a la carpeta anterior cuando la nueva no se puede abrir"""
+        if self.back_history:
+            self.current_path = self.back_history.pop()
+        elif self.current_path != self.current_path.parent:
+            self.current_path = self.current_path.parent
+        else:
+            return
         self.load_directory()
-        self.clear_selection()
+    
+    def update_history_buttons(self):
+        """Habilitar Atrás, Adelante y Subir según el historial"""
+        self.back_button.setEnabled(bool(self.back_history))
+        self.forward_button.setEnabled(bool(self.forward_history))
+        self.up_button.setEnabled(self.current_path != self.current_path.parent)
     
     def clear_selection(self):
         """Limpiar selección"""
@@ -355,9 +1164,17 @@ class FileExplorerWidget(QWidget):
         self.delete_btn.setEnabled(False)
         self.rename_btn.setEnabled(False)
         self.open_file_btn.setEnabled(False)
+        self.open_with_btn.setEnabled(False)
+        self.checksum_btn.setEnabled(False)
+        self.copy_btn.setEnabled(False)
+        self.cut_btn.setEnabled(False)
+        self.compress_btn.setEnabled(False)
+        self.extract_btn.setEnabled(False)
     
     def create_folder(self):
         """Crear nueva carpeta"""
+        if self.is_read_only_location():
+            return
         if not self.is_in_user_directory():
             QMessageBox.warning(self, "Ubicación no permitida", 
                               "Solo puedes crear carpetas dentro de tu directorio personal.")
@@ -377,6 +1194,8 @@ class FileExplorerWidget(QWidget):
     
     def create_file(self):
         """Crear nuevo archivo"""
+        if self.is_read_only_location():
+            return
         if not self.is_in_user_directory():
             QMessageBox.warning(self, "Ubicación no permitida", 
                               "Solo puedes crear archivos dentro de tu directorio personal.")
@@ -395,9 +1214,17 @@ class FileExplorerWidget(QWidget):
                 QMessageBox.critical(self, "Error", f"Error al crear archivo: {str(e)}")
     
     def delete_selected(self):
-        """Eliminar el item seleccionado"""
-        current_item = self.file_list.currentItem()
-        if not isinstance(current_item, FileExplorerItem):
+        """Enviar los items seleccionados a la papelera (se puede deshacer)"""
+        self._delete_selected(permanent=False)
+    
+    def delete_selected_permanently(self):
+        """Eliminar los items seleccionados sin pasar por la papelera"""
+        self._delete_selected(permanent=True)
+    
+    def _delete_selected(self, permanent):
+        """Eliminar los items seleccionados como un único lote"""
+        selected = self.selected_file_items()
+        if not selected or self.is_read_only_location():
             return
         
         if not self.is_in_user_directory():
@@ -405,31 +1232,38 @@ class FileExplorerWidget(QWidget):
                               "Solo puedes eliminar archivos dentro de tu directorio personal.")
             return
         
-        # Confirmar eliminación
-        reply = QMessageBox.question(self, "Confirmar eliminación", 
-                                   f"¿Estás seguro de que quieres eliminar '{current_item.file_name}'?",
+        # Una sola confirmación para todo el lote
+        action = "eliminar definitivamente" if permanent else "enviar a la papelera"
+        if len(selected) == 1:
+            question = f"¿Estás seguro de que quieres {action} '{selected[0].file_name}'?"
+        else:
+            preview = "\n".join(f"  • {item.file_name}" for item in selected[:8])
+            if len(selected) > 8:
+                preview += f"\n  … y {len(selected) - 8} más"
+            question = f"¿Estás seguro de que quieres {action} {len(selected)} elementos?\n\n{preview}"
+        if permanent:
+            question += "\n\nEsta acción no se puede deshacer."
+        reply = QMessageBox.question(self, "Confirmar eliminación", question,
                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                                    QMessageBox.StandardButton.No)
         
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                path = Path(current_item.file_path)
-                if path.is_dir():
-                    shutil.rmtree(path)
-                else:
-                    path.unlink()
-                
-                self.load_directory()
-                self.clear_selection()
-                QMessageBox.information(self, "Éxito", f"'{current_item.file_name}' eliminado correctamente.")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error al eliminar: {str(e)}")
+            # Se procesa en segundo plano; la lista se recarga una vez al terminar.
+            # En la papelera del mismo disco cada elemento es un rename instantáneo
+            paths = [item.file_path for item in selected]
+            operation = DeleteOperation(paths) if permanent else TrashOperation(paths)
+            self.operation_queue.submit(operation)
+            self.clear_selection()
     
     def rename_selected(self):
-        """Renombrar el item seleccionado"""
-        current_item = self.file_list.currentItem()
-        if not isinstance(current_item, FileExplorerItem):
+        """Renombrar el item seleccionado (con varios, renombrado masivo)"""
+        selected = self.selected_file_items()
+        if not selected or self.is_read_only_location():
+            return
+        if len(selected) > 1:
+            self.bulk_rename_selected(selected)
             return
+        current_item = selected[0]
         
         if not self.is_in_user_directory():
             QMessageBox.warning(self, "Ubicación no permitida", 
@@ -440,38 +1274,276 @@ class FileExplorerWidget(QWidget):
                                           f"Nuevo nombre para '{current_item.file_name}':",
                                           text=current_item.file_name)
         if ok and new_name and new_name != current_item.file_name:
-            try:
-                old_path = Path(current_item.file_path)
-                new_path = old_path.parent / new_name
-                old_path.rename(new_path)
-                
-                self.load_directory()
-                self.clear_selection()
-                QMessageBox.information(self, "Éxito", f"Renombrado a '{new_name}' correctamente.")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error al renombrar: {str(e)}")
+            old_path = Path(current_item.file_path)
+            new_path = old_path.parent / new_name
+            self.operation_queue.submit(RenameOperation([old_path], new_path))
+            self.clear_selection()
+    
+    def bulk_rename_selected(self, selected):
+        """Renombrar varios elementos con un patrón y vista previa"""
+        if not self.is_in_user_directory():
+            QMessageBox.warning(self, "Ubicación no permitida", 
+                              "Solo puedes renombrar archivos dentro de tu directorio personal.")
+            return
+        
+        theme = self.theme_manager.get_theme(self.current_theme)
+        dialog = BulkRenameDialog([item.file_path for item in selected],
+                                  self.items_by_path.keys(), theme, self)
+        if dialog.exec() and dialog.renames():
+            # Todo el lote es una sola transacción en la cola de operaciones
+            self.operation_queue.submit(BulkRenameOperation(dialog.renames()))
+            self.clear_selection()
+    
+    def checksum_selected(self):
+        """Calcular las sumas de los archivos seleccionados y verificarlas"""
+        paths = [item.file_path for item in self.selected_file_items() if not item.is_directory]
+        if not paths or self.archive_path is not None:
+            return
+        # Si junto a los archivos hay un SHA512SUMS o similar, se usa ese algoritmo
+        algorithm = detect_algorithm(paths, (os.path.basename(path) for path in self.items_by_path))
+        theme = self.theme_manager.get_theme(self.current_theme)
+        dialog = ChecksumDialog(paths, algorithm, theme, self)
+        dialog.show()
+        dialog.toggle_checksums()
+    
+    def undo_last_operation(self):
+        """Deshacer la última operación del diario (renombrar, mover o papelera)"""
+        entry = operation_journal.undo_entry()
+        if entry is None or self.history_job is not None:
+            return
+        self.history_job = self.operation_queue.submit(undo_operation(entry))
+        self.update_undo_buttons()
+    
+    def redo_last_operation(self):
+        """Volver a aplicar la última operación deshecha"""
+        entry = operation_journal.redo_entry()
+        if entry is None or self.history_job is not None:
+            return
+        self.history_job = self.operation_queue.submit(redo_operation(entry))
+        self.update_undo_buttons()
+    
+    def update_undo_buttons(self):
+        """Habilitar Deshacer y Rehacer según el diario de operaciones"""
+        busy = self.history_job is not None
+        for button, entry, label in ((self.undo_btn, operation_journal.undo_entry(), "Deshacer"),
+                                     (self.redo_btn, operation_journal.redo_entry(), "Rehacer")):
+            button.setEnabled(entry is not None and not busy)
+            button.setToolTip(f"{label}: {entry.title}" if entry is not None else "")
+    
+    def copy_selected(self):
+        """Copiar los items seleccionados al portapapeles"""
+        self._set_clipboard("copy")
+    
+    def cut_selected(self):
+        """Cortar los items seleccionados (se moverán al pegar)"""
+        self._set_clipboard("cut")
+    
+    def _set_clipboard(self, mode):
+        """Guardar rutas en el portapapeles del sistema
+        
+        Se usa el formato de GNOME (x-special/gnome-copied-files) además de
+        la lista de URLs para interoperar con otros gestores de archivos.
+        """
+        paths = self.get_selected_paths()
+        if not paths or self.archive_path is not None:
+            return
+        
+        urls = [QUrl.fromLocalFile(path) for path in paths]
+        mime_data = QMimeData()
+        mime_data.setUrls(urls)
+        gnome_payload = "\n".join([mode] + [url.toString() for url in urls])
+        mime_data.setData("x-special/gnome-copied-files", gnome_payload.encode("utf-8"))
+        QGuiApplication.clipboard().setMimeData(mime_data)
+    
+    def _read_clipboard(self):
+        """Leer del portapapeles (modo, rutas locales)"""
+        mime_data = QGuiApplication.clipboard().mimeData()
+        if mime_data is None:
+            return None, []
+        
+        mode = "copy"
+        if mime_data.hasFormat("x-special/gnome-copied-files"):
+            lines = bytes(mime_data.data("x-special/gnome-copied-files")).decode("utf-8").splitlines()
+            if lines and lines[0] in ("copy", "cut"):
+                mode = lines[0]
+        paths = [url.toLocalFile() for url in mime_data.urls() if url.isLocalFile()]
+        return mode, paths
+    
+    def paste_clipboard(self):
+        """Pegar en la carpeta actual lo copiado o cortado"""
+        if self.is_read_only_location():
+            return
+        if not self.is_in_user_directory():
+            QMessageBox.warning(self, "Ubicación no permitida", 
+                              "Solo puedes pegar archivos dentro de tu directorio personal.")
+            return
+        
+        mode, paths = self._read_clipboard()
+        paths = [path for path in paths if os.path.lexists(path)]
+        if not paths:
+            return
+        
+        if mode == "cut":
+            self.operation_queue.submit(MoveOperation(paths, self.current_path))
+            # Lo cortado solo se puede pegar una vez
+            QGuiApplication.clipboard().clear()
+        else:
+            self.operation_queue.submit(CopyOperation(paths, self.current_path))
+    
+    def compress_selected(self):
+        """Comprimir la selección en un .tar.gz dentro de la carpeta actual"""
+        selected = self.selected_file_items()
+        if not selected or self.is_read_only_location():
+            return
+        if not self.is_in_user_directory():
+            QMessageBox.warning(self, "Ubicación no permitida", 
+                              "Solo puedes comprimir archivos dentro de tu directorio personal.")
+            return
+        
+        default_name = selected[0].file_name if len(selected) == 1 else "Archivo"
+        name, ok = QInputDialog.getText(self, "Comprimir", "Nombre del archivo comprimido:",
+                                        text=f"{default_name}.tar.gz")
+        if not ok or not name.strip():
+            return
+        name = name.strip()
+        if not name.lower().endswith((".tar.gz", ".tgz")):
+            name += ".tar.gz"
+        destination = unique_destination(str(self.current_path), name)
+        # Se comprime en segundo plano usando todos los núcleos
+        self.operation_queue.submit(CompressOperation([item.file_path for item in selected],
+                                                      destination))
+    
+    def extract_selected(self):
+        """Extraer los archivos comprimidos seleccionados en la carpeta actual"""
+        selected = self.selected_file_items()
+        if not selected or self.is_read_only_location():
+            return
+        if not self.is_in_user_directory():
+            QMessageBox.warning(self, "Ubicación no permitida", 
+                              "Solo puedes extraer archivos dentro de tu directorio personal.")
+            return
+        
+        archives = [item.file_path for item in selected
+                    if not item.is_directory and is_browsable_archive(item.file_name, item.file_type.mime)]
+        if archives:
+            # Cada archivo se extrae en una carpeta nueva con su nombre
+            self.operation_queue.submit(ExtractOperation(archives, self.current_path))
+    
+    def on_operation_finished(self, job):
+        """Recargar la vista si la operación cambió la carpeta actual"""
+        current = os.path.normpath(str(self.current_path))
+        if any(os.path.normpath(path) == current for path in job.affected_dirs()):
+            # Varias operaciones que terminan seguidas producen una sola recarga
+            self.reload_timer.start()
+        
+        if job is self.history_job:
+            self.history_job = None
+        self.update_undo_buttons()
+        
+        if job.state == FAILED:
+            # Un único mensaje por lote con el detalle de los elementos que fallaron
+            details = "\n".join(f"  • {os.path.basename(path)}: {message}"
+                                for path, message in job.errors[:10])
+            if len(job.errors) > 10:
+                details += f"\n  … y {len(job.errors) - 10} más"
+            text = f"Error en la operación: {job.error}"
+            if details:
+                text += f"\n\n{details}"
+            QMessageBox.critical(self, "Error", text)
     
     def open_selected_file(self):
         """Abrir el archivo seleccionado"""
-        current_item = self.file_list.currentItem()
+        current_item = self.file_list.current_item()
         if isinstance(current_item, FileExplorerItem) and not current_item.is_directory:
-            self.open_file(current_item.file_path)
+            self.open_item(current_item)
+    
+    def open_item(self, item):
+        """Abrir un archivo: los comprimidos se exploran como carpetas y sus
+        miembros se extraen antes de abrirlos"""
+        if item.virtual:
+            self.open_archive_member(item.file_path)
+        elif is_browsable_archive(item.file_name, item.file_type.mime):
+            self.navigate_to(item.file_path)
+        else:
+            self.open_file(item.file_path, item.file_type.mime)
+    
+    def open_archive_member(self, member_path):
+        """Extraer un miembro por bloques en segundo plano y abrirlo"""
+        self.stop_member_extractor()
+        inner = os.path.relpath(member_path, self.archive_path)
+        self.member_extractor = MemberExtractor(self.archive_path, inner, parent=self)
+        self.member_extractor.extracted.connect(self.open_file)
+        self.member_extractor.failed.connect(self.on_member_extraction_failed)
+        self.member_extractor.finished.connect(self.on_member_extractor_finished)
+        self.member_extractor.start()
+    
+    def stop_member_extractor(self):
+        """Abandonar la extracción en curso"""
+        if self.member_extractor is not None:
+            self.member_extractor.extracted.disconnect(self.open_file)
+            self.member_extractor.failed.disconnect(self.on_member_extraction_failed)
+            self.member_extractor.cancel()
+            self.member_extractor = None
+    
+    def on_member_extractor_finished(self):
+        """Liberar el hilo de extracción cuando termina"""
+        worker = self.sender()
+        if worker is self.member_extractor:
+            self.member_extractor = None
+        worker.deleteLater()
     
-    def open_file(self, file_path):
-        """Abrir un archivo con la aplicación predeterminada o editor de texto"""
+    def on_member_extraction_failed(self, message):
+        """Informar de un miembro que no se pudo extraer"""
+        QMessageBox.warning(self, "Error", f"No se pudo extraer el archivo: {message}")
+    
+    def open_file(self, file_path, mime=None):
+        """Abrir un archivo con la aplicación predeterminada para su tipo"""
+        mime = mime or guess_type_from_name(os.path.basename(file_path)).mime
+        app = desktop_app_index.default_application(mime)
+        if app is not None:
+            self.launch_application(app, file_path)
+            return
         try:
-            import subprocess
-            
-            # Intentar abrir con xdg-open (Linux)
-            subprocess.run(['xdg-open', file_path], check=True)
-        except subprocess.CalledProcessError:
-            # Si falla, mostrar mensaje informativo
-            QMessageBox.information(self, "Abrir archivo", 
-                                  f"No se pudo abrir automáticamente el archivo:\n{file_path}\n\n"
-                                  "Puedes abrirlo manualmente con tu aplicación preferida.")
-        except Exception as e:
+            # Sin aplicación en el índice se prueba xdg-open, también desacoplado
+            subprocess.Popen(['xdg-open', file_path],
+                             stdin=subprocess.DEVNULL,
+                             stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL,
+                             start_new_session=True)
+        except FileNotFoundError:
+            # xdg-open no está instalado: dejar elegir la aplicación a mano
+            QMessageBox.information(self, "Abrir archivo",
+                                    "No se encontró xdg-open para abrir el archivo con la "
+                                    "aplicación del sistema. Elige con qué abrirlo.")
+            self.choose_application(file_path, mime)
+        except OSError as e:
             QMessageBox.warning(self, "Error", f"Error al abrir archivo: {str(e)}")
     
+    def open_selected_with(self):
+        """Elegir con qué aplicación abrir el archivo seleccionado"""
+        selected = self.selected_file_items()
+        if len(selected) == 1 and not selected[0].is_directory and not selected[0].virtual:
+            self.choose_application(selected[0].file_path, selected[0].file_type.mime)
+    
+    def choose_application(self, file_path, mime):
+        """Mostrar "Abrir con…" y lanzar la aplicación elegida"""
+        theme = self.theme_manager.get_theme(self.current_theme)
+        dialog = OpenWithDialog(file_path, mime, theme, self)
+        if dialog.exec() and dialog.selected_app() is not None:
+            self.launch_application(dialog.selected_app(), file_path)
+    
+    def launch_application(self, app, file_path):
+        """Lanzar una aplicación con un archivo sin esperar a que termine"""
+        try:
+            launch(app, [file_path])
+        except FileNotFoundError as e:
+            # Falta el ejecutable de la línea Exec (o la carpeta de trabajo)
+            QMessageBox.warning(self, "Abrir archivo",
+                                f"No se encontró el programa de {app.name}: "
+                                f"{e.filename or app.exec_line}")
+        except OSError as e:
+            QMessageBox.warning(self, "Error", f"No se pudo abrir con {app.name}: {str(e)}")
+    
     def is_in_user_directory(self):
         """Verificar si estamos dentro del directorio del usuario"""
         try:
@@ -481,14 +1553,12 @@ class FileExplorerWidget(QWidget):
             return False
     
     def set_path(self, path):
-        """Establecer la ruta actual del explorador"""
-        new_path = Path(path)
-        if new_path.exists() and new_path.is_dir():
-            self.current_path = new_path
-            self.load_directory()
-            self.clear_selection()
-        else:
-            QMessageBox.warning(self, "Error", f"La ruta no existe o no es un directorio: {path}")
+        """Establecer la ruta actual del explorador
+        
+        La ruta se comprueba al listarla en segundo plano; si no es una
+        carpeta se avisa y se vuelve a la anterior.
+        """
+        self.navigate_to(Path(path))
     
     def get_current_path(self):
         """Obtener la ruta actual"""
@@ -496,7 +1566,7 @@ class FileExplorerWidget(QWidget):
     
     def get_selected_item_path(self):
         """Obtener la ruta del item seleccionado"""
-        current_item = self.file_list.currentItem()
+        current_item = self.file_list.current_item()
         if isinstance(current_item, FileExplorerItem):
             return current_item.file_path
         return None
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Lista de archivos del explorador sobre un modelo propio
+
+Los items viven en una lista de Python y la vista solo pide los datos de
+las filas que pinta, así que una carpeta con cien mil entradas no crea un
+objeto de Qt por fila. Ordenar es permutar esa lista con las claves que
+cada item ya calculó de su stat (nombre, tamaño, fecha y tipo) y avisar
+con layoutChanged: ni se vuelve a leer la carpeta ni se recrean items.
+
+Buscar al teclear usa el índice de nombres ordenado que mantiene el
+modelo, así cada pulsación es una bisección y no un recorrido de la lista.
+"""
+
+import time
+from bisect import bisect_left
+from operator import attrgetter
+from PyQt6.QtWidgets import QApplication, QListView
+from PyQt6.QtCore import Qt, QStringListModel, QItemSelectionModel, pyqtSignal
+
+
+# Atributo de cada item con la clave de cada criterio (None: solo el nombre)
+SORT_KEYS = {
+    "name": None,
+    "size": "size_rank",
+    "mtime": "mtime_rank",
+    "type": "type_key",
+}
+
+# Con más índices persistentes que estos, su nueva fila se busca en un diccionario
+INDEX_SCAN_LIMIT = 32
+
+
+class FileListModel(QStringListModel):
+    """Items del explorador en el orden en que se muestran
+    
+    Cada item expone text, tool_tip e icon para pintarse y las claves
+    name_key, dir_rank, size_rank, mtime_rank y type_key para ordenarse.
+    Los órdenes ya calculados se guardan hasta que cambian sus claves, así
+    volver a un criterio anterior no ordena de nuevo.
+    
+    La base es una QStringListModel de cadenas vacías: la vista pide el
+    índice de cada fila al maquetar y así eso se resuelve en C++; solo
+    data() y flags() pasan por Python, y solo para lo que se pinta.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.sort_mode = "name"
+        self._items = []
+        self._rows = None
+        self._orders = {}
+        # Índice de nombres: todos los items por name_key y sus claves aparte
+        self._name_index = []
+        self._name_keys = []
+    
+    def flags(self, index):
+        # Solo se elige: renombrar tiene su propia acción
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemNeverHasChildren
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row = index.row()
+        if not 0 <= row < len(self._items):
+            return None
+        item = self._items[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return item.text
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return item.tool_tip
+        if role == Qt.ItemDataRole.DecorationRole:
+            return item.icon
+        return None
+    
+    def set_items(self, items):
+        """Reemplazar el contenido (un listado nuevo)"""
+        self._name_index = sorted(items, key=attrgetter("name_key"))
+        self._name_keys = [item.name_key for item in self._name_index]
+        self._orders = {}
+        self._items = self._order(self.sort_mode)
+        self._rows = None
+        # Reinicia el modelo con tantas filas como items
+        self.setStringList([""] * len(self._items))
+    
+    def item(self, row):
+        """Item de una fila (o None)"""
+        return self._items[row] if 0 <= row < len(self._items) else None
+    
+    def row(self, item):
+        """Fila de un item (-1 si no está en la lista)"""
+        if self._rows is None:
+            self._rows = {entry: row for row, entry in enumerate(self._items)}
+        return self._rows.get(item, -1)
+    
+    def refresh_item(self, item):
+        """Volver a pintar un item cuyo texto o icono cambió"""
+        row = self.row(item)
+        if row >= 0:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+    
+    def refresh_all(self):
+        """Volver a pintar todos los items"""
+        if self._items:
+            self.dataChanged.emit(self.index(0), self.index(len(self._items) - 1))
+    
+    # --- Orden ---------------------------------------------------------
+    
+    def sort_by(self, mode):
+        """Mostrar los items según otro criterio"""
+        self.sort_mode = mode
+        self._reorder(self._order(mode))
+    
+    def discard_order(self, mode):
+        """Olvidar el orden de un criterio cuyas claves cambiaron
+        
+        Devuelve True si es el criterio mostrado y hay que volver a ordenar.
+        """
+        if SORT_KEYS[mode] is None:
+            return False
+        self._orders.pop(mode, None)
+        return mode == self.sort_mode
+    
+    def _order(self, mode):
+        """Items ordenados por un criterio: carpetas primero y empates por nombre"""
+        order = self._orders.get(mode)
+        if order is None:
+            key = SORT_KEYS[mode]
+            order = self._name_index
+            if key is not None:
+                order = sorted(order, key=attrgetter(key))
+            # sorted es estable: dentro de carpetas y archivos sigue el orden anterior
+            order = sorted(order, key=attrgetter("dir_rank"))
+            self._orders[mode] = order
+        return order
+    
+    def _reorder(self, order):
+        """Cambiar el orden mostrado conservando selección y elemento actual"""
+        if order is self._items:
+            return
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        moved = [self._items[index.row()] for index in old_indexes]
+        self._items = order
+        self._rows = None
+        if len(moved) > INDEX_SCAN_LIMIT:
+            new_rows = [self.row(item) for item in moved]
+        else:
+            # Pocos índices (lo normal): list.index recorre en C sin crear el diccionario
+            new_rows = [order.index(item) for item in moved]
+        self.changePersistentIndexList(old_indexes, [self.index(row) for row in new_rows])
+        self.layoutChanged.emit()
+    
+    # --- Búsqueda por nombre -------------------------------------------
+    
+    def find_prefix(self, prefix, after=None):
+        """Primer item cuyo nombre empieza por prefix (casefold)
+        
+        Con after se devuelve la coincidencia siguiente a ese item, o la
+        primera si era la última.
+        """
+        keys = self._name_keys
+        position = bisect_left(keys, prefix)
+        if position == len(keys) or not keys[position].startswith(prefix):
+            return None
+        if after is not None:
+            current = bisect_left(keys, after.name_key)
+            # Nombres que solo difieren en mayúsculas comparten clave
+            while current < len(keys) and self._name_index[current] is not after:
+                current += 1
+            following = current + 1
+            if following < len(keys) and following > position and keys[following].startswith(prefix):
+                position = following
+        return self._name_index[position]
+
+
+class FileListView(QListView):
+    """Vista del explorador sobre FileListModel con búsqueda al teclear
+    
+    Las señales entregan el item, no el índice del modelo, y los métodos
+    trabajan con items igual que el resto del explorador.
+    """
+    
+    item_clicked = pyqtSignal(object)
+    item_double_clicked = pyqtSignal(object)
+    item_entered = pyqtSignal(object)
+    selection_changed = pyqtSignal()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.file_model = FileListModel(self)
+        self.setModel(self.file_model)
+        self.clicked.connect(self._on_clicked)
+        self.doubleClicked.connect(self._on_double_clicked)
+        self.entered.connect(self._on_entered)
+        self.selectionModel().selectionChanged.connect(self.selection_changed)
+        
+        # Texto tecleado y momento de la última pulsación
+        self.search_text = ""
+        self.search_time = 0.0
+    
+    def _on_clicked(self, index):
+        self.item_clicked.emit(self.file_model.item(index.row()))
+    
+    def _on_double_clicked(self, index):
+        self.item_double_clicked.emit(self.file_model.item(index.row()))
+    
+    def _on_entered(self, index):
+        self.item_entered.emit(self.file_model.item(index.row()))
+    
+    def set_items(self, items):
+        """Mostrar un listado nuevo"""
+        self.selectionModel().clear()
+        self.file_model.set_items(items)
+    
+    def clear(self):
+        """Vaciar la lista"""
+        self.set_items([])
+    
+    def count(self):
+        return self.file_model.rowCount()
+    
+    def item(self, row):
+        return self.file_model.item(row)
+    
+    def row(self, item):
+        return self.file_model.row(item)
+    
+    def row_rect(self, row):
+        """Rectángulo de una fila en la vista"""
+        return self.visualRect(self.file_model.index(row))
+    
+    def current_item(self):
+        """Item actual (o None)"""
+        return self.file_model.item(self.currentIndex().row())
+    
+    def set_current_item(self, item,
+                         command=QItemSelectionModel.SelectionFlag.ClearAndSelect):
+        """Hacer actual un item y mostrarlo"""
+        index = self.file_model.index(self.file_model.row(item))
+        self.selectionModel().setCurrentIndex(index, command)
+        self.scrollTo(index)
+    
+    def select_item(self, item):
+        """Añadir un item a la selección"""
+        index = self.file_model.index(self.file_model.row(item))
+        self.selectionModel().select(index, QItemSelectionModel.SelectionFlag.Select)
+    
+    def selected_items(self):
+        """Items seleccionados, en el orden de la lista"""
+        rows = sorted(index.row() for index in self.selectionModel().selectedIndexes())
+        return [self.file_model.item(row) for row in rows]
+    
+    def sort_by(self, mode):
+        self.file_model.sort_by(mode)
+    
+    def resort(self):
+        """Volver a ordenar con el criterio actual tras cambiar sus claves"""
+        self.file_model.sort_by(self.file_model.sort_mode)
+    
+    def keyboardSearch(self, search):
+        """Saltar al primer nombre que empieza por lo tecleado
+        
+        Las pulsaciones seguidas se acumulan; repetir una misma letra
+        recorre los nombres que empiezan por ella.
+        """
+        now = time.monotonic()
+        if now - self.search_time > QApplication.keyboardInputInterval() / 1000:
+            self.search_text = ""
+        self.search_time = now
+        self.search_text += search.casefold()
+        text = self.search_text
+        if not text:
+            return
+        
+        current = self.current_item()
+        if len(text) > 1 and text == text[0] * len(text) and current is not None:
+            item = self.file_model.find_prefix(text[0], after=current)
+        else:
+            item = self.file_model.find_prefix(text)
+        if item is not None:
+            self.set_current_item(item)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Panel de progreso de las operaciones de archivos en segundo plano
+"""
+
+from PyQt6.QtWidgets import (QFrame, QVBoxLayout, QHBoxLayout, QLabel,
+                           QPushButton, QProgressBar)
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QFont
+
+from core.file_operations import DONE, CANCELLED, FAILED
+
+
+def format_rate(size):
+    """Formatear un tamaño en bytes de forma compacta"""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def format_eta(seconds):
+    """Formatear el tiempo restante como mm:ss o hh:mm:ss"""
+    if seconds is None:
+        return "--:--"
+    seconds = int(seconds)
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+class FileOperationsPanel(QFrame):
+    """Muestra la operación en curso, su progreso y la cola pendiente"""
+    
+    def __init__(self, operation_queue, parent=None):
+        super().__init__(parent)
+        self.operation_queue = operation_queue
+        self.current_job = None
+        
+        self.hide_timer = QTimer(self)
+        self.hide_timer.setSingleShot(True)
+        self.hide_timer.setInterval(4000)
+        self.hide_timer.timeout.connect(self.hide)
+        
+        self.setup_ui()
+        
+        self.operation_queue.job_queued.connect(self.on_job_queued)
+        self.operation_queue.job_started.connect(self.on_job_started)
+        self.operation_queue.progress_changed.connect(self.on_progress_changed)
+        self.operation_queue.job_finished.connect(self.on_job_finished)
+        self.hide()
+    
+    def setup_ui(self):
+        """Crear la interfaz del panel"""
+        self.setObjectName("operationsFrame")
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 6, 10, 6)
+        layout.setSpacing(4)
+        
+        header_layout = QHBoxLayout()
+        header_layout.setSpacing(8)
+        
+        self.title_label = QLabel("⚙️ Operaciones")
+        self.title_label.setObjectName("operationTitle")
+        self.title_label.setFont(QFont("Roboto", 11, QFont.Weight.Bold))
+        header_layout.addWidget(self.title_label, 1)
+        
+        self.queue_label = QLabel("")
+        self.queue_label.setObjectName("operationStats")
+        header_layout.addWidget(self.queue_label)
+        
+        self.pause_button = QPushButton("⏸️")
+        self.pause_button.setObjectName("navButton")
+        self.pause_button.setFixedSize(32, 28)
+        self.pause_button.setToolTip("Pausar / reanudar")
+        self.pause_button.clicked.connect(self.toggle_pause)
+        header_layout.addWidget(self.pause_button)
+        
+        self.cancel_button = QPushButton("✖")
+        self.cancel_button.setObjectName("navButton")
+        self.cancel_button.setFixedSize(32, 28)
+        self.cancel_button.setToolTip("Cancelar operación")
+        self.cancel_button.clicked.connect(self.cancel_current)
+        header_layout.addWidget(self.cancel_button)
+        
+        layout.addLayout(header_layout)
+        
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setObjectName("operationProgress")
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setFixedHeight(10)
+        layout.addWidget(self.progress_bar)
+        
+        self.stats_label = QLabel("")
+        self.stats_label.setObjectName("operationStats")
+        self.stats_label.setFont(QFont("JetBrains Mono", 9))
+        self.stats_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+        layout.addWidget(self.stats_label)
+    
+    def _update_queue_label(self):
+        """Mostrar cuántas operaciones esperan su turno"""
+        pending = len(self.operation_queue.pending_jobs())
+        self.queue_label.setText(f"{pending} en cola" if pending else "")
+    
+    def on_job_queued(self, job):
+        """Una nueva operación entra en la cola"""
+        self.hide_timer.stop()
+        self._update_queue_label()
+        if self.current_job is None:
+            self.title_label.setText(job.describe())
+            self.stats_label.setText("En cola...")
+            self.progress_bar.setValue(0)
+        self.show()
+    
+    def on_job_started(self, job):
+        """Comienza una operación"""
+        self.current_job = job
+        self.title_label.setText(job.describe())
+        self.stats_label.setText("Calculando...")
+        self.progress_bar.setRange(0, 0)  # Indeterminado mientras se planifica
+        self.pause_button.setText("⏸️")
+        self.pause_button.setEnabled(True)
+        self.cancel_button.setEnabled(True)
+        self._update_queue_label()
+        self.show()
+    
+    def on_progress_changed(self, progress):
+        """Actualizar barra y estadísticas de la operación en curso"""
+        if self.current_job is None or progress.job_id != self.current_job.job_id:
+            return
+        
+        if progress.total_bytes:
+            fraction = progress.done_bytes / progress.total_bytes
+        elif progress.total_files:
+            fraction = progress.done_files / progress.total_files
+        else:
+            fraction = 0.0
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setValue(int(min(fraction, 1.0) * 1000))
+        
+        parts = [f"{progress.done_files}/{progress.total_files} archivos"]
+        if progress.total_bytes:
+            parts.append(f"{format_rate(progress.done_bytes)} / {format_rate(progress.total_bytes)}")
+            parts.append(f"{format_rate(progress.bytes_per_second)}/s")
+            parts.append(f"ETA {format_eta(progress.eta_seconds)}")
+        if progress.paused:
+            parts.append("⏸️ En pausa")
+        self.stats_label.setText("  ·  ".join(parts))
+    
+    def on_job_finished(self, job):
+        """Mostrar el resultado de una operación"""
+        if job is self.current_job:
+            self.current_job = None
+        self._update_queue_label()
+        
+        if job.state == DONE:
+            self.title_label.setText(f"✅ {job.describe()}")
+            self.progress_bar.setRange(0, 1000)
+            self.progress_bar.setValue(1000)
+        elif job.state == CANCELLED:
+            self.title_label.setText(f"⛔ Cancelado: {job.describe()}")
+        elif job.state == FAILED:
+            self.title_label.setText(f"❌ Error: {job.describe()}")
+            self.stats_label.setText(job.error or "")
+        
+        if self.current_job is None and not self.operation_queue.pending_jobs():
+            self.pause_button.setEnabled(False)
+            self.cancel_button.setEnabled(False)
+            self.hide_timer.start()
+    
+    def toggle_pause(self):
+        """Pausar o reanudar la operación en curso"""
+        job = self.current_job
+        if job is None:
+            return
+        if job.is_paused():
+            job.resume()
+            self.pause_button.setText("⏸️")
+        else:
+            job.pause()
+            self.pause_button.setText("▶️")
+    
+    def cancel_current(self):
+        """Cancelar la operación en curso"""
+        if self.current_job is not None:
+            self.current_job.cancel()
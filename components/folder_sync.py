@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Herramienta de sincronización de carpetas para el modo Easy
+"""
+
+from pathlib import Path
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                           QPushButton, QFrame, QTreeWidget, QTreeWidgetItem,
+                           QProgressBar, QFileDialog, QMessageBox, QHeaderView,
+                           QCheckBox)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
+
+from core.folder_sync import FolderSync, COMPARING, COPY, UPDATE, DELETE, MKDIR
+from core.file_operations import is_same_or_inside
+from components.file_explorer import format_size
+
+
+# Filas del informe que se muestran (el resumen cuenta todas)
+MAX_REPORT_ROWS = 2000
+
+ACTION_LABELS = {
+    COPY: "➕ Nuevo",
+    UPDATE: "🔁 Cambiado",
+    DELETE: "🗑️ Eliminar",
+    MKDIR: "📁 Crear carpeta",
+}
+
+
+class FolderSyncWidget(QWidget):
+    """Sincroniza una carpeta de origen con una de destino (p. ej. una copia en USB)
+    
+    Simular muestra las diferencias sin tocar nada; Sincronizar copia solo
+    lo que cambió. La comparación y la copia se hacen en FolderSync.
+    """
+    
+    def __init__(self, theme_manager, current_theme, parent=None):
+        super().__init__(parent)
+        self.theme_manager = theme_manager
+        self.current_theme = current_theme
+        self.source_path = Path.home()
+        self.destination_path = None
+        self.worker = None
+        self.dry_run = False
+        
+        self.setup_ui()
+        self.apply_theme()
+    
+    def setup_ui(self):
+        """Crear la interfaz de la herramienta"""
+        self.setObjectName("modeWidget")
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(30, 30, 30, 30)
+        layout.setSpacing(15)
+        
+        # Título
+        title_frame = QFrame()
+        title_frame.setObjectName("titleFrame")
+        title_layout = QVBoxLayout(title_frame)
+        title_layout.setContentsMargins(20, 15, 20, 15)
+        
+        title = QLabel("🔄 SINCRONIZAR CARPETAS")
+        title.setObjectName("easyTitle")
+        title.setFont(QFont("Roboto", 18, QFont.Weight.Bold))
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title_layout.addWidget(title)
+        
+        subtitle = QLabel("Copia solo lo que cambió: ideal para copias de seguridad en un USB")
+        subtitle.setObjectName("subtitle")
+        subtitle.setFont(QFont("Roboto", 12, QFont.Weight.Normal))
+        subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title_layout.addWidget(subtitle)
+        
+        layout.addWidget(title_frame)
+        
+        # Panel principal
+        panel = QFrame()
+        panel.setObjectName("toolPanel")
+        panel_layout = QVBoxLayout(panel)
+        panel_layout.setContentsMargins(15, 15, 15, 15)
+        panel_layout.setSpacing(10)
+        
+        # Origen y destino
+        source_layout = QHBoxLayout()
+        self.source_label = QLabel(f"📤 {self.source_path}")
+        self.source_label.setObjectName("toolPath")
+        source_layout.addWidget(self.source_label, 1)
+        self.source_button = QPushButton("📂 Elegir origen")
+        self.source_button.setObjectName("actionButton")
+        self.source_button.setFont(QFont("Roboto", 12, QFont.Weight.Bold))
+        self.source_button.clicked.connect(self.choose_source)
+        source_layout.addWidget(self.source_button)
+        panel_layout.addLayout(source_layout)
+        
+        destination_layout = QHBoxLayout()
+        self.destination_label = QLabel("📥 Elige la carpeta de destino")
+        self.destination_label.setObjectName("toolPath")
+        destination_layout.addWidget(self.destination_label, 1)
+        self.destination_button = QPushButton("📂 Elegir destino")
+        self.destination_button.setObjectName("actionButton")
+        self.destination_button.setFont(QFont("Roboto", 12, QFont.Weight.Bold))
+        self.destination_button.clicked.connect(self.choose_destination)
+        destination_layout.addWidget(self.destination_button)
+        panel_layout.addLayout(destination_layout)
+        
+        # Opciones y acciones
+        controls_layout = QHBoxLayout()
+        controls_layout.setSpacing(10)
+        self.delete_check = QCheckBox("Eliminar del destino lo que ya no está en el origen")
+        self.delete_check.setObjectName("toolOption")
+        controls_layout.addWidget(self.delete_check, 1)
+        
+        self.simulate_button = QPushButton("🔍 Simular")
+        self.simulate_button.setObjectName("actionButton")
+        self.simulate_button.setFont(QFont("Roboto", 12, QFont.Weight.Bold))
+        self.simulate_button.setToolTip("Muestra las diferencias sin modificar nada")
+        self.simulate_button.clicked.connect(lambda: self.toggle_sync(dry_run=True))
+        controls_layout.addWidget(self.simulate_button)
+        
+        self.sync_button = QPushButton("🔄 Sincronizar")
+        self.sync_button.setObjectName("primaryButton")
+        self.sync_button.setFont(QFont("Roboto", 12, QFont.Weight.Bold))
+        self.sync_button.clicked.connect(lambda: self.toggle_sync(dry_run=False))
+        controls_layout.addWidget(self.sync_button)
+        panel_layout.addLayout(controls_layout)
+        
+        # Estado
+        self.status_label = QLabel("Elige origen y destino y pulsa Simular o Sincronizar.")
+        self.status_label.setObjectName("toolStatus")
+        self.status_label.setFont(QFont("JetBrains Mono", 10))
+        self.status_label.setWordWrap(True)
+        panel_layout.addWidget(self.status_label)
+        
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setObjectName("toolProgress")
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setFixedHeight(10)
+        self.progress_bar.hide()
+        panel_layout.addWidget(self.progress_bar)
+        
+        # Informe de diferencias
+        self.tree = QTreeWidget()
+        self.tree.setObjectName("toolTree")
+        self.tree.setFont(QFont("JetBrains Mono", 11))
+        self.tree.setRootIsDecorated(False)
+        self.tree.setHeaderLabels(["Acción", "Ruta", "Tamaño"])
+        self.tree.header().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        self.tree.header().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.tree.header().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        panel_layout.addWidget(self.tree, 1)
+        
+        layout.addWidget(panel, 1)
+        self.update_action_buttons()
+    
+    def apply_theme(self):
+        """Aplicar estilos según el tema seleccionado"""
+        from styles.mode_styles import get_tool_page_styles
+        theme = self.theme_manager.get_theme(self.current_theme)
+        self.setStyleSheet(get_tool_page_styles(theme))
+    
+    def change_theme(self, theme_name):
+        """Cambiar tema del widget"""
+        self.current_theme = theme_name
+        self.apply_theme()
+    
+    def choose_source(self):
+        """Elegir la carpeta que se copia"""
+        folder = QFileDialog.getExistingDirectory(self, "Carpeta de origen", str(self.source_path))
+        if folder:
+            self.source_path = Path(folder)
+            self.source_label.setText(f"📤 {self.source_path}")
+            self.update_action_buttons()
+    
+    def choose_destination(self):
+        """Elegir la carpeta que recibirá la copia"""
+        start = str(self.destination_path or self.source_path)
+        folder = QFileDialog.getExistingDirectory(self, "Carpeta de destino", start)
+        if folder:
+            self.destination_path = Path(folder)
+            self.destination_label.setText(f"📥 {self.destination_path}")
+            self.update_action_buttons()
+    
+    def update_action_buttons(self):
+        """Habilitar las acciones cuando hay origen y destino"""
+        running = self.worker is not None
+        ready = self.destination_path is not None
+        self.simulate_button.setEnabled(ready and (not running or self.dry_run))
+        self.sync_button.setEnabled(ready and (not running or not self.dry_run))
+        self.source_button.setEnabled(not running)
+        self.destination_button.setEnabled(not running)
+        self.delete_check.setEnabled(not running)
+    
+    def toggle_sync(self, dry_run):
+        """Iniciar la simulación o la sincronización, o cancelar la que está en curso"""
+        if self.worker is not None:
+            self.stop_sync()
+            self.status_label.setText("Sincronización cancelada.")
+            return
+        if self.destination_path is None:
+            return
+        if (is_same_or_inside(self.destination_path, self.source_path)
+                or is_same_or_inside(self.source_path, self.destination_path)):
+            QMessageBox.warning(self, "Sincronizar carpetas",
+                                "El origen y el destino no pueden estar uno dentro del otro.")
+            return
+        delete_extra = self.delete_check.isChecked()
+        if delete_extra and not dry_run:
+            reply = QMessageBox.question(self, "Confirmar sincronización",
+                                         "Se eliminarán del destino los archivos que ya no "
+                                         "estén en el origen.\n\n¿Continuar?",
+                                         QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                                         QMessageBox.StandardButton.No)
+            if reply != QMessageBox.StandardButton.Yes:
+                return
+        
+        self.tree.clear()
+        self.dry_run = dry_run
+        self.worker = FolderSync(self.source_path, self.destination_path,
+                                 delete_extra=delete_extra, dry_run=dry_run, parent=self)
+        self.worker.progress_changed.connect(self.on_progress_changed)
+        self.worker.plan_ready.connect(self.on_plan_ready)
+        self.worker.sync_finished.connect(self.on_sync_finished)
+        self.worker.finished.connect(self.on_worker_finished)
+        self.worker.start()
+        
+        button = self.simulate_button if dry_run else self.sync_button
+        button.setText("⛔ Cancelar")
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.show()
+        self.status_label.setText("Comparando carpetas...")
+        self.update_action_buttons()
+    
+    def stop_sync(self):
+        """Cancelar la sincronización (el hilo termina en segundo plano)"""
+        if self.worker is not None:
+            self.worker.progress_changed.disconnect(self.on_progress_changed)
+            self.worker.plan_ready.disconnect(self.on_plan_ready)
+            self.worker.sync_finished.disconnect(self.on_sync_finished)
+            self.worker.cancel()
+            self.worker = None
+        self.simulate_button.setText("🔍 Simular")
+        self.sync_button.setText("🔄 Sincronizar")
+        self.progress_bar.hide()
+        self.update_action_buttons()
+    
+    def on_worker_finished(self):
+        """Liberar el hilo cuando termina"""
+        worker = self.sender()
+        if worker is self.worker:
+            self.stop_sync()
+        worker.deleteLater()
+    
+    def on_progress_changed(self, phase, done, total):
+        """Mostrar el avance de la comparación o de la copia"""
+        if phase == COMPARING:
+            self.status_label.setText("Comparando carpetas...")
+            return
+        if total:
+            # QProgressBar usa enteros de 32 bits: se trabaja en KiB
+            self.progress_bar.setRange(0, max(total // 1024, 1))
+            self.progress_bar.setValue(done // 1024)
+        self.status_label.setText(f"Sincronizando... {format_size(done)} de {format_size(total)}")
+    
+    def on_plan_ready(self, plan):
+        """Mostrar el informe de diferencias (acotado a MAX_REPORT_ROWS filas)"""
+        items = []
+        total = 0
+        for action in plan.actions():
+            total += 1
+            if len(items) >= MAX_REPORT_ROWS:
+                continue
+            path = action.relative + ("/" if action.is_dir else "")
+            items.append(QTreeWidgetItem([ACTION_LABELS[action.kind], path,
+                                          format_size(action.size) if action.size else ""]))
+        if total > MAX_REPORT_ROWS:
+            items.append(QTreeWidgetItem(["", f"… y {total - MAX_REPORT_ROWS} cambios más", ""]))
+        self.tree.addTopLevelItems(items)
+        if self.dry_run:
+            return
+        self.status_label.setText(f"Sincronizando {total} cambios...")
+    
+    def on_sync_finished(self, summary):
+        """Resumen al terminar"""
+        changes = summary.copied + summary.updated + summary.deleted
+        if self.dry_run:
+            if changes:
+                text = (f"🔍 Simulación: {summary.copied} nuevos · {summary.updated} cambiados · "
+                        f"{summary.deleted} a eliminar · {summary.unchanged} sin cambios")
+            else:
+                text = f"✅ Ya están sincronizadas ({summary.unchanged} archivos sin cambios)"
+        else:
+            text = (f"✅ {summary.copied} nuevos · {summary.updated} actualizados · "
+                    f"{summary.deleted} eliminados · {summary.unchanged} sin cambios · "
+                    f"{format_size(summary.bytes_written)} escritos, "
+                    f"{format_size(max(summary.bytes_skipped, 0))} sin copiar")
+        if summary.errors:
+            details = "\n".join(f"  • {path}: {message}" for path, message in summary.errors[:10])
+            if len(summary.errors) > 10:
+                details += f"\n  … y {len(summary.errors) - 10} más"
+            text = f"⚠️ {len(summary.errors)} elemento(s) con errores · " + text
+            QMessageBox.warning(self, "Sincronizar carpetas",
+                                f"{len(summary.errors)} elemento(s) no se pudieron sincronizar:\n\n{details}")
+        self.status_label.setText(text)
+    
+    def cleanup(self):
+        """Detener la sincronización en curso"""
+        worker = self.worker
+        self.stop_sync()
+        if worker is not None:
+            worker.wait()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Diálogo "Abrir con…": aplicaciones recomendadas para el tipo y el resto
+"""
+
+import os
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+                             QListWidget, QListWidgetItem, QPushButton)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QIcon
+
+from core.desktop_apps import desktop_app_index
+
+
+def _app_icon(app):
+    """Icono del tema o de una ruta absoluta (se carga al pintarlo)"""
+    if not app.icon:
+        return QIcon()
+    if os.path.isabs(app.icon):
+        return QIcon(app.icon)
+    return QIcon.fromTheme(app.icon)
+
+
+class OpenWithDialog(QDialog):
+    """Elegir la aplicación con la que abrir un archivo
+    
+    Todo sale del índice de aplicaciones ya cargado en memoria, así que el
+    diálogo se muestra sin leer ningún .desktop.
+    """
+    
+    def __init__(self, file_path, mime, theme, parent=None):
+        super().__init__(parent)
+        self.theme = theme
+        self.setObjectName("openWithDialog")
+        self.setWindowTitle("Abrir con…")
+        self.resize(460, 520)
+        
+        self.setup_ui(os.path.basename(file_path), mime)
+        self.populate(mime)
+        self.apply_theme()
+    
+    def setup_ui(self, name, mime):
+        """Crear el filtro y la lista de aplicaciones"""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(8)
+        
+        title = QLabel(f"📄 {name}\n🔖 {mime}")
+        title.setObjectName("openWithTitle")
+        title.setWordWrap(True)
+        layout.addWidget(title)
+        
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("🔍 Filtrar aplicaciones")
+        self.filter_edit.textChanged.connect(self.apply_filter)
+        layout.addWidget(self.filter_edit)
+        
+        self.app_list = QListWidget()
+        self.app_list.setObjectName("openWithList")
+        self.app_list.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.app_list.itemSelectionChanged.connect(self.update_open_button)
+        layout.addWidget(self.app_list, 1)
+        
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        cancel_button = QPushButton("Cancelar")
+        cancel_button.setObjectName("actionButton")
+        cancel_button.clicked.connect(self.reject)
+        self.open_button = QPushButton("📂 Abrir")
+        self.open_button.setObjectName("primaryButton")
+        self.open_button.setDefault(True)
+        self.open_button.clicked.connect(self.accept)
+        buttons.addWidget(cancel_button)
+        buttons.addWidget(self.open_button)
+        layout.addLayout(buttons)
+    
+    def populate(self, mime):
+        """Recomendadas para el tipo primero y luego las demás"""
+        recommended = desktop_app_index.applications_for(mime)
+        recommended_ids = {app.desktop_id for app in recommended}
+        others = [app for app in desktop_app_index.all_applications()
+                  if app.desktop_id not in recommended_ids]
+        
+        for title, apps in (("RECOMENDADAS", recommended), ("OTRAS APLICACIONES", others)):
+            if not apps:
+                continue
+            header = QListWidgetItem(title)
+            header.setFlags(Qt.ItemFlag.NoItemFlags)
+            self.app_list.addItem(header)
+            for app in apps:
+                item = QListWidgetItem(_app_icon(app), app.name)
+                item.setData(Qt.ItemDataRole.UserRole, app)
+                item.setToolTip(f"{app.desktop_id}\n{app.exec_line}")
+                self.app_list.addItem(item)
+        
+        if not desktop_app_index.is_ready():
+            loading = QListWidgetItem("⏳ Buscando aplicaciones instaladas… vuelve a abrir en un momento")
+            loading.setFlags(Qt.ItemFlag.NoItemFlags)
+            self.app_list.addItem(loading)
+        
+        if recommended:
+            self.app_list.setCurrentRow(1)
+        self.update_open_button()
+    
+    def apply_filter(self, text):
+        """Ocultar las aplicaciones cuyo nombre no contiene el texto"""
+        text = text.casefold()
+        for row in range(self.app_list.count()):
+            item = self.app_list.item(row)
+            app = item.data(Qt.ItemDataRole.UserRole)
+            if app is None:
+                # Los títulos de sección solo se ven sin filtro
+                item.setHidden(bool(text))
+            else:
+                item.setHidden(text not in app.name.casefold()
+                               and text not in app.desktop_id.casefold())
+        current = self.app_list.currentItem()
+        if current is None or current.isHidden():
+            for row in range(self.app_list.count()):
+                item = self.app_list.item(row)
+                if not item.isHidden() and item.data(Qt.ItemDataRole.UserRole) is not None:
+                    self.app_list.setCurrentItem(item)
+                    break
+        self.update_open_button()
+    
+    def on_item_double_clicked(self, item):
+        """Abrir directamente con la aplicación pulsada"""
+        if item.data(Qt.ItemDataRole.UserRole) is not None:
+            self.accept()
+    
+    def update_open_button(self):
+        self.open_button.setEnabled(self.selected_app() is not None)
+    
+    def selected_app(self):
+        """Aplicación elegida (o None)"""
+        item = self.app_list.currentItem()
+        if item is None or item.isHidden():
+            return None
+        return item.data(Qt.ItemDataRole.UserRole)
+    
+    def accept(self):
+        if self.selected_app() is not None:
+            super().accept()
+    
+    def apply_theme(self):
+        """Aplicar los estilos del tema actual"""
+        from styles.mode_styles import get_form_styles, get_open_with_styles
+        self.setStyleSheet(get_form_styles(self.theme) + get_open_with_styles(self.theme))
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Barra de direcciones editable del explorador con completado de carpetas
+"""
+
+import os
+from PyQt6.QtWidgets import QLineEdit, QCompleter
+from PyQt6.QtCore import Qt, QEvent, QTimer, QStringListModel, QThread, pyqtSignal
+
+from core.path_completion import PathCompleter, split_path_text, matching_names
+
+
+class PathBar(QLineEdit):
+    """Ruta de la carpeta mostrada que se puede escribir
+    
+    Las subcarpetas de lo que se escribe llegan de un PathCompleter en
+    segundo plano y se ofrecen en una lista desplegable. Tab completa el
+    nombre hasta donde todas las opciones coinciden; si solo queda una
+    carpeta, se abre sin más y se sigue escribiendo dentro de ella. Enter
+    abre la ruta escrita y Escape la descarta.
+    """
+    
+    path_activated = pyqtSignal(str)  # Ruta escrita o completada
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("pathEdit")
+        self.current_path = ""
+        # Si hay texto escrito que no es la ruta mostrada
+        self.editing = False
+        # Subcarpetas conocidas: (carpeta, con ocultos) -> nombres
+        self.known_key = None
+        self.known_names = ()
+        # Tab pulsado antes de que llegaran las subcarpetas
+        self.tab_pending = False
+        
+        self.completion_model = QStringListModel(self)
+        completer = QCompleter(self.completion_model, self)
+        completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseSensitive)
+        completer.setMaxVisibleItems(12)
+        completer.popup().setObjectName("pathCompletions")
+        completer.activated.connect(self.on_completion_activated)
+        self.setCompleter(completer)
+        
+        # Pedir subcarpetas a cada pulsación sería leer carpetas a medio escribir
+        self.completion_timer = QTimer(self)
+        self.completion_timer.setSingleShot(True)
+        self.completion_timer.setInterval(60)
+        self.completion_timer.timeout.connect(self.update_completions)
+        
+        self.path_completer = PathCompleter(parent=self)
+        self.path_completer.completions_ready.connect(self.on_completions_ready)
+        self.path_completer.start(QThread.Priority.LowPriority)
+        
+        self.textEdited.connect(self.on_text_edited)
+        self.returnPressed.connect(self.activate_text)
+    
+    def set_path(self, path):
+        """Mostrar la carpeta abierta (sin pisar lo que se está escribiendo)"""
+        self.current_path = str(path)
+        if not self.editing:
+            self.show_current_path()
+    
+    def show_current_path(self):
+        """Volver a mostrar la ruta actual con su final a la vista"""
+        self.editing = False
+        self.setText(self.current_path)
+        self.setCursorPosition(len(self.current_path))
+    
+    def on_text_edited(self, text):
+        self.editing = True
+        self.completion_timer.start()
+    
+    def split_text(self):
+        """Carpeta (expandida), parte escrita de la carpeta y principio del nombre"""
+        text = self.text()
+        directory, partial_name = split_path_text(text)
+        return directory, text[:len(text) - len(partial_name)], partial_name
+    
+    def update_completions(self):
+        """Ofrecer las subcarpetas ya conocidas o pedirlas al hilo"""
+        directory, _, partial_name = self.split_text()
+        if directory is None:
+            self.completion_model.setStringList([])
+            return
+        hidden = partial_name.startswith(".")
+        # Con los ocultos ya leídos también sirven para lo que no lo es
+        if self.known_key in ((directory, hidden), (directory, True)):
+            self.show_completions()
+        else:
+            self.path_completer.request(directory, hidden)
+    
+    def on_completions_ready(self, directory, hidden, names):
+        """Guardar las subcarpetas recibidas si siguen siendo las de lo escrito"""
+        current_directory, _, _ = self.split_text()
+        if directory != current_directory:
+            return
+        self.known_key = (directory, hidden)
+        self.known_names = names
+        if self.tab_pending:
+            self.tab_pending = False
+            self.complete_text()
+        else:
+            self.show_completions()
+    
+    def current_matches(self):
+        """Subcarpetas que encajan con lo escrito (None si aún no se conocen)"""
+        directory, _, partial_name = self.split_text()
+        if directory is None or self.known_key is None or self.known_key[0] != directory:
+            return None
+        return matching_names(self.known_names, partial_name)
+    
+    def show_completions(self):
+        """Rellenar la lista desplegable con lo que encaja"""
+        matches = self.current_matches()
+        if matches is None or not self.hasFocus():
+            return
+        _, typed_directory, partial_name = self.split_text()
+        completer = self.completer()
+        if not matches or matches == [partial_name]:
+            completer.popup().hide()
+            return
+        # Las opciones conservan lo escrito ("~" incluido) para que el filtro encaje
+        self.completion_model.setStringList([typed_directory + name for name in matches])
+        completer.setCompletionPrefix(self.text())
+        completer.complete()
+    
+    def complete_text(self):
+        """Completar con Tab hasta donde coinciden todas las opciones"""
+        matches = self.current_matches()
+        if matches is None:
+            # Las subcarpetas aún no han llegado: se completa al recibirlas
+            self.tab_pending = True
+            self.update_completions()
+            return
+        if not matches:
+            return
+        _, typed_directory, partial_name = self.split_text()
+        self.completer().popup().hide()
+        if len(matches) == 1:
+            self.enter_directory(typed_directory + matches[0])
+            return
+        common = os.path.commonprefix(matches)
+        if len(common) > len(partial_name):
+            self.setText(typed_directory + common)
+            self.editing = True
+        self.show_completions()
+    
+    def enter_directory(self, text):
+        """Abrir una carpeta completada y seguir escribiendo dentro de ella"""
+        self.setText(text.rstrip(os.sep) + os.sep)
+        self.editing = True
+        self.path_activated.emit(os.path.expanduser(text))
+        self.update_completions()
+    
+    def on_completion_activated(self, text):
+        """Elegir una carpeta de la lista desplegable"""
+        # QLineEdit pone el texto elegido después de esta señal
+        QTimer.singleShot(0, lambda: self.enter_directory(text))
+    
+    def activate_text(self):
+        """Abrir la ruta escrita con Enter"""
+        text = self.text().strip()
+        if not text:
+            self.show_current_path()
+            return
+        # Una ruta relativa se entiende desde la carpeta mostrada
+        path = os.path.normpath(os.path.join(self.current_path, os.path.expanduser(text)))
+        self.editing = False
+        self.path_activated.emit(path)
+        self.show_current_path()
+    
+    def event(self, event):
+        # Tab se consume aquí: si no, QWidget lo usa para pasar al siguiente control
+        if (event.type() == QEvent.Type.KeyPress and event.key() == Qt.Key.Key_Tab
+                and not event.modifiers() & ~Qt.KeyboardModifier.KeypadModifier):
+            self.complete_text()
+            return True
+        return super().event(event)
+    
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key.Key_Escape:
+            self.tab_pending = False
+            self.show_current_path()
+            self.selectAll()
+            return
+        super().keyPressEvent(event)
+    
+    def focusOutEvent(self, event):
+        super().focusOutEvent(event)
+        # Al abrir la lista desplegable el foco no se va de verdad
+        if event.reason() != Qt.FocusReason.PopupFocusReason:
+            self.tab_pending = False
+            self.show_current_path()
+    
+    def cleanup(self):
+        """Detener el hilo de completado"""
+        self.path_completer.cancel()
+        self.path_completer.wait()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Panel de lugares del explorador: carpetas del usuario y unidades montadas
+"""
+
+import os
+from PyQt6.QtWidgets import QFrame, QVBoxLayout, QLabel, QListWidget, QListWidgetItem
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtGui import QFont
+
+from core.places import PlacesMonitor
+
+
+# Celdas de la barra de ocupación dibujada con texto
+USAGE_BAR_CELLS = 10
+
+SECTION_TITLES = {
+    "places": "CARPETAS",
+    "devices": "UNIDADES",
+}
+
+
+def _format_bytes(size):
+    """Formatear un tamaño en bytes de forma compacta"""
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if size < 1024 or unit == "TB":
+            return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} {unit}"
+        size /= 1024
+
+
+class PlacesSidebar(QFrame):
+    """Lista de lugares con el espacio libre de cada unidad
+    
+    La lista y el espacio los mantiene un PlacesMonitor en segundo plano;
+    aquí solo se pintan, así que una unidad colgada nunca bloquea el panel.
+    """
+    
+    place_activated = pyqtSignal(str)  # Ruta del lugar elegido
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.items_by_path = {}
+        self.usage = {}
+        self.current_path = None
+        
+        self.setup_ui()
+        
+        self.monitor = PlacesMonitor(parent=self)
+        self.monitor.places_changed.connect(self.on_places_changed)
+        self.monitor.usage_changed.connect(self.on_usage_changed)
+        self.monitor.start(QThread.Priority.LowPriority)
+    
+    def setup_ui(self):
+        """Crear la interfaz del panel"""
+        self.setObjectName("placesFrame")
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(5, 5, 5, 5)
+        layout.setSpacing(5)
+        
+        title = QLabel("📌 LUGARES")
+        title.setObjectName("placesTitle")
+        title.setFont(QFont("Roboto", 11, QFont.Weight.Bold))
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(title)
+        
+        self.places_list = QListWidget()
+        self.places_list.setObjectName("placesList")
+        self.places_list.setWordWrap(True)
+        self.places_list.itemClicked.connect(self.on_item_clicked)
+        layout.addWidget(self.places_list)
+    
+    def on_places_changed(self, places):
+        """Rehacer la lista tras un cambio de montajes"""
+        self.places_list.clear()
+        self.items_by_path = {}
+        section = None
+        for place in places:
+            place_section = "places" if place.mount is None else "devices"
+            if place_section != section:
+                section = place_section
+                header = QListWidgetItem(SECTION_TITLES[section])
+                header.setFlags(Qt.ItemFlag.NoItemFlags)
+                self.places_list.addItem(header)
+            item = QListWidgetItem()
+            item.setData(Qt.ItemDataRole.UserRole, place)
+            self.places_list.addItem(item)
+            self.items_by_path[place.path] = item
+            self.update_item(item)
+        self.set_current_path(self.current_path)
+    
+    def on_usage_changed(self, usage):
+        """Actualizar el espacio mostrado sin rehacer la lista"""
+        self.usage = usage
+        for item in self.items_by_path.values():
+            self.update_item(item)
+    
+    def update_item(self, item):
+        """Texto y tooltip de un lugar con su espacio conocido"""
+        place = item.data(Qt.ItemDataRole.UserRole)
+        usage = self.usage.get(place.path)
+        text = f"{place.icon}  {place.label}"
+        tooltip = f"📍 {place.path}"
+        if place.mount is not None:
+            tooltip += f"\n💿 {place.mount.source} ({place.mount.fs_type})"
+        if usage is not None and not usage.responsive:
+            text += "\n⚠️ No responde"
+            tooltip += "\n⚠️ La unidad no responde"
+        elif usage is not None and usage.total and place.kind != "user":
+            used = usage.total - usage.free
+            filled = round(USAGE_BAR_CELLS * used / usage.total)
+            bar = "█" * filled + "░" * (USAGE_BAR_CELLS - filled)
+            text += f"\n{bar} {_format_bytes(usage.free)} libres"
+            tooltip += (f"\n📊 {_format_bytes(used)} usados de {_format_bytes(usage.total)}"
+                        f" ({100 * used / usage.total:.0f}%)")
+        item.setText(text)
+        item.setToolTip(tooltip)
+    
+    def set_current_path(self, path):
+        """Marcar el lugar que contiene la carpeta mostrada"""
+        self.current_path = path
+        best = None
+        if path is not None:
+            path = str(path)
+            for place_path in self.items_by_path:
+                inside = path == place_path or path.startswith(place_path.rstrip(os.sep) + os.sep)
+                if inside and (best is None or len(place_path) > len(best)):
+                    best = place_path
+        self.places_list.blockSignals(True)
+        if best is None:
+            self.places_list.clearSelection()
+        else:
+            self.places_list.setCurrentItem(self.items_by_path[best])
+        self.places_list.blockSignals(False)
+    
+    def on_item_clicked(self, item):
+        """Abrir el lugar elegido"""
+        place = item.data(Qt.ItemDataRole.UserRole)
+        if place is not None:
+            self.place_activated.emit(place.path)
+            # Al volver a una unidad se comprueba enseguida su espacio
+            self.monitor.refresh()
+    
+    def cleanup(self):
+        """Detener la vigilancia de montajes"""
+        self.monitor.cancel()
+        self.monitor.wait()
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Panel de vista previa del archivo seleccionado en el explorador
+"""
+
+import os
+from PyQt6.QtWidgets import (QFrame, QVBoxLayout, QHBoxLayout, QLabel,
+                           QPushButton, QPlainTextEdit, QTextEdit, QSpinBox)
+from PyQt6.QtGui import QFont, QTextCursor, QTextFormat
+
+from core.file_preview import (FilePreview, PreviewTask, PAGE_BYTES,
+                               HEAD_BYTES, TAIL_BYTES, HEX_ROW_BYTES)
+
+
+# Líneas que se muestran por encima de la línea a la que se salta
+JUMP_CONTEXT_LINES = 3
+
+
+def _format_bytes(size):
+    """Formatear un tamaño en bytes de forma compacta"""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def _open_preview(path):
+    """Abrir el archivo y preparar la primera vista (en un hilo)"""
+    preview = FilePreview(path)
+    try:
+        if preview.is_binary():
+            return preview, True, preview.hex_dump(0, PAGE_BYTES), "", min(preview.size, PAGE_BYTES)
+        head, tail, head_end = preview.head_and_tail()
+        return preview, False, head, tail, head_end
+    except Exception:
+        preview.close()
+        raise
+
+
+def _read_page(preview, offset, binary):
+    """Leer una página de texto o de volcado hexadecimal (en un hilo)"""
+    if binary:
+        offset -= offset % HEX_ROW_BYTES
+        return preview.hex_dump(offset, PAGE_BYTES), offset, min(preview.size, offset + PAGE_BYTES)
+    return preview.page(offset)
+
+
+def _read_line(preview, line_number, progress=None, cancel_event=None):
+    """Localizar una línea con el índice y leer su página (en un hilo)
+    
+    Si el archivo se cierra o la petición se cancela mientras se construye
+    el índice, la búsqueda termina sin resultado.
+    """
+    offset = preview.offset_of_line(line_number, cancel_event, progress)
+    if offset is None:
+        return None
+    return preview.page(offset)
+
+
+class PreviewPane(QFrame):
+    """Vista previa de texto o hexadecimal sin cargar el archivo en memoria
+    
+    Toda lectura se hace en un PreviewTask; cada petición lleva un
+    identificador y los resultados de peticiones antiguas se descartan.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.preview = None
+        self.current_path = None
+        self.binary = False
+        self.page_start = 0
+        self.page_end = 0
+        self.request_id = 0
+        self.result_handler = None
+        self.tasks = set()
+        # Línea a la que saltar en cuanto se abra el archivo
+        self.pending_line = None
+        # Línea resaltada dentro de la página que se está pidiendo
+        self.target_line = None
+        self.setup_ui()
+        self.show_message("Selecciona un archivo para ver su contenido")
+    
+    def setup_ui(self):
+        """Crear la interfaz del panel"""
+        self.setObjectName("previewFrame")
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(5)
+        
+        self.title_label = QLabel("👁️ Vista previa")
+        self.title_label.setObjectName("sectionTitle")
+        self.title_label.setFont(QFont("Roboto", 12, QFont.Weight.Bold))
+        layout.addWidget(self.title_label)
+        
+        self.info_label = QLabel("")
+        self.info_label.setObjectName("previewInfo")
+        self.info_label.setFont(QFont("JetBrains Mono", 9))
+        layout.addWidget(self.info_label)
+        
+        self.text_view = QPlainTextEdit()
+        self.text_view.setObjectName("previewText")
+        self.text_view.setReadOnly(True)
+        self.text_view.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.text_view.setFont(QFont("JetBrains Mono", 10))
+        layout.addWidget(self.text_view, 1)
+        
+        nav_layout = QHBoxLayout()
+        nav_layout.setSpacing(4)
+        
+        self.first_button = self._nav_button("⏮", "Inicio del archivo", self.show_first_page)
+        self.prev_button = self._nav_button("◀", "Página anterior", self.show_previous_page)
+        self.next_button = self._nav_button("▶", "Página siguiente", self.show_next_page)
+        self.last_button = self._nav_button("⏭", "Final del archivo", self.show_last_page)
+        for button in (self.first_button, self.prev_button, self.next_button, self.last_button):
+            nav_layout.addWidget(button)
+        nav_layout.addStretch()
+        
+        self.line_spin = QSpinBox()
+        self.line_spin.setObjectName("previewLineSpin")
+        self.line_spin.setRange(1, 2**31 - 1)
+        self.line_spin.setToolTip("Número de línea")
+        nav_layout.addWidget(self.line_spin)
+        
+        self.goto_button = self._nav_button("↪", "Ir a la línea", self.go_to_line)
+        self.line_spin.lineEdit().returnPressed.connect(self.go_to_line)
+        nav_layout.addWidget(self.goto_button)
+        
+        layout.addLayout(nav_layout)
+        self._update_navigation()
+    
+    def _nav_button(self, text, tooltip, slot):
+        """Crear un botón de navegación pequeño"""
+        button = QPushButton(text)
+        button.setObjectName("navButton")
+        button.setFixedSize(32, 28)
+        button.setToolTip(tooltip)
+        button.clicked.connect(slot)
+        return button
+    
+    def _update_navigation(self):
+        """Habilitar la navegación según la página mostrada"""
+        has_file = self.preview is not None and self.preview.size > 0
+        self.first_button.setEnabled(has_file and self.page_start > 0)
+        self.prev_button.setEnabled(has_file and self.page_start > 0)
+        self.next_button.setEnabled(has_file and self.page_end < self.preview.size)
+        self.last_button.setEnabled(has_file and self.page_end < self.preview.size)
+        self.line_spin.setEnabled(has_file and not self.binary)
+        self.goto_button.setEnabled(has_file and not self.binary)
+    
+    def _start_task(self, function, *args, on_result, watch_progress=False):
+        """Lanzar una lectura en segundo plano descartando las anteriores"""
+        self.request_id += 1
+        self.result_handler = on_result
+        task = PreviewTask(self.request_id, function, *args, path=self.current_path,
+                           watch_progress=watch_progress, parent=self)
+        task.result_ready.connect(self._on_task_result)
+        task.failed.connect(self._on_task_failed)
+        task.finished.connect(lambda: self.tasks.discard(task))
+        task.finished.connect(task.deleteLater)
+        self.tasks.add(task)
+        task.start()
+    
+    def _on_task_result(self, request_id, result):
+        """Entregar el resultado de la última petición a su manejador"""
+        if request_id == self.request_id:
+            self.result_handler(result)
+        elif isinstance(result, tuple) and isinstance(result[0], FilePreview):
+            # Vista previa abierta por una petición ya descartada
+            result[0].close()
+    
+    def _on_task_failed(self, request_id, message):
+        """Mostrar el error de la última petición"""
+        if request_id == self.request_id:
+            self.show_message(f"No se puede previsualizar: {message}")
+    
+    def _close_preview(self):
+        """Liberar el archivo mostrado"""
+        if self.preview is not None:
+            self.preview.close()
+            self.preview = None
+        self.page_start = self.page_end = 0
+    
+    def show_message(self, message):
+        """Mostrar un mensaje en lugar de contenido"""
+        self._close_preview()
+        self.title_label.setText("👁️ Vista previa")
+        self.info_label.setText("")
+        self.text_view.setPlainText(message)
+        self._update_navigation()
+    
+    def clear(self):
+        """Vaciar el panel (sin selección o selección múltiple)"""
+        self.request_id += 1
+        self.current_path = None
+        self.show_message("Selecciona un archivo para ver su contenido")
+    
+    def show_file(self, path):
+        """Previsualizar un archivo; la apertura y lectura van en segundo plano"""
+        self._close_preview()
+        self.current_path = path
+        self.pending_line = None
+        self.title_label.setText(f"👁️ {os.path.basename(path)}")
+        self.info_label.setText("Cargando...")
+        self.text_view.setPlainText("")
+        self._update_navigation()
+        self._start_task(_open_preview, path, on_result=self._on_preview_opened)
+    
+    def show_file_at_line(self, path, line_number):
+        """Previsualizar un archivo por una línea (p. ej. una coincidencia de búsqueda)"""
+        self.line_spin.setValue(line_number)
+        if path != self.current_path or self.preview is None:
+            self.show_file(path)
+            self.pending_line = line_number
+        elif not self.binary:
+            self.go_to_line()
+    
+    def _on_preview_opened(self, result):
+        """Mostrar la primera vista de un archivo"""
+        self.preview, self.binary, head, tail, self.page_end = result
+        self.page_start = 0
+        
+        if tail:
+            # Archivo grande: principio y final, el resto se recorre por páginas
+            omitted = self.preview.size - HEAD_BYTES - TAIL_BYTES
+            self.text_view.setPlainText(
+                f"{head}\n··· {_format_bytes(omitted)} sin mostrar (usa ▶ o ⏭) ···\n\n{tail}")
+        else:
+            self.text_view.setPlainText(head)
+        
+        self._update_info()
+        self._update_navigation()
+        
+        if self.pending_line is not None and not self.binary:
+            self.pending_line = None
+            self.go_to_line()
+    
+    def _update_info(self):
+        """Tipo, tamaño y posición de la página mostrada"""
+        size = self.preview.size
+        kind = "Binario (hex)" if self.binary else "Texto"
+        parts = [kind, _format_bytes(size)]
+        if size > 0 and (self.page_start > 0 or self.page_end < size):
+            percent = self.page_end * 100 // size
+            parts.append(f"{_format_bytes(self.page_start)}–{_format_bytes(self.page_end)} ({percent}%)")
+        self.info_label.setText("  ·  ".join(parts))
+    
+    def _load_page(self, offset):
+        """Pedir una página a partir de un offset"""
+        if self.preview is None:
+            return
+        offset = max(0, min(offset, self.preview.size))
+        self._start_task(_read_page, self.preview, offset, self.binary,
+                         on_result=self._on_page_loaded)
+    
+    def _on_page_loaded(self, result):
+        """Mostrar una página ya leída"""
+        if result is None or self.preview is None:
+            return
+        text, self.page_start, self.page_end = result
+        self.text_view.setPlainText(text)
+        self.text_view.setExtraSelections([])
+        self._update_info()
+        self._update_navigation()
+    
+    def show_first_page(self):
+        """Volver al principio del archivo"""
+        self._load_page(0)
+    
+    def show_previous_page(self):
+        """Página anterior a la mostrada"""
+        self._load_page(self.page_start - PAGE_BYTES)
+    
+    def show_next_page(self):
+        """Página siguiente a la mostrada"""
+        self._load_page(self.page_end)
+    
+    def show_last_page(self):
+        """Última página del archivo"""
+        if self.preview is not None:
+            self._load_page(self.preview.size - PAGE_BYTES)
+    
+    def go_to_line(self):
+        """Saltar a una línea usando el índice de líneas"""
+        if self.preview is None or self.binary:
+            return
+        self.target_line = self.line_spin.value()
+        self.info_label.setText(f"Buscando línea {self.target_line}...")
+        # La página empieza unas líneas antes para ver la pedida en contexto
+        self._start_task(_read_line, self.preview, max(1, self.target_line - JUMP_CONTEXT_LINES),
+                         on_result=self._on_line_loaded, watch_progress=True)
+    
+    def _on_line_loaded(self, result):
+        """Mostrar la página de la línea pedida"""
+        if result is None:
+            self._update_info()
+            self.info_label.setText(self.info_label.text() + "  ·  La línea no existe")
+            return
+        self._on_page_loaded(result)
+        self._highlight_line(min(self.target_line - 1, JUMP_CONTEXT_LINES))
+    
+    def _highlight_line(self, block_number):
+        """Resaltar una línea de la página mostrada y llevar el cursor a ella"""
+        block = self.text_view.document().findBlockByNumber(block_number)
+        if not block.isValid():
+            return
+        cursor = QTextCursor(block)
+        selection = QTextEdit.ExtraSelection()
+        selection.format.setBackground(self.text_view.palette().highlight())
+        selection.format.setForeground(self.text_view.palette().highlightedText())
+        selection.format.setProperty(QTextFormat.Property.FullWidthSelection, True)
+        selection.cursor = cursor
+        self.text_view.setExtraSelections([selection])
+        self.text_view.setTextCursor(cursor)
+        self.text_view.centerCursor()
+    
+    def cleanup(self):
+        """Detener lecturas en curso y liberar el archivo"""
+        self.request_id += 1
+        # Cerrar el mapeo primero hace que un índice a medio construir se detenga
+        self._close_preview()
+        for task in list(self.tasks):
+            task.cancel()
+        for task in list(self.tasks):
+            task.wait()
@@ -2,8 +2,57 @@
 Inicializador del módulo core
 """
 
+from .archives import ArchiveCache, ArchiveIndex, MemberExtractor
+from .bulk_rename import RenamePlan, RenameRule
+from .checksums import ChecksumWorker
 from .command_runner import CommandRunner
+from .content_search import ContentSearcher
+from .desktop_apps import AppIndexLoader, DesktopAppIndex
+from .dir_size import DirSizeCache, DirSizeWorker
+from .directory_cache import DirectoryCache, ListingPrefetcher, ListingWorker
+from .disk_usage import DiskUsageScanner, DiskUsageTree
+from .duplicates import DuplicateFinder
+from .file_operations import FileOperationQueue
+from .file_preview import FilePreview
+from .file_types import FileTypeCache, FileTypeWorker
+from .folder_sync import FolderSync
+from .fs_guard import FilesystemGuard, MountUnresponsive
+from .journal import OperationJournal
+from .path_completion import PathCompleter
+from .places import PlacesMonitor
+from .script_metadata import ScriptMetadataCache, ScriptScanner
+from .thumbnails import ThumbnailLoader
 
 __all__ = [
-    'CommandRunner'
+    'ArchiveCache',
+    'ArchiveIndex',
+    'MemberExtractor',
+    'ChecksumWorker',
+    'CommandRunner',
+    'ContentSearcher',
+    'AppIndexLoader',
+    'DesktopAppIndex',
+    'DirSizeCache',
+    'DirSizeWorker',
+    'DirectoryCache',
+    'ListingPrefetcher',
+    'ListingWorker',
+    'DiskUsageScanner',
+    'DiskUsageTree',
+    'DuplicateFinder',
+    'FileOperationQueue',
+    'FilePreview',
+    'FileTypeCache',
+    'FileTypeWorker',
+    'FilesystemGuard',
+    'FolderSync',
+    'MountUnresponsive',
+    'OperationJournal',
+    'PathCompleter',
+    'PlacesMonitor',
+    'RenamePlan',
+    'RenameRule',
+    'ScriptMetadataCache',
+    'ScriptScanner',
+    'ThumbnailLoader'
 ]
@@ -0,0 +1,706 @@
+#!/usr/bin/env python3
+"""
+Archivos comprimidos (zip y tar) como carpetas virtuales
+
+Solo se leen las tablas de miembros: el directorio central de un zip (al
+final del archivo, sin tocar los datos) o las cabeceras de un tar, saltando
+el contenido de cada miembro. Las tablas se guardan en una caché indexada
+por ruta interna y cada miembro se extrae por bloques sin descomprimir el
+resto del archivo.
+"""
+
+import bz2
+import gzip
+import hashlib
+import lzma
+import os
+import re
+import shutil
+import struct
+import threading
+import time
+import zipfile
+import zlib
+from collections import namedtuple, OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+CHUNK_SIZE = 1024 * 1024
+
+# Cada cuántos miembros se informa del progreso y se revisa la cancelación
+PROGRESS_INTERVAL = 256
+
+# Límites de la caché de miembros extraídos: tamaño total y días sin usar
+EXTRACTION_CACHE_BYTES = 2 * 1024 ** 3
+EXTRACTION_CACHE_DAYS = 7
+
+# Sufijos de tar comprimido y su compresión
+TAR_SUFFIXES = {
+    ".tar.gz": "gz", ".tgz": "gz",
+    ".tar.bz2": "bz2", ".tbz2": "bz2", ".tbz": "bz2",
+    ".tar.xz": "xz", ".txz": "xz",
+    ".tar": None,
+}
+
+BROWSABLE_MIMES = {"application/zip", "application/x-tar"}
+
+_OPENERS = {None: open, "gz": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+
+# Miembro de un archivo: ruta interna, si es carpeta, tamaño, mtime y
+# ubicación de los datos (None en carpetas que no tienen entrada propia)
+ArchiveMember = namedtuple("ArchiveMember", "path is_dir size mtime location")
+
+_EOCD = struct.Struct("<4s4H2LH")
+_ZIP64_LOCATOR = struct.Struct("<4sLQL")
+_ZIP64_EOCD = struct.Struct("<4sQ2H2L4Q")
+_CENTRAL_HEADER = struct.Struct("<4s6H3L5H2L")
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_ZIP64_MARK = 0xFFFFFFFF
+
+# Campos usados de una cabecera tar: nombre, tamaño, mtime, tipo, firma y prefijo ustar
+_TAR_HEADER = struct.Struct("100s24x12s12s8xc100x6s82x155s")
+
+# Nombres que hay que normalizar: absolutos, con "//", ".", ".." o barras invertidas
+_IRREGULAR_NAME = re.compile(r"^/|//|\\|(?:^|/)\.\.?(?:/|$)")
+
+
+class ArchiveError(OSError):
+    """El archivo comprimido está dañado o no se puede leer"""
+
+
+def is_browsable_archive(name, mime=None):
+    """Indica si un archivo se puede abrir como carpeta virtual"""
+    if mime in BROWSABLE_MIMES:
+        return True
+    lower = name.lower()
+    return lower.endswith(".zip") or any(lower.endswith(suffix) for suffix in TAR_SUFFIXES)
+
+
+def detect_archive(path):
+    """Formato de un archivo por su contenido: ("zip"|"tar", compresión) o None"""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(512)
+    except OSError:
+        return None
+    if header[:4] in (b"PK\x03\x04", b"PK\x05\x06"):
+        return "zip", None
+    if header[257:262] == b"ustar":
+        return "tar", None
+    lower = os.path.basename(path).lower()
+    compression = next((value for suffix, value in TAR_SUFFIXES.items()
+                        if lower.endswith(suffix)), None)
+    magic = {"gz": b"\x1f\x8b", "bz2": b"BZh", "xz": b"\xfd7zXZ"}.get(compression)
+    if magic is not None and header.startswith(magic):
+        return "tar", compression
+    if lower.endswith(".tar") and len(header) == 512:
+        # tar v7 sin firma ustar
+        return "tar", None
+    if lower.endswith(".zip") and len(header) > 0:
+        # Zip con datos antepuestos (autoextraíble): se valida al leer el final
+        return "zip", None
+    return None
+
+
+def archive_stem(name):
+    """Nombre de un archivo sin la extensión de archivo comprimido"""
+    lower = name.lower()
+    for suffix in (*TAR_SUFFIXES, ".zip"):
+        if lower.endswith(suffix) and len(name) > len(suffix):
+            return name[:-len(suffix)]
+    return os.path.splitext(name)[0] or name
+
+
+def safe_extract_path(root, name):
+    """Ruta de extracción de un miembro dentro de root
+
+    Se descartan "." y las barras iniciales (como hace tar); una ruta con
+    ".." o cuya carpeta resuelve fuera de root (por un enlace simbólico
+    extraído antes) lanza ArchiveError.
+    """
+    parts = [part for part in name.replace("\\", "/").split("/") if part not in ("", ".")]
+    if not parts or ".." in parts:
+        raise ArchiveError(f"Ruta fuera de la carpeta de destino: {name}")
+    target = os.path.join(root, *parts)
+    real_root = os.path.realpath(root)
+    real_parent = os.path.realpath(os.path.dirname(target))
+    if real_parent != real_root and not real_parent.startswith(real_root + os.sep):
+        raise ArchiveError(f"Ruta fuera de la carpeta de destino: {name}")
+    return target
+
+
+def safe_link_target(root, target, link):
+    """Comprobar que un enlace simbólico extraído apunta dentro de root"""
+    resolved = os.path.normpath(os.path.join(os.path.dirname(target), link))
+    root = os.path.normpath(root)
+    if os.path.isabs(link) or (resolved != root and not resolved.startswith(root + os.sep)):
+        raise ArchiveError(f"Enlace fuera de la carpeta de destino: {link}")
+    return link
+
+
+def split_archive_path(path):
+    """Separar "/ruta/datos.zip/carpeta" en ("/ruta/datos.zip", "carpeta")
+    
+    Devuelve (None, None) si ningún componente de la ruta es un archivo
+    comprimido.
+    """
+    current = os.path.abspath(str(path))
+    inner = []
+    while True:
+        if os.path.isfile(current):
+            if detect_archive(current) is None:
+                return None, None
+            return current, "/".join(reversed(inner))
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None, None
+        inner.append(os.path.basename(current))
+        current = parent
+
+
+def _clean_name(name):
+    """Ruta interna normalizada; None si intenta salir del archivo"""
+    if not _IRREGULAR_NAME.search(name):
+        return name.rstrip("/")
+    parts = [part for part in name.replace("\\", "/").split("/") if part not in ("", ".")]
+    if ".." in parts:
+        return None
+    return "/".join(parts)
+
+
+@lru_cache(maxsize=4096)
+def _dos_timestamp(dos_date, dos_time):
+    """Fecha de un miembro zip (formato MS-DOS, hora local) a timestamp"""
+    try:
+        return time.mktime(((dos_date >> 9) + 1980, (dos_date >> 5) & 0xF, dos_date & 0x1F,
+                            dos_time >> 11, (dos_time >> 5) & 0x3F, (dos_time & 0x1F) * 2,
+                            0, 0, -1))
+    except (OverflowError, ValueError):
+        return 0.0
+
+
+def _zip64_values(extra, compressed, uncompressed, header_offset):
+    """Tamaños y offset reales del campo extra ZIP64 de un miembro"""
+    position = 0
+    while position + 4 <= len(extra):
+        tag, length = struct.unpack_from("<HH", extra, position)
+        if tag == 1:
+            cursor = position + 4
+            if uncompressed == _ZIP64_MARK:
+                uncompressed, = struct.unpack_from("<Q", extra, cursor)
+                cursor += 8
+            if compressed == _ZIP64_MARK:
+                compressed, = struct.unpack_from("<Q", extra, cursor)
+                cursor += 8
+            if header_offset == _ZIP64_MARK:
+                header_offset, = struct.unpack_from("<Q", extra, cursor)
+            break
+        position += 4 + length
+    return compressed, uncompressed, header_offset
+
+
+def _tar_number(field):
+    """Campo numérico de una cabecera tar (octal o base 256 de GNU)"""
+    if field[:1] and field[0] & 0x80:
+        return int.from_bytes(field[1:], "big")
+    field = field.strip(b"\0 ")
+    return int(field, 8) if field else 0
+
+
+def _tar_string(field):
+    """Campo de texto de una cabecera tar (terminado en NUL)"""
+    return field.partition(b"\0")[0].decode("utf-8", errors="surrogateescape")
+
+
+def _pax_records(data):
+    """Registros "longitud clave=valor" de una cabecera extendida pax"""
+    records = {}
+    position = 0
+    while position < len(data):
+        space = data.find(b" ", position)
+        if space < 0:
+            break
+        try:
+            length = int(data[position:space])
+        except ValueError:
+            break
+        if length <= 0:
+            break
+        key, _, value = data[space + 1:position + length - 1].partition(b"=")
+        records[key.decode("utf-8", errors="replace")] = value.decode("utf-8", errors="surrogateescape")
+        position += length
+    return records
+
+
+class ArchiveIndex:
+    """Tabla de miembros de un archivo indexada por ruta interna
+    
+    children asocia cada carpeta interna ("" es la raíz) con las rutas de
+    sus hijos. Las carpetas intermedias que el archivo no declara se
+    sintetizan para que todo miembro sea alcanzable navegando.
+    """
+    
+    def __init__(self, path, key, kind, compression, mtime):
+        self.path = path
+        self.key = key
+        self.kind = kind
+        self.compression = compression
+        self.mtime = mtime
+        self.members = {}
+        self.children = {"": []}
+    
+    def add(self, name, is_dir, size, mtime, location):
+        """Registrar un miembro (se ignoran las rutas que salen del archivo)"""
+        path = _clean_name(name)
+        if not path:
+            return
+        existing = self.members.get(path)
+        if existing is None:
+            parent = path.rpartition("/")[0]
+            self._ensure_directory(parent)
+            self.children[parent].append(path)
+        elif existing.is_dir and not is_dir:
+            # Una entrada posterior no puede convertir una carpeta con hijos en archivo
+            return
+        self.members[path] = ArchiveMember(path, is_dir, size, mtime, location)
+        if is_dir:
+            self.children.setdefault(path, [])
+    
+    def _ensure_directory(self, path):
+        """Crear las carpetas implícitas que faltan hasta la raíz"""
+        missing = []
+        while path not in self.children:
+            missing.append(path)
+            path = path.rpartition("/")[0]
+        for directory in reversed(missing):
+            self.children[directory] = []
+            self.children[directory.rpartition("/")[0]].append(directory)
+            self.members[directory] = ArchiveMember(directory, True, 0, self.mtime, None)
+    
+    def list_directory(self, inner=""):
+        """Miembros directos de una carpeta interna"""
+        inner = _clean_name(inner) or ""
+        children = self.children.get(inner)
+        if children is None:
+            if inner in self.members:
+                raise NotADirectoryError(f"No es una carpeta: {inner}")
+            raise FileNotFoundError(f"No existe en el archivo: {inner}")
+        return [self.members[path] for path in children]
+    
+    def member(self, inner):
+        """Miembro por su ruta interna (None si no existe)"""
+        return self.members.get(_clean_name(inner) or "")
+    
+    def iter_member(self, inner, chunk_size=CHUNK_SIZE):
+        """Contenido de un miembro por bloques, sin leer el resto del archivo"""
+        member = self.member(inner)
+        if member is None or member.is_dir:
+            raise FileNotFoundError(f"No existe en el archivo: {inner}")
+        if self.kind == "zip":
+            return self._iter_zip_member(member, chunk_size)
+        return self._iter_tar_member(member, chunk_size)
+    
+    def _iter_zip_member(self, member, chunk_size):
+        """Leer un miembro zip desde su cabecera local (stored y deflate en bloques)"""
+        header_offset, compressed, method, flags, crc, raw_name = member.location
+        if flags & 0x1:
+            raise ArchiveError(f"El miembro está cifrado: {member.path}")
+        if method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            # bzip2, lzma...: zipfile ya los descomprime por bloques
+            with zipfile.ZipFile(self.path) as archive, archive.open(raw_name) as source:
+                while True:
+                    data = source.read(chunk_size)
+                    if not data:
+                        return
+                    yield data
+        
+        with open(self.path, "rb") as f:
+            f.seek(header_offset)
+            header = f.read(_LOCAL_HEADER.size)
+            if len(header) < _LOCAL_HEADER.size or header[:4] != b"PK\x03\x04":
+                raise ArchiveError(f"Cabecera local dañada: {member.path}")
+            name_length, extra_length = _LOCAL_HEADER.unpack(header)[9:]
+            f.seek(header_offset + _LOCAL_HEADER.size + name_length + extra_length)
+            
+            decompressor = zlib.decompressobj(-15) if method == zipfile.ZIP_DEFLATED else None
+            remaining = compressed
+            checksum = 0
+            while remaining > 0:
+                data = f.read(min(chunk_size, remaining))
+                if not data:
+                    raise ArchiveError(f"Archivo truncado: {member.path}")
+                remaining -= len(data)
+                if decompressor is None:
+                    checksum = zlib.crc32(data, checksum)
+                    yield data
+                    continue
+                # max_length acota la memoria aunque el miembro se expanda mucho
+                while data:
+                    output = decompressor.decompress(data, chunk_size)
+                    data = decompressor.unconsumed_tail
+                    if output:
+                        checksum = zlib.crc32(output, checksum)
+                        yield output
+            if decompressor is not None:
+                output = decompressor.flush()
+                if output:
+                    checksum = zlib.crc32(output, checksum)
+                    yield output
+        if checksum != crc:
+            raise ArchiveError(f"CRC incorrecto: {member.path}")
+    
+    def _iter_tar_member(self, member, chunk_size):
+        """Leer un miembro tar saltando hasta sus datos"""
+        if member.location is None:
+            return
+        with _OPENERS[self.compression](self.path, "rb") as f:
+            # En un tar comprimido avanzar descomprime, pero no guarda nada
+            f.seek(member.location)
+            remaining = member.size
+            while remaining > 0:
+                data = f.read(min(chunk_size, remaining))
+                if not data:
+                    raise ArchiveError(f"Archivo truncado: {member.path}")
+                remaining -= len(data)
+                yield data
+    
+    def extract_member(self, inner, destination, cancel_event=None):
+        """Extraer un miembro a destination por bloques
+        
+        Se escribe en un temporal junto al destino y se renombra al
+        terminar, así una extracción cancelada nunca deja un archivo a
+        medias. Devuelve False si cancel_event se activa.
+        """
+        temporary = f"{destination}.part"
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        try:
+            with open(temporary, "wb") as output:
+                for data in self.iter_member(inner):
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise InterruptedError
+                    output.write(data)
+        except InterruptedError:
+            os.unlink(temporary)
+            return False
+        except BaseException:
+            try:
+                os.unlink(temporary)
+            except OSError:
+                pass
+            raise
+        member = self.member(inner)
+        os.utime(temporary, (member.mtime, member.mtime))
+        os.replace(temporary, destination)
+        return True
+
+
+def _read_zip_index(index, f, size, cancel_event=None, progress=None):
+    """Llenar el índice con el directorio central de un zip (una sola lectura)"""
+    tail_size = min(size, 65536 + _EOCD.size)
+    f.seek(size - tail_size)
+    tail = f.read(tail_size)
+    position = tail.rfind(b"PK\x05\x06")
+    if position < 0 or position + _EOCD.size > len(tail):
+        raise ArchiveError(f"No es un zip válido: {index.path}")
+    _, _, _, _, entries, directory_size, directory_offset, _ = _EOCD.unpack_from(tail, position)
+    end_offset = size - tail_size + position
+    
+    if _ZIP64_MARK in (directory_size, directory_offset) or entries == 0xFFFF:
+        f.seek(end_offset - _ZIP64_LOCATOR.size)
+        locator = f.read(_ZIP64_LOCATOR.size)
+        if len(locator) == _ZIP64_LOCATOR.size and locator[:4] == b"PK\x06\x07":
+            zip64_offset = _ZIP64_LOCATOR.unpack(locator)[2]
+            f.seek(zip64_offset)
+            record = f.read(_ZIP64_EOCD.size)
+            if len(record) == _ZIP64_EOCD.size and record[:4] == b"PK\x06\x06":
+                entries, directory_size, directory_offset = _ZIP64_EOCD.unpack(record)[7:10]
+                end_offset = zip64_offset
+    
+    # Datos antepuestos al zip (autoextraíbles): los offsets son relativos a ellos
+    prefix = end_offset - directory_size - directory_offset
+    f.seek(directory_offset + prefix)
+    directory = f.read(directory_size)
+    
+    offset = 0
+    for number in range(entries):
+        if offset + _CENTRAL_HEADER.size > len(directory):
+            break
+        (signature, _, _, flags, method, dos_time, dos_date, crc, compressed, uncompressed,
+         name_length, extra_length, comment_length, _, _, _, header_offset) = \
+            _CENTRAL_HEADER.unpack_from(directory, offset)
+        if signature != b"PK\x01\x02":
+            raise ArchiveError(f"Directorio central dañado: {index.path}")
+        start = offset + _CENTRAL_HEADER.size
+        raw_name = directory[start:start + name_length]
+        name = raw_name.decode("utf-8" if flags & 0x800 else "cp437", errors="replace")
+        if _ZIP64_MARK in (compressed, uncompressed, header_offset):
+            compressed, uncompressed, header_offset = _zip64_values(
+                directory[start + name_length:start + name_length + extra_length],
+                compressed, uncompressed, header_offset)
+        index.add(name, name.endswith("/"), uncompressed, _dos_timestamp(dos_date, dos_time),
+                  (header_offset + prefix, compressed, method, flags, crc, name))
+        offset = start + name_length + extra_length + comment_length
+        if number % PROGRESS_INTERVAL == 0:
+            if cancel_event is not None and cancel_event.is_set():
+                return False
+            if progress is not None:
+                progress()
+    return True
+
+
+def _read_tar_index(index, f, cancel_event=None, progress=None):
+    """Llenar el índice con las cabeceras de un tar saltando los datos
+    
+    Las cabeceras se analizan sobre bloques de CHUNK_SIZE: los datos de los
+    miembros pequeños se saltan dentro del bloque y los grandes con seek.
+    """
+    buffer = b""
+    cursor = 0
+    buffer_offset = 0  # posición en el tar de buffer[0]
+    long_name = None
+    pax = {}
+    number = 0
+    while True:
+        if cursor + 512 > len(buffer):
+            buffer_offset += cursor
+            buffer = buffer[cursor:] + f.read(CHUNK_SIZE)
+            cursor = 0
+            if len(buffer) < 512:
+                return True
+        if buffer.count(0, cursor, cursor + 512) == 512:
+            return True
+        raw_name, raw_size, raw_mtime, typeflag, magic, raw_prefix = \
+            _TAR_HEADER.unpack_from(buffer, cursor)
+        try:
+            name = _tar_string(raw_name)
+            size = _tar_number(raw_size)
+            mtime = _tar_number(raw_mtime)
+        except ValueError:
+            raise ArchiveError(f"Cabecera tar dañada: {index.path}") from None
+        if magic[:5] == b"ustar" and raw_prefix[:1] != b"\0":
+            name = f"{_tar_string(raw_prefix)}/{name}"
+        cursor += 512
+        data_offset = buffer_offset + cursor
+        
+        # Cabeceras auxiliares: nombres largos de GNU y atributos pax
+        if typeflag in (b"L", b"x"):
+            padded = (size + 511) // 512 * 512
+            if cursor + padded > len(buffer):
+                buffer_offset += cursor
+                buffer = buffer[cursor:] + f.read(max(CHUNK_SIZE, padded))
+                cursor = 0
+            data = buffer[cursor:cursor + size]
+            cursor += padded
+            if typeflag == b"L":
+                long_name = _tar_string(data)
+            else:
+                pax = _pax_records(data)
+            continue
+        
+        if typeflag not in (b"K", b"g"):
+            if long_name is not None:
+                name = long_name
+            name = pax.get("path", name)
+            size = int(pax.get("size", size))
+            mtime = float(pax.get("mtime", mtime))
+            long_name = None
+            pax = {}
+            if typeflag == b"5" or (typeflag in (b"0", b"\0") and name.endswith("/")):
+                index.add(name, True, 0, mtime, None)
+            elif typeflag in (b"0", b"\0", b"7"):
+                index.add(name, False, size, mtime, data_offset)
+            # Enlaces, dispositivos y FIFOs no se muestran
+        
+        cursor += (size + 511) // 512 * 512
+        if cursor > len(buffer):
+            f.seek(cursor - len(buffer), 1)
+            buffer_offset += cursor
+            buffer = b""
+            cursor = 0
+        
+        number += 1
+        if number % PROGRESS_INTERVAL == 0:
+            if cancel_event is not None and cancel_event.is_set():
+                return False
+            if progress is not None:
+                progress()
+
+
+def read_archive_index(path, cancel_event=None, progress=None):
+    """Leer la tabla de miembros de un archivo (None si se cancela)"""
+    path = os.path.abspath(str(path))
+    detected = detect_archive(path)
+    if detected is None:
+        raise ArchiveError(f"Formato de archivo no soportado: {path}")
+    kind, compression = detected
+    stat_result = os.stat(path)
+    index = ArchiveIndex(path, archive_key(stat_result), kind, compression, stat_result.st_mtime)
+    try:
+        if kind == "zip":
+            with open(path, "rb") as f:
+                completed = _read_zip_index(index, f, stat_result.st_size, cancel_event, progress)
+        else:
+            with _OPENERS[compression](path, "rb") as f:
+                completed = _read_tar_index(index, f, cancel_event, progress)
+    except (EOFError, zlib.error, lzma.LZMAError) as error:
+        raise ArchiveError(f"Archivo dañado: {path} ({error})") from None
+    return index if completed else None
+
+
+def archive_key(stat_result):
+    """Clave de validez de un archivo comprimido"""
+    return (stat_result.st_dev, stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+
+
+class ArchiveCache:
+    """Caché LRU de tablas de miembros validadas por (dev, ino, mtime, tamaño)
+    
+    Navegar dentro de un archivo ya abierto cuesta un stat del archivo en
+    lugar de volver a leer su directorio central o sus cabeceras.
+    """
+    
+    def __init__(self, max_archives=8):
+        self.max_archives = max_archives
+        self._lock = threading.Lock()
+        self._indexes = OrderedDict()
+    
+    def get(self, path, cancel_event=None, progress=None):
+        """Tabla de miembros de un archivo, leyéndola si no está al día"""
+        path = os.path.abspath(str(path))
+        key = archive_key(os.stat(path))
+        with self._lock:
+            index = self._indexes.get(path)
+            if index is not None and index.key == key:
+                self._indexes.move_to_end(path)
+                return index
+        index = read_archive_index(path, cancel_event, progress)
+        if index is None:
+            return None
+        with self._lock:
+            self._indexes[path] = index
+            self._indexes.move_to_end(path)
+            while len(self._indexes) > self.max_archives:
+                self._indexes.popitem(last=False)
+        return index
+
+
+# Caché compartida por todos los exploradores de la aplicación
+archive_cache = ArchiveCache()
+
+
+def extraction_cache_dir():
+    """Carpeta donde se extraen los miembros abiertos desde el explorador"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return os.path.join(cache_home, "linux-gui", "archives")
+
+
+def _tree_size(path):
+    """Bytes de los archivos bajo una carpeta (sin seguir enlaces)"""
+    total = 0
+    for directory, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(directory, name)).st_size
+            except OSError:
+                continue
+    return total
+
+
+def prune_extraction_cache(keep=None, max_bytes=EXTRACTION_CACHE_BYTES,
+                           max_days=EXTRACTION_CACHE_DAYS):
+    """Eliminar de la caché las extracciones viejas o las que sobran
+    
+    Cada carpeta es una versión de un archivo y su mtime, la última vez
+    que se abrió algo de ella. Se eliminan las que llevan más de max_days
+    sin usarse y, si aún se pasa de max_bytes, las menos usadas. keep (la
+    que se acaba de usar) se conserva siempre.
+    """
+    try:
+        with os.scandir(extraction_cache_dir()) as entries:
+            entries = list(entries)
+    except OSError:
+        return
+    now = time.time()
+    folders = []
+    total = 0
+    for entry in entries:
+        try:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            used = entry.stat(follow_symlinks=False).st_mtime
+        except OSError:
+            continue
+        size = _tree_size(entry.path)
+        total += size
+        if entry.path == keep:
+            continue
+        if now - used > max_days * 86400:
+            shutil.rmtree(entry.path, ignore_errors=True)
+            total -= size
+        else:
+            folders.append((used, entry.path, size))
+    for _, path, size in sorted(folders):
+        if total <= max_bytes:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+
+
+class MemberExtractor(QThread):
+    """Extrae un miembro de un archivo a la caché para abrirlo
+    
+    Si el miembro ya se extrajo antes desde la misma versión del archivo
+    se reutiliza sin volver a descomprimirlo. La caché se poda con
+    prune_extraction_cache() tras cada extracción.
+    """
+    extracted = pyqtSignal(str)  # ruta del archivo extraído
+    failed = pyqtSignal(str)  # mensaje de error
+    
+    def __init__(self, archive_path, inner, cache=None, parent=None):
+        super().__init__(parent)
+        self.archive_path = str(archive_path)
+        self.inner = inner
+        self.cache = cache or archive_cache
+        self._cancel_event = threading.Event()
+    
+    def cancel(self):
+        """Abandonar la extracción"""
+        self._cancel_event.set()
+    
+    def folder(self, index):
+        """Carpeta de extracción: una por archivo y versión del archivo"""
+        digest = hashlib.sha1(f"{self.archive_path}\0{index.key}".encode(
+            "utf-8", errors="surrogateescape")).hexdigest()
+        return os.path.join(extraction_cache_dir(), digest)
+    
+    def destination(self, index):
+        """Ruta de extracción del miembro dentro de la carpeta de su archivo"""
+        return os.path.join(self.folder(index), *_clean_name(self.inner).split("/"))
+    
+    def run(self):
+        try:
+            index = self.cache.get(self.archive_path, self._cancel_event)
+            if index is None:
+                return
+            member = index.member(self.inner)
+            if member is None or member.is_dir:
+                raise FileNotFoundError(f"No existe en el archivo: {self.inner}")
+            destination = self.destination(index)
+            try:
+                reusable = os.stat(destination).st_size == member.size
+            except OSError:
+                reusable = False
+            if not reusable and not index.extract_member(self.inner, destination, self._cancel_event):
+                return
+            # El mtime de la carpeta marca su último uso para la poda
+            folder = self.folder(index)
+            os.utime(folder)
+        except OSError as e:
+            if not self._cancel_event.is_set():
+                self.failed.emit(str(e))
+            return
+        prune_extraction_cache(keep=folder)
+        if not self._cancel_event.is_set():
+            self.extracted.emit(destination)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Renombrado masivo: reglas de buscar/reemplazar, plantilla y contador
+
+Los nombres nuevos se calculan bajo demanda (la vista previa solo pide las
+filas visibles) y las colisiones se comprueban para todo el lote antes de
+tocar el disco. El renombrado en sí lo hace BulkRenameOperation en la cola
+de operaciones de archivos.
+"""
+
+import os
+import re
+from collections import Counter
+
+
+# Longitud máxima de un nombre en los sistemas de archivos de Linux (bytes)
+NAME_MAX = 255
+
+DEFAULT_TEMPLATE = "{name}"
+
+
+def validate_name(name):
+    """Motivo por el que un nombre no es válido (None si lo es)"""
+    if not name or name in (".", ".."):
+        return "Nombre vacío"
+    if "/" in name or "\0" in name:
+        return "El nombre no puede contener '/'"
+    if len(os.fsencode(name)) > NAME_MAX:
+        return "Nombre demasiado largo"
+    return None
+
+
+class RenameRule:
+    """Regla que transforma un nombre según su posición en la selección
+    
+    Primero se aplica buscar/reemplazar (texto literal o expresión regular,
+    con grupos \\1 o \\g<nombre> en el reemplazo) y después la plantilla,
+    que admite {name} (nombre tras reemplazar), {stem}, {ext} (con punto) y
+    {n} (contador, {n:03} para rellenar con ceros). Lanza ValueError si la
+    expresión o la plantilla no son válidas.
+    """
+    
+    def __init__(self, find="", replace="", regex=False, ignore_case=False,
+                 template=DEFAULT_TEMPLATE, start=1, step=1):
+        self.template = template or DEFAULT_TEMPLATE
+        self.start = start
+        self.step = step
+        self.replace = replace
+        self.regex = regex
+        self._pattern = None
+        if find:
+            flags = re.IGNORECASE if ignore_case else 0
+            try:
+                self._pattern = re.compile(find if regex else re.escape(find), flags)
+            except re.error as e:
+                raise ValueError(f"Expresión regular no válida: {e}") from None
+        # Comprobar la plantilla y el reemplazo una vez y no en cada fila
+        self.apply("ejemplo.txt", 0)
+    
+    def apply(self, name, index):
+        """Nombre nuevo para el elemento en la posición index"""
+        new_name = name
+        if self._pattern is not None:
+            try:
+                if self.regex:
+                    new_name = self._pattern.sub(self.replace, name)
+                else:
+                    new_name = self._pattern.sub(lambda match: self.replace, name)
+            except (re.error, IndexError) as e:
+                raise ValueError(f"Reemplazo no válido: {e}") from None
+        stem, extension = os.path.splitext(new_name)
+        try:
+            return self.template.format_map({
+                "name": new_name, "stem": stem, "ext": extension,
+                "n": self.start + index * self.step,
+            })
+        except (KeyError, ValueError, IndexError, AttributeError) as e:
+            raise ValueError(f"Plantilla no válida: {e}") from None
+
+
+class RenamePlan:
+    """Nombres nuevos de una selección, calculados solo cuando se piden"""
+    
+    def __init__(self, paths, rule):
+        self.paths = list(paths)
+        self.rule = rule
+        self._names = {}
+    
+    def __len__(self):
+        return len(self.paths)
+    
+    def new_name(self, row):
+        """Nombre nuevo de una fila (se calcula una vez)"""
+        name = self._names.get(row)
+        if name is None:
+            name = self._names[row] = self.rule.apply(os.path.basename(self.paths[row]), row)
+        return name
+    
+    def check(self, existing_paths):
+        """Calcular todo el lote y devolver (renombrados, conflictos)
+        
+        renombrados es la lista de (origen, destino) que cambian de nombre
+        y conflictos asocia filas con el motivo por el que no se pueden
+        renombrar: nombre no válido, dos elementos con el mismo destino o un
+        destino que ya existe y no forma parte del lote.
+        """
+        sources = set(self.paths)
+        targets = []
+        conflicts = {}
+        for row, source in enumerate(self.paths):
+            name = self.new_name(row)
+            error = validate_name(name)
+            if error is not None:
+                conflicts[row] = error
+            targets.append(os.path.join(os.path.dirname(source), name))
+        
+        counts = Counter(targets)
+        for row, (source, target) in enumerate(zip(self.paths, targets)):
+            if row not in conflicts and source != target and counts[target] > 1:
+                conflicts[row] = "Otro elemento recibe el mismo nombre"
+        
+        # Un destino puede ser el nombre de otro elemento del lote solo si
+        # ese elemento también cambia; un conflicto puede provocar otros
+        while True:
+            staying = {source for row, (source, target) in enumerate(zip(self.paths, targets))
+                       if row in conflicts or source == target}
+            blocked = {row: "Ya existe un elemento con ese nombre"
+                       for row, (source, target) in enumerate(zip(self.paths, targets))
+                       if row not in conflicts and source != target
+                       and ((target in existing_paths and target not in sources) or target in staying)}
+            if not blocked:
+                break
+            conflicts.update(blocked)
+        
+        renames = [(source, target) for row, (source, target) in enumerate(zip(self.paths, targets))
+                   if row not in conflicts and source != target]
+        return renames, conflicts
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Sumas de comprobación (SHA-256, SHA-512, BLAKE2) y su verificación
+
+Cada archivo se lee a través de mmap en bloques grandes y se pasa a
+hashlib, que suelta el GIL mientras calcula: varios hilos del pool hashean
+archivos distintos a la vez de verdad, sin copiar los datos a Python. Si
+junto al archivo hay una suma publicada ("imagen.iso.sha256sum",
+"SHA256SUMS"...) el resultado se compara con ella.
+"""
+
+import hashlib
+import mmap
+import os
+import queue
+import re
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+# Bloque que se pasa de una vez a hashlib
+HASH_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Intervalo mínimo entre señales de progreso (segundos)
+REPORT_INTERVAL = 0.2
+
+# Algoritmo: nombre visible, constructor y nombres de las sumas publicadas
+# (sufijos del archivo y listas de la carpeta)
+Algorithm = namedtuple("Algorithm", "label new suffixes list_names")
+
+ALGORITHMS = {
+    "sha256": Algorithm("SHA-256", hashlib.sha256, (".sha256sum", ".sha256"),
+                        ("SHA256SUMS", "sha256sums.txt", "sha256sum.txt")),
+    "sha512": Algorithm("SHA-512", hashlib.sha512, (".sha512sum", ".sha512"),
+                        ("SHA512SUMS", "sha512sums.txt", "sha512sum.txt")),
+    "blake2b": Algorithm("BLAKE2b", hashlib.blake2b, (".b2sum", ".blake2b"),
+                         ("B2SUMS", "b2sums.txt")),
+}
+
+# Estados de un resultado
+MATCH = "match"
+MISMATCH = "mismatch"
+UNVERIFIED = "unverified"
+FAILED = "failed"
+
+# Resultado de un archivo: ruta, algoritmo, suma calculada (None si falló),
+# suma esperada (None sin suma publicada), archivo de donde salió y error
+ChecksumResult = namedtuple("ChecksumResult", "path algorithm digest expected source error")
+
+# Formato de coreutils ("suma  nombre" o "suma *nombre") y formato BSD
+# ("SHA256 (nombre) = suma")
+_GNU_LINE = re.compile(r"^\\?([0-9a-fA-F]{32,128}) [ *](.+)$")
+_BSD_LINE = re.compile(r"^[A-Z0-9-]+ \((.+)\) = ([0-9a-fA-F]{32,128})$")
+
+
+class ChecksumCancelled(Exception):
+    """El cálculo se canceló antes de terminar"""
+
+
+def checksum_status(result):
+    """Estado de un resultado: coincide, no coincide, sin verificar o error"""
+    if result.digest is None:
+        return FAILED
+    if result.expected is None:
+        return UNVERIFIED
+    return MATCH if result.digest == result.expected else MISMATCH
+
+
+def hash_file(path, algorithm, cancel_event=None, progress=None):
+    """Suma de un archivo leído a través de mmap
+    
+    progress se llama con los bytes de cada bloque procesado. Lanza
+    ChecksumCancelled si cancel_event se activa.
+    """
+    digest = ALGORITHMS[algorithm].new()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return digest.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mapped) as view:
+                for offset in range(0, size, HASH_CHUNK_BYTES):
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise ChecksumCancelled()
+                    with view[offset:offset + HASH_CHUNK_BYTES] as chunk:
+                        digest.update(chunk)
+                        if progress is not None:
+                            progress(len(chunk))
+    return digest.hexdigest()
+
+
+def parse_checksum_file(text):
+    """Sumas de un archivo de comprobación: {nombre: suma en minúsculas}"""
+    sums = {}
+    for line in text.splitlines():
+        line = line.strip()
+        match = _GNU_LINE.match(line)
+        if match:
+            digest, name = match.groups()
+        else:
+            match = _BSD_LINE.match(line)
+            if not match:
+                continue
+            name, digest = match.groups()
+        sums[os.path.basename(name)] = digest.lower()
+    return sums
+
+
+def checksum_sources(path, algorithm):
+    """Archivos donde puede estar publicada la suma de path, por preferencia"""
+    directory = os.path.dirname(path)
+    info = ALGORITHMS[algorithm]
+    return ([path + suffix for suffix in info.suffixes]
+            + [os.path.join(directory, list_name) for list_name in info.list_names])
+
+
+def detect_algorithm(paths, folder_names):
+    """Algoritmo con suma publicada para los archivos (sha256 si no hay ninguna)
+    
+    Solo mira los nombres del listado ya leído, sin tocar el disco.
+    """
+    folder_names = set(folder_names)
+    for algorithm in ALGORITHMS:
+        for path in paths:
+            if any(os.path.basename(source) in folder_names
+                   for source in checksum_sources(path, algorithm)):
+                return algorithm
+    return "sha256"
+
+
+def expected_checksum(path, algorithm, sums_cache=None):
+    """Suma publicada para un archivo: (suma, archivo de origen) o (None, None)
+    
+    sums_cache guarda los archivos de comprobación ya leídos, así una
+    lista SHA256SUMS se lee una vez aunque cubra muchos archivos.
+    """
+    name = os.path.basename(path)
+    for source in checksum_sources(path, algorithm):
+        if source == path:
+            continue
+        sums = None if sums_cache is None else sums_cache.get(source)
+        if sums is None:
+            try:
+                with open(source, encoding="utf-8", errors="replace") as f:
+                    # Una suma publicada es pequeña; un archivo enorme no lo es
+                    text = f.read(4 * 1024 * 1024)
+            except OSError:
+                sums = {}
+            else:
+                sums = parse_checksum_file(text)
+                # "archivo.sha256sum" con solo la suma, sin nombre
+                if not sums and source.startswith(path):
+                    first = text.split()[:1]
+                    if first and re.fullmatch(r"[0-9a-fA-F]{32,128}", first[0]):
+                        sums = {name: first[0].lower()}
+            if sums_cache is not None:
+                sums_cache[source] = sums
+        if name in sums:
+            return sums[name], source
+    return None, None
+
+
+class ChecksumWorker(QThread):
+    """Hilo que calcula y verifica las sumas de varios archivos a la vez
+    
+    Los archivos se reparten en un pool de hilos; cada resultado se emite
+    en cuanto termina. El progreso cuenta bytes y lleva la velocidad media
+    desde el inicio.
+    """
+    progress_changed = pyqtSignal(object, object, float)  # bytes hechos, bytes totales, bytes/s
+    file_finished = pyqtSignal(object)  # ChecksumResult
+    checksums_finished = pyqtSignal(int, float)  # archivos, segundos
+    
+    def __init__(self, paths, algorithm="sha256", max_workers=None, parent=None):
+        super().__init__(parent)
+        self.paths = [str(path) for path in paths]
+        self.algorithm = algorithm
+        self.max_workers = max_workers or max(1, min(4, os.cpu_count() or 1))
+        self._cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._sums_lock = threading.Lock()
+        self._done_bytes = 0
+        self._total_bytes = 0
+        self._last_report = 0.0
+        self._start = 0.0
+    
+    def cancel(self):
+        """Detener el cálculo lo antes posible"""
+        self._cancel_event.set()
+    
+    def _add_progress(self, count):
+        with self._lock:
+            self._done_bytes += count
+    
+    def _report(self, force=False):
+        """Emitir progreso como máximo cada REPORT_INTERVAL segundos"""
+        now = time.monotonic()
+        if force or now - self._last_report >= REPORT_INTERVAL:
+            self._last_report = now
+            elapsed = max(now - self._start, 1e-6)
+            with self._lock:
+                done = self._done_bytes
+            self.progress_changed.emit(done, self._total_bytes, done / elapsed)
+    
+    def _checksum(self, path, sums_cache):
+        """Calcular y verificar un archivo (se ejecuta en el pool)"""
+        try:
+            digest = hash_file(path, self.algorithm, self._cancel_event, self._add_progress)
+        except ChecksumCancelled:
+            return None
+        except OSError as e:
+            return ChecksumResult(path, self.algorithm, None, None, None, e.strerror or str(e))
+        with self._sums_lock:
+            expected, source = expected_checksum(path, self.algorithm, sums_cache)
+        return ChecksumResult(path, self.algorithm, digest, expected, source, None)
+    
+    def run(self):
+        self._start = time.monotonic()
+        for path in self.paths:
+            try:
+                self._total_bytes += os.stat(path).st_size
+            except OSError:
+                pass
+        
+        results = queue.SimpleQueue()
+        sums_cache = {}
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            for path in self.paths:
+                future = pool.submit(self._checksum, path, sums_cache)
+                future.add_done_callback(results.put)
+            remaining = len(self.paths)
+            while remaining:
+                try:
+                    future = results.get(timeout=REPORT_INTERVAL)
+                except queue.Empty:
+                    if self._cancel_event.is_set():
+                        return
+                    self._report()
+                    continue
+                remaining -= 1
+                result = future.result()
+                if result is None or self._cancel_event.is_set():
+                    return
+                self.file_finished.emit(result)
+                self._report()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        self._report(force=True)
+        self.checksums_finished.emit(len(self.paths), time.monotonic() - self._start)
@@ -4,7 +4,9 @@ CommandRunner - Hilo para ejecutar comandos sin bloquear la interfaz
 """
 
 import os
+import signal
 import subprocess
+import threading
 from PyQt6.QtCore import QThread, pyqtSignal
 
 
@@ -14,13 +16,42 @@ class CommandRunner(QThread):
     finished_execution = pyqtSignal()
     password_required = pyqtSignal(str)  # comando que requiere contraseña
     
-    def __init__(self, command, password=None):
+    def __init__(self, command, password=None, time_limit=None):
         super().__init__()
         self.command = command
         self.password = password
         self.process = None
         # Timeout más largo para comandos de instalación
         self.timeout = 300 if any(keyword in command.lower() for keyword in ['install', 'upgrade', 'update']) else 30
+        # Segundos tras los que se mata el comando (None: sin límite)
+        self.time_limit = time_limit
+        self.timed_out = False
+    
+    def _start_deadline(self):
+        """Programar la muerte del grupo de procesos al vencer time_limit
+        
+        readline() se queda bloqueado si el comando no escribe nada, así que
+        el plazo lo vigila un temporizador aparte y no el bucle de lectura.
+        """
+        if self.time_limit is None:
+            return None
+        process = self.process
+        
+        def expire():
+            if process.poll() is None:
+                self.timed_out = True
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except OSError:
+                    pass
+        
+        deadline = threading.Timer(self.time_limit, expire)
+        deadline.daemon = True
+        deadline.start()
+        return deadline
+    
+    def _report_timeout(self):
+        self.output_ready.emit(f"⏰ Comando cancelado por timeout ({self.time_limit}s)\n", "error")
     
     def run(self):
         try:
@@ -84,6 +115,7 @@ class CommandRunner(QThread):
                 cwd=os.getcwd(),
                 preexec_fn=os.setsid  # Crear nuevo grupo de procesos
             )
+            deadline = self._start_deadline()
             
             # Leer salida línea por línea
             while True:
@@ -95,7 +127,11 @@ class CommandRunner(QThread):
             
             # Esperar a que termine y obtener código de retorno
             return_code = self.process.wait()
-            if return_code != 0:
+            if deadline is not None:
+                deadline.cancel()
+            if self.timed_out:
+                self._report_timeout()
+            elif return_code != 0:
                 self.output_ready.emit(f"❌ Comando terminó con código de error: {return_code}\n", "error")
                 
         except Exception as e:
@@ -128,6 +164,8 @@ class CommandRunner(QThread):
                 preexec_fn=os.setsid  # Crear nuevo grupo de procesos
             )
             
+            deadline = self._start_deadline()
+            
             # Enviar contraseña
             self.process.stdin.write(self.password + '\n')
             self.process.stdin.flush()
@@ -143,7 +181,11 @@ class CommandRunner(QThread):
             
             # Verificar código de retorno
             return_code = self.process.wait()
-            if return_code == 0:
+            if deadline is not None:
+                deadline.cancel()
+            if self.timed_out:
+                self._report_timeout()
+            elif return_code == 0:
                 self.output_ready.emit("✅ Comando sudo ejecutado exitosamente\n", "success")
             else:
                 self.output_ready.emit(f"❌ Error en comando sudo (código: {return_code})\n", "error")
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Búsqueda de texto dentro de los archivos de un árbol de carpetas
+
+El árbol se recorre con el walker paralelo y los archivos se buscan por
+lotes en un pool de procesos (re no suelta el GIL). Cada archivo se
+descarta si la cabecera parece binaria y, si no, la expresión compilada
+recorre el archivo directamente sobre mmap: solo se copian a Python las
+líneas que coinciden. Los resultados se emiten por lotes en cuanto llegan
+y la búsqueda se detiene al alcanzar el máximo de coincidencias.
+"""
+
+import mmap
+import multiprocessing
+import os
+import queue
+import re
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .file_preview import SNIFF_BYTES, looks_binary
+from .walker import walk_files, WalkCancelled
+
+
+# Coincidencias como máximo antes de detener la búsqueda
+MAX_MATCHES = 2000
+
+# Coincidencias como máximo por archivo (un log enorme no acapara el resultado)
+MAX_MATCHES_PER_FILE = 100
+
+# Líneas de contexto antes y después de cada coincidencia
+CONTEXT_LINES = 2
+
+# Caracteres que se conservan de una línea (los archivos minificados tienen
+# líneas de megas)
+MAX_LINE_CHARS = 300
+
+# Archivos más grandes que esto no se buscan
+MAX_FILE_BYTES = 256 * 1024 * 1024
+
+# Por debajo de este tamaño se lee el archivo de una vez en vez de mapearlo
+MMAP_MIN_BYTES = 64 * 1024
+
+# Un lote se envía al pool al juntar estos archivos o estos bytes
+BATCH_FILES = 64
+BATCH_BYTES = 16 * 1024 * 1024
+
+# Carpetas que no se recorren: control de versiones y cachés, que nunca
+# tienen contenido propio (build/, dist/ o node_modules/ sí se buscan)
+SKIPPED_DIRS = frozenset({".git", ".hg", ".svn", ".bzr", "__pycache__",
+                          ".mypy_cache", ".pytest_cache", ".ruff_cache"})
+
+# Intervalo mínimo entre señales de progreso (segundos)
+REPORT_INTERVAL = 0.2
+
+# Coincidencia: archivo, número de línea (desde 1), texto de la línea,
+# columnas donde empieza y acaba lo encontrado, y líneas de contexto
+ContentMatch = namedtuple("ContentMatch", "path line_number line start end before after")
+
+# Patrón compilado; folded es el texto literal en minúsculas para buscarlo
+# sobre una copia en minúsculas (mucho más rápido que IGNORECASE) o None
+SearchPattern = namedtuple("SearchPattern", "regex folded")
+
+# Resultado de un lote: coincidencias, archivos buscados y binarios descartados
+BatchResult = namedtuple("BatchResult", "matches searched binary")
+
+
+def compile_pattern(text, regex=False, case_sensitive=False):
+    """Compilar lo buscado como expresión sobre bytes (ValueError si no es válida)"""
+    pattern = text if regex else re.escape(text)
+    flags = re.MULTILINE
+    if not case_sensitive:
+        flags |= re.IGNORECASE
+    try:
+        compiled = re.compile(pattern.encode("utf-8"), flags)
+    except re.error as e:
+        raise ValueError(f"Expresión no válida: {e}") from None
+    folded = None
+    if not regex and not case_sensitive:
+        # IGNORECASE sobre bytes solo pliega ASCII, igual que bytes.lower()
+        folded = re.compile(re.escape(text.encode("utf-8").lower()))
+    return SearchPattern(compiled, folded)
+
+
+def _decode_line(data):
+    return data[:MAX_LINE_CHARS * 4].decode("utf-8", errors="replace")[:MAX_LINE_CHARS]
+
+
+def _context_before(data, line_start, count):
+    """Hasta count líneas anteriores a la que empieza en line_start"""
+    lines = []
+    end = line_start - 1
+    while len(lines) < count and end >= 0:
+        start = data.rfind(b"\n", 0, end) + 1
+        lines.append(_decode_line(data[start:end]).rstrip("\r"))
+        end = start - 1
+    lines.reverse()
+    return tuple(lines)
+
+
+def _context_after(data, line_end, count):
+    """Hasta count líneas posteriores a la que acaba en line_end"""
+    lines = []
+    start = line_end + 1
+    size = len(data)
+    while len(lines) < count and start < size:
+        end = data.find(b"\n", start)
+        if end < 0:
+            end = size
+        lines.append(_decode_line(data[start:end]).rstrip("\r"))
+        start = end + 1
+    return tuple(lines)
+
+
+def _search_buffer(path, data, pattern, max_matches, context):
+    """Coincidencias de pattern en data (bytes o mmap), una por línea"""
+    matches = []
+    size = len(data)
+    line_number = 1
+    counted_until = 0
+    position = 0
+    # Un archivo ya leído se copia en minúsculas (mismas posiciones); uno
+    # mapeado se recorre tal cual con IGNORECASE
+    if pattern.folded is not None and isinstance(data, bytes):
+        regex, haystack = pattern.folded, data.lower()
+    else:
+        regex, haystack = pattern.regex, data
+    while len(matches) < max_matches:
+        found = regex.search(haystack, position)
+        if found is None:
+            break
+        line_start = data.rfind(b"\n", 0, found.start()) + 1
+        line_end = data.find(b"\n", found.end() if found.end() > found.start() else found.start())
+        if line_end < 0:
+            line_end = size
+        # Solo se copian los bytes entre una coincidencia y la siguiente
+        line_number += data[counted_until:line_start].count(b"\n")
+        counted_until = line_start
+        raw_line = data[line_start:line_end]
+        prefix = raw_line[:found.start() - line_start].decode("utf-8", errors="replace")
+        found_text = data[found.start():min(found.end(), line_end)].decode("utf-8", errors="replace")
+        line = _decode_line(raw_line).rstrip("\r")
+        start = min(len(prefix), len(line))
+        matches.append(ContentMatch(path, line_number, line, start,
+                                    min(start + len(found_text), len(line)),
+                                    _context_before(data, line_start, context),
+                                    _context_after(data, line_end, context)))
+        # Una línea con varias coincidencias se muestra una vez
+        position = line_end + 1
+        if position > size:
+            break
+    return matches
+
+
+def search_file(path, pattern, max_matches=MAX_MATCHES_PER_FILE, context=CONTEXT_LINES):
+    """Coincidencias en un archivo; None si parece binario
+    
+    Los archivos pequeños se leen de una vez; los demás se recorren sobre
+    mmap, que el sistema carga bajo demanda sin copiarlos a Python.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []
+        if size < MMAP_MIN_BYTES:
+            data = f.read()
+            if looks_binary(data[:SNIFF_BYTES]):
+                return None
+            return _search_buffer(path, data, pattern, max_matches, context)
+        if looks_binary(f.read(SNIFF_BYTES)):
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            return _search_buffer(path, mapped, pattern, max_matches, context)
+
+
+def search_batch(paths, pattern, max_matches, context=CONTEXT_LINES):
+    """Buscar en un lote de archivos (se ejecuta en otro proceso)"""
+    matches = []
+    searched = binary = 0
+    for path in paths:
+        if len(matches) >= max_matches:
+            break
+        try:
+            found = search_file(path, pattern, min(MAX_MATCHES_PER_FILE, max_matches - len(matches)),
+                                context)
+        except (OSError, ValueError):
+            # Ilegible, borrado durante la búsqueda o sin permisos
+            continue
+        searched += 1
+        if found is None:
+            binary += 1
+            continue
+        matches.extend(found)
+    return BatchResult(matches, searched, binary)
+
+
+class ContentSearcher(QThread):
+    """Hilo que busca un patrón dentro de los archivos de un árbol
+    
+    matches_found entrega las coincidencias por lotes según terminan;
+    search_finished indica si la búsqueda se cortó al llegar al máximo.
+    """
+    matches_found = pyqtSignal(object)  # lista de ContentMatch
+    progress_changed = pyqtSignal(int, int)  # archivos buscados, coincidencias
+    search_finished = pyqtSignal(int, int, bool, float)  # archivos, coincidencias, recortada, segundos
+    
+    def __init__(self, root, pattern, max_matches=MAX_MATCHES, skip_hidden=True,
+                 max_workers=8, max_processes=None, parent=None):
+        super().__init__(parent)
+        self.root = str(root)
+        self.pattern = pattern
+        self.max_matches = max_matches
+        self.skip_hidden = skip_hidden
+        self.max_workers = max_workers
+        self.max_processes = max_processes or max(1, min(4, (os.cpu_count() or 2) - 1))
+        self._cancel_event = threading.Event()
+        self._last_report = 0.0
+        self.files_searched = 0
+        self.match_count = 0
+    
+    def cancel(self):
+        """Detener la búsqueda lo antes posible"""
+        self._cancel_event.set()
+    
+    def _report(self, force=False):
+        """Emitir progreso como máximo cada REPORT_INTERVAL segundos"""
+        now = time.monotonic()
+        if force or now - self._last_report >= REPORT_INTERVAL:
+            self._last_report = now
+            self.progress_changed.emit(self.files_searched, self.match_count)
+    
+    def _batches(self):
+        """Lotes de archivos del árbol según se van encontrando"""
+        batch = []
+        batch_bytes = 0
+        for path, stat_result in walk_files(self.root, self._cancel_event, self.max_workers,
+                                            self.skip_hidden, skip_dirs=SKIPPED_DIRS):
+            size = stat_result.st_size
+            if size == 0 or size > MAX_FILE_BYTES:
+                continue
+            batch.append(path)
+            batch_bytes += size
+            if len(batch) >= BATCH_FILES or batch_bytes >= BATCH_BYTES:
+                yield batch
+                batch = []
+                batch_bytes = 0
+        if batch:
+            yield batch
+    
+    def _collect(self, results, block):
+        """Emitir los lotes terminados; devuelve cuántos se recogieron"""
+        collected = 0
+        while True:
+            try:
+                future = results.get(timeout=REPORT_INTERVAL) if block and not collected \
+                    else results.get_nowait()
+            except queue.Empty:
+                return collected
+            collected += 1
+            try:
+                result = future.result()
+            except Exception:
+                # Lote cancelado o proceso caído: sus archivos quedan sin buscar
+                continue
+            self.files_searched += result.searched
+            remaining = self.max_matches - self.match_count
+            matches = result.matches[:max(remaining, 0)]
+            if matches and not self._cancel_event.is_set():
+                self.match_count += len(matches)
+                self.matches_found.emit(matches)
+            self._report()
+    
+    def run(self):
+        start = time.monotonic()
+        results = queue.SimpleQueue()
+        pool = ProcessPoolExecutor(max_workers=self.max_processes,
+                                   mp_context=multiprocessing.get_context("spawn"))
+        outstanding = 0
+        truncated = False
+        try:
+            for batch in self._batches():
+                if self.match_count >= self.max_matches:
+                    truncated = True
+                    break
+                future = pool.submit(search_batch, batch, self.pattern,
+                                     self.max_matches - self.match_count)
+                future.add_done_callback(results.put)
+                outstanding += 1
+                # Sin acumular lotes de más: el recorrido espera al pool
+                while outstanding > 2 * self.max_processes:
+                    outstanding -= self._collect(results, block=True)
+                    if self._cancel_event.is_set():
+                        return
+                outstanding -= self._collect(results, block=False)
+            while outstanding and not self._cancel_event.is_set():
+                outstanding -= self._collect(results, block=True)
+                if self.match_count >= self.max_matches:
+                    truncated = True
+                    break
+        except WalkCancelled:
+            return
+        except (OSError, BrokenProcessPool):
+            # La carpeta raíz desapareció o no se puede leer, o el pool cayó:
+            # se queda lo encontrado hasta ahí
+            pass
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            if not self._cancel_event.is_set():
+                self._report(force=True)
+                self.search_finished.emit(self.files_searched, self.match_count,
+                                          truncated or self.match_count >= self.max_matches,
+                                          time.monotonic() - start)
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Índice de aplicaciones instaladas (.desktop) por tipo MIME
+
+Recorre las carpetas applications/ de los directorios de datos XDG, lee
+la línea MimeType de cada .desktop y las asociaciones de mimeapps.list.
+El índice se guarda en $XDG_CACHE_HOME/linux-gui/desktop-apps.json junto
+con la fecha de modificación de cada carpeta y archivo leído: mientras
+ninguna cambie, cargarlo cuesta unos pocos stat en vez de leer cientos de
+archivos. Lanzar una aplicación no espera al proceso: se arranca en una
+sesión propia y la interfaz sigue al momento.
+"""
+
+import json
+import locale
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import threading
+from collections import namedtuple
+from pathlib import Path
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+CACHE_VERSION = 1
+
+# Aplicación: id del .desktop, nombre visible, línea Exec, icono, si va en
+# terminal, tipos MIME que declara, ruta del .desktop y si se oculta en menús
+DesktopApp = namedtuple("DesktopApp", "desktop_id name exec_line icon terminal mime_types "
+                                      "path no_display")
+
+# Códigos de campo de Exec que se descartan (obsoletos o sin sentido aquí)
+_DROPPED_FIELD_CODES = {"%d", "%D", "%n", "%N", "%v", "%m"}
+
+# Emuladores de terminal probados para las aplicaciones con Terminal=true
+TERMINALS = ("x-terminal-emulator", "gnome-terminal", "konsole", "xfce4-terminal", "xterm")
+
+# Códigos de campo dentro de un argumento de Exec ("%%" es un "%" literal)
+_FIELD_CODE = re.compile(r"%[%a-zA-Z]")
+
+
+def _data_dirs():
+    """Directorios de datos XDG por orden de preferencia"""
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.join(Path.home(), ".local", "share")
+    data_dirs = os.environ.get("XDG_DATA_DIRS") or "/usr/local/share:/usr/share"
+    dirs = [data_home] + [path for path in data_dirs.split(":") if path]
+    return list(dict.fromkeys(dirs))
+
+
+def application_dirs():
+    """Carpetas applications/ a recorrer (la primera gana en ids repetidos)"""
+    return [os.path.join(path, "applications") for path in _data_dirs()]
+
+
+def mimeapps_files():
+    """mimeapps.list por orden de preferencia (el del usuario primero)"""
+    config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.join(Path.home(), ".config")
+    files = [os.path.join(config_home, "mimeapps.list")]
+    files += [os.path.join(path, "mimeapps.list") for path in application_dirs()]
+    return files
+
+
+def mime_subclass_files():
+    """Archivos subclasses de shared-mime-info (text/x-python es un text/plain)"""
+    return [os.path.join(path, "mime", "subclasses") for path in _data_dirs()]
+
+
+def cache_path():
+    """Archivo del índice: $XDG_CACHE_HOME/linux-gui/desktop-apps.json"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return os.path.join(cache_home, "linux-gui", "desktop-apps.json")
+
+
+def _language_keys():
+    """Sufijos de Name[...] aceptados para el idioma actual, del más concreto al menos"""
+    language = (os.environ.get("LC_ALL") or os.environ.get("LC_MESSAGES")
+                or os.environ.get("LANG") or locale.getlocale()[0] or "")
+    language = language.split(".")[0].split("@")[0]
+    keys = []
+    if language and language not in ("C", "POSIX"):
+        keys.append(f"Name[{language}]")
+        if "_" in language:
+            keys.append(f"Name[{language.split('_')[0]}]")
+    return keys + ["Name"]
+
+
+def parse_desktop_file(path, desktop_id, name_keys=None):
+    """Leer el grupo [Desktop Entry] de un .desktop (None si no es una aplicación)"""
+    values = {}
+    in_entry = False
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("["):
+                if in_entry:
+                    break
+                in_entry = line == "[Desktop Entry]"
+                continue
+            if in_entry and "=" in line:
+                key, value = line.split("=", 1)
+                values.setdefault(key.strip(), value.strip())
+    
+    if values.get("Type") != "Application" or "Exec" not in values:
+        return None
+    if values.get("Hidden", "").lower() == "true":
+        return None
+    name = next((values[key] for key in (name_keys or _language_keys()) if values.get(key)),
+                desktop_id)
+    return DesktopApp(desktop_id, name, values["Exec"], values.get("Icon", ""),
+                      values.get("Terminal", "").lower() == "true",
+                      [mime for mime in values.get("MimeType", "").split(";") if mime],
+                      path, values.get("NoDisplay", "").lower() == "true")
+
+
+def _parse_mimeapps(path):
+    """Secciones de un mimeapps.list: {sección: {tipo: [ids]}}"""
+    sections = {}
+    current = None
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("["):
+                current = sections.setdefault(line.strip("[]"), {})
+            elif current is not None and "=" in line:
+                mime, ids = line.split("=", 1)
+                current[mime.strip()] = [desktop_id for desktop_id in ids.split(";") if desktop_id]
+    return sections
+
+
+def _parse_subclasses(path):
+    """Pares (tipo, tipo padre) de un archivo subclasses"""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return [tuple(line.split()[:2]) for line in f if len(line.split()) >= 2]
+
+
+def expand_exec(app, paths):
+    """Convertir la línea Exec en las órdenes a lanzar para unos archivos
+    
+    %f y %u admiten un solo archivo, así que con varios se lanza una orden
+    por archivo; %F y %U los reciben todos a la vez. Sin ningún código de
+    archivo se lanza la aplicación tal cual.
+    """
+    try:
+        arguments = shlex.split(app.exec_line)
+    except ValueError:
+        arguments = app.exec_line.split()
+    single = any(code in ("%f", "%u") for argument in arguments
+                 for code in _FIELD_CODE.findall(argument))
+    groups = [[path] for path in paths] if single and paths else [list(paths)]
+    
+    commands = []
+    for group in groups:
+        command = []
+        for argument in arguments:
+            if argument in ("%F", "%U"):
+                command.extend(group)
+            elif argument == "%i":
+                if app.icon:
+                    command.extend(["--icon", app.icon])
+            elif argument in _DROPPED_FIELD_CODES:
+                continue
+            else:
+                replacements = {"%%": "%", "%f": group[0] if group else "",
+                                "%u": group[0] if group else "", "%c": app.name, "%k": app.path}
+                # Una sola pasada: lo ya sustituido (una ruta con "%") no se vuelve a mirar
+                argument = _FIELD_CODE.sub(lambda code: replacements.get(code.group(), ""), argument)
+                if argument:
+                    command.append(argument)
+        if app.terminal:
+            terminal = next((name for name in TERMINALS if shutil.which(name)), None)
+            if terminal is not None:
+                command = [terminal, "-e"] + command
+        commands.append(command)
+    return commands
+
+
+def launch(app, paths):
+    """Lanzar una aplicación con unos archivos sin esperar a que termine
+    
+    Lanza FileNotFoundError si el programa de la línea Exec no existe.
+    """
+    working_dir = os.path.dirname(paths[0]) if paths else str(Path.home())
+    for command in expand_exec(app, paths):
+        # Sesión propia: la aplicación sobrevive a este proceso y no recibe
+        # sus señales de terminal
+        subprocess.Popen(command, cwd=working_dir,
+                         stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, start_new_session=True)
+
+
+class DesktopAppIndex:
+    """Aplicaciones por tipo MIME, guardadas en disco entre ejecuciones
+    
+    load() se llama una vez (normalmente desde AppIndexLoader al arrancar);
+    las consultas posteriores solo usan memoria, así el diálogo "Abrir
+    con…" aparece al instante. Mientras otro hilo reconstruye el índice,
+    las consultas no esperan: responden con lo ya cargado (vacío si aún no
+    hay nada, y quien abre un archivo recurre a xdg-open).
+    """
+    
+    def __init__(self, path=None):
+        self.path = path or cache_path()
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._ready = False
+        self.apps = {}
+        self.by_mime = {}
+        self.defaults = {}
+        self.added = {}
+        self.removed = {}
+        self.parents = {}
+    
+    # --- Consultas -----------------------------------------------------
+    
+    def applications_for(self, mime):
+        """Aplicaciones para un tipo: la predeterminada primero
+        
+        Se incluyen las que declaran un tipo padre (un script de Python se
+        puede abrir con un editor de texto plano).
+        """
+        self.load(wait=False)
+        ordered = []
+        removed = set()
+        for current in self._mime_chain(mime):
+            removed.update(self.removed.get(current, ()))
+            for desktop_id in (self.defaults.get(current, []) + self.added.get(current, [])
+                               + self.by_mime.get(current, [])):
+                if desktop_id in self.apps and desktop_id not in removed and desktop_id not in ordered:
+                    ordered.append(desktop_id)
+        return [self.apps[desktop_id] for desktop_id in ordered]
+    
+    def default_application(self, mime):
+        """Aplicación con la que se abre un tipo por defecto (o None)"""
+        applications = self.applications_for(mime)
+        return applications[0] if applications else None
+    
+    def all_applications(self):
+        """Todas las aplicaciones visibles en menús, por nombre"""
+        self.load(wait=False)
+        return sorted((app for app in self.apps.values() if not app.no_display),
+                      key=lambda app: app.name.casefold())
+    
+    def _mime_chain(self, mime):
+        """El tipo y sus padres, del más concreto al más general"""
+        chain = [mime]
+        for current in chain:
+            for parent in self.parents.get(current, ()):
+                if parent not in chain:
+                    chain.append(parent)
+            if current.startswith("text/") and "text/plain" not in chain:
+                chain.append("text/plain")
+        return chain
+    
+    # --- Construcción y caché ------------------------------------------
+    
+    def is_ready(self):
+        """Indica si el índice ya se cargó alguna vez"""
+        return self._ready
+    
+    def load(self, refresh=False, wait=True):
+        """Cargar el índice de la caché o reconstruirlo si algo cambió
+        
+        Con wait=False no se espera a otro hilo que lo esté cargando.
+        """
+        if not self._lock.acquire(blocking=wait):
+            return
+        try:
+            if self._loaded and not refresh:
+                return
+            self._loaded = True
+            data = None if refresh else self._read_cache()
+            if data is None:
+                data = self._build()
+                self._write_cache(data)
+            self._apply(data)
+            self._ready = True
+        finally:
+            self._lock.release()
+    
+    def _sources(self):
+        """Marcas de validez: mtime de cada carpeta y archivo que alimenta el índice"""
+        marks = {}
+        for directory in application_dirs():
+            for root, dirs, _ in os.walk(directory):
+                try:
+                    marks[root] = os.stat(root).st_mtime_ns
+                except OSError:
+                    continue
+        for path in mimeapps_files() + mime_subclass_files():
+            try:
+                marks[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+        return marks
+    
+    def _read_cache(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != CACHE_VERSION or data.get("language") != _language_keys()[0]:
+            return None
+        if data.get("sources") != self._sources():
+            return None
+        return data
+    
+    def _write_cache(self, data):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temporary = f"{self.path}.tmp"
+            with open(temporary, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temporary, self.path)
+        except OSError:
+            pass
+    
+    def _build(self):
+        """Leer todos los .desktop, mimeapps.list y subclasses"""
+        sources = self._sources()
+        name_keys = _language_keys()
+        apps = {}
+        for directory in application_dirs():
+            for root, _, files in os.walk(directory):
+                for name in files:
+                    if not name.endswith(".desktop"):
+                        continue
+                    path = os.path.join(root, name)
+                    # El id incluye las subcarpetas: kde4/foo.desktop es kde4-foo.desktop
+                    desktop_id = os.path.relpath(path, directory).replace(os.sep, "-")
+                    if desktop_id in apps:
+                        continue
+                    try:
+                        app = parse_desktop_file(path, desktop_id, name_keys)
+                    except OSError:
+                        continue
+                    # Un id ya visto en una carpeta preferente tapa a los siguientes
+                    apps[desktop_id] = list(app) if app is not None else None
+        
+        associations = {"Default Applications": {}, "Added Associations": {},
+                        "Removed Associations": {}}
+        for path in mimeapps_files():
+            try:
+                sections = _parse_mimeapps(path)
+            except OSError:
+                continue
+            for section, entries in associations.items():
+                for mime, ids in sections.get(section, {}).items():
+                    entries.setdefault(mime, ids)
+        
+        parents = {}
+        for path in mime_subclass_files():
+            try:
+                pairs = _parse_subclasses(path)
+            except OSError:
+                continue
+            for mime, parent in pairs:
+                parents.setdefault(mime, [])
+                if parent not in parents[mime]:
+                    parents[mime].append(parent)
+        
+        return {"version": CACHE_VERSION, "language": name_keys[0], "sources": sources,
+                "apps": {key: value for key, value in apps.items() if value is not None},
+                "defaults": associations["Default Applications"],
+                "added": associations["Added Associations"],
+                "removed": associations["Removed Associations"],
+                "parents": parents}
+    
+    def _apply(self, data):
+        """Pasar los datos leídos a las tablas de consulta"""
+        apps = {key: DesktopApp(*value) for key, value in data["apps"].items()}
+        by_mime = {}
+        for app in apps.values():
+            for mime in app.mime_types:
+                by_mime.setdefault(mime, []).append(app.desktop_id)
+        # Las consultas pueden leer a la vez: cada tabla se sustituye entera
+        self.apps = apps
+        self.by_mime = by_mime
+        self.defaults = data["defaults"]
+        self.added = data["added"]
+        self.removed = data["removed"]
+        self.parents = data["parents"]
+
+
+class AppIndexLoader(QThread):
+    """Hilo que carga (o reconstruye) el índice de aplicaciones al arrancar"""
+    index_ready = pyqtSignal()
+    
+    def __init__(self, index=None, parent=None):
+        super().__init__(parent)
+        self.index = index or desktop_app_index
+    
+    def run(self):
+        self.index.load()
+        self.index_ready.emit()
+
+
+# Índice compartido por toda la aplicación
+desktop_app_index = DesktopAppIndex()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+DirSizeCache - Cálculo del tamaño de carpetas (estilo du) en segundo plano
+"""
+
+import os
+import threading
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .fs_guard import fs_guard
+
+
+# Resultado del listado de una carpeta: clave de validez, bytes de sus archivos
+# directos, archivos con enlaces duros (dev, ino, tamaño) y nombres de subcarpetas
+_DirRecord = namedtuple("_DirRecord", "key own_size hardlinks subdirs")
+
+
+class DirSizeCancelled(Exception):
+    """El cálculo se canceló antes de terminar"""
+
+
+class DirSizeCache:
+    """Caché de tamaños de carpeta con validez por (st_dev, st_ino, st_mtime)
+    
+    Cada carpeta guarda únicamente el resultado de listar su contenido directo.
+    El mtime de una carpeta cambia cuando se crean, borran o renombran entradas
+    dentro de ella, así que solo se vuelven a listar las carpetas modificadas;
+    el resto del árbol se valida con un simple stat. Listados y totales son
+    LRU con tamaño limitado para que recorrer árboles enormes no haga crecer
+    la memoria durante toda la sesión.
+    """
+    
+    def __init__(self, max_records=100000, max_totals=10000):
+        self.max_records = max_records
+        self.max_totals = max_totals
+        self._lock = threading.Lock()
+        self._records = OrderedDict()
+        self._totals = OrderedDict()
+    
+    def cached_size(self, path):
+        """Último tamaño total conocido de una carpeta (None si nunca se calculó)"""
+        with self._lock:
+            return self._totals.get(str(path))
+    
+    def invalidate(self, path):
+        """Olvidar el listado de una carpeta para forzar su relectura"""
+        with self._lock:
+            self._records.pop(str(path), None)
+            self._totals.pop(str(path), None)
+    
+    def compute(self, path, cancel_event=None, progress=None):
+        """Calcular el tamaño total de una carpeta reutilizando la caché
+        
+        progress se llama tras cada subcarpeta (para FilesystemGuard).
+        """
+        root = str(path)
+        seen_inodes = set()
+        total = 0
+        pending = [root]
+        while pending:
+            if cancel_event is not None and cancel_event.is_set():
+                raise DirSizeCancelled(root)
+            current = pending.pop()
+            record = self._get_record(current)
+            if progress is not None:
+                progress()
+            if record is None:
+                continue
+            total += record.own_size
+            # Los enlaces duros solo se cuentan una vez por cálculo
+            for dev, ino, size in record.hardlinks:
+                if (dev, ino) not in seen_inodes:
+                    seen_inodes.add((dev, ino))
+                    total += size
+            pending.extend(os.path.join(current, name) for name in record.subdirs)
+        
+        with self._lock:
+            self._totals[root] = total
+            self._totals.move_to_end(root)
+            while len(self._totals) > self.max_totals:
+                self._totals.popitem(last=False)
+        return total
+    
+    def _get_record(self, path):
+        """Obtener el listado de una carpeta, releyéndolo solo si cambió"""
+        try:
+            st = os.stat(path, follow_symlinks=False)
+        except OSError:
+            return None
+        key = (st.st_dev, st.st_ino, st.st_mtime_ns)
+        
+        with self._lock:
+            record = self._records.get(path)
+            if record is not None and record.key == key:
+                self._records.move_to_end(path)
+                return record
+        
+        own_size = 0
+        hardlinks = []
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                            continue
+                        entry_stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if entry_stat.st_nlink > 1:
+                        hardlinks.append((entry_stat.st_dev, entry_stat.st_ino, entry_stat.st_size))
+                    else:
+                        own_size += entry_stat.st_size
+        except OSError:
+            return None
+        
+        record = _DirRecord(key, own_size, tuple(hardlinks), tuple(subdirs))
+        with self._lock:
+            self._records[path] = record
+            self._records.move_to_end(path)
+            # Descartar los listados usados hace más tiempo
+            while len(self._records) > self.max_records:
+                self._records.popitem(last=False)
+        return record
+
+
+# Caché compartida por todos los exploradores de la aplicación
+dir_size_cache = DirSizeCache()
+
+
+class DirSizeWorker(QThread):
+    """Hilo que calcula el tamaño de varias carpetas con un pool de workers"""
+    size_ready = pyqtSignal(str, object)  # ruta, tamaño en bytes
+    
+    def __init__(self, paths, cache=None, max_workers=4, guard=None, parent=None):
+        super().__init__(parent)
+        self.paths = [str(p) for p in paths]
+        self.cache = cache or dir_size_cache
+        self.max_workers = max_workers
+        self.guard = guard or fs_guard
+        self._cancel_event = threading.Event()
+    
+    def _compute(self, path):
+        """Calcular una carpeta a través de FilesystemGuard
+        
+        El tiempo límite cuenta desde la última subcarpeta leída: un árbol
+        grande pero activo no se confunde con un montaje colgado.
+        """
+        return self.guard.call(self.cache.compute, path, self._cancel_event,
+                               cancel_event=self._cancel_event, watch_progress=True)
+    
+    def run(self):
+        if not self.paths:
+            return
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = {pool.submit(self._compute, path): path
+                       for path in self.paths}
+            for future in as_completed(futures):
+                if self._cancel_event.is_set():
+                    break
+                try:
+                    size = future.result()
+                except (DirSizeCancelled, OSError):
+                    continue
+                if size is None:
+                    continue
+                self.size_ready.emit(futures[future], size)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+    
+    def cancel(self):
+        """Detener el cálculo lo antes posible"""
+        self._cancel_event.set()
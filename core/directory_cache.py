@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+DirectoryCache - Listados de carpetas y estado de la vista en una caché LRU
+"""
+
+import errno
+import os
+import stat
+import threading
+from collections import namedtuple, OrderedDict, deque
+from functools import partial
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .archives import archive_cache, split_archive_path
+from .fs_guard import fs_guard
+
+
+# Entrada de un listado: nombre, ruta, si es carpeta y su stat (siguiendo enlaces)
+DirectoryEntry = namedtuple("DirectoryEntry", "name path is_dir stat")
+
+# Listado completo de una carpeta con su clave de validez; archive es la
+# ruta del archivo comprimido cuando la carpeta es virtual
+DirectoryListing = namedtuple("DirectoryListing", "path key entries archive", defaults=(None,))
+
+# Posición de la vista al salir de una carpeta: scroll, rutas seleccionadas e item actual
+ViewState = namedtuple("ViewState", "scroll selected current")
+
+
+def directory_key(stat_result):
+    """Clave de validez de una carpeta: cambia al crear, borrar o renombrar entradas"""
+    return (stat_result.st_dev, stat_result.st_ino, stat_result.st_mtime_ns)
+
+
+def read_listing(path, show_hidden=False, cancel_event=None, max_entries=None, progress=None):
+    """Listar una carpeta en una sola pasada de os.scandir
+    
+    La clave se lee antes de listar: si la carpeta cambia durante el
+    listado, la siguiente consulta a la caché lo detecta y vuelve a leerla.
+    Solo se incluyen carpetas y archivos regulares (siguiendo enlaces).
+    Devuelve None si cancel_event se activa o la carpeta tiene más de
+    max_entries entradas. progress se llama con cada entrada leída.
+    """
+    path = str(path)
+    key = directory_key(os.stat(path))
+    entries = []
+    with os.scandir(path) as scanner:
+        for index, entry in enumerate(scanner):
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            if max_entries is not None and index >= max_entries:
+                return None
+            if progress is not None:
+                progress()
+            if not show_hidden and entry.name.startswith('.'):
+                continue
+            try:
+                is_dir = entry.is_dir()
+                if not is_dir and not entry.is_file():
+                    continue
+                stat_result = entry.stat()
+            except OSError:
+                continue
+            entries.append(DirectoryEntry(entry.name, entry.path, is_dir, stat_result))
+    return DirectoryListing(path, key, tuple(entries))
+
+
+def _member_stat(member):
+    """stat sintético de un miembro de un archivo comprimido"""
+    mode = (stat.S_IFDIR | 0o755) if member.is_dir else (stat.S_IFREG | 0o644)
+    mtime = member.mtime
+    return os.stat_result((mode, 0, 0, 1, os.getuid(), os.getgid(), member.size, mtime, mtime, mtime))
+
+
+def read_archive_listing(path, show_hidden=False, cancel_event=None, progress=None):
+    """Listar una carpeta virtual dentro de un archivo comprimido
+    
+    path es la ruta del archivo seguida de la ruta interna
+    ("/ruta/datos.zip/carpeta"). La tabla de miembros se lee una vez y
+    queda en archive_cache; las visitas siguientes solo hacen un stat del
+    archivo. Devuelve None si cancel_event se activa.
+    """
+    path = str(path)
+    archive_path, inner = split_archive_path(path)
+    if archive_path is None:
+        raise NotADirectoryError(errno.ENOTDIR, os.strerror(errno.ENOTDIR), path)
+    index = archive_cache.get(archive_path, cancel_event, progress)
+    if index is None:
+        return None
+    entries = []
+    for member in index.list_directory(inner):
+        name = member.path.rpartition("/")[2]
+        if not show_hidden and name.startswith('.'):
+            continue
+        entries.append(DirectoryEntry(name, os.path.join(archive_path, member.path),
+                                      member.is_dir, _member_stat(member)))
+    return DirectoryListing(path, None, tuple(entries), archive_path)
+
+
+class _CacheEntry:
+    """Listado y estado de vista de una carpeta"""
+    __slots__ = ("listing", "view_state")
+    
+    def __init__(self):
+        self.listing = None
+        self.view_state = None
+
+
+class DirectoryCache:
+    """Caché LRU de listados de carpetas con validez por (dev, ino, mtime)
+    
+    Volver a una carpeta visitada cuesta un stat de la propia carpeta en
+    lugar de listarla de nuevo. El tamaño se limita por número de carpetas
+    y por número total de entradas para que una carpeta enorme no retenga
+    memoria indefinidamente.
+    """
+    
+    def __init__(self, max_directories=64, max_items=250000):
+        self.max_directories = max_directories
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._item_count = 0
+    
+    def get(self, path):
+        """Listado en caché si la carpeta no cambió desde que se leyó"""
+        path = str(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            listing = entry.listing if entry is not None else None
+        if listing is None:
+            return None
+        try:
+            key = directory_key(os.stat(path))
+        except OSError:
+            return None
+        if key != listing.key:
+            return None
+        with self._lock:
+            if path in self._entries:
+                self._entries.move_to_end(path)
+        return listing
+    
+    def store(self, listing):
+        """Guardar un listado recién leído"""
+        with self._lock:
+            entry = self._touch(listing.path)
+            if entry.listing is not None:
+                self._item_count -= len(entry.listing.entries)
+            entry.listing = listing
+            self._item_count += len(listing.entries)
+            self._trim()
+    
+    def view_state(self, path):
+        """Último estado de vista guardado para una carpeta"""
+        with self._lock:
+            entry = self._entries.get(str(path))
+            return entry.view_state if entry is not None else None
+    
+    def save_view_state(self, path, view_state):
+        """Guardar scroll y selección al salir de una carpeta"""
+        with self._lock:
+            self._touch(str(path)).view_state = view_state
+            self._trim()
+    
+    def invalidate(self, path):
+        """Olvidar el listado de una carpeta (se conserva su estado de vista)"""
+        with self._lock:
+            entry = self._entries.get(str(path))
+            if entry is not None and entry.listing is not None:
+                self._item_count -= len(entry.listing.entries)
+                entry.listing = None
+    
+    def _touch(self, path):
+        """Entrada de una carpeta marcada como la más reciente (con el lock tomado)"""
+        entry = self._entries.get(path)
+        if entry is None:
+            entry = self._entries[path] = _CacheEntry()
+        else:
+            self._entries.move_to_end(path)
+        return entry
+    
+    def _trim(self):
+        """Descartar las carpetas usadas hace más tiempo (con el lock tomado)"""
+        while self._entries and (len(self._entries) > self.max_directories
+                                 or self._item_count > self.max_items):
+            _, entry = self._entries.popitem(last=False)
+            if entry.listing is not None:
+                self._item_count -= len(entry.listing.entries)
+
+
+# Caché compartida por todos los exploradores de la aplicación
+directory_cache = DirectoryCache()
+
+
+class ListingPrefetcher(QThread):
+    """Hilo de baja prioridad que lee por adelantado las carpetas probables
+    
+    Las peticiones forman una pila acotada: la más reciente se atiende
+    primero y las más antiguas se descartan. Mientras el explorador lista
+    la carpeta actual, el prefetch se pausa y la lectura en curso se aborta
+    para no competir con ella.
+    """
+    
+    def __init__(self, cache=None, max_pending=8, max_entries=5000, guard=None, parent=None):
+        super().__init__(parent)
+        self.cache = cache or directory_cache
+        self.guard = guard or fs_guard
+        self.max_pending = max_pending
+        self.max_entries = max_entries
+        self._condition = threading.Condition()
+        self._pending = deque()
+        self._paused = False
+        self._stopped = False
+        self._abort_event = threading.Event()
+        # Cambia con cada clear(): una lectura abortada de antes no se reintenta
+        self._generation = 0
+    
+    def request(self, path):
+        """Pedir la lectura anticipada de una carpeta"""
+        path = str(path)
+        with self._condition:
+            if path in self._pending:
+                self._pending.remove(path)
+            self._pending.append(path)
+            while len(self._pending) > self.max_pending:
+                self._pending.popleft()
+            self._condition.notify()
+    
+    def clear(self):
+        """Olvidar las peticiones pendientes y abortar la lectura en curso"""
+        with self._condition:
+            self._pending.clear()
+            self._generation += 1
+            self._abort_event.set()
+    
+    def pause(self):
+        """Ceder el disco al listado de primer plano"""
+        with self._condition:
+            self._paused = True
+            self._abort_event.set()
+    
+    def resume(self):
+        """Reanudar el prefetch tras el listado de primer plano"""
+        with self._condition:
+            self._paused = False
+            self._condition.notify()
+    
+    def cancel(self):
+        """Detener el hilo"""
+        with self._condition:
+            self._stopped = True
+            self._abort_event.set()
+            self._condition.notify()
+    
+    def _next_path(self):
+        """Esperar a la siguiente petición y su generación (None al detener el hilo)"""
+        with self._condition:
+            while not self._stopped and (self._paused or not self._pending):
+                self._condition.wait()
+            if self._stopped:
+                return None
+            self._abort_event.clear()
+            return self._pending.pop(), self._generation
+    
+    def run(self):
+        while True:
+            request = self._next_path()
+            if request is None:
+                return
+            path, generation = request
+            # Las lecturas pasan por el guardián: un montaje colgado no bloquea el hilo
+            try:
+                if self.guard.call(self.cache.get, path, cancel_event=self._abort_event) is not None:
+                    continue
+                listing = self.guard.call(
+                    partial(read_listing, cancel_event=self._abort_event, max_entries=self.max_entries),
+                    path, cancel_event=self._abort_event, watch_progress=True)
+            except OSError:
+                continue
+            if listing is not None:
+                self.cache.store(listing)
+            elif self._paused:
+                # Abortada por el listado de primer plano: reintentar después,
+                # salvo que la pila se haya vaciado (el usuario ya se fue de ahí)
+                with self._condition:
+                    if generation == self._generation and path not in self._pending:
+                        self._pending.append(path)
+
+
+class ListingWorker(QThread):
+    """Hilo que obtiene el listado de la carpeta mostrada sin bloquear la interfaz
+    
+    Tanto la validación de la caché (un stat) como el listado pasan por
+    FilesystemGuard, así que un montaje colgado produce MountUnresponsive
+    en lugar de congelar la aplicación. Si la ruta atraviesa un archivo
+    comprimido se lista como carpeta virtual (sin guardarla en la caché de
+    carpetas: archive_cache ya conserva su tabla de miembros).
+    """
+    listing_ready = pyqtSignal(object, bool)  # DirectoryListing, si salió de la caché
+    listing_failed = pyqtSignal(object)  # OSError
+    
+    def __init__(self, path, refresh=False, cache=None, guard=None, parent=None):
+        super().__init__(parent)
+        self.path = str(path)
+        self.refresh = refresh
+        self.cache = cache or directory_cache
+        self.guard = guard or fs_guard
+        self._cancel_event = threading.Event()
+    
+    def cancel(self):
+        """Dejar de esperar el listado"""
+        self._cancel_event.set()
+    
+    def run(self):
+        try:
+            listing = None
+            if not self.refresh:
+                listing = self.guard.call(self.cache.get, self.path, cancel_event=self._cancel_event)
+            from_cache = listing is not None
+            if listing is None and not self._cancel_event.is_set():
+                try:
+                    listing = self.guard.call(partial(read_listing, cancel_event=self._cancel_event),
+                                              self.path, cancel_event=self._cancel_event,
+                                              watch_progress=True)
+                except NotADirectoryError:
+                    listing = self.guard.call(partial(read_archive_listing, cancel_event=self._cancel_event),
+                                              self.path, cancel_event=self._cancel_event,
+                                              watch_progress=True)
+                if listing is not None and listing.archive is None:
+                    self.cache.store(listing)
+        except OSError as error:
+            if not self._cancel_event.is_set():
+                self.listing_failed.emit(error)
+            return
+        if listing is not None and not self._cancel_event.is_set():
+            self.listing_ready.emit(listing, from_cache)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+DiskUsageScanner - Uso de disco por carpeta y archivos más grandes
+
+La memoria del análisis es proporcional al número de carpetas más N: de
+cada archivo solo se conserva su tamaño sumado a su carpeta, salvo los N
+más grandes, que se mantienen en un montículo acotado.
+"""
+
+import heapq
+import os
+import threading
+import time
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .walker import walk_directories, WalkCancelled
+
+
+# Intervalo mínimo entre señales de progreso (segundos)
+REPORT_INTERVAL = 0.3
+
+
+class _DirNode:
+    """Carpeta del árbol de uso: tamaño propio, total acumulado y subcarpetas"""
+    __slots__ = ("own_size", "total", "file_count", "children", "scanned")
+    
+    def __init__(self):
+        self.own_size = 0
+        self.total = 0
+        self.file_count = 0
+        self.children = ()
+        self.scanned = False
+
+
+class DiskUsageTree:
+    """Tamaños acumulados por carpeta, consultables mientras crece el análisis
+    
+    Cada listado suma sus bytes a la carpeta y a todos sus antecesores, así
+    que el total de cualquier subárbol está disponible sin recorrerlo de
+    nuevo al navegar hacia dentro.
+    """
+    
+    def __init__(self, root):
+        self.root = os.path.abspath(str(root))
+        self._lock = threading.Lock()
+        self._nodes = {self.root: _DirNode()}
+    
+    def add_directory(self, path, own_size, file_count, subdirs):
+        """Registrar el listado de una carpeta y propagar su tamaño hacia arriba"""
+        with self._lock:
+            node = self._nodes.setdefault(path, _DirNode())
+            node.own_size = own_size
+            node.file_count = file_count
+            node.children = tuple(subdirs)
+            node.scanned = True
+            for subdir in subdirs:
+                self._nodes.setdefault(subdir, _DirNode())
+            
+            current = path
+            while True:
+                self._nodes.setdefault(current, _DirNode()).total += own_size
+                if current == self.root or len(current) <= len(self.root):
+                    break
+                current = os.path.dirname(current)
+    
+    def contains(self, path):
+        """Indica si una carpeta forma parte del árbol analizado"""
+        with self._lock:
+            return path in self._nodes
+    
+    def total(self, path):
+        """Tamaño acumulado de una carpeta (hasta donde se ha analizado)"""
+        with self._lock:
+            node = self._nodes.get(path)
+            return node.total if node is not None else 0
+    
+    def children(self, path):
+        """Contenido de una carpeta: [(subcarpeta, total)], bytes de sus archivos y si ya se listó"""
+        with self._lock:
+            node = self._nodes.get(path)
+            if node is None:
+                return [], 0, False
+            sizes = [(child, self._nodes[child].total) for child in node.children]
+            return sizes, node.own_size, node.scanned
+
+
+class DiskUsageScanner(QThread):
+    """Hilo que recorre un árbol en paralelo acumulando tamaños"""
+    progress_changed = pyqtSignal(int, object)  # archivos, bytes
+    scan_finished = pyqtSignal(int, object)  # archivos, bytes
+    
+    def __init__(self, root, top_n=100, max_workers=8, parent=None):
+        super().__init__(parent)
+        self.tree = DiskUsageTree(root)
+        self.top_n = top_n
+        self.max_workers = max_workers
+        self._cancel_event = threading.Event()
+        self._top_lock = threading.Lock()
+        self._top_files = []  # Montículo mínimo de (tamaño, ruta)
+    
+    @property
+    def root(self):
+        return self.tree.root
+    
+    def cancel(self):
+        """Detener el análisis lo antes posible"""
+        self._cancel_event.set()
+    
+    def top_files(self):
+        """Los N archivos más grandes encontrados hasta ahora, de mayor a menor"""
+        with self._top_lock:
+            return sorted(self._top_files, reverse=True)
+    
+    def _offer_file(self, size, path):
+        """Mantener en el montículo solo los N archivos más grandes"""
+        heap = self._top_files
+        if len(heap) < self.top_n:
+            with self._top_lock:
+                heapq.heappush(heap, (size, path))
+        elif size > heap[0][0]:
+            with self._top_lock:
+                heapq.heapreplace(heap, (size, path))
+    
+    def run(self):
+        files = 0
+        total_bytes = 0
+        seen_inodes = set()
+        last_report = 0.0
+        try:
+            for directory, entries, subdirs in walk_directories(
+                    self.tree.root, self._cancel_event, self.max_workers, one_file_system=True):
+                own_size = 0
+                for path, stat_result in entries:
+                    if stat_result.st_nlink > 1:
+                        # Los enlaces duros ocupan espacio una sola vez
+                        inode = (stat_result.st_dev, stat_result.st_ino)
+                        if inode in seen_inodes:
+                            continue
+                        seen_inodes.add(inode)
+                    own_size += stat_result.st_size
+                    self._offer_file(stat_result.st_size, path)
+                files += len(entries)
+                total_bytes += own_size
+                self.tree.add_directory(directory, own_size, len(entries), subdirs)
+                
+                now = time.monotonic()
+                if now - last_report >= REPORT_INTERVAL:
+                    last_report = now
+                    self.progress_changed.emit(files, total_bytes)
+        except WalkCancelled:
+            return
+        self.scan_finished.emit(files, total_bytes)
+
+
+def _worst_ratio(row_total, row_max, row_min, side):
+    """Peor relación de aspecto de una fila del treemap"""
+    side_squared = side * side
+    total_squared = row_total * row_total
+    return max(side_squared * row_max / total_squared, total_squared / (side_squared * row_min))
+
+
+def squarify(items, x, y, width, height):
+    """Treemap squarificado (Bruls, Huizing y van Wijk)
+    
+    items es una lista de (clave, valor) ordenada de mayor a menor. Devuelve
+    [(clave, x, y, ancho, alto)] con áreas proporcionales a los valores y
+    rectángulos lo más cuadrados posible.
+    """
+    items = [(key, value) for key, value in items if value > 0]
+    if not items or width <= 0 or height <= 0:
+        return []
+    scale = width * height / sum(value for _, value in items)
+    areas = [(key, value * scale) for key, value in items]
+    
+    rects = []
+    index = 0
+    while index < len(areas):
+        side = min(width, height)
+        row = [areas[index]]
+        row_total = row_max = row_min = areas[index][1]
+        index += 1
+        # Añadir elementos a la fila mientras no empeore la relación de aspecto
+        while index < len(areas):
+            area = areas[index][1]
+            current = _worst_ratio(row_total, row_max, row_min, side)
+            candidate = _worst_ratio(row_total + area, max(row_max, area), min(row_min, area), side)
+            if candidate > current:
+                break
+            row.append(areas[index])
+            row_total += area
+            row_max = max(row_max, area)
+            row_min = min(row_min, area)
+            index += 1
+        
+        thickness = row_total / side
+        offset = 0.0
+        if width >= height:
+            # Fila vertical en el lado izquierdo
+            for key, area in row:
+                length = area / thickness
+                rects.append((key, x, y + offset, thickness, length))
+                offset += length
+            x += thickness
+            width -= thickness
+        else:
+            # Fila horizontal en la parte superior
+            for key, area in row:
+                length = area / thickness
+                rects.append((key, x + offset, y, length, thickness))
+                offset += length
+            y += thickness
+            height -= thickness
+    return rects
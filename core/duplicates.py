@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+DuplicateFinder - Búsqueda de archivos duplicados leyendo lo mínimo posible
+
+Tres filtros sucesivos: tamaño (solo stat), hash parcial de los primeros y
+últimos 64 KB, y hash completo BLAKE2 sobre mmap en un pool de procesos
+solo para los candidatos que superan los dos anteriores.
+"""
+
+import hashlib
+import mmap
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import namedtuple, defaultdict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .walker import walk_files, WalkCancelled
+
+
+# Bytes que se leen del principio y del final para el hash parcial
+PARTIAL_BYTES = 64 * 1024
+
+# Bloque de hash sobre el mmap
+HASH_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Intervalo mínimo entre señales de progreso (segundos)
+REPORT_INTERVAL = 0.2
+
+# Grupo confirmado: tamaño de cada copia, hash completo y rutas
+DuplicateGroup = namedtuple("DuplicateGroup", "size digest paths")
+
+# Fases del análisis
+SCANNING = "scanning"
+COMPARING = "comparing"
+
+
+def partial_hash(path, size):
+    """BLAKE2 de los primeros y últimos PARTIAL_BYTES de un archivo
+    
+    Si el archivo cabe en los dos bloques se lee entero y el hash ya es
+    definitivo.
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as f:
+        if size <= 2 * PARTIAL_BYTES:
+            digest.update(f.read())
+            return digest.hexdigest()
+        digest.update(f.read(PARTIAL_BYTES))
+        f.seek(size - PARTIAL_BYTES)
+        digest.update(f.read(PARTIAL_BYTES))
+    return digest.hexdigest()
+
+
+def full_hash(path):
+    """BLAKE2 del archivo completo leído a través de mmap (se ejecuta en otro proceso)"""
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return digest.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mapped) as view:
+                for offset in range(0, size, HASH_CHUNK_BYTES):
+                    with view[offset:offset + HASH_CHUNK_BYTES] as chunk:
+                        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _split_by_digest(results):
+    """Agrupar (ruta, digest) por digest y quedarse con los grupos repetidos"""
+    groups = defaultdict(list)
+    for path, digest in results:
+        groups[digest].append(path)
+    return [(digest, sorted(paths)) for digest, paths in groups.items() if len(paths) > 1]
+
+
+class _Candidates:
+    """Archivos del mismo tamaño pendientes de hash; se resuelve al completar todos"""
+    __slots__ = ("size", "remaining", "results", "full")
+    
+    def __init__(self, size, count, full=False):
+        self.size = size
+        self.full = full
+        self.remaining = count
+        self.results = []
+    
+    def add(self, path, digest):
+        """Registrar un resultado (digest None si el archivo no se pudo leer)"""
+        self.remaining -= 1
+        if digest is not None:
+            self.results.append((path, digest))
+        return self.remaining == 0
+
+
+class DuplicateFinder(QThread):
+    """Hilo que busca duplicados y emite cada grupo en cuanto se confirma"""
+    progress_changed = pyqtSignal(str, int, int)  # fase, hechos, total
+    group_found = pyqtSignal(object)  # DuplicateGroup
+    scan_finished = pyqtSignal(int, int, object)  # archivos, grupos, bytes recuperables
+    
+    def __init__(self, root, min_size=1, skip_hidden=False, max_workers=8,
+                 max_processes=None, parent=None):
+        super().__init__(parent)
+        self.root = str(root)
+        self.min_size = max(1, min_size)
+        self.skip_hidden = skip_hidden
+        self.max_workers = max_workers
+        self.max_processes = max_processes or max(1, min(4, (os.cpu_count() or 2) - 1))
+        self._cancel_event = threading.Event()
+        self._last_report = 0.0
+        self.files_scanned = 0
+        self.groups_found = 0
+        self.wasted_bytes = 0
+    
+    def cancel(self):
+        """Detener la búsqueda lo antes posible"""
+        self._cancel_event.set()
+    
+    def _report(self, phase, done, total, force=False):
+        """Emitir progreso como máximo cada REPORT_INTERVAL segundos"""
+        now = time.monotonic()
+        if force or now - self._last_report >= REPORT_INTERVAL:
+            self._last_report = now
+            self.progress_changed.emit(phase, done, total)
+    
+    def _emit_group(self, size, digest, paths):
+        """Publicar un grupo confirmado"""
+        self.groups_found += 1
+        self.wasted_bytes += size * (len(paths) - 1)
+        self.group_found.emit(DuplicateGroup(size, digest, tuple(paths)))
+    
+    def _collect_by_size(self):
+        """Primer filtro: agrupar por tamaño con un recorrido paralelo"""
+        by_size = defaultdict(list)
+        seen_inodes = set()
+        for path, stat_result in walk_files(self.root, self._cancel_event, self.max_workers,
+                                            self.skip_hidden, one_file_system=True):
+            self.files_scanned += 1
+            if stat_result.st_size < self.min_size:
+                continue
+            # Los enlaces duros ya comparten los datos: no son duplicados a limpiar
+            if stat_result.st_nlink > 1:
+                inode = (stat_result.st_dev, stat_result.st_ino)
+                if inode in seen_inodes:
+                    continue
+                seen_inodes.add(inode)
+            by_size[stat_result.st_size].append(path)
+            self._report(SCANNING, self.files_scanned, 0)
+        self._report(SCANNING, self.files_scanned, 0, force=True)
+        # Los más grandes primero: son los que más espacio liberan
+        return sorted(((size, paths) for size, paths in by_size.items() if len(paths) > 1),
+                      reverse=True)
+    
+    def run(self):
+        try:
+            buckets = self._collect_by_size()
+        except WalkCancelled:
+            return
+        
+        # Los resultados llegan por una cola: no hace falta recorrer todos
+        # los futures pendientes en cada vuelta
+        results = queue.SimpleQueue()
+        outstanding = 0
+        
+        def submit(pool, function, path, candidates, *args):
+            """Programar un hash y dejar su resultado en la cola"""
+            future = pool.submit(function, path, *args)
+            future.add_done_callback(lambda f: results.put((f, path, candidates)))
+        
+        # Progreso: hashes terminados frente a hashes programados (crece al
+        # pasar candidatos al hash completo)
+        scheduled = completed = 0
+        thread_pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        process_pool = None
+        try:
+            # Segundo filtro: hash parcial de todos los candidatos por tamaño
+            for size, paths in buckets:
+                candidates = _Candidates(size, len(paths))
+                for path in paths:
+                    submit(thread_pool, partial_hash, path, candidates, size)
+                scheduled += len(paths)
+            del buckets
+            outstanding = scheduled
+            
+            while outstanding:
+                if self._cancel_event.is_set():
+                    return
+                try:
+                    future, path, candidates = results.get(timeout=REPORT_INTERVAL)
+                except queue.Empty:
+                    continue
+                outstanding -= 1
+                completed += 1
+                try:
+                    digest = future.result()
+                except Exception:
+                    # Archivo ilegible, borrado o truncado durante el análisis
+                    digest = None
+                if candidates.add(path, digest):
+                    # Los archivos pequeños ya se leyeron enteros en el hash parcial
+                    confirmed = candidates.full or candidates.size <= 2 * PARTIAL_BYTES
+                    for digest, group_paths in _split_by_digest(candidates.results):
+                        if confirmed:
+                            self._emit_group(candidates.size, digest, group_paths)
+                            continue
+                        # Tercer filtro: hash completo en procesos separados
+                        if process_pool is None:
+                            process_pool = ProcessPoolExecutor(
+                                max_workers=self.max_processes,
+                                mp_context=multiprocessing.get_context("spawn"))
+                        group = _Candidates(candidates.size, len(group_paths), full=True)
+                        for group_path in group_paths:
+                            submit(process_pool, full_hash, group_path, group)
+                        scheduled += len(group_paths)
+                        outstanding += len(group_paths)
+                self._report(COMPARING, completed, scheduled)
+        finally:
+            thread_pool.shutdown(wait=False, cancel_futures=True)
+            if process_pool is not None:
+                process_pool.shutdown(wait=False, cancel_futures=True)
+            if not self._cancel_event.is_set():
+                self._report(COMPARING, completed, scheduled, force=True)
+                self.scan_finished.emit(self.files_scanned, self.groups_found, self.wasted_bytes)
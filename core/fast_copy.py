@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Motor de copia rápida: reflinks (FICLONE), copy_file_range y sendfile
+
+Los datos se mueven dentro del kernel siempre que es posible. Si el sistema
+de archivos no lo permite se usa un búfer grande alineado a página.
+"""
+
+import errno
+import fcntl
+import mmap
+import os
+import shutil
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait
+
+
+# ioctl FICLONE (linux/fs.h): comparte los bloques en btrfs/xfs/bcachefs
+FICLONE = 0x40049409
+
+# Bloque por llamada al kernel; limita la espera entre puntos de control
+KERNEL_CHUNK_SIZE = 64 * 1024 * 1024
+
+# Búfer alineado para la copia en espacio de usuario
+BUFFER_SIZE = 4 * 1024 * 1024
+
+# Archivos por debajo de este tamaño se copian en paralelo dentro de un árbol
+SMALL_FILE_SIZE = 1024 * 1024
+
+# Errores que indican que el método no está disponible para este par de archivos
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP,
+    errno.ENOTTY, errno.EBADF, errno.ETXTBSY, errno.EPERM,
+}
+
+# Métodos que ya fallaron para un par (dispositivo origen, dispositivo destino)
+_unsupported_methods = set()
+_unsupported_lock = threading.Lock()
+
+
+def _is_unsupported(method, devices):
+    """Indica si un método ya falló para este par de dispositivos"""
+    with _unsupported_lock:
+        return (method, devices) in _unsupported_methods
+
+
+def _mark_unsupported(method, devices):
+    """Recordar que un método no funciona para este par de dispositivos"""
+    with _unsupported_lock:
+        _unsupported_methods.add((method, devices))
+
+
+def _no_checkpoint():
+    """Punto de control vacío cuando no se necesita pausa ni cancelación"""
+
+
+def _no_progress(nbytes):
+    """Callback de progreso vacío"""
+
+
+def _try_reflink(src_fd, dst_fd, devices):
+    """Clonar el archivo completo compartiendo bloques (copy-on-write)"""
+    if devices[0] != devices[1] or _is_unsupported("reflink", devices):
+        return False
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except OSError as e:
+        if e.errno not in _UNSUPPORTED_ERRNOS:
+            raise
+        _mark_unsupported("reflink", devices)
+        return False
+
+
+def _copy_in_kernel(copy_call, method, src_fd, dst_fd, size, devices, progress, checkpoint):
+    """Copiar con copy_file_range o sendfile; devuelve los bytes copiados
+    
+    Si el método no funciona antes de copiar nada devuelve None para que se
+    pruebe el siguiente.
+    """
+    if _is_unsupported(method, devices):
+        return None
+    copied = 0
+    while True:
+        checkpoint()
+        try:
+            sent = copy_call(src_fd, dst_fd, KERNEL_CHUNK_SIZE)
+        except OSError as e:
+            if copied == 0 and e.errno in _UNSUPPORTED_ERRNOS:
+                _mark_unsupported(method, devices)
+                return None
+            raise
+        if sent == 0:
+            if copied == 0 and size > 0:
+                # Algunos sistemas (procfs, FUSE) devuelven 0 sin copiar nada
+                _mark_unsupported(method, devices)
+                return None
+            return copied
+        copied += sent
+        progress(sent)
+
+
+def _copy_file_range(src_fd, dst_fd, count):
+    """Copiar count bytes con copy_file_range usando la posición de los archivos"""
+    return os.copy_file_range(src_fd, dst_fd, count)
+
+
+def _sendfile(src_fd, dst_fd, count):
+    """Copiar count bytes con sendfile usando la posición de los archivos"""
+    return os.sendfile(dst_fd, src_fd, None, count)
+
+
+def _copy_with_buffer(src_fd, dst_fd, progress, checkpoint):
+    """Copia clásica con un búfer grande alineado a página (mmap anónimo)"""
+    buffer = mmap.mmap(-1, BUFFER_SIZE)
+    try:
+        with memoryview(buffer) as view:
+            while True:
+                checkpoint()
+                read = os.readv(src_fd, [view])
+                if read == 0:
+                    break
+                written = 0
+                while written < read:
+                    written += os.write(dst_fd, view[written:read])
+                progress(read)
+    finally:
+        buffer.close()
+
+
+def copy_file_data(src_fd, dst_fd, size, devices, progress=_no_progress, checkpoint=_no_checkpoint):
+    """Copiar el contenido entre dos descriptores con el método más rápido posible"""
+    if size > 0 and _try_reflink(src_fd, dst_fd, devices):
+        progress(size)
+        return "reflink"
+    
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    
+    if hasattr(os, "copy_file_range"):
+        if _copy_in_kernel(_copy_file_range, "copy_file_range", src_fd, dst_fd,
+                           size, devices, progress, checkpoint) is not None:
+            return "copy_file_range"
+    if hasattr(os, "sendfile"):
+        if _copy_in_kernel(_sendfile, "sendfile", src_fd, dst_fd,
+                           size, devices, progress, checkpoint) is not None:
+            return "sendfile"
+    
+    os.lseek(src_fd, 0, os.SEEK_SET)
+    os.lseek(dst_fd, 0, os.SEEK_SET)
+    os.ftruncate(dst_fd, 0)
+    _copy_with_buffer(src_fd, dst_fd, progress, checkpoint)
+    return "buffer"
+
+
+def copy_file(source, target, progress=_no_progress, checkpoint=_no_checkpoint):
+    """Copiar un archivo (contenido y metadatos) sin sobrescribir el destino"""
+    src_fd = os.open(source, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        src_stat = os.fstat(src_fd)
+        dst_fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_CLOEXEC,
+                         stat.S_IMODE(src_stat.st_mode) | stat.S_IWUSR)
+        try:
+            target_dev = os.fstat(dst_fd).st_dev
+            copy_file_data(src_fd, dst_fd, src_stat.st_size,
+                           (src_stat.st_dev, target_dev), progress, checkpoint)
+        except BaseException:
+            os.close(dst_fd)
+            dst_fd = None
+            os.unlink(target)
+            raise
+        finally:
+            if dst_fd is not None:
+                os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    shutil.copystat(source, target)
+
+
+def copy_tree(source, target, progress=_no_progress, file_done=None,
+              checkpoint=_no_checkpoint, max_workers=8):
+    """Copiar un árbol completo
+    
+    Los archivos pequeños se copian en paralelo (su coste está en abrir,
+    crear y cerrar, no en los datos); los grandes se copian de uno en uno
+    para no fragmentar la escritura en disco.
+    
+    progress(nbytes) se llama con los bytes copiados y file_done(path) al
+    terminar cada archivo o enlace. Ambos pueden llamarse desde varios hilos.
+    """
+    file_done = file_done or (lambda path: None)
+    dir_stats = []
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = set()
+        
+        def copy_small(src, dst):
+            """Copiar un archivo pequeño en un hilo del pool"""
+            copy_file(src, dst, progress, checkpoint)
+            file_done(src)
+        
+        try:
+            for root, dirs, files in os.walk(source):
+                checkpoint()
+                relative = os.path.relpath(root, source)
+                target_root = os.path.normpath(os.path.join(target, relative))
+                os.makedirs(target_root, exist_ok=relative != ".")
+                dir_stats.append((root, target_root))
+                
+                for name in dirs:
+                    dir_source = os.path.join(root, name)
+                    if os.path.islink(dir_source):
+                        os.symlink(os.readlink(dir_source), os.path.join(target_root, name))
+                        file_done(dir_source)
+                
+                for name in files:
+                    checkpoint()
+                    file_source = os.path.join(root, name)
+                    file_target = os.path.join(target_root, name)
+                    file_stat = os.lstat(file_source)
+                    if stat.S_ISLNK(file_stat.st_mode):
+                        os.symlink(os.readlink(file_source), file_target)
+                        file_done(file_source)
+                    elif not stat.S_ISREG(file_stat.st_mode):
+                        # Sockets, FIFOs y dispositivos no se copian
+                        file_done(file_source)
+                    elif file_stat.st_size < SMALL_FILE_SIZE:
+                        futures.add(pool.submit(copy_small, file_source, file_target))
+                    else:
+                        copy_file(file_source, file_target, progress, checkpoint)
+                        file_done(file_source)
+                
+                # Propagar errores de los archivos pequeños sin esperar al final
+                finished = {future for future in futures if future.done()}
+                for future in finished:
+                    future.result()
+                futures -= finished
+            
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in done:
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    
+    # Las fechas de las carpetas se fijan al final (copiar dentro las modifica)
+    for source_dir, target_dir in reversed(dir_stats):
+        shutil.copystat(source_dir, target_dir)
@@ -0,0 +1,929 @@
+#!/usr/bin/env python3
+"""
+FileOperationQueue - Cola de operaciones de archivos en segundo plano
+(papelera, eliminar, copiar, mover, renombrar, comprimir y extraer) con
+progreso, pausa y cancelación
+
+Renombrar, mover y enviar a la papelera se anotan en el diario de
+operaciones antes de ejecutarse, así que se pueden deshacer y rehacer.
+"""
+
+import errno
+import itertools
+import os
+import queue
+import shutil
+import stat
+import tarfile
+import threading
+import time
+import zipfile
+from collections import namedtuple
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .archives import (CHUNK_SIZE, ArchiveError, archive_stem, detect_archive,
+                       safe_extract_path, safe_link_target)
+from .fast_copy import copy_file, copy_tree
+from .journal import operation_journal
+from .parallel_gzip import ParallelGzipWriter
+from .trash import discard_trash_info, reserve_trash_entry, trash_dir_for
+
+
+# Estados de una operación
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+CANCELLED = "cancelled"
+FAILED = "failed"
+
+# Fotografía del progreso que se envía a la interfaz
+FileOperationProgress = namedtuple(
+    "FileOperationProgress",
+    "job_id done_bytes total_bytes done_files total_files bytes_per_second eta_seconds current_path paused"
+)
+
+_job_ids = itertools.count(1)
+
+
+class OperationCancelled(Exception):
+    """La operación fue cancelada por el usuario"""
+
+
+def unique_destination(directory, name, taken=()):
+    """Ruta libre dentro de una carpeta: 'foto.jpg', 'foto (2).jpg', ...
+    
+    taken son rutas ya reservadas por el mismo lote aunque aún no existan.
+    """
+    candidate = os.path.join(directory, name)
+    if candidate not in taken and not os.path.lexists(candidate):
+        return candidate
+    stem, extension = os.path.splitext(name)
+    if os.path.isdir(candidate) and not os.path.islink(candidate):
+        stem, extension = name, ""
+    for counter in itertools.count(2):
+        candidate = os.path.join(directory, f"{stem} ({counter}){extension}")
+        if candidate not in taken and not os.path.lexists(candidate):
+            return candidate
+
+
+def is_same_or_inside(path, parent):
+    """Indica si path es parent o está dentro de parent"""
+    path = os.path.realpath(path)
+    parent = os.path.realpath(parent)
+    return path == parent or path.startswith(parent.rstrip(os.sep) + os.sep)
+
+
+class _ProgressReader:
+    """Archivo de solo lectura que informa a la operación de cada lectura
+    
+    Cada read() es un punto de control, así que pausar o cancelar responde
+    aunque la lectura la haga tarfile o zipfile.
+    """
+    
+    def __init__(self, fileobj, operation):
+        self.fileobj = fileobj
+        self.operation = operation
+    
+    def read(self, size=-1):
+        self.operation.checkpoint()
+        data = self.fileobj.read(size)
+        self.operation.add_progress(len(data))
+        return data
+    
+    def seek(self, *args):
+        return self.fileobj.seek(*args)
+    
+    def tell(self):
+        return self.fileobj.tell()
+    
+    def seekable(self):
+        return self.fileobj.seekable()
+
+
+class FileOperation:
+    """Operación de archivos que se ejecuta en la cola
+    
+    Las subclases implementan plan() para calcular el trabajo total y
+    execute() para realizarlo, llamando a checkpoint() con frecuencia para
+    respetar pausas y cancelaciones y a add_progress() para informar avances.
+    """
+    kind = "operation"
+    icon = "⚙️"
+    title = "Procesando"
+    journal = operation_journal
+    
+    def __init__(self, sources, destination=None):
+        self.job_id = next(_job_ids)
+        # Entrada del diario que esta operación deshace o rehace
+        self.undo_of = None
+        self.redo_of = None
+        self.sources = [str(source) for source in sources]
+        self.destination = str(destination) if destination is not None else None
+        self.state = QUEUED
+        self.error = None
+        self.errors = []  # (ruta, mensaje) de los elementos que fallaron
+        self.total_bytes = 0
+        self.total_files = 0
+        self.done_bytes = 0
+        self.done_files = 0
+        self.current_path = ""
+        self.started_at = None
+        self.paused_seconds = 0.0
+        self._paused_at = None
+        self._cancel_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._reporter = None
+        self._progress_lock = threading.Lock()
+        # (entrada del diario, índice) del paso en curso en _run_journaled
+        self._journal_step = None
+    
+    def describe(self):
+        """Texto corto para mostrar en la interfaz"""
+        if len(self.sources) == 1:
+            target = os.path.basename(self.sources[0].rstrip(os.sep))
+        else:
+            target = f"{len(self.sources)} elementos"
+        return f"{self.icon} {self.title} {target}"
+    
+    def affected_dirs(self):
+        """Carpetas cuyo contenido cambia con esta operación"""
+        dirs = {os.path.dirname(source.rstrip(os.sep)) for source in self.sources}
+        if self.destination:
+            dirs.add(self.destination)
+        return dirs
+    
+    def plan(self):
+        """Calcular el total de archivos y bytes a procesar"""
+        for source in self.sources:
+            files, size = self._measure(source)
+            self.total_files += files
+            self.total_bytes += size
+    
+    def execute(self):
+        """Realizar la operación (implementado por las subclases)"""
+        raise NotImplementedError
+    
+    # --- Control desde la interfaz -------------------------------------
+    
+    def pause(self):
+        """Pausar la operación en el siguiente punto de control"""
+        if self._resume_event.is_set():
+            self._paused_at = time.monotonic()
+            self._resume_event.clear()
+    
+    def resume(self):
+        """Reanudar una operación pausada"""
+        if not self._resume_event.is_set():
+            if self._paused_at is not None:
+                self.paused_seconds += time.monotonic() - self._paused_at
+                self._paused_at = None
+            self._resume_event.set()
+    
+    def cancel(self):
+        """Cancelar la operación (también si está pausada)"""
+        self._cancel_event.set()
+        self._resume_event.set()
+    
+    def is_paused(self):
+        """Indica si la operación está en pausa"""
+        return not self._resume_event.is_set()
+    
+    def is_cancelled(self):
+        """Indica si se pidió cancelar la operación"""
+        return self._cancel_event.is_set()
+    
+    # --- Utilidades para las subclases ---------------------------------
+    
+    def checkpoint(self):
+        """Esperar si está en pausa y abortar si se canceló"""
+        if not self._resume_event.is_set():
+            self._report(force=True)
+            self._resume_event.wait()
+        if self._cancel_event.is_set():
+            raise OperationCancelled()
+    
+    def add_progress(self, nbytes=0, nfiles=0, current_path=None):
+        """Registrar trabajo realizado (se puede llamar desde varios hilos)"""
+        with self._progress_lock:
+            self.done_bytes += nbytes
+            self.done_files += nfiles
+            if current_path is not None:
+                self.current_path = current_path
+            self._report()
+    
+    def _report(self, force=False):
+        """Enviar el progreso a la cola (que decide si emitirlo)"""
+        if self._reporter is not None:
+            self._reporter(self, force)
+    
+    def _measure(self, path):
+        """Contar archivos y bytes de un árbol sin seguir enlaces simbólicos"""
+        try:
+            st = os.lstat(path)
+        except OSError:
+            return 0, 0
+        if stat.S_ISLNK(st.st_mode):
+            return 1, 0
+        if not stat.S_ISDIR(st.st_mode):
+            return 1, st.st_size
+        
+        files, size = 0, 0
+        pending = [path]
+        while pending:
+            self.checkpoint()
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            else:
+                                # Los enlaces simbólicos cuentan como archivo pero sin bytes
+                                files += 1
+                                if not entry.is_symlink():
+                                    size += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return files, size
+    
+    def _for_each_source(self, action):
+        """Aplicar action a cada origen como un único lote
+        
+        Un fallo en un elemento no detiene el resto: se registra en errors y
+        se informa una sola vez al terminar el lote.
+        """
+        for source in self.sources:
+            self.checkpoint()
+            try:
+                action(source)
+            except OperationCancelled:
+                raise
+            except OSError as e:
+                self.errors.append((source, str(e)))
+    
+    def _data_size(self, path):
+        """Bytes de datos de un archivo (0 para enlaces simbólicos)"""
+        st = os.lstat(path)
+        return 0 if stat.S_ISLNK(st.st_mode) else st.st_size
+    
+    def _delete_path(self, path):
+        """Eliminar un archivo o un árbol completo, de abajo hacia arriba"""
+        if os.path.islink(path) or not os.path.isdir(path):
+            size = self._data_size(path)
+            os.unlink(path)
+            self.add_progress(size, 1, path)
+            return
+        
+        for root, dirs, files in os.walk(path, topdown=False):
+            for name in files:
+                self.checkpoint()
+                file_path = os.path.join(root, name)
+                size = self._data_size(file_path)
+                os.unlink(file_path)
+                self.add_progress(size, 1, file_path)
+            for name in dirs:
+                dir_path = os.path.join(root, name)
+                if os.path.islink(dir_path):
+                    os.unlink(dir_path)
+                    self.add_progress(0, 1, dir_path)
+                else:
+                    os.rmdir(dir_path)
+        os.rmdir(path)
+    
+    def _copy_path(self, source, target):
+        """Copiar un archivo, enlace o árbol completo a target"""
+        if os.path.islink(source):
+            os.symlink(os.readlink(source), target)
+            self.add_progress(0, 1, source)
+        elif os.path.isdir(source):
+            copy_tree(source, target,
+                      progress=lambda nbytes: self.add_progress(nbytes),
+                      file_done=lambda path: self.add_progress(0, 1, path),
+                      checkpoint=self.checkpoint)
+        else:
+            self.current_path = source
+            copy_file(source, target,
+                      progress=lambda nbytes: self.add_progress(nbytes),
+                      checkpoint=self.checkpoint)
+            self.add_progress(0, 1, source)
+    
+    def _move_path(self, source, target):
+        """Mover con rename; entre discos, copiar y eliminar el original
+        
+        Entre la copia y la eliminación se anota en el diario que el destino
+        ya está completo: si se interrumpe borrando el original, la
+        recuperación termina de eliminarlo en vez de descartar la copia.
+        """
+        try:
+            os.rename(source, target)
+            self.add_progress(0, 1, source)
+            return
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+        try:
+            self._copy_path(source, target)
+        except BaseException:
+            # Sin copias a medias: el original sigue intacto
+            self._delete_path_quietly(target)
+            raise
+        if self._journal_step is not None:
+            self.journal.copied(*self._journal_step)
+        self._delete_path_quietly(source)
+    
+    def _delete_path_quietly(self, path):
+        """Eliminar sin contar progreso (originales ya copiados, copias a medias)"""
+        try:
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path)
+            else:
+                os.unlink(path)
+        except FileNotFoundError:
+            pass
+    
+    def _run_journaled(self, steps, action):
+        """Aplicar los pasos anotándolos antes en el diario
+        
+        Un paso que falla se registra en errors y no detiene el resto; al
+        terminar (o cancelar) el diario recibe solo los pasos aplicados.
+        """
+        entry_id = self.journal.begin(self.kind, self.describe(), steps,
+                                      self.undo_of, self.redo_of)
+        applied = []
+        attempted = 0
+        try:
+            for index, step in enumerate(steps):
+                self.checkpoint()
+                self._journal_step = (entry_id, index)
+                try:
+                    action(step)
+                    applied.append(step)
+                except OperationCancelled:
+                    raise
+                except OSError as e:
+                    self.errors.append((step["source"], str(e)))
+                attempted += 1
+        finally:
+            self._journal_step = None
+            self.journal.commit(entry_id, applied)
+            # Los nombres reservados en la papelera que no se usaron sobran
+            for step in steps[attempted:]:
+                if step["op"] == "trash":
+                    discard_trash_info(step["info"])
+
+
+class TrashOperation(FileOperation):
+    """Enviar archivos y carpetas a la papelera
+    
+    En el mismo sistema de archivos es un rename instantáneo sea cual sea el
+    tamaño del árbol. Solo si el montaje no admite papelera propia se copia
+    a la del usuario y después se elimina el original.
+    """
+    kind = "trash"
+    icon = "🗑️"
+    title = "Enviando a la papelera"
+    
+    def plan(self):
+        for source in self.sources:
+            try:
+                cross_device = trash_dir_for(source)[2]
+            except OSError:
+                cross_device = False
+            if cross_device:
+                files, size = self._measure(source)
+                self.total_files += files
+                self.total_bytes += size
+            else:
+                self.total_files += 1
+    
+    def execute(self):
+        steps = []
+        for source in self.sources:
+            self.checkpoint()
+            try:
+                target, info = reserve_trash_entry(source)
+            except OSError as e:
+                self.errors.append((source, str(e)))
+                continue
+            steps.append({"op": "trash", "source": source, "target": target, "info": info})
+        self._run_journaled(steps, self._trash_one)
+    
+    def _trash_one(self, step):
+        """Mover un elemento a su nombre reservado en la papelera"""
+        try:
+            self._move_path(step["source"], step["target"])
+        except BaseException:
+            discard_trash_info(step["info"])
+            raise
+
+
+class JournalReplayOperation(FileOperation):
+    """Reproducir pasos del diario: mover de vuelta y restaurar de la papelera"""
+    kind = "replay"
+    icon = "↩️"
+    title = "Deshaciendo"
+    
+    def __init__(self, steps):
+        self.steps = steps
+        super().__init__([step["source"] for step in steps])
+    
+    def plan(self):
+        self.total_files = len(self.steps)
+    
+    def affected_dirs(self):
+        return {os.path.dirname(step[key]) for step in self.steps for key in ("source", "target")}
+    
+    def execute(self):
+        self._run_journaled(self.steps, self._replay_one)
+    
+    def _replay_one(self, step):
+        """Mover un elemento a la ruta que indica el paso"""
+        if os.path.lexists(step["target"]):
+            raise FileExistsError(f"Ya existe un elemento con ese nombre: {step['target']}")
+        # La carpeta original puede haberse eliminado mientras tanto
+        os.makedirs(os.path.dirname(step["target"]), exist_ok=True)
+        self._move_path(step["source"], step["target"])
+        if step["op"] == "restore":
+            discard_trash_info(step["info"])
+
+
+class DeleteOperation(FileOperation):
+    """Eliminar archivos y carpetas de forma permanente"""
+    kind = "delete"
+    icon = "🗑️"
+    title = "Eliminando"
+    
+    def execute(self):
+        self._for_each_source(self._delete_path)
+
+
+class CopyOperation(FileOperation):
+    """Copiar archivos y carpetas dentro de una carpeta destino"""
+    kind = "copy"
+    icon = "📋"
+    title = "Copiando"
+    
+    def execute(self):
+        self._for_each_source(self._copy_one)
+    
+    def _copy_one(self, source):
+        """Copiar un origen a la carpeta destino con un nombre libre"""
+        if os.path.isdir(source) and is_same_or_inside(self.destination, source):
+            raise OSError(f"No se puede copiar una carpeta dentro de sí misma: {source}")
+        target = unique_destination(self.destination, os.path.basename(source.rstrip(os.sep)))
+        self._copy_path(source, target)
+
+
+class MoveOperation(FileOperation):
+    """Mover archivos y carpetas (renombrado directo si están en el mismo disco)"""
+    kind = "move"
+    icon = "✂️"
+    title = "Moviendo"
+    
+    def plan(self):
+        # En el mismo sistema de archivos mover es un rename: no hay bytes que copiar
+        try:
+            destination_dev = os.stat(self.destination).st_dev
+        except OSError:
+            destination_dev = None
+        for source in self.sources:
+            try:
+                same_device = os.lstat(source).st_dev == destination_dev
+            except OSError:
+                same_device = True
+            if same_device:
+                self.total_files += 1
+            else:
+                files, size = self._measure(source)
+                self.total_files += files
+                self.total_bytes += size
+    
+    def execute(self):
+        # Los destinos se eligen antes de empezar para anotarlos en el diario
+        steps = []
+        taken = set()
+        for source in self.sources:
+            if os.path.dirname(source.rstrip(os.sep)) == self.destination.rstrip(os.sep):
+                self.add_progress(0, 1, source)
+                continue
+            if os.path.isdir(source) and is_same_or_inside(self.destination, source):
+                self.errors.append((source, f"No se puede mover una carpeta dentro de sí misma: {source}"))
+                continue
+            target = unique_destination(self.destination, os.path.basename(source.rstrip(os.sep)), taken)
+            taken.add(target)
+            steps.append({"op": "move", "source": source, "target": target})
+        self._run_journaled(steps, self._move_one)
+    
+    def _move_one(self, step):
+        """Mover un origen a su destino (otro disco: copiar y eliminar)"""
+        if os.path.lexists(step["target"]):
+            raise FileExistsError(f"Ya existe un elemento con ese nombre: {step['target']}")
+        self._move_path(step["source"], step["target"])
+
+
+class RenameOperation(FileOperation):
+    """Renombrar un archivo o carpeta (destination es la nueva ruta completa)"""
+    kind = "rename"
+    icon = "✏️"
+    title = "Renombrando"
+    
+    def plan(self):
+        self.total_files = 1
+    
+    def affected_dirs(self):
+        return {os.path.dirname(self.sources[0]), os.path.dirname(self.destination)}
+    
+    def execute(self):
+        if os.path.lexists(self.destination):
+            raise FileExistsError(f"Ya existe un elemento con ese nombre: {os.path.basename(self.destination)}")
+        step = {"op": "rename", "source": self.sources[0], "target": self.destination}
+        entry_id = self.journal.begin(self.kind, self.describe(), [step], self.undo_of, self.redo_of)
+        try:
+            os.rename(self.sources[0], self.destination)
+        except BaseException:
+            self.journal.abort(entry_id)
+            raise
+        self.journal.commit(entry_id, [step])
+        self.add_progress(0, 1, self.sources[0])
+
+
+class BulkRenameOperation(FileOperation):
+    """Renombrar muchos elementos como una única transacción
+    
+    Primero todos los orígenes pasan a un nombre temporal y después cada
+    temporal a su destino, así que intercambios (a↔b) y cadenas (a→b, b→c)
+    funcionan. Si algo falla o se cancela, lo ya renombrado se deshace en
+    orden inverso y todo queda como estaba. El diario anota el plan antes
+    de empezar y el fin de la primera fase, para poder volver atrás también
+    si la aplicación se cierra a mitad.
+    """
+    kind = "bulk_rename"
+    icon = "✏️"
+    title = "Renombrando"
+    
+    def __init__(self, renames):
+        self.renames = [(str(source), str(target)) for source, target in renames]
+        super().__init__([source for source, _ in self.renames])
+    
+    def plan(self):
+        self.total_files = len(self.renames)
+    
+    def affected_dirs(self):
+        return {os.path.dirname(path) for pair in self.renames for path in pair}
+    
+    def execute(self):
+        sources = {source for source, _ in self.renames}
+        for _, target in self.renames:
+            if target not in sources and os.path.lexists(target):
+                raise FileExistsError(f"Ya existe un elemento con ese nombre: {os.path.basename(target)}")
+        
+        steps = [{"op": "rename", "source": source, "target": target,
+                  "temporary": os.path.join(os.path.dirname(source), f".~rename-{self.job_id}-{index}")}
+                 for index, (source, target) in enumerate(self.renames)]
+        entry_id = self.journal.begin(self.kind, self.describe(), steps, self.undo_of, self.redo_of)
+        staged = []
+        renamed = []
+        try:
+            for step in steps:
+                self.checkpoint()
+                if os.path.lexists(step["temporary"]):
+                    raise FileExistsError(f"El nombre temporal ya existe: {step['temporary']}")
+                os.rename(step["source"], step["temporary"])
+                staged.append((step["source"], step["temporary"]))
+            self.journal.stage(entry_id)
+            for (source, temporary), (_, target) in zip(staged, self.renames):
+                self.checkpoint()
+                if os.path.lexists(target):
+                    raise FileExistsError(f"Ya existe un elemento con ese nombre: {os.path.basename(target)}")
+                os.rename(temporary, target)
+                renamed.append((temporary, target))
+                self.add_progress(0, 1, source)
+        except BaseException:
+            self._rollback(staged, renamed)
+            self.journal.abort(entry_id)
+            raise
+        self.journal.commit(entry_id, steps)
+    
+    def _rollback(self, staged, renamed):
+        """Devolver cada elemento a su nombre original (lo posible)"""
+        for temporary, target in reversed(renamed):
+            try:
+                os.rename(target, temporary)
+            except OSError:
+                continue
+        for source, temporary in reversed(staged):
+            try:
+                os.rename(temporary, source)
+            except OSError:
+                continue
+
+
+class CompressOperation(FileOperation):
+    """Comprimir archivos y carpetas en un .tar.gz (destination es la ruta del archivo)
+    
+    El tar se genera en un solo hilo y se comprime por bloques en todos los
+    núcleos con ParallelGzipWriter. Se escribe en un temporal que solo se
+    renombra al terminar: cancelar o fallar no deja un archivo a medias.
+    """
+    kind = "compress"
+    icon = "🗜️"
+    title = "Comprimiendo"
+    
+    def affected_dirs(self):
+        return {os.path.dirname(self.destination)}
+    
+    def execute(self):
+        temporary = f"{self.destination}.part"
+        try:
+            with open(temporary, "wb") as output:
+                with ParallelGzipWriter(output) as writer:
+                    with tarfile.open(fileobj=writer, mode="w|", copybufsize=CHUNK_SIZE) as tar:
+                        for source in self.sources:
+                            self.checkpoint()
+                            self._add_path(tar, source, os.path.basename(source.rstrip(os.sep)))
+            # Los elementos ilegibles quedan en errors; el resto del archivo es válido
+            os.replace(temporary, self.destination)
+        except BaseException:
+            try:
+                os.unlink(temporary)
+            except OSError:
+                pass
+            raise
+    
+    def _add_path(self, tar, path, arcname):
+        """Añadir un archivo, enlace o árbol completo al tar"""
+        try:
+            info = tar.gettarinfo(path, arcname)
+            if info is None:
+                # Sockets y similares no se pueden guardar
+                return
+            if info.isreg():
+                # Se abre antes de escribir la cabecera: un error no deja el tar roto
+                with open(path, "rb") as f:
+                    self.current_path = path
+                    tar.addfile(info, _ProgressReader(f, self))
+            elif info.isdir():
+                tar.addfile(info)
+                for name in sorted(os.listdir(path)):
+                    self.checkpoint()
+                    self._add_path(tar, os.path.join(path, name), f"{arcname}/{name}")
+                return
+            else:
+                tar.addfile(info)
+            self.add_progress(0, 1, path)
+        except OperationCancelled:
+            raise
+        except OSError as e:
+            self.errors.append((path, str(e)))
+
+
+class ExtractOperation(FileOperation):
+    """Extraer archivos zip o tar, cada uno en una carpeta nueva dentro de destination
+    
+    El progreso son los bytes leídos del archivo comprimido. Ningún
+    miembro puede escribir fuera de la carpeta creada: se rechazan las
+    rutas con "..", los enlaces que apuntan fuera y los miembros que
+    atravesarían un enlace ya extraído.
+    """
+    kind = "extract"
+    icon = "📦"
+    title = "Extrayendo"
+    
+    def plan(self):
+        for source in self.sources:
+            try:
+                self.total_bytes += os.stat(source).st_size
+            except OSError:
+                continue
+            self.total_files += 1
+    
+    def execute(self):
+        self._for_each_source(self._extract_one)
+    
+    def _extract_one(self, source):
+        """Extraer un archivo en una carpeta libre con su nombre"""
+        detected = detect_archive(source)
+        if detected is None:
+            raise ArchiveError(f"Formato de archivo no soportado: {os.path.basename(source)}")
+        root = unique_destination(self.destination, archive_stem(os.path.basename(source)))
+        os.mkdir(root)
+        self.current_path = source
+        with open(source, "rb") as raw:
+            reader = _ProgressReader(raw, self)
+            if detected[0] == "zip":
+                self._extract_zip(reader, root)
+            else:
+                self._extract_tar(reader, root)
+        self.add_progress(0, 1, source)
+    
+    def _extract_tar(self, reader, root):
+        """Extraer un tar leyéndolo de principio a fin (también comprimido)"""
+        try:
+            with tarfile.open(fileobj=reader, mode="r|*") as tar:
+                for member in tar:
+                    self.checkpoint()
+                    try:
+                        target = safe_extract_path(root, member.name)
+                        if member.isdir():
+                            os.makedirs(target, exist_ok=True)
+                        elif member.isreg():
+                            self._write_member(target, tar.extractfile(member),
+                                               member.mode, member.mtime)
+                        elif member.issym():
+                            self._make_parent(target)
+                            os.symlink(safe_link_target(root, target, member.linkname), target)
+                        elif member.islnk():
+                            self._make_parent(target)
+                            os.link(safe_extract_path(root, member.linkname), target)
+                        # Dispositivos y FIFOs no se extraen
+                    except ArchiveError as e:
+                        self.errors.append((member.name, str(e)))
+        except tarfile.TarError as e:
+            raise ArchiveError(f"Archivo dañado: {e}") from None
+    
+    def _extract_zip(self, reader, root):
+        """Extraer un zip miembro a miembro"""
+        try:
+            with zipfile.ZipFile(reader) as archive:
+                for info in archive.infolist():
+                    self.checkpoint()
+                    try:
+                        target = safe_extract_path(root, info.filename)
+                        mode = info.external_attr >> 16
+                        if info.is_dir():
+                            os.makedirs(target, exist_ok=True)
+                        elif stat.S_ISLNK(mode):
+                            link = archive.read(info).decode("utf-8", errors="surrogateescape")
+                            self._make_parent(target)
+                            os.symlink(safe_link_target(root, target, link), target)
+                        else:
+                            mtime = time.mktime(info.date_time + (0, 0, -1))
+                            with archive.open(info) as member:
+                                self._write_member(target, member, mode or 0o644, mtime)
+                    except ArchiveError as e:
+                        self.errors.append((info.filename, str(e)))
+        except (zipfile.BadZipFile, RuntimeError) as e:
+            # RuntimeError: miembros cifrados
+            raise ArchiveError(f"No se pudo extraer: {e}") from None
+    
+    def _make_parent(self, target):
+        """Crear la carpeta de un miembro y quitar un enlace previo con su nombre"""
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if os.path.islink(target):
+            os.unlink(target)
+    
+    def _write_member(self, target, source, mode, mtime):
+        """Copiar por bloques el contenido de un miembro"""
+        self._make_parent(target)
+        with open(target, "wb") as output:
+            shutil.copyfileobj(source, output, CHUNK_SIZE)
+        # Sin setuid/setgid ni permisos de escritura para otros
+        os.chmod(target, mode & 0o755 | 0o600)
+        os.utime(target, (mtime, mtime))
+
+
+def undo_operation(entry):
+    """Operación que deshace una entrada del diario"""
+    if entry.kind in (RenameOperation.kind, BulkRenameOperation.kind):
+        operation = BulkRenameOperation([(step["target"], step["source"]) for step in entry.steps])
+    elif entry.kind == TrashOperation.kind:
+        operation = JournalReplayOperation([
+            {"op": "restore", "source": step["target"], "target": step["source"], "info": step["info"]}
+            for step in reversed(entry.steps)])
+    else:
+        operation = JournalReplayOperation([
+            {"op": "move", "source": step["target"], "target": step["source"]}
+            for step in reversed(entry.steps)])
+    operation.undo_of = entry.id
+    operation.icon = "↩️"
+    operation.title = "Deshaciendo"
+    return operation
+
+
+def redo_operation(entry):
+    """Operación que vuelve a aplicar una entrada deshecha del diario"""
+    if entry.kind in (RenameOperation.kind, BulkRenameOperation.kind):
+        operation = BulkRenameOperation([(step["source"], step["target"]) for step in entry.steps])
+    elif entry.kind == TrashOperation.kind:
+        # Los nombres en la papelera se vuelven a reservar
+        operation = TrashOperation([step["source"] for step in entry.steps])
+    else:
+        operation = JournalReplayOperation([
+            {"op": "move", "source": step["source"], "target": step["target"]}
+            for step in entry.steps])
+    operation.redo_of = entry.id
+    operation.icon = "↪️"
+    operation.title = "Rehaciendo"
+    return operation
+
+
+class FileOperationQueue(QThread):
+    """Hilo que ejecuta las operaciones de archivos en orden de llegada"""
+    job_queued = pyqtSignal(object)  # FileOperation
+    job_started = pyqtSignal(object)  # FileOperation
+    progress_changed = pyqtSignal(object)  # FileOperationProgress
+    job_finished = pyqtSignal(object)  # FileOperation
+    
+    # Intervalo mínimo entre actualizaciones de progreso (segundos)
+    REPORT_INTERVAL = 0.1
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._jobs = queue.Queue()
+        self._lock = threading.Lock()
+        self._waiting = []
+        self.current_job = None
+        self._last_report = 0.0
+    
+    def submit(self, job):
+        """Añadir una operación a la cola"""
+        with self._lock:
+            self._waiting.append(job)
+        self._jobs.put(job)
+        self.job_queued.emit(job)
+        if not self.isRunning():
+            self.start()
+        return job
+    
+    def pending_jobs(self):
+        """Operaciones que aún esperan su turno"""
+        with self._lock:
+            return list(self._waiting)
+    
+    def cancel_all(self):
+        """Cancelar la operación en curso y todas las pendientes"""
+        for job in self.pending_jobs():
+            job.cancel()
+        if self.current_job is not None:
+            self.current_job.cancel()
+    
+    def stop(self):
+        """Cancelar todo y terminar el hilo"""
+        self.cancel_all()
+        self._jobs.put(None)
+        if self.isRunning():
+            self.wait(5000)
+    
+    def run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            with self._lock:
+                if job in self._waiting:
+                    self._waiting.remove(job)
+            self._run_job(job)
+    
+    def _run_job(self, job):
+        """Ejecutar una operación capturando su resultado"""
+        self.current_job = job
+        job._reporter = self._report
+        try:
+            if job.is_cancelled():
+                raise OperationCancelled()
+            job.state = RUNNING
+            job.started_at = time.monotonic()
+            self.job_started.emit(job)
+            job.plan()
+            self._report(job, force=True)
+            job.execute()
+            if job.errors:
+                job.state = FAILED
+                job.error = f"{len(job.errors)} elemento(s) no se pudieron procesar"
+            else:
+                job.state = DONE
+        except OperationCancelled:
+            job.state = CANCELLED
+        except Exception as e:
+            job.state = FAILED
+            job.error = str(e)
+        finally:
+            job._reporter = None
+            self.current_job = None
+            if job.started_at is not None:
+                self._report(job, force=True)
+            self.job_finished.emit(job)
+    
+    def _report(self, job, force=False):
+        """Emitir el progreso como máximo cada REPORT_INTERVAL segundos"""
+        now = time.monotonic()
+        if not force and now - self._last_report < self.REPORT_INTERVAL:
+            return
+        self._last_report = now
+        
+        elapsed = now - job.started_at - job.paused_seconds
+        if job._paused_at is not None:
+            elapsed -= now - job._paused_at
+        bytes_per_second = job.done_bytes / elapsed if elapsed > 0 else 0.0
+        if bytes_per_second > 0 and job.total_bytes > job.done_bytes:
+            eta_seconds = (job.total_bytes - job.done_bytes) / bytes_per_second
+        else:
+            eta_seconds = None
+        self.progress_changed.emit(FileOperationProgress(
+            job.job_id, job.done_bytes, job.total_bytes, job.done_files, job.total_files,
+            bytes_per_second, eta_seconds, job.current_path, job.is_paused()
+        ))
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+FilePreview - Lectura acotada de archivos mediante mmap para la vista previa
+"""
+
+import bisect
+import mmap
+import os
+import threading
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .fs_guard import fs_guard
+
+
+# Límites de lo que se muestra al seleccionar un archivo
+HEAD_BYTES = 64 * 1024
+TAIL_BYTES = 16 * 1024
+
+# Tamaño de página al navegar por archivos grandes
+PAGE_BYTES = 64 * 1024
+
+# Bytes que se examinan para decidir si un archivo es binario
+SNIFF_BYTES = 8 * 1024
+
+# Bloque usado para construir el índice de líneas
+INDEX_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Bytes por línea en la vista hexadecimal
+HEX_ROW_BYTES = 16
+
+_TEXT_CONTROL_BYTES = {7, 8, 9, 10, 12, 13, 27}
+
+# Bytes de control que no aparecen en un texto normal
+_BINARY_CONTROL_BYTES = bytes(byte for byte in range(32) if byte not in _TEXT_CONTROL_BYTES)
+
+
+def looks_binary(sample):
+    """Heurística de binario: bytes NUL o demasiados caracteres de control"""
+    if not sample:
+        return False
+    if b"\0" in sample:
+        return True
+    # translate borra en C los bytes de control: la diferencia es cuántos hay
+    control = len(sample) - len(sample.translate(None, _BINARY_CONTROL_BYTES))
+    return control / len(sample) > 0.10
+
+
+def decode_text(data):
+    """Decodificar bytes como UTF-8 sin fallar ante secuencias inválidas"""
+    return data.decode("utf-8", errors="replace")
+
+
+class FilePreview:
+    """Acceso acotado a un archivo a través de mmap
+    
+    Nunca se lee el archivo completo: el sistema operativo carga bajo demanda
+    solo las páginas que se tocan. El índice de líneas es disperso (una marca
+    por bloque) y se construye de forma incremental solo hasta donde se
+    necesite.
+    """
+    
+    def __init__(self, path):
+        self.path = str(path)
+        self.size = 0
+        self._mmap = None
+        self._lock = threading.Lock()
+        self._index_lock = threading.Lock()
+        # Índice disperso: offset de inicio de bloque y número de línea en ese offset
+        self._chunk_offsets = [0]
+        self._chunk_lines = [0]
+        self._indexed_until = 0
+        
+        with open(self.path, "rb") as f:
+            self.size = os.fstat(f.fileno()).st_size
+            if self.size > 0:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if hasattr(self._mmap, "madvise"):
+                    self._mmap.madvise(mmap.MADV_RANDOM)
+    
+    def close(self):
+        """Liberar el mapeo de memoria"""
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+    
+    def read(self, offset, length):
+        """Leer un rango de bytes acotado al tamaño del archivo"""
+        with self._lock:
+            if self._mmap is None:
+                return b""
+            offset = max(0, min(offset, self.size))
+            return self._mmap[offset:min(self.size, offset + length)]
+    
+    def is_binary(self):
+        """Indica si el contenido parece binario"""
+        return looks_binary(self.read(0, SNIFF_BYTES))
+    
+    def is_truncated(self):
+        """Indica si el archivo supera lo que se muestra de una vez"""
+        return self.size > HEAD_BYTES + TAIL_BYTES
+    
+    def head_and_tail(self):
+        """Primeros y últimos bytes del archivo, cortados en límites de línea
+        
+        Devuelve (texto inicial, texto final, offset donde termina el inicial).
+        """
+        if not self.is_truncated():
+            return decode_text(self.read(0, self.size)), "", self.size
+        head = self.read(0, HEAD_BYTES)
+        cut = head.rfind(b"\n")
+        if cut > 0:
+            head = head[:cut + 1]
+        tail = self.read(self.size - TAIL_BYTES, TAIL_BYTES)
+        cut = tail.find(b"\n")
+        if 0 <= cut < len(tail) - 1:
+            tail = tail[cut + 1:]
+        return decode_text(head), decode_text(tail), len(head)
+    
+    def page(self, offset, length=PAGE_BYTES):
+        """Página de texto desde offset, ajustada a inicios de línea
+        
+        Devuelve (texto, offset real de inicio, offset siguiente).
+        """
+        start = self.line_start_before(offset)
+        data = self.read(start, offset + length - start)
+        offset = start
+        end = offset + len(data)
+        if end < self.size:
+            cut = data.rfind(b"\n")
+            if cut >= 0:
+                data = data[:cut + 1]
+                end = offset + len(data)
+        return decode_text(data), offset, end
+    
+    def line_start_before(self, offset):
+        """Inicio de la línea que contiene offset"""
+        if offset <= 0:
+            return 0
+        with self._lock:
+            if self._mmap is None:
+                return 0
+            found = self._mmap.rfind(b"\n", max(0, offset - PAGE_BYTES), offset)
+        return found + 1 if found >= 0 else max(0, offset - PAGE_BYTES)
+    
+    def _extend_index(self, target_line=None, cancel_event=None, progress=None):
+        """Ampliar el índice disperso hasta cubrir target_line (o todo el archivo)
+        
+        progress se llama tras cada bloque leído para que FilesystemGuard
+        no confunda un índice largo con un montaje colgado.
+        """
+        with self._index_lock:
+            while self._indexed_until < self.size:
+                if target_line is not None and self._chunk_lines[-1] > target_line:
+                    return
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+                start = self._indexed_until
+                chunk = self.read(start, INDEX_CHUNK_BYTES)
+                if not chunk:
+                    return  # Mapeo cerrado
+                self._indexed_until = start + len(chunk)
+                self._chunk_offsets.append(self._indexed_until)
+                self._chunk_lines.append(self._chunk_lines[-1] + chunk.count(b"\n"))
+                if progress is not None:
+                    progress()
+    
+    def offset_of_line(self, line_number, cancel_event=None, progress=None):
+        """Offset de inicio de una línea (1 = primera); None si no existe"""
+        target = max(0, line_number - 1)
+        self._extend_index(target, cancel_event, progress)
+        chunk_index = bisect.bisect_right(self._chunk_lines, target) - 1
+        if chunk_index >= len(self._chunk_offsets) - 1 and self._chunk_lines[-1] < target:
+            return None
+        offset = self._chunk_offsets[chunk_index]
+        remaining = target - self._chunk_lines[chunk_index]
+        with self._lock:
+            if self._mmap is None:
+                return None
+            while remaining > 0:
+                found = self._mmap.find(b"\n", offset)
+                if found < 0:
+                    return None
+                offset = found + 1
+                remaining -= 1
+        return offset if offset < self.size or target == 0 else None
+    
+    def hex_dump(self, offset=0, length=HEAD_BYTES):
+        """Vista hexadecimal clásica: offset, bytes y ASCII"""
+        offset -= offset % HEX_ROW_BYTES
+        data = self.read(offset, length)
+        rows = []
+        for row_start in range(0, len(data), HEX_ROW_BYTES):
+            row = data[row_start:row_start + HEX_ROW_BYTES]
+            hex_part = " ".join(f"{byte:02x}" for byte in row)
+            ascii_part = "".join(chr(byte) if 32 <= byte < 127 else "." for byte in row)
+            rows.append(f"{offset + row_start:010x}  {hex_part:<{HEX_ROW_BYTES * 3 - 1}}  |{ascii_part}|")
+        return "\n".join(rows)
+
+
+class PreviewTask(QThread):
+    """Ejecuta una lectura de la vista previa fuera del hilo de la interfaz
+    
+    El resultado siempre se emite (salvo si se cancela): quien lanzó la
+    tarea decide, con el identificador de petición, si sigue siendo válido.
+    Con path, la lectura pasa por FilesystemGuard y un montaje colgado
+    produce un fallo en vez de bloquear el hilo para siempre. Con
+    watch_progress, function recibe progress y cancel_event para lecturas
+    largas que avanzan por bloques (el índice de líneas).
+    """
+    result_ready = pyqtSignal(int, object)  # identificador de petición, resultado
+    failed = pyqtSignal(int, str)  # identificador de petición, mensaje
+    
+    def __init__(self, request_id, function, *args, path=None, guard=None, watch_progress=False,
+                 parent=None):
+        super().__init__(parent)
+        self.request_id = request_id
+        self.function = function
+        self.args = args
+        self.path = path
+        self.guard = guard or fs_guard
+        self.watch_progress = watch_progress
+        self._cancel_event = threading.Event()
+    
+    def cancel(self):
+        """Dejar de esperar la lectura (el resultado se descarta)"""
+        self._cancel_event.set()
+    
+    def run(self):
+        try:
+            if self.path is None:
+                result = self.function(*self.args)
+            elif self.watch_progress:
+                result = self.guard.call(
+                    lambda _path, progress: self.function(*self.args, progress=progress,
+                                                          cancel_event=self._cancel_event),
+                    self.path, cancel_event=self._cancel_event, watch_progress=True)
+            else:
+                result = self.guard.call(lambda _path: self.function(*self.args), self.path,
+                                         cancel_event=self._cancel_event)
+        except Exception as e:
+            self.failed.emit(self.request_id, str(e))
+            return
+        if not self._cancel_event.is_set():
+            self.result_ready.emit(self.request_id, result)
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+FileTypes - Detección del tipo de archivo por extensión y por contenido
+"""
+
+import mimetypes
+import os
+import threading
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .file_preview import looks_binary
+from .fs_guard import fs_guard
+
+
+# Tipo de un archivo: categoría (para icono y orden), tipo MIME y si se
+# obtuvo leyendo el contenido o solo por el nombre
+FileType = namedtuple("FileType", "category mime sniffed")
+
+# Bytes de cabecera que se leen para reconocer el contenido
+HEADER_BYTES = 512
+
+CATEGORY_ICONS = {
+    "folder": "📁",
+    "text": "📄",
+    "code": "💻",
+    "image": "🖼️",
+    "audio": "🎵",
+    "video": "🎬",
+    "archive": "📦",
+    "pdf": "📋",
+    "executable": "⚙️",
+    "binary": "📄",
+}
+
+CATEGORY_LABELS = {
+    "folder": "Carpeta",
+    "text": "Texto",
+    "code": "Código",
+    "image": "Imagen",
+    "audio": "Audio",
+    "video": "Vídeo",
+    "archive": "Archivo comprimido",
+    "pdf": "Documento PDF",
+    "executable": "Ejecutable",
+    "binary": "Archivo",
+}
+
+_CATEGORY_EXTENSIONS = {
+    "text": ('.txt', '.md', '.readme', '.log', '.csv', '.ini', '.cfg', '.conf'),
+    "code": ('.py', '.js', '.ts', '.html', '.css', '.json', '.xml', '.yaml', '.yml',
+             '.toml', '.sh', '.bash', '.c', '.h', '.cpp', '.hpp', '.rs', '.go',
+             '.java', '.rb', '.pl', '.lua', '.sql'),
+    "image": ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg', '.ico',
+              '.tif', '.tiff'),
+    "audio": ('.mp3', '.wav', '.flac', '.ogg', '.opus', '.m4a'),
+    "video": ('.mp4', '.avi', '.mkv', '.mov', '.webm'),
+    "archive": ('.zip', '.tar', '.gz', '.tgz', '.bz2', '.xz', '.zst', '.7z', '.rar'),
+    "pdf": ('.pdf',),
+}
+
+UNKNOWN_TYPE = FileType("binary", "application/octet-stream", False)
+
+
+def _build_extension_table():
+    """Tabla extensión -> FileType calculada una sola vez al importar"""
+    table = {}
+    for category, extensions in _CATEGORY_EXTENSIONS.items():
+        for extension in extensions:
+            mime = mimetypes.guess_type("file" + extension, strict=False)[0]
+            if mime is None:
+                mime = "text/plain" if category == "text" else UNKNOWN_TYPE.mime
+            table[extension] = FileType(category, mime, False)
+    return table
+
+
+# Tabla precompilada: clasificar una fila del listado es una búsqueda en diccionario
+EXTENSION_TYPES = _build_extension_table()
+
+# Firmas de contenido: (offset, bytes, categoría, tipo MIME)
+MAGIC_SIGNATURES = (
+    (0, b"\x89PNG\r\n\x1a\n", "image", "image/png"),
+    (0, b"\xff\xd8\xff", "image", "image/jpeg"),
+    (0, b"GIF87a", "image", "image/gif"),
+    (0, b"GIF89a", "image", "image/gif"),
+    (8, b"WEBP", "image", "image/webp"),
+    (0, b"II*\x00", "image", "image/tiff"),
+    (0, b"MM\x00*", "image", "image/tiff"),
+    (0, b"\x00\x00\x01\x00", "image", "image/vnd.microsoft.icon"),
+    (0, b"%PDF-", "pdf", "application/pdf"),
+    (0, b"PK\x03\x04", "archive", "application/zip"),
+    (0, b"PK\x05\x06", "archive", "application/zip"),
+    (0, b"\x1f\x8b", "archive", "application/gzip"),
+    (0, b"BZh", "archive", "application/x-bzip2"),
+    (0, b"\xfd7zXZ\x00", "archive", "application/x-xz"),
+    (0, b"\x28\xb5\x2f\xfd", "archive", "application/zstd"),
+    (0, b"7z\xbc\xaf\x27\x1c", "archive", "application/x-7z-compressed"),
+    (0, b"Rar!\x1a\x07", "archive", "application/vnd.rar"),
+    (257, b"ustar", "archive", "application/x-tar"),
+    (0, b"\x7fELF", "executable", "application/x-executable"),
+    (0, b"ID3", "audio", "audio/mpeg"),
+    (0, b"\xff\xfb", "audio", "audio/mpeg"),
+    (0, b"fLaC", "audio", "audio/flac"),
+    (0, b"OggS", "audio", "audio/ogg"),
+    (8, b"WAVE", "audio", "audio/wav"),
+    (8, b"AVI ", "video", "video/x-msvideo"),
+    (4, b"ftyp", "video", "video/mp4"),
+    (0, b"\x1a\x45\xdf\xa3", "video", "video/x-matroska"),
+)
+
+# Intérpretes de la línea shebang (#!) -> tipo MIME del script
+SHEBANG_TYPES = {
+    "python": "text/x-python",
+    "python3": "text/x-python",
+    "python2": "text/x-python",
+    "sh": "text/x-shellscript",
+    "bash": "text/x-shellscript",
+    "dash": "text/x-shellscript",
+    "zsh": "text/x-shellscript",
+    "fish": "text/x-shellscript",
+    "perl": "text/x-perl",
+    "ruby": "text/x-ruby",
+    "node": "text/javascript",
+    "lua": "text/x-lua",
+}
+
+
+def guess_type_from_name(name):
+    """Tipo según la extensión: una búsqueda en diccionario, sin leer el archivo"""
+    return EXTENSION_TYPES.get(os.path.splitext(name)[1].lower(), UNKNOWN_TYPE)
+
+
+def _shebang_mime(header):
+    """Tipo MIME del intérprete indicado en la línea #!"""
+    first_line = header.split(b"\n", 1)[0][2:].decode("utf-8", errors="replace").split()
+    if not first_line:
+        return "text/x-script"
+    interpreter = os.path.basename(first_line[0])
+    if interpreter == "env":
+        # #!/usr/bin/env [-S] programa
+        arguments = [arg for arg in first_line[1:] if not arg.startswith("-")]
+        interpreter = arguments[0] if arguments else interpreter
+    # python3.12 -> python3 -> python
+    return (SHEBANG_TYPES.get(interpreter)
+            or SHEBANG_TYPES.get(interpreter.rstrip("0123456789."), "text/x-script"))
+
+
+def sniff_type(header, name=""):
+    """Tipo según el contenido de la cabecera; el nombre solo desempata texto"""
+    for offset, signature, category, mime in MAGIC_SIGNATURES:
+        if header.startswith(signature, offset):
+            return FileType(category, mime, True)
+    if header.startswith(b"#!"):
+        return FileType("code", _shebang_mime(header), True)
+    
+    by_name = guess_type_from_name(name)
+    if not header or not looks_binary(header):
+        # Texto: la extensión distingue código, datos o texto plano
+        if by_name.category in ("text", "code"):
+            return FileType(by_name.category, by_name.mime, True)
+        if by_name.category == "image" and by_name.mime == "image/svg+xml":
+            return FileType("image", by_name.mime, True)
+        return FileType("text", "text/plain", True)
+    if by_name.category not in ("text", "code", "binary"):
+        # Binario sin firma conocida (BMP, formatos multimedia poco comunes...)
+        return FileType(by_name.category, by_name.mime, True)
+    return FileType("binary", UNKNOWN_TYPE.mime, True)
+
+
+class FileTypeCache:
+    """Caché LRU de tipos detectados por contenido con validez por (dev, ino, mtime)"""
+    
+    def __init__(self, max_entries=100000):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._types = OrderedDict()
+    
+    @staticmethod
+    def stat_key(stat_result):
+        """Clave de validez de una entrada a partir de su stat"""
+        return (stat_result.st_dev, stat_result.st_ino, stat_result.st_mtime_ns)
+    
+    def cached_type(self, path, key):
+        """Tipo ya detectado si el archivo no cambió desde entonces"""
+        path = str(path)
+        with self._lock:
+            entry = self._types.get(path)
+            if entry is not None and entry[0] == key:
+                self._types.move_to_end(path)
+                return entry[1]
+        return None
+    
+    def detect(self, path):
+        """Detectar el tipo leyendo solo la cabecera, reutilizando la caché"""
+        path = str(path)
+        with open(path, "rb") as f:
+            key = self.stat_key(os.fstat(f.fileno()))
+            file_type = self.cached_type(path, key)
+            if file_type is not None:
+                return file_type
+            header = f.read(HEADER_BYTES)
+        
+        file_type = sniff_type(header, os.path.basename(path))
+        with self._lock:
+            self._types[path] = (key, file_type)
+            self._types.move_to_end(path)
+            # Descartar los tipos consultados hace más tiempo
+            while len(self._types) > self.max_entries:
+                self._types.popitem(last=False)
+        return file_type
+
+
+# Caché compartida por todos los exploradores de la aplicación
+file_type_cache = FileTypeCache()
+
+
+class FileTypeWorker(QThread):
+    """Hilo que detecta el tipo por contenido de varios archivos"""
+    type_ready = pyqtSignal(str, object)  # ruta, FileType
+    
+    def __init__(self, paths, cache=None, max_workers=4, guard=None, parent=None):
+        super().__init__(parent)
+        self.paths = [str(p) for p in paths]
+        self.cache = cache or file_type_cache
+        self.max_workers = max_workers
+        self.guard = guard or fs_guard
+        self._cancel_event = threading.Event()
+    
+    def _detect(self, path):
+        """Detectar un archivo salvo que se haya cancelado el trabajo
+        
+        La lectura pasa por FilesystemGuard: un montaje que se cuelga
+        después de listarlo no deja el hilo bloqueado para siempre.
+        """
+        if self._cancel_event.is_set():
+            return None
+        return self.guard.call(self.cache.detect, path, cancel_event=self._cancel_event)
+    
+    def run(self):
+        if not self.paths:
+            return
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = {pool.submit(self._detect, path): path for path in self.paths}
+            for future in as_completed(futures):
+                if self._cancel_event.is_set():
+                    break
+                try:
+                    file_type = future.result()
+                except OSError:
+                    continue
+                if file_type is None:
+                    continue
+                self.type_ready.emit(futures[future], file_type)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+    
+    def cancel(self):
+        """Detener la detección lo antes posible"""
+        self._cancel_event.set()
@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+"""
+FolderSync - Sincronización de una carpeta local con otra al estilo de rsync
+
+Los dos árboles se recorren a la vez y cada archivo se compara por su firma
+(tamaño, mtime): lo que coincide no se lee. Los archivos grandes que
+cambiaron se actualizan en el sitio escribiendo solo los bloques que son
+distintos, y las firmas de bloque del destino se guardan en caché, así que
+la siguiente sincronización no necesita volver a leerlo. Las copias se
+reparten en un pool de hilos; en modo simulación solo se calcula el informe.
+
+Se sincronizan archivos regulares y carpetas; los enlaces simbólicos, los
+sockets y los dispositivos se omiten.
+"""
+
+import hashlib
+import os
+import shutil
+import stat
+import struct
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait
+from pathlib import Path
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .fast_copy import copy_file
+from .mounts import read_mounts, mount_point_of
+from .walker import walk_directories, WalkCancelled
+
+
+# Bloque de comparación en las actualizaciones en el sitio
+SYNC_BLOCK_SIZE = 256 * 1024
+
+# Por debajo de este tamaño se copia el archivo entero
+DELTA_MIN_SIZE = 8 * 1024 * 1024
+
+# Bytes del digest BLAKE2 de cada bloque
+DIGEST_SIZE = 16
+
+# Intervalo mínimo entre señales de progreso (segundos)
+REPORT_INTERVAL = 0.2
+
+# FAT guarda el mtime con resolución de 2 segundos
+FAT_FILESYSTEMS = {"vfat", "msdos", "fat", "exfat"}
+
+# Acciones del plan
+COPY = "copy"
+UPDATE = "update"
+DELETE = "delete"
+MKDIR = "mkdir"
+
+# Fases de la sincronización
+COMPARING = "comparing"
+SYNCING = "syncing"
+
+# Acción del informe: tipo, ruta relativa, bytes afectados y si es carpeta
+SyncAction = namedtuple("SyncAction", "kind relative size is_dir")
+
+# Resultado final (en simulación, lo que se habría hecho)
+SyncSummary = namedtuple("SyncSummary",
+                         "copied updated deleted unchanged bytes_written bytes_skipped errors")
+
+_SIGNATURE_HEADER = struct.Struct("<QqI")
+
+
+class SyncCancelled(Exception):
+    """La sincronización se canceló antes de terminar"""
+
+
+def signature_cache_dir():
+    """Carpeta de las firmas de bloque de los destinos sincronizados"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return os.path.join(cache_home, "linux-gui", "sync")
+
+
+def block_digest(block):
+    """Firma fuerte de un bloque"""
+    return hashlib.blake2b(block, digest_size=DIGEST_SIZE).digest()
+
+
+class BlockSignatureCache:
+    """Firmas de bloque de archivos del destino, válidas mientras no cambien
+    
+    Cada archivo tiene su entrada con el tamaño y el mtime con los que se
+    calculó; si no coinciden con los actuales la entrada se ignora.
+    """
+    
+    def __init__(self, directory=None):
+        self.directory = directory or signature_cache_dir()
+    
+    def _path(self, target):
+        digest = hashlib.sha1(os.fsencode(os.path.abspath(target))).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest)
+    
+    def get(self, target, stat_result):
+        """Digests de los bloques de target, o None si no hay firma válida"""
+        try:
+            with open(self._path(target), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) < _SIGNATURE_HEADER.size:
+            return None
+        size, mtime_ns, block_size = _SIGNATURE_HEADER.unpack_from(data)
+        blocks = (size + SYNC_BLOCK_SIZE - 1) // SYNC_BLOCK_SIZE
+        body = data[_SIGNATURE_HEADER.size:]
+        if (size != stat_result.st_size or mtime_ns != stat_result.st_mtime_ns
+                or block_size != SYNC_BLOCK_SIZE or len(body) != blocks * DIGEST_SIZE):
+            return None
+        return [body[offset:offset + DIGEST_SIZE] for offset in range(0, len(body), DIGEST_SIZE)]
+    
+    def put(self, target, stat_result, digests):
+        """Guardar las firmas de target (si falla, simplemente no hay caché)"""
+        path = self._path(target)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temporary = f"{path}.{threading.get_ident()}.tmp"
+            with open(temporary, "wb") as f:
+                f.write(_SIGNATURE_HEADER.pack(stat_result.st_size, stat_result.st_mtime_ns,
+                                               SYNC_BLOCK_SIZE))
+                f.write(b"".join(digests))
+            os.replace(temporary, path)
+        except OSError:
+            pass
+
+
+# Caché compartida por todas las sincronizaciones de la aplicación
+signature_cache = BlockSignatureCache()
+
+
+def mtime_window(path):
+    """Diferencia de mtime (segundos) que se tolera en el sistema de archivos de path"""
+    mounts = read_mounts()
+    point = mount_point_of(path, mounts)
+    # Si hay montajes apilados en el mismo punto, el visible es el último
+    fs_types = [mount.fs_type for mount in mounts if mount.mount_point == point]
+    return 1 if fs_types and fs_types[-1] in FAT_FILESYSTEMS else 0
+
+
+def scan_tree(root, cancel_event=None, max_workers=8):
+    """Archivos ({ruta relativa: stat}), carpetas (conjunto) y errores de un árbol
+    
+    Los errores son (ruta relativa, mensaje) de lo que no se pudo listar;
+    la ruta relativa de la propia raíz es "".
+    """
+    files = {}
+    dirs = set()
+    walk_errors = []
+    root = str(root)
+    prefix = len(root.rstrip(os.sep)) + 1
+    for directory, entries, _ in walk_directories(root, cancel_event, max_workers,
+                                                  one_file_system=True, errors=walk_errors):
+        if directory != root:
+            dirs.add(directory[prefix:])
+        for path, stat_result in entries:
+            files[path[prefix:]] = stat_result
+    errors = [(path[prefix:] if path != root else "", error.strerror or str(error))
+              for path, error in walk_errors]
+    return files, dirs, errors
+
+
+def _inside(path, folders):
+    """Indica si una ruta relativa es alguna de folders o está dentro ("" es la raíz)"""
+    return any(not folder or path == folder or path.startswith(folder + os.sep)
+               for folder in folders)
+
+
+def _unchanged(source_stat, target_stat, window):
+    """Comprobación rápida: mismo tamaño y mismo mtime (a la resolución del destino)"""
+    if source_stat.st_size != target_stat.st_size:
+        return False
+    if source_stat.st_mtime_ns == target_stat.st_mtime_ns:
+        return True
+    # Los destinos con resolución de segundos (ext3, FAT...) truncan el mtime
+    if target_stat.st_mtime_ns % 1_000_000_000 == 0:
+        return abs(source_stat.st_mtime_ns // 1_000_000_000
+                   - target_stat.st_mtime_ns // 1_000_000_000) <= window
+    return False
+
+
+class SyncPlan:
+    """Diferencias entre origen y destino y lo que hay que hacer con ellas
+    
+    unreadable son las rutas del origen que no se pudieron listar: lo que
+    haya bajo ellas en el destino no se elimina, como hace rsync tras un
+    error de lectura.
+    """
+    
+    def __init__(self, source_files, source_dirs, target_files, target_dirs,
+                 delete_extra=False, window=0, unreadable=()):
+        self.mkdirs = sorted(source_dirs - target_dirs)
+        # Lo que estorba (un archivo donde va una carpeta o al revés) se
+        # elimina siempre; lo que sobra, solo si se pidió
+        self.conflicts = sorted([(path, False) for path in self.mkdirs if path in target_files]
+                                + [(path, True) for path in source_files if path in target_dirs])
+        self.copies = []
+        self.updates = []
+        self.unchanged = 0
+        self.bytes_skipped = 0
+        for path, source_stat in source_files.items():
+            target_stat = target_files.get(path)
+            if target_stat is None or path in target_dirs:
+                self.copies.append(path)
+            elif _unchanged(source_stat, target_stat, window):
+                self.unchanged += 1
+                self.bytes_skipped += source_stat.st_size
+            else:
+                self.updates.append(path)
+        self.copies.sort()
+        self.updates.sort()
+        
+        self.extra = []
+        if delete_extra:
+            # Una carpeta que sobra se elimina entera: no se listan sus archivos
+            extra_dirs = {path for path in target_dirs - source_dirs
+                          if path not in source_files}
+            top_dirs = {path for path in extra_dirs if os.path.dirname(path) not in extra_dirs}
+            extra = ([(path, True) for path in top_dirs]
+                     + [(path, False) for path in target_files
+                        if path not in source_files and path not in source_dirs
+                        and os.path.dirname(path) not in extra_dirs])
+            if unreadable:
+                # Lo que no se pudo listar en el origen no se sabe si sobra
+                extra = [item for item in extra if not _inside(item[0], unreadable)]
+            self.extra = sorted(extra)
+        self.source_files = source_files
+        self.target_files = target_files
+    
+    def bytes_to_copy(self):
+        """Bytes de origen que hay que leer (copias y actualizaciones)"""
+        return sum(self.source_files[path].st_size for path in self.copies + self.updates)
+    
+    def actions(self):
+        """Informe completo como SyncAction, en el orden en que se ejecuta"""
+        for path, is_dir in self.conflicts:
+            yield SyncAction(DELETE, path, 0, is_dir)
+        for path in self.mkdirs:
+            yield SyncAction(MKDIR, path, 0, True)
+        for path in self.copies:
+            yield SyncAction(COPY, path, self.source_files[path].st_size, False)
+        for path in self.updates:
+            yield SyncAction(UPDATE, path, self.source_files[path].st_size, False)
+        for path, is_dir in self.extra:
+            size = 0 if is_dir else self.target_files[path].st_size
+            yield SyncAction(DELETE, path, size, is_dir)
+    
+    def is_empty(self):
+        """Indica si origen y destino ya están sincronizados"""
+        return not (self.conflicts or self.mkdirs or self.copies or self.updates or self.extra)
+
+
+class FolderSync(QThread):
+    """Hilo que compara dos carpetas y, salvo en simulación, las sincroniza
+    
+    plan_ready se emite al terminar la comparación (con el informe
+    completo) y sync_finished al final con el resumen.
+    """
+    progress_changed = pyqtSignal(str, object, object)  # fase, hechos, total
+    plan_ready = pyqtSignal(object)  # SyncPlan
+    sync_finished = pyqtSignal(object)  # SyncSummary
+    
+    def __init__(self, source, destination, delete_extra=False, dry_run=False,
+                 max_workers=4, cache=None, parent=None):
+        super().__init__(parent)
+        self.source = str(source).rstrip(os.sep) or os.sep
+        self.destination = str(destination).rstrip(os.sep) or os.sep
+        self.delete_extra = delete_extra
+        self.dry_run = dry_run
+        self.max_workers = max_workers
+        self.cache = cache or signature_cache
+        self._cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._last_report = 0.0
+        self.bytes_done = 0
+        self.bytes_written = 0
+        self.errors = []
+    
+    def cancel(self):
+        """Detener la sincronización lo antes posible"""
+        self._cancel_event.set()
+    
+    def _checkpoint(self):
+        if self._cancel_event.is_set():
+            raise SyncCancelled(self.source)
+    
+    def _add_progress(self, read=0, written=0, total=0):
+        """Sumar bytes procesados y escritos (desde cualquier hilo del pool)"""
+        with self._lock:
+            self.bytes_done += read
+            self.bytes_written += written
+            now = time.monotonic()
+            if now - self._last_report < REPORT_INTERVAL:
+                return
+            self._last_report = now
+            done = self.bytes_done
+        self.progress_changed.emit(SYNCING, done, total)
+    
+    def _compare(self):
+        """Recorrer ambos árboles a la vez y calcular el plan"""
+        self.progress_changed.emit(COMPARING, 0, 0)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            # El destino (a menudo un USB lento) se recorre mientras tanto
+            target_scan = pool.submit(self._scan_destination)
+            source_files, source_dirs, source_errors = scan_tree(self.source, self._cancel_event)
+            target_files, target_dirs, target_errors = target_scan.result()
+        self.errors.extend(source_errors + target_errors)
+        return SyncPlan(source_files, source_dirs, target_files, target_dirs,
+                        self.delete_extra, mtime_window(self.destination),
+                        [path for path, _ in source_errors])
+    
+    def _scan_destination(self):
+        """Recorrer el destino; si aún no existe es un árbol vacío (se crea al sincronizar)"""
+        if not os.path.lexists(self.destination):
+            return {}, set(), []
+        return scan_tree(self.destination, self._cancel_event)
+    
+    def run(self):
+        try:
+            plan = self._compare()
+        except (WalkCancelled, SyncCancelled):
+            return
+        except OSError as e:
+            self.errors.append((self.destination, str(e)))
+            self.sync_finished.emit(SyncSummary(0, 0, 0, 0, 0, 0, self.errors))
+            return
+        self.plan_ready.emit(plan)
+        
+        deleted = len(plan.conflicts) + len(plan.extra)
+        if self.dry_run:
+            self.sync_finished.emit(SyncSummary(len(plan.copies), len(plan.updates), deleted,
+                                                plan.unchanged, 0, plan.bytes_skipped, self.errors))
+            return
+        
+        try:
+            self._execute(plan)
+        except SyncCancelled:
+            return
+        except OSError as e:
+            # No se pudo crear el destino
+            self.errors.append((self.destination, str(e)))
+            self.sync_finished.emit(SyncSummary(0, 0, 0, plan.unchanged, 0, 0, self.errors))
+            return
+        self.sync_finished.emit(SyncSummary(len(plan.copies), len(plan.updates), deleted,
+                                            plan.unchanged, self.bytes_written,
+                                            plan.bytes_skipped + plan.bytes_to_copy() - self.bytes_written,
+                                            self.errors))
+    
+    # --- Ejecución -----------------------------------------------------
+    
+    def _target(self, relative):
+        return os.path.join(self.destination, relative)
+    
+    def _execute(self, plan):
+        """Aplicar el plan: carpetas, archivos en paralelo y por último lo que sobra"""
+        total = plan.bytes_to_copy()
+        self.progress_changed.emit(SYNCING, 0, total)
+        os.makedirs(self.destination, exist_ok=True)
+        for path, is_dir in plan.conflicts:
+            self._remove(path, is_dir)
+        for path in plan.mkdirs:
+            self._checkpoint()
+            try:
+                os.makedirs(self._target(path), exist_ok=True)
+            except OSError as e:
+                self.errors.append((path, str(e)))
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [pool.submit(self._copy_whole, path, total) for path in plan.copies]
+            futures += [pool.submit(self._update, path, plan.source_files[path],
+                                    plan.target_files[path], total)
+                        for path in plan.updates]
+            try:
+                done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        
+        for path, is_dir in plan.extra:
+            self._checkpoint()
+            self._remove(path, is_dir)
+        self.progress_changed.emit(SYNCING, self.bytes_done, total)
+    
+    def _remove(self, relative, is_dir):
+        """Eliminar del destino un archivo o una carpeta entera"""
+        target = self._target(relative)
+        try:
+            if is_dir:
+                shutil.rmtree(target)
+            else:
+                os.unlink(target)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.errors.append((relative, str(e)))
+    
+    def _copy_whole(self, relative, total):
+        """Copiar un archivo completo a un temporal y reemplazar el destino"""
+        self._checkpoint()
+        source = os.path.join(self.source, relative)
+        target = self._target(relative)
+        temporary = os.path.join(os.path.dirname(target),
+                                 f".{os.path.basename(target)}.sync-{threading.get_ident()}")
+        try:
+            copy_file(source, temporary,
+                      progress=lambda nbytes: self._add_progress(nbytes, nbytes, total),
+                      checkpoint=self._checkpoint)
+            os.replace(temporary, target)
+        except SyncCancelled:
+            raise
+        except OSError as e:
+            self.errors.append((relative, str(e)))
+    
+    def _update(self, relative, source_stat, target_stat, total):
+        """Actualizar un archivo que cambió escribiendo solo los bloques distintos
+        
+        Con enlaces duros en el destino o archivos pequeños se copia entero.
+        """
+        if (source_stat.st_size < DELTA_MIN_SIZE or target_stat.st_nlink > 1
+                or not stat.S_ISREG(target_stat.st_mode)):
+            self._copy_whole(relative, total)
+            return
+        self._checkpoint()
+        source = os.path.join(self.source, relative)
+        target = self._target(relative)
+        try:
+            self._update_in_place(source, target, source_stat, target_stat, total)
+        except SyncCancelled:
+            raise
+        except OSError as e:
+            self.errors.append((relative, str(e)))
+    
+    def _update_in_place(self, source, target, source_stat, target_stat, total):
+        """Reescribir en target solo los bloques que difieren de source
+        
+        Sin firmas en caché se comparan los bloques leídos del destino; con
+        ellas basta leer el origen. Si se interrumpe, el mtime del destino
+        ya no coincide y la próxima vez se vuelve a comparar.
+        """
+        cached = self.cache.get(target, target_stat)
+        size = source_stat.st_size
+        digests = []
+        src_fd = os.open(source, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            dst_fd = os.open(target, os.O_RDWR | os.O_CLOEXEC)
+            try:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                for index, offset in enumerate(range(0, size, SYNC_BLOCK_SIZE)):
+                    self._checkpoint()
+                    block = os.pread(src_fd, SYNC_BLOCK_SIZE, offset)
+                    digest = block_digest(block)
+                    digests.append(digest)
+                    if cached is not None:
+                        same = index < len(cached) and cached[index] == digest
+                        # El último bloque puede coincidir en digest pero no en longitud
+                        same = same and offset + len(block) <= target_stat.st_size
+                    else:
+                        same = (offset < target_stat.st_size
+                                and os.pread(dst_fd, len(block), offset) == block)
+                    written = 0
+                    if not same:
+                        view = memoryview(block)
+                        while written < len(block):
+                            written += os.pwrite(dst_fd, view[written:], offset + written)
+                    self._add_progress(len(block), written, total)
+                if target_stat.st_size != size:
+                    os.ftruncate(dst_fd, size)
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        os.utime(target, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+        try:
+            os.chmod(target, stat.S_IMODE(source_stat.st_mode))
+        except OSError:
+            # FAT y similares no guardan permisos
+            pass
+        self.cache.put(target, os.stat(target), digests)
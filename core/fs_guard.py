@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+FilesystemGuard - Llamadas al sistema de archivos con tiempo límite
+
+Una llamada a un montaje NFS, FUSE o sshfs colgado puede bloquearse en el
+kernel indefinidamente y ningún hilo de Python se puede interrumpir. Por
+eso cada llamada se ejecuta en un hilo daemon propio y quien la pide solo
+espera un tiempo limitado: si vence, el montaje se marca como "no
+responde" y no se lanzan más llamadas contra él hasta que se reintente.
+"""
+
+import errno
+import threading
+import time
+
+from .mounts import read_mounts, mount_point_of
+
+
+# Segundos sin progreso tras los que un montaje se considera colgado
+DEFAULT_TIMEOUT = 5.0
+
+# Cada cuánto se revisa el progreso y la cancelación mientras se espera
+POLL_INTERVAL = 0.1
+
+# Segundos durante los que se reutiliza la lista de montajes
+MOUNTS_REFRESH = 2.0
+
+
+class MountUnresponsive(OSError):
+    """El montaje que contiene la ruta no respondió a tiempo"""
+    
+    def __init__(self, mount_point):
+        super().__init__(errno.ETIMEDOUT, "La unidad no responde", mount_point)
+        self.mount_point = mount_point
+
+
+class FilesystemGuard:
+    """Ejecuta llamadas al sistema de archivos sin que nadie espere para siempre
+    
+    Los hilos que se quedan bloqueados son daemon (no impiden cerrar la
+    aplicación) y están limitados por montaje: con max_stuck_calls hilos
+    atascados en un montaje ya no se crean más aunque se reintente. Un
+    hilo cuya espera se canceló cuenta igual hasta que termina.
+    """
+    
+    def __init__(self, timeout=DEFAULT_TIMEOUT, max_stuck_calls=4):
+        self.timeout = timeout
+        self.max_stuck_calls = max_stuck_calls
+        self._lock = threading.Lock()
+        self._unresponsive = set()
+        # Hilos abandonados sin terminar por montaje: id -> estado de la llamada
+        self._stuck = {}
+        self._mounts = []
+        self._mounts_time = 0.0
+    
+    def mount_point(self, path):
+        """Punto de montaje de una ruta (solo consulta /proc)"""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._mounts_time > MOUNTS_REFRESH:
+                self._mounts = read_mounts()
+                self._mounts_time = now
+            mounts = self._mounts
+        return mount_point_of(path, mounts)
+    
+    def is_unresponsive(self, path):
+        """Indica si el montaje de una ruta está marcado como colgado"""
+        mount = self.mount_point(path)
+        with self._lock:
+            return mount in self._unresponsive
+    
+    def retry(self, path):
+        """Permitir de nuevo llamadas al montaje de una ruta"""
+        mount = self.mount_point(path)
+        with self._lock:
+            self._unresponsive.discard(mount)
+    
+    def _abandon(self, mount, state):
+        """Contar como atascado un hilo que sigue en marcha (con el lock tomado)"""
+        if not state.get("finished") and not state.get("stuck"):
+            state["stuck"] = True
+            self._stuck.setdefault(mount, {})[id(state)] = state
+    
+    def call(self, function, path, *args, cancel_event=None, watch_progress=False, **kwargs):
+        """Ejecutar function(path, *args, **kwargs) con tiempo límite
+        
+        Con watch_progress, function recibe progress=callable y el tiempo
+        límite cuenta desde la última vez que lo llamó: un listado largo
+        pero activo no se confunde con un montaje colgado. Devuelve None si
+        cancel_event se activa antes de terminar y lanza MountUnresponsive
+        si vence el tiempo.
+        """
+        mount = self.mount_point(path)
+        now = time.monotonic()
+        with self._lock:
+            stuck = self._stuck.get(mount, {})
+            # Una llamada cancelada que lleva demasiado sin avanzar delata un
+            # montaje colgado aunque nadie haya llegado a esperarla entera
+            if any(now - abandoned["beat"] > self.timeout for abandoned in stuck.values()):
+                self._unresponsive.add(mount)
+            if mount in self._unresponsive or len(stuck) >= self.max_stuck_calls:
+                raise MountUnresponsive(mount)
+        
+        state = {"beat": time.monotonic()}
+        done = threading.Event()
+        if watch_progress:
+            kwargs["progress"] = lambda: state.__setitem__("beat", time.monotonic())
+        
+        def target():
+            try:
+                state["value"] = function(path, *args, **kwargs)
+            except BaseException as error:
+                state["error"] = error
+            finally:
+                with self._lock:
+                    state["finished"] = True
+                    if state.get("stuck"):
+                        # El montaje contestó por fin: el hilo deja de contar
+                        self._stuck[mount].pop(id(state), None)
+                done.set()
+        
+        threading.Thread(target=target, name=f"fs-guard {mount}", daemon=True).start()
+        
+        while not done.wait(POLL_INTERVAL):
+            if cancel_event is not None and cancel_event.is_set():
+                with self._lock:
+                    self._abandon(mount, state)
+                return None
+            if time.monotonic() - state["beat"] > self.timeout:
+                with self._lock:
+                    if not state.get("finished"):
+                        self._abandon(mount, state)
+                        self._unresponsive.add(mount)
+                        raise MountUnresponsive(mount)
+                break
+        
+        if "error" in state:
+            raise state["error"]
+        return state["value"]
+
+
+# Guardián compartido por toda la aplicación
+fs_guard = FilesystemGuard()
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Diario de escritura anticipada de las operaciones de archivos
+
+Antes de tocar el disco, cada operación que se puede deshacer (renombrar,
+mover, enviar a la papelera) anota en el diario los pasos que va a dar y
+hace fsync; al terminar anota cuáles se aplicaron. Si la aplicación se
+cierra a mitad, al arrancar se revisa el disco para cerrar lo pendiente.
+Deshacer y rehacer reproducen los pasos guardados, también tras reiniciar.
+
+Cada paso es un diccionario con "op" (rename, move, trash o restore),
+"source" y "target"; los de la papelera llevan también "info" (el
+.trashinfo) y los renombrados masivos "temporary" (su nombre intermedio).
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+from .trash import discard_trash_info
+
+
+# Operaciones que se conservan para deshacer
+MAX_HISTORY = 100
+
+
+def journal_path():
+    """Archivo del diario: $XDG_DATA_HOME/linux-gui/journal.jsonl"""
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.join(Path.home(), ".local", "share")
+    return os.path.join(data_home, "linux-gui", "journal.jsonl")
+
+
+def step_applied(step):
+    """Indica si el disco refleja un paso ya aplicado"""
+    return os.path.lexists(step["target"]) and not os.path.lexists(step["source"])
+
+
+class JournalEntry:
+    """Operación registrada en el diario"""
+    
+    def __init__(self, entry_id, kind, title, steps, undo_of=None, redo_of=None):
+        self.id = entry_id
+        self.kind = kind
+        self.title = title
+        self.steps = steps
+        self.undo_of = undo_of
+        self.redo_of = redo_of
+        self.staged = False
+        self.copied = set()  # Pasos copiados entre discos cuyo origen se estaba eliminando
+        self.undone = False
+    
+    def snapshot(self):
+        """Estado completo de una entrada del historial (para compactar)"""
+        return {"event": "entry", "id": self.id, "kind": self.kind, "title": self.title,
+                "steps": self.steps, "undone": self.undone}
+
+
+class OperationJournal:
+    """Diario persistente con historial de deshacer y rehacer
+    
+    begin() se escribe antes de ejecutar, stage() marca el final de la
+    primera fase de un renombrado en dos fases, copied() el final de la
+    copia de un paso que cruza de disco y commit() anota los pasos que se
+    aplicaron de verdad. Las operaciones que deshacen o rehacen
+    indican en begin() a qué entrada se refieren. Si el diario no se puede
+    escribir se sigue funcionando solo en memoria.
+    """
+    
+    def __init__(self, path=None, max_history=MAX_HISTORY):
+        self.path = path or journal_path()
+        self.max_history = max_history
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._history = []
+        self._next_id = 1
+        self._file = None
+        self._loaded = False
+    
+    # --- Registro ------------------------------------------------------
+    
+    def begin(self, kind, title, steps, undo_of=None, redo_of=None):
+        """Anotar los pasos de una operación antes de ejecutarla"""
+        with self._lock:
+            self._load()
+            entry = JournalEntry(self._next_id, kind, title, steps, undo_of, redo_of)
+            self._next_id += 1
+            self._pending[entry.id] = entry
+            self._write({"event": "begin", "id": entry.id, "kind": kind, "title": title,
+                         "steps": steps, "undo_of": undo_of, "redo_of": redo_of,
+                         "time": time.time()})
+            return entry.id
+    
+    def stage(self, entry_id):
+        """Anotar que todos los orígenes están ya en su nombre temporal"""
+        with self._lock:
+            self._pending[entry_id].staged = True
+            self._write({"event": "stage", "id": entry_id})
+    
+    def copied(self, entry_id, index):
+        """Anotar que el destino de un paso entre discos está completo
+        
+        A partir de aquí solo falta eliminar el origen, que puede quedar a
+        medias: la copia del destino es la que vale.
+        """
+        with self._lock:
+            self._pending[entry_id].copied.add(index)
+            self._write({"event": "copied", "id": entry_id, "step": index})
+    
+    def commit(self, entry_id, steps):
+        """Anotar los pasos aplicados y pasar la operación al historial"""
+        with self._lock:
+            self._write({"event": "commit", "id": entry_id, "steps": steps})
+            self._finish(self._pending.pop(entry_id), steps)
+    
+    def abort(self, entry_id):
+        """Anotar que la operación no cambió nada"""
+        with self._lock:
+            self._write({"event": "abort", "id": entry_id})
+            self._pending.pop(entry_id, None)
+    
+    # --- Historial -----------------------------------------------------
+    
+    def undo_entry(self):
+        """Última operación que se puede deshacer (o None)"""
+        with self._lock:
+            self._load()
+            for entry in reversed(self._history):
+                if not entry.undone:
+                    return entry
+            return None
+    
+    def redo_entry(self):
+        """Última operación deshecha que se puede rehacer (o None)"""
+        with self._lock:
+            self._load()
+            candidate = None
+            for entry in reversed(self._history):
+                if not entry.undone:
+                    break
+                candidate = entry
+            return candidate
+    
+    def _find(self, entry_id):
+        for entry in reversed(self._history):
+            if entry.id == entry_id:
+                return entry
+        return None
+    
+    def _finish(self, entry, steps):
+        """Actualizar el historial con una operación terminada"""
+        if not steps:
+            return
+        entry.steps = steps
+        if entry.undo_of is not None:
+            target = self._find(entry.undo_of)
+            if target is not None:
+                target.undone = True
+        elif entry.redo_of is not None:
+            target = self._find(entry.redo_of)
+            if target is not None:
+                target.undone = False
+                # Rehacer puede elegir nombres nuevos (p. ej. en la papelera)
+                target.steps = steps
+        else:
+            # Una operación nueva descarta lo que se podía rehacer
+            while self._history and self._history[-1].undone:
+                self._history.pop()
+            self._history.append(entry)
+            del self._history[:-self.max_history]
+    
+    # --- Persistencia --------------------------------------------------
+    
+    def _write(self, event):
+        """Añadir un evento al diario y llevarlo al disco"""
+        self._load()
+        if self._file is None:
+            return
+        try:
+            self._file.write(json.dumps(event, ensure_ascii=False) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except OSError:
+            self._close_file()
+    
+    def _close_file(self):
+        try:
+            self._file.close()
+        except OSError:
+            pass
+        self._file = None
+    
+    def _load(self):
+        """Leer el diario, cerrar lo pendiente y reescribirlo compactado (una vez)"""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, encoding="utf-8", errors="surrogateescape") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            lines = []
+        except OSError:
+            return
+        
+        for line in lines:
+            try:
+                self._replay(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                # Una última línea a medio escribir no invalida el resto
+                continue
+        
+        # Operaciones interrumpidas: el disco dice hasta dónde llegaron
+        for entry in list(self._pending.values()):
+            steps = self._recover(entry)
+            self._pending.pop(entry.id)
+            self._finish(entry, steps)
+        
+        # Reescribir solo el historial vigente mantiene el archivo acotado
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temporary = f"{self.path}.tmp"
+            with open(temporary, "w", encoding="utf-8", errors="surrogateescape") as f:
+                for entry in self._history:
+                    f.write(json.dumps(entry.snapshot(), ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporary, self.path)
+            self._file = open(self.path, "a", encoding="utf-8", errors="surrogateescape")
+        except OSError:
+            self._file = None
+    
+    def _replay(self, event):
+        """Aplicar un evento leído del diario al estado en memoria"""
+        kind = event["event"]
+        entry_id = event["id"]
+        self._next_id = max(self._next_id, entry_id + 1)
+        if kind == "entry":
+            entry = JournalEntry(entry_id, event["kind"], event["title"], event["steps"])
+            entry.undone = event["undone"]
+            self._history.append(entry)
+        elif kind == "begin":
+            self._pending[entry_id] = JournalEntry(entry_id, event["kind"], event["title"],
+                                                   event["steps"], event.get("undo_of"),
+                                                   event.get("redo_of"))
+        elif kind == "stage":
+            self._pending[entry_id].staged = True
+        elif kind == "copied":
+            self._pending[entry_id].copied.add(event["step"])
+        elif kind == "commit":
+            self._finish(self._pending.pop(entry_id), event["steps"])
+        elif kind == "abort":
+            self._pending.pop(entry_id, None)
+    
+    def _recover(self, entry):
+        """Revisar el disco tras una interrupción y devolver los pasos aplicados
+        
+        Un renombrado en dos fases se deshace entero para no dejar nombres
+        temporales. En el resto se conservan los pasos que llegaron a
+        aplicarse (para poder deshacerlos) y se limpia lo que no.
+        """
+        if any("temporary" in step for step in entry.steps):
+            self._rollback_staged(entry)
+            return []
+        
+        applied = []
+        for index, step in enumerate(entry.steps):
+            if index in entry.copied and os.path.lexists(step["target"]):
+                # La copia entre discos terminó y se estaba eliminando el
+                # origen: el destino es el completo, se termina de eliminar
+                if os.path.lexists(step["source"]):
+                    self._remove_quietly(step["source"])
+            if step_applied(step):
+                applied.append(step)
+                if step["op"] == "restore":
+                    discard_trash_info(step["info"])
+            elif index in entry.copied:
+                # No se pudo terminar: se conservan el origen y la copia
+                # completa (con su .trashinfo si está en la papelera)
+                continue
+            elif step["op"] == "trash":
+                # Copia a medias entre discos: el original sigue intacto
+                if os.path.lexists(step["target"]) and os.path.lexists(step["source"]):
+                    self._remove_quietly(step["target"])
+                discard_trash_info(step["info"])
+        return applied
+    
+    def _rollback_staged(self, entry):
+        """Devolver a su nombre original un renombrado masivo interrumpido"""
+        steps = list(reversed(entry.steps))
+        if entry.staged:
+            # Tras la primera fase ningún origen existe: un destino presente
+            # solo puede venir de la segunda
+            for step in steps:
+                if not os.path.lexists(step["temporary"]) and os.path.lexists(step["target"]):
+                    self._rename_quietly(step["target"], step["temporary"])
+        for step in steps:
+            if os.path.lexists(step["temporary"]) and not os.path.lexists(step["source"]):
+                self._rename_quietly(step["temporary"], step["source"])
+    
+    def _rename_quietly(self, source, target):
+        try:
+            os.rename(source, target)
+        except OSError:
+            pass
+    
+    def _remove_quietly(self, path):
+        try:
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path)
+            else:
+                os.unlink(path)
+        except OSError:
+            pass
+
+
+# Diario compartido por todos los exploradores de la aplicación
+operation_journal = OperationJournal()
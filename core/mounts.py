@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Puntos de montaje leídos de /proc/self/mountinfo
+
+Consultar /proc nunca toca los sistemas de archivos montados, así que estas
+funciones son seguras aunque un montaje de red esté colgado.
+"""
+
+import os
+import re
+from collections import namedtuple
+
+
+MOUNTINFO_PATH = "/proc/self/mountinfo"
+
+# Montaje: punto de montaje, tipo de sistema de archivos, origen y opciones
+Mount = namedtuple("Mount", "mount_point fs_type source options")
+
+_ESCAPE_PATTERN = re.compile(r"\\([0-7]{3})")
+
+
+def _unescape(field):
+    """Deshacer los escapes octales de mountinfo (\\040 para espacios...)"""
+    return _ESCAPE_PATTERN.sub(lambda match: chr(int(match.group(1), 8)), field)
+
+
+def parse_mountinfo(text):
+    """Convertir el contenido de mountinfo en una lista de Mount"""
+    mounts = []
+    for line in text.splitlines():
+        fields = line.split()
+        # Los campos opcionales terminan en un "-" aislado
+        try:
+            separator = fields.index("-", 6)
+        except ValueError:
+            continue
+        if len(fields) < separator + 3:
+            continue
+        mounts.append(Mount(_unescape(fields[4]), fields[separator + 1],
+                            _unescape(fields[separator + 2]), fields[5]))
+    return mounts
+
+
+def read_mounts():
+    """Montajes visibles para este proceso"""
+    try:
+        with open(MOUNTINFO_PATH, encoding="utf-8", errors="replace") as f:
+            return parse_mountinfo(f.read())
+    except OSError:
+        return []
+
+
+def mount_point_of(path, mounts):
+    """Punto de montaje que contiene una ruta, sin acceder a la ruta"""
+    path = os.path.abspath(str(path))
+    best = "/"
+    for mount in mounts:
+        point = mount.mount_point
+        if len(point) > len(best) and (path == point or path.startswith(point.rstrip("/") + "/")):
+            best = point
+    return best
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Compresión gzip por bloques en varios hilos (al estilo de pigz)
+
+La entrada se corta en bloques que se comprimen en paralelo como flujos
+deflate independientes terminados en Z_SYNC_FLUSH (alineados a byte y sin
+marca de final). Concatenados en orden forman un único flujo deflate, así
+que el resultado es un .gz normal que cualquier gzip descomprime. Cada
+bloque usa los últimos 32 KiB del anterior como diccionario para no perder
+ratio de compresión en los cortes. zlib libera el GIL mientras comprime,
+por lo que los hilos aprovechan todos los núcleos.
+"""
+
+import os
+import struct
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Bytes sin comprimir por bloque
+BLOCK_SIZE = 1024 * 1024
+
+# Ventana de deflate: lo que un bloque puede referenciar del anterior
+DICTIONARY_SIZE = 32 * 1024
+
+
+def _compress_block(block, dictionary, level, last):
+    """Comprimir un bloque como deflate crudo usando el final del anterior"""
+    if dictionary:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS,
+                                      zlib.DEF_MEM_LEVEL, zlib.Z_DEFAULT_STRATEGY, dictionary)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(block) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+class ParallelGzipWriter:
+    """Objeto de archivo de solo escritura que produce gzip comprimiendo en paralelo
+    
+    Los bloques en vuelo están acotados (dos por hilo), así que la memoria
+    no depende del tamaño de la entrada. close() escribe el último bloque y
+    el pie (CRC32 y tamaño); abort() descarta el trabajo pendiente.
+    """
+    
+    def __init__(self, fileobj, level=6, workers=None, block_size=BLOCK_SIZE):
+        self.fileobj = fileobj
+        self.level = level
+        self.block_size = block_size
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                            thread_name_prefix="gzip-block")
+        self._pending = deque()
+        self._buffer = bytearray()
+        self._dictionary = b""
+        self._crc = 0
+        self._size = 0
+        self._closed = False
+        # Cabecera gzip: deflate, sin nombre, mtime actual, sistema Unix
+        self.fileobj.write(b"\x1f\x8b\x08\x00" + struct.pack("<L", int(time.time()))
+                           + b"\x00\x03")
+    
+    def write(self, data):
+        """Añadir datos; cada bloque completo se envía a comprimir"""
+        self._buffer += data
+        while len(self._buffer) >= self.block_size:
+            block = bytes(self._buffer[:self.block_size])
+            del self._buffer[:self.block_size]
+            self._submit(block, last=False)
+        return len(data)
+    
+    def flush(self):
+        """Los datos se escriben por bloques completos: no hay nada que forzar"""
+    
+    def _submit(self, block, last):
+        """Encolar la compresión de un bloque y escribir los ya terminados"""
+        self._crc = zlib.crc32(block, self._crc)
+        self._size += len(block)
+        self._pending.append(self._executor.submit(
+            _compress_block, block, self._dictionary, self.level, last))
+        self._dictionary = block[-DICTIONARY_SIZE:]
+        while len(self._pending) > 2 * self.workers:
+            self._write_next()
+    
+    def _write_next(self):
+        """Escribir el bloque más antiguo (el orden de salida es el de entrada)"""
+        self.fileobj.write(self._pending.popleft().result())
+    
+    def close(self):
+        """Comprimir lo que queda y escribir el pie del gzip"""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._submit(bytes(self._buffer), last=True)
+            self._buffer.clear()
+            while self._pending:
+                self._write_next()
+            self.fileobj.write(struct.pack("<LL", self._crc, self._size & 0xFFFFFFFF))
+        finally:
+            self._executor.shutdown(wait=True)
+    
+    def abort(self):
+        """Descartar los bloques pendientes sin terminar el archivo"""
+        self._closed = True
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=True)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
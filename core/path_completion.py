@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Completado de rutas para la barra de direcciones del explorador
+
+Los nombres de las subcarpetas salen del listado que directory_cache ya
+guarda de las carpetas visitadas o leídas por adelantado; solo si no está
+se recorre la carpeta con os.scandir, que distingue las carpetas por el
+tipo de cada entrada sin un stat por nombre. Todo ocurre en un hilo y
+pasa por FilesystemGuard: escribir la ruta de un montaje colgado no
+bloquea la barra.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from functools import partial
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .directory_cache import directory_cache, directory_key
+from .fs_guard import fs_guard
+
+
+# Entradas que se leen como mucho de una carpeta que no está en la caché
+MAX_SCAN_ENTRIES = 20000
+
+# Carpetas recorridas con scandir cuyos nombres se recuerdan
+MAX_REMEMBERED = 32
+
+
+def split_path_text(text):
+    """Separar lo escrito en (carpeta, principio del nombre)
+    
+    "~" se expande al home; con una barra final se completa dentro de la
+    propia carpeta. Devuelve (None, "") si el texto no es una ruta absoluta.
+    """
+    text = os.path.expanduser(text)
+    if not text.startswith(os.sep):
+        return None, ""
+    directory, partial_name = os.path.split(text)
+    return directory or os.sep, partial_name
+
+
+def matching_names(names, partial_name):
+    """Nombres que empiezan por lo escrito (los ocultos solo si se pide un punto)"""
+    if not partial_name.startswith("."):
+        return [name for name in names if name.startswith(partial_name) and not name.startswith(".")]
+    return [name for name in names if name.startswith(partial_name)]
+
+
+def read_directory_names(path, cancel_event=None, max_entries=None, progress=None):
+    """Nombres de las subcarpetas de una carpeta, ordenados
+    
+    Devuelve None si cancel_event se activa; con más de max_entries
+    entradas se devuelven las encontradas hasta ese punto.
+    """
+    names = []
+    with os.scandir(path) as scanner:
+        for index, entry in enumerate(scanner):
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            if max_entries is not None and index >= max_entries:
+                break
+            if progress is not None:
+                progress()
+            try:
+                # Sin enlaces de por medio is_dir() no hace stat
+                if entry.is_dir():
+                    names.append(entry.name)
+            except OSError:
+                continue
+    names.sort()
+    return tuple(names)
+
+
+class PathCompleter(QThread):
+    """Hilo que busca las subcarpetas de la carpeta que se está escribiendo
+    
+    Solo importa la última petición: las anteriores se descartan y una
+    lectura en curso se aborta. completions_ready entrega todos los
+    nombres de la carpeta; filtrar por lo escrito es cosa de la barra, así
+    teclear más letras no vuelve a pedir nada. Los listados de la caché
+    omiten los ocultos, así que para ellos se lee siempre la carpeta.
+    """
+    completions_ready = pyqtSignal(str, bool, object)  # carpeta, con ocultos, tupla de nombres
+    
+    def __init__(self, cache=None, guard=None, parent=None):
+        super().__init__(parent)
+        self.cache = cache or directory_cache
+        self.guard = guard or fs_guard
+        self._condition = threading.Condition()
+        self._pending = None
+        self._stopped = False
+        self._abort_event = threading.Event()
+        # Carpeta -> (clave de validez, nombres) de las leídas con scandir
+        self._remembered = OrderedDict()
+    
+    def request(self, path, hidden=False):
+        """Pedir las subcarpetas de una carpeta (con hidden, también las ocultas)"""
+        with self._condition:
+            self._pending = (str(path), hidden)
+            self._abort_event.set()
+            self._condition.notify()
+    
+    def cancel(self):
+        """Detener el hilo"""
+        with self._condition:
+            self._stopped = True
+            self._abort_event.set()
+            self._condition.notify()
+    
+    def _next_path(self):
+        """Esperar a la siguiente petición (None al detener el hilo)"""
+        with self._condition:
+            while not self._stopped and self._pending is None:
+                self._condition.wait()
+            if self._stopped:
+                return None
+            request, self._pending = self._pending, None
+            self._abort_event.clear()
+            return request
+    
+    def run(self):
+        while True:
+            request = self._next_path()
+            if request is None:
+                return
+            path, hidden = request
+            try:
+                names = self._directory_names(path, hidden)
+            except OSError:
+                # Carpeta inexistente, sin permiso o montaje colgado: nada que sugerir
+                names = ()
+            if names is not None and not self._abort_event.is_set():
+                self.completions_ready.emit(path, hidden, names)
+    
+    def _directory_names(self, path, hidden):
+        """Subcarpetas de path desde la caché de listados o con scandir"""
+        if not hidden:
+            listing = self.guard.call(self.cache.get, path, cancel_event=self._abort_event)
+            if listing is not None:
+                return tuple(sorted(entry.name for entry in listing.entries if entry.is_dir))
+        
+        stat_result = self.guard.call(os.stat, path, cancel_event=self._abort_event)
+        if stat_result is None:
+            return None
+        key = directory_key(stat_result)
+        remembered = self._remembered.get(path)
+        if remembered is not None and remembered[0] == key:
+            self._remembered.move_to_end(path)
+            return remembered[1]
+        
+        names = self.guard.call(
+            partial(read_directory_names, cancel_event=self._abort_event, max_entries=MAX_SCAN_ENTRIES),
+            path, cancel_event=self._abort_event, watch_progress=True)
+        if names is not None:
+            self._remembered[path] = (key, names)
+            self._remembered.move_to_end(path)
+            while len(self._remembered) > MAX_REMEMBERED:
+                self._remembered.popitem(last=False)
+        return names
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Lugares del explorador: carpetas del usuario y unidades montadas
+
+Los montajes salen de /proc/self/mountinfo, que el kernel marca con
+POLLPRI cada vez que cambia la tabla de montajes: el hilo de vigilancia
+espera ese aviso en poll() en lugar de releer el archivo a ciegas. El
+espacio libre (statvfs) se refresca cada cierto tiempo y pasa por
+FilesystemGuard, así que una unidad de red colgada aparece como "no
+responde" sin detener al resto ni a la interfaz.
+"""
+
+import os
+import re
+import select
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .fs_guard import fs_guard
+from .mounts import MOUNTINFO_PATH, parse_mountinfo
+
+
+# Segundos entre dos lecturas del espacio libre
+USAGE_REFRESH = 10.0
+
+# Cada cuánto se revisa la cancelación mientras se espera un aviso
+POLL_INTERVAL = 0.25
+
+# Lugar del panel: tipo (home, user, mount, removable, network), nombre,
+# ruta, icono y el montaje que lo respalda (None para carpetas del usuario)
+Place = namedtuple("Place", "kind label path icon mount")
+
+# Espacio de un lugar en bytes; responsive es False si la unidad no contestó
+PlaceUsage = namedtuple("PlaceUsage", "total free responsive")
+
+# Carpetas XDG por defecto (clave de user-dirs.dirs, carpeta, icono)
+XDG_USER_DIRS = (
+    ("XDG_DESKTOP_DIR", "Desktop", "🖥️"),
+    ("XDG_DOCUMENTS_DIR", "Documents", "📄"),
+    ("XDG_DOWNLOAD_DIR", "Downloads", "📥"),
+    ("XDG_MUSIC_DIR", "Music", "🎵"),
+    ("XDG_PICTURES_DIR", "Pictures", "🖼️"),
+    ("XDG_VIDEOS_DIR", "Videos", "🎬"),
+)
+
+NETWORK_FILESYSTEMS = {"nfs", "nfs4", "cifs", "smb3", "smbfs", "sshfs", "fuse.sshfs",
+                       "fuse.rclone", "9p", "afs", "ceph", "glusterfs", "davfs", "fuse.davfs"}
+
+# Montajes del sistema que no interesan como lugares
+HIDDEN_PREFIXES = ("/proc", "/sys", "/dev", "/run", "/snap", "/var/lib", "/boot", "/tmp")
+VISIBLE_UNDER_HIDDEN = ("/run/media/",)
+
+_USER_DIR_PATTERN = re.compile(r'^(XDG_[A-Z]+_DIR)="(.*)"\s*$')
+
+
+def read_user_dirs(home=None):
+    """Carpetas del usuario según $XDG_CONFIG_HOME/user-dirs.dirs
+    
+    Las que no aparecen en el archivo toman su nombre por defecto. No se
+    comprueba si existen; quien llama decide cómo tocar el disco.
+    """
+    home = str(home or Path.home())
+    config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.join(home, ".config")
+    configured = {}
+    try:
+        with open(os.path.join(config_home, "user-dirs.dirs"), encoding="utf-8") as f:
+            for line in f:
+                match = _USER_DIR_PATTERN.match(line)
+                if match:
+                    configured[match.group(1)] = match.group(2).replace("$HOME", home)
+    except OSError:
+        pass
+    
+    places = []
+    for key, default, icon in XDG_USER_DIRS:
+        path = configured.get(key, os.path.join(home, default))
+        # Una clave que apunta al propio home significa "desactivada"
+        if os.path.normpath(path) != os.path.normpath(home):
+            places.append(Place("user", os.path.basename(path.rstrip("/")), path, icon, None))
+    return places
+
+
+def _is_removable(source):
+    """Consultar en /sys si el dispositivo de un montaje es extraíble"""
+    if not source.startswith("/dev/"):
+        return False
+    name = os.path.basename(os.path.realpath(source))
+    block = f"/sys/class/block/{name}"
+    # Una partición hereda el atributo del disco que la contiene
+    for candidate in (block, os.path.join(block, "..")):
+        try:
+            with open(os.path.join(candidate, "removable")) as f:
+                if f.read().strip() == "1":
+                    return True
+        except OSError:
+            continue
+    return False
+
+
+def mount_places(mounts):
+    """Montajes que se muestran como lugares, sin acceder a ninguno
+    
+    Se listan los discos (origen en /dev), los sistemas de red y FUSE, y
+    se omiten los montajes internos del sistema y los repetidos.
+    """
+    places = []
+    seen = set()
+    for mount in mounts:
+        point = mount.mount_point
+        if point in seen:
+            continue
+        network = mount.fs_type in NETWORK_FILESYSTEMS
+        # La raíz se muestra siempre (en un contenedor suele ser overlay)
+        if point != "/" and not (network or mount.source.startswith("/dev/")
+                                 or mount.fs_type.startswith("fuse.")):
+            continue
+        if point != "/" and any(point == prefix or point.startswith(prefix + "/")
+                                for prefix in HIDDEN_PREFIXES) \
+                and not point.startswith(VISIBLE_UNDER_HIDDEN):
+            continue
+        seen.add(point)
+        
+        if point == "/":
+            places.append(Place("mount", "Sistema", point, "🖴", mount))
+        elif network:
+            places.append(Place("network", os.path.basename(point), point, "🌐", mount))
+        elif point.startswith(("/media/", "/run/media/")) or _is_removable(mount.source):
+            places.append(Place("removable", os.path.basename(point), point, "💽", mount))
+        else:
+            places.append(Place("mount", os.path.basename(point), point, "💾", mount))
+    return places
+
+
+class PlacesMonitor(QThread):
+    """Hilo que mantiene al día la lista de lugares y su espacio libre
+    
+    places_changed se emite al empezar y cada vez que cambia la tabla de
+    montajes; usage_changed, tras cada lectura del espacio libre. Las
+    carpetas del usuario que no existen no se muestran.
+    """
+    places_changed = pyqtSignal(object)  # lista de Place
+    usage_changed = pyqtSignal(object)  # {ruta: PlaceUsage}
+    
+    def __init__(self, guard=None, usage_refresh=USAGE_REFRESH, parent=None):
+        super().__init__(parent)
+        self.guard = guard or fs_guard
+        self.usage_refresh = usage_refresh
+        self._cancel_event = threading.Event()
+        self._refresh_event = threading.Event()
+        self._places = []
+    
+    def cancel(self):
+        """Terminar la vigilancia"""
+        self._cancel_event.set()
+    
+    def refresh(self):
+        """Pedir una lectura del espacio libre sin esperar al siguiente turno"""
+        self._refresh_event.set()
+    
+    def run(self):
+        try:
+            mountinfo = open(MOUNTINFO_PATH, "rb")
+        except OSError:
+            mountinfo = None
+        poller = select.poll()
+        if mountinfo is not None:
+            poller.register(mountinfo, select.POLLPRI | select.POLLERR)
+        
+        try:
+            mounts_text = None
+            next_usage = 0.0
+            while not self._cancel_event.is_set():
+                # Releer mountinfo también rearma el aviso de poll()
+                text = self._read_mountinfo(mountinfo)
+                if text != mounts_text:
+                    mounts_text = text
+                    self._update_places(text)
+                    next_usage = 0.0
+                
+                if time.monotonic() >= next_usage or self._refresh_event.is_set():
+                    self._refresh_event.clear()
+                    self._read_usage()
+                    next_usage = time.monotonic() + self.usage_refresh
+                
+                # Esperar un cambio de montajes, el siguiente turno o la cancelación
+                while not self._cancel_event.is_set() and not self._refresh_event.is_set():
+                    if mountinfo is not None and poller.poll(POLL_INTERVAL * 1000):
+                        break
+                    if mountinfo is None:
+                        self._cancel_event.wait(POLL_INTERVAL)
+                    if time.monotonic() >= next_usage:
+                        break
+        finally:
+            if mountinfo is not None:
+                mountinfo.close()
+    
+    def _read_mountinfo(self, mountinfo):
+        if mountinfo is None:
+            return ""
+        try:
+            mountinfo.seek(0)
+            return mountinfo.read().decode("utf-8", errors="replace")
+        except OSError:
+            return ""
+    
+    def _update_places(self, mountinfo_text):
+        """Recalcular la lista de lugares tras un cambio de montajes"""
+        home = str(Path.home())
+        places = [Place("home", "Carpeta personal", home, "🏠", None)]
+        # Las carpetas del usuario se leen con tiempo límite: el home
+        # también puede estar en red
+        try:
+            user_dirs = self.guard.call(read_user_dirs, home, cancel_event=self._cancel_event) or []
+        except OSError:
+            user_dirs = []
+        for place in user_dirs:
+            try:
+                if self.guard.call(os.path.isdir, place.path, cancel_event=self._cancel_event):
+                    places.append(place)
+            except OSError:
+                continue
+        places.extend(mount_places(parse_mountinfo(mountinfo_text)))
+        self._places = places
+        if not self._cancel_event.is_set():
+            self.places_changed.emit(places)
+    
+    def _read_usage(self):
+        """Leer el espacio de cada montaje (y del home) sin colgarse"""
+        usage = {}
+        for place in self._places:
+            if place.kind == "user" or self._cancel_event.is_set():
+                continue
+            # Volver a probar los montajes marcados como colgados: un corte
+            # breve de la red no deja la unidad "sin respuesta" para siempre.
+            # Mientras sigan atascados los hilos anteriores, el guardián la
+            # vuelve a marcar sin lanzar más llamadas
+            if self.guard.is_unresponsive(place.path):
+                self.guard.retry(place.path)
+            try:
+                result = self.guard.call(os.statvfs, place.path, cancel_event=self._cancel_event)
+            except OSError:
+                # Colgada (MountUnresponsive) o inaccesible: se muestra sin datos
+                usage[place.path] = PlaceUsage(0, 0, False)
+                continue
+            if result is None:
+                return
+            usage[place.path] = PlaceUsage(result.f_blocks * result.f_frsize,
+                                           result.f_bavail * result.f_frsize, True)
+        if not self._cancel_event.is_set():
+            self.usage_changed.emit(usage)
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Metadatos de los scripts del modo Easy leídos de su cabecera
+
+La cabecera es el bloque de comentarios del principio del script:
+
+    #!/bin/bash
+    # Actualiza la lista de paquetes del sistema
+    # sudo: sí
+    # timeout: 600
+    # param: PAQUETE Paquete que se instala
+
+La primera línea de comentario libre es la descripción (o la de una
+directiva "description:"/"descripción:"). Sin directiva sudo, el script
+requiere sudo si lo usa en algún sitio. Los metadatos se guardan en
+$XDG_CACHE_HOME/linux-gui/script-metadata.json con el mtime y el tamaño de
+cada script: mientras no cambien, listar la carpeta solo cuesta un stat
+por script.
+
+Además de la carpeta scripts/ de la aplicación se listan las de
+script_directories(): $XDG_DATA_HOME/linux-gui/scripts y las indicadas en
+LINUX_GUI_SCRIPT_DIRS (separadas por ":").
+"""
+
+import json
+import os
+import threading
+from collections import namedtuple
+from pathlib import Path
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+CACHE_VERSION = 1
+
+# Extensión de los scripts que se listan
+SCRIPT_SUFFIX = ".sh"
+
+# Bytes que se leen como mucho de un script para buscar sudo
+MAX_SCAN_BYTES = 1024 * 1024
+
+# Líneas de la cabecera que se miran como mucho
+HEADER_LINES = 40
+
+# Variable de entorno con carpetas de scripts adicionales
+SCRIPT_DIRS_ENV = "LINUX_GUI_SCRIPT_DIRS"
+
+# Metadatos de un script: ruta, nombre, tamaño, mtime (ns), descripción,
+# si requiere sudo, tiempo límite declarado (segundos o None) y parámetros
+# declarados como (nombre, ayuda)
+ScriptInfo = namedtuple("ScriptInfo", "path name size mtime_ns description requires_sudo "
+                                      "timeout params")
+
+_DESCRIPTION_KEYS = {"description", "descripción", "descripcion", "desc"}
+_TRUE_VALUES = {"1", "yes", "sí", "si", "true", "y", "s"}
+
+
+def cache_path():
+    """Archivo de la caché: $XDG_CACHE_HOME/linux-gui/script-metadata.json"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return os.path.join(cache_home, "linux-gui", "script-metadata.json")
+
+
+def user_scripts_dir():
+    """Carpeta de scripts del usuario: $XDG_DATA_HOME/linux-gui/scripts"""
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.join(Path.home(), ".local", "share")
+    return os.path.join(data_home, "linux-gui", "scripts")
+
+
+def script_directories(bundled_dir):
+    """Carpetas de scripts sin repetir: la de la aplicación, la del usuario y las configuradas"""
+    candidates = [bundled_dir, user_scripts_dir()]
+    candidates += [path for path in os.environ.get(SCRIPT_DIRS_ENV, "").split(os.pathsep) if path]
+    directories = []
+    seen = set()
+    for directory in candidates:
+        directory = os.path.abspath(os.path.expanduser(directory))
+        real = os.path.realpath(directory)
+        if real not in seen:
+            seen.add(real)
+            directories.append(directory)
+    return directories
+
+
+def parse_script_header(data):
+    """Descripción, sudo, tiempo límite y parámetros del contenido de un script
+    
+    Devuelve (descripción o None, requiere sudo, timeout o None, parámetros).
+    """
+    description = None
+    requires_sudo = None
+    timeout = None
+    params = []
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    for line in lines[:HEADER_LINES]:
+        line = line.strip()
+        if not line or line.startswith("#!"):
+            continue
+        if not line.startswith("#"):
+            # Fin de la cabecera: empieza el código
+            break
+        text = line.lstrip("#").strip()
+        key, separator, value = text.partition(":")
+        key = key.strip().lower()
+        value = value.strip()
+        if separator and key in _DESCRIPTION_KEYS:
+            description = value or description
+        elif separator and key == "sudo":
+            requires_sudo = value.lower() in _TRUE_VALUES
+        elif separator and key == "timeout":
+            try:
+                timeout = max(1, int(value.split()[0]))
+            except (ValueError, IndexError):
+                pass
+        elif separator and key in ("param", "parámetro", "parametro"):
+            name, _, help_text = value.partition(" ")
+            if name:
+                params.append((name, help_text.strip()))
+        elif description is None and len(text) > 1:
+            description = text
+    if requires_sudo is None:
+        requires_sudo = b"sudo " in data
+    return description, requires_sudo, timeout, tuple(params)
+
+
+def read_script_info(path, stat_result):
+    """Leer la cabecera de un script (un único read acotado)"""
+    with open(path, "rb") as f:
+        data = f.read(MAX_SCAN_BYTES)
+    description, requires_sudo, timeout, params = parse_script_header(data)
+    return ScriptInfo(path, os.path.basename(path), stat_result.st_size, stat_result.st_mtime_ns,
+                      description, requires_sudo, timeout, params)
+
+
+def list_scripts(directory):
+    """Scripts de una carpeta con su stat (scandir: sin isfile por entrada)"""
+    scripts = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.name.endswith(SCRIPT_SUFFIX):
+                continue
+            try:
+                if entry.is_file():
+                    scripts.append((entry.path, entry.stat()))
+            except OSError:
+                continue
+    return scripts
+
+
+class ScriptMetadataCache:
+    """Metadatos de scripts por ruta, válidos mientras no cambien mtime y tamaño
+    
+    La caché se carga de disco la primera vez que se usa y save() la
+    escribe solo si algo cambió.
+    """
+    
+    def __init__(self, path=None):
+        self.path = path or cache_path()
+        self._lock = threading.Lock()
+        self._entries = None
+        self._dirty = False
+    
+    def _load(self):
+        if self._entries is not None:
+            return
+        self._entries = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != CACHE_VERSION:
+            return
+        for path, value in data.get("scripts", {}).items():
+            try:
+                info = ScriptInfo(*value)
+            except TypeError:
+                continue
+            self._entries[path] = info._replace(params=tuple(tuple(param) for param in info.params))
+    
+    def get(self, path, stat_result=None):
+        """Metadatos de un script; se vuelve a leer solo si cambió en disco
+        
+        Lanza OSError si el script no existe o no se puede leer.
+        """
+        if stat_result is None:
+            stat_result = os.stat(path)
+        with self._lock:
+            self._load()
+            info = self._entries.get(path)
+        if (info is not None and info.mtime_ns == stat_result.st_mtime_ns
+                and info.size == stat_result.st_size):
+            return info
+        info = read_script_info(path, stat_result)
+        with self._lock:
+            self._entries[path] = info
+            self._dirty = True
+        return info
+    
+    def prune(self, directory, existing_paths):
+        """Olvidar los scripts de una carpeta que ya no existen"""
+        existing_paths = set(existing_paths)
+        with self._lock:
+            self._load()
+            for path in [path for path in self._entries
+                         if os.path.dirname(path) == directory and path not in existing_paths]:
+                del self._entries[path]
+                self._dirty = True
+    
+    def save(self):
+        """Escribir la caché si cambió desde la última vez"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"version": CACHE_VERSION,
+                    "scripts": {path: list(info) for path, info in self._entries.items()}}
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temporary = f"{self.path}.tmp"
+            with open(temporary, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temporary, self.path)
+        except OSError:
+            pass
+
+
+class ScriptScanner(QThread):
+    """Hilo que lista los scripts de unas carpetas con sus metadatos
+    
+    Solo se leen los scripts nuevos o modificados desde la última vez; el
+    resto sale de la caché. Cada carpeta se entrega por separado para que
+    la lista se actualice solo en lo que cambió.
+    """
+    scripts_ready = pyqtSignal(str, object)  # carpeta, lista de ScriptInfo ordenada por nombre
+    scan_failed = pyqtSignal(str, str)  # carpeta, mensaje de error
+    
+    def __init__(self, directories, cache=None, parent=None):
+        super().__init__(parent)
+        self.directories = [str(directory) for directory in directories]
+        self.cache = cache or script_metadata_cache
+    
+    def run(self):
+        for directory in self.directories:
+            try:
+                scripts = list_scripts(directory)
+            except OSError as e:
+                self.scan_failed.emit(directory, e.strerror or str(e))
+                continue
+            infos = []
+            for path, stat_result in scripts:
+                try:
+                    infos.append(self.cache.get(path, stat_result))
+                except OSError:
+                    continue
+            self.cache.prune(directory, [path for path, _ in scripts])
+            infos.sort(key=lambda info: info.name)
+            self.scripts_ready.emit(directory, infos)
+        self.cache.save()
+
+
+# Caché compartida por toda la aplicación
+script_metadata_cache = ScriptMetadataCache()
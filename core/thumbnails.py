@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+ThumbnailLoader - Miniaturas de imágenes con caché freedesktop (~/.cache/thumbnails)
+"""
+
+import hashlib
+import multiprocessing
+import os
+import struct
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+
+
+# Extensiones para las que se generan miniaturas
+THUMBNAIL_EXTENSIONS = frozenset({
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tif', '.tiff', '.ico'
+})
+
+# Tipos detectados por contenido para los que se generan miniaturas
+THUMBNAIL_MIME_TYPES = frozenset({
+    'image/jpeg', 'image/png', 'image/gif', 'image/bmp', 'image/webp',
+    'image/tiff', 'image/vnd.microsoft.icon'
+})
+
+# Tamaños definidos por la especificación freedesktop
+THUMBNAIL_SIZES = {"normal": 128, "large": 256}
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Nombre de la aplicación para la carpeta de fallos (fail/<aplicación>)
+FAIL_APP_NAME = "linux-gui"
+
+
+def thumbnails_root():
+    """Carpeta raíz de miniaturas según XDG_CACHE_HOME"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return os.path.join(cache_home, "thumbnails")
+
+
+def file_uri(path):
+    """URI canónica del archivo (file:///...) tal como la usa la especificación"""
+    return Path(os.path.abspath(path)).as_uri()
+
+
+def thumbnail_name(path):
+    """Nombre de la miniatura: MD5 de la URI del archivo + .png"""
+    return hashlib.md5(file_uri(path).encode("utf-8")).hexdigest() + ".png"
+
+
+def thumbnail_path(path, flavor="normal"):
+    """Ruta de la miniatura para un archivo en la caché"""
+    return os.path.join(thumbnails_root(), flavor, thumbnail_name(path))
+
+
+def fail_marker_path(path):
+    """Ruta del marcador de fallo para archivos que no se pudieron decodificar"""
+    return os.path.join(thumbnails_root(), "fail", FAIL_APP_NAME, thumbnail_name(path))
+
+
+def read_png_text(png_path):
+    """Leer los bloques tEXt de un PNG sin decodificar la imagen
+    
+    Los metadatos de las miniaturas van antes de los datos de imagen (IDAT),
+    así que basta con recorrer las cabeceras de los primeros bloques.
+    """
+    text = {}
+    with open(png_path, "rb") as png:
+        if png.read(8) != PNG_SIGNATURE:
+            return text
+        while True:
+            header = png.read(8)
+            if len(header) < 8:
+                break
+            length, chunk_type = struct.unpack(">I4s", header)
+            if chunk_type in (b"IDAT", b"IEND"):
+                break
+            if chunk_type == b"tEXt":
+                key, _, value = png.read(length).partition(b"\0")
+                text[key.decode("latin-1")] = value.decode("latin-1")
+                png.seek(4, os.SEEK_CUR)  # CRC
+            else:
+                png.seek(length + 4, os.SEEK_CUR)
+    return text
+
+
+def _is_valid_thumbnail(thumb_path, mtime):
+    """Comprobar que la miniatura existe y corresponde al mtime del original"""
+    try:
+        metadata = read_png_text(thumb_path)
+    except OSError:
+        return False
+    return metadata.get("Thumb::MTime") == str(int(mtime))
+
+
+def find_cached_thumbnail(path, mtime, flavor="normal"):
+    """Buscar una miniatura válida en la caché (None si hay que generarla)"""
+    thumb_path = thumbnail_path(path, flavor)
+    if _is_valid_thumbnail(thumb_path, mtime):
+        return thumb_path
+    return None
+
+
+def is_known_failure(path, mtime):
+    """Indica si el archivo ya falló antes con el mismo mtime"""
+    return _is_valid_thumbnail(fail_marker_path(path), mtime)
+
+
+def _write_png_atomically(image, target_path):
+    """Guardar un PNG de forma atómica con permisos 0600 (exigido por la especificación)"""
+    target_dir = os.path.dirname(target_path)
+    os.makedirs(target_dir, mode=0o700, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".thumb-", suffix=".png", dir=target_dir)
+    os.close(fd)
+    try:
+        if not image.save(tmp_path, "PNG"):
+            raise OSError(f"No se pudo escribir la miniatura: {target_path}")
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, target_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def generate_thumbnail(path, mtime, flavor="normal"):
+    """Generar la miniatura de un archivo (se ejecuta en un proceso del pool)
+    
+    Devuelve la ruta de la miniatura o None si el archivo no se pudo decodificar.
+    """
+    from PyQt6.QtGui import QImage, QImageReader
+    
+    thumb_path = thumbnail_path(path, flavor)
+    if _is_valid_thumbnail(thumb_path, mtime):
+        return thumb_path
+    
+    max_size = THUMBNAIL_SIZES[flavor]
+    reader = QImageReader(path)
+    reader.setDecideFormatFromContent(True)  # Imágenes con extensión incorrecta
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    if source_size.isValid() and (source_size.width() > max_size or source_size.height() > max_size):
+        # Decodificar ya reducido (JPEG puede escalar durante la decodificación)
+        reader.setScaledSize(source_size.scaled(max_size, max_size, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    
+    metadata = {
+        "Thumb::URI": file_uri(path),
+        "Thumb::MTime": str(int(mtime)),
+        "Software": FAIL_APP_NAME,
+    }
+    if image.isNull():
+        # Registrar el fallo para no volver a intentarlo mientras no cambie el archivo
+        marker = QImage(1, 1, QImage.Format.Format_ARGB32)
+        marker.fill(0)
+        for key, value in metadata.items():
+            marker.setText(key, value)
+        try:
+            _write_png_atomically(marker, fail_marker_path(path))
+        except OSError:
+            pass
+        return None
+    
+    if image.width() > max_size or image.height() > max_size:
+        image = image.scaled(max_size, max_size, Qt.AspectRatioMode.KeepAspectRatio,
+                             Qt.TransformationMode.SmoothTransformation)
+    try:
+        metadata["Thumb::Size"] = str(os.path.getsize(path))
+    except OSError:
+        pass
+    for key, value in metadata.items():
+        image.setText(key, value)
+    _write_png_atomically(image, thumb_path)
+    return thumb_path
+
+
+class ThumbnailLoader(QObject):
+    """Generador de miniaturas en un pool de procesos
+    
+    La decodificación ocurre en procesos separados para no competir por el GIL
+    con la interfaz. Las miniaturas válidas de la caché se devuelven sin pasar
+    por el pool.
+    """
+    thumbnail_ready = pyqtSignal(str, str)  # ruta original, ruta de la miniatura
+    
+    def __init__(self, max_workers=None, flavor="normal", parent=None):
+        super().__init__(parent)
+        self.flavor = flavor
+        self.max_workers = max_workers or max(1, min(4, (os.cpu_count() or 2) - 1))
+        self._executor = None
+        self._lock = threading.Lock()
+        self._pending = {}
+    
+    def _get_executor(self):
+        """Crear el pool bajo demanda (spawn: no se hereda el estado de Qt)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+    
+    def request(self, path, mtime):
+        """Pedir la miniatura de un archivo; devuelve la ruta si ya está en caché"""
+        # La especificación prohíbe generar miniaturas de las propias miniaturas
+        if os.path.abspath(path).startswith(thumbnails_root() + os.sep):
+            return None
+        cached = find_cached_thumbnail(path, mtime, self.flavor)
+        if cached or is_known_failure(path, mtime):
+            return cached
+        with self._lock:
+            if path in self._pending:
+                return None
+            future = self._get_executor().submit(generate_thumbnail, path, mtime, self.flavor)
+            self._pending[path] = future
+        future.add_done_callback(lambda f, p=path: self._on_done(p, f))
+        return None
+    
+    def retain_only(self, paths):
+        """Cancelar las peticiones que ya no son visibles"""
+        keep = set(paths)
+        with self._lock:
+            stale = [future for path, future in self._pending.items() if path not in keep]
+        # cancel() ejecuta el callback en este hilo, que vuelve a tomar el lock
+        for future in stale:
+            future.cancel()
+    
+    def cancel_all(self):
+        """Cancelar todas las peticiones pendientes"""
+        self.retain_only(())
+    
+    def _on_done(self, path, future):
+        """Callback del pool: emitir la señal hacia el hilo de la interfaz"""
+        with self._lock:
+            if self._pending.get(path) is future:
+                del self._pending[path]
+        if future.cancelled():
+            return
+        try:
+            thumb_path = future.result()
+        except Exception:
+            return
+        if thumb_path:
+            self.thumbnail_ready.emit(path, thumb_path)
+    
+    def shutdown(self):
+        """Cerrar el pool de procesos"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Papelera según la especificación de freedesktop.org
+
+Cada elemento enviado a la papelera se mueve a files/ y se describe con un
+archivo .trashinfo en info/ (ruta original y fecha), así que cualquier
+gestor de archivos del escritorio puede restaurarlo. Se usa una papelera
+del mismo sistema de archivos siempre que se puede: mover a ella es un
+rename instantáneo aunque el elemento sea un árbol enorme.
+"""
+
+import os
+import stat
+import threading
+import time
+from pathlib import Path
+from urllib.parse import quote
+
+from .mounts import read_mounts, mount_point_of
+
+
+# Carpetas de papelera ya resueltas por dispositivo
+_trash_dirs = {}
+_trash_lock = threading.Lock()
+
+
+def home_trash_dir():
+    """Papelera del usuario: $XDG_DATA_HOME/Trash"""
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.join(Path.home(), ".local", "share")
+    return os.path.join(data_home, "Trash")
+
+
+def _prepare_trash_dir(trash_dir):
+    """Crear files/ e info/ con permisos solo para el usuario"""
+    os.makedirs(os.path.join(trash_dir, "files"), mode=0o700, exist_ok=True)
+    os.makedirs(os.path.join(trash_dir, "info"), mode=0o700, exist_ok=True)
+
+
+def _topdir_trash_dir(topdir, device):
+    """Papelera en la raíz de otro montaje ($topdir/.Trash/$uid o $topdir/.Trash-$uid)"""
+    uid = str(os.getuid())
+    shared = os.path.join(topdir, ".Trash")
+    try:
+        st = os.lstat(shared)
+        # La especificación exige carpeta real (no enlace) con el bit sticky
+        if stat.S_ISDIR(st.st_mode) and st.st_mode & stat.S_ISVTX:
+            candidate = os.path.join(shared, uid)
+            _prepare_trash_dir(candidate)
+            if os.stat(candidate).st_dev == device:
+                return candidate
+    except OSError:
+        pass
+    candidate = os.path.join(topdir, f".Trash-{uid}")
+    try:
+        _prepare_trash_dir(candidate)
+        st = os.lstat(candidate)
+        if stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid() and st.st_dev == device:
+            return candidate
+    except OSError:
+        pass
+    return None
+
+
+def trash_dir_for(path):
+    """Papelera para una ruta y si moverla a ella cruza de dispositivo
+    
+    Devuelve (carpeta de papelera, topdir o None para la del usuario,
+    cross_device). Si el montaje no admite papelera propia se usa la del
+    usuario copiando y borrando el original.
+    """
+    device = os.lstat(path).st_dev
+    with _trash_lock:
+        cached = _trash_dirs.get(device)
+    if cached is not None:
+        return cached
+    
+    home_trash = home_trash_dir()
+    _prepare_trash_dir(home_trash)
+    if os.stat(home_trash).st_dev == device:
+        result = (home_trash, None, False)
+    else:
+        topdir = mount_point_of(path, read_mounts())
+        trash_dir = _topdir_trash_dir(topdir, device)
+        result = (trash_dir, topdir, False) if trash_dir else (home_trash, None, True)
+    with _trash_lock:
+        _trash_dirs[device] = result
+    return result
+
+
+def reserve_trash_entry(path):
+    """Reservar un nombre en la papelera y escribir su .trashinfo
+    
+    El nombre se reserva creando el .trashinfo con O_EXCL, así dos envíos
+    simultáneos nunca eligen el mismo. Devuelve (ruta en files/, ruta del
+    .trashinfo); mover el elemento queda a cargo de quien llama.
+    """
+    path = os.path.abspath(path)
+    trash_dir, topdir, _ = trash_dir_for(path)
+    name = os.path.basename(path.rstrip(os.sep))
+    stem, extension = os.path.splitext(name)
+    # Ruta relativa al montaje en su propia papelera, absoluta en la del usuario
+    original = os.path.relpath(path, topdir) if topdir else path
+    contents = ("[Trash Info]\n"
+                f"Path={quote(original)}\n"
+                f"DeletionDate={time.strftime('%Y-%m-%dT%H:%M:%S')}\n").encode("utf-8")
+    
+    counter = 1
+    while True:
+        candidate = name if counter == 1 else f"{stem}.{counter}{extension}"
+        counter += 1
+        info_path = os.path.join(trash_dir, "info", f"{candidate}.trashinfo")
+        target = os.path.join(trash_dir, "files", candidate)
+        try:
+            fd = os.open(info_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            continue
+        if os.path.lexists(target):
+            # Restos de otro gestor sin .trashinfo: no reutilizar el nombre
+            os.close(fd)
+            os.unlink(info_path)
+            continue
+        try:
+            os.write(fd, contents)
+        finally:
+            os.close(fd)
+        return target, info_path
+
+
+def discard_trash_info(info_path):
+    """Eliminar el .trashinfo de un elemento restaurado o que no llegó a moverse"""
+    try:
+        os.unlink(info_path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Recorrido paralelo de árboles de carpetas con os.scandir
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+
+class WalkCancelled(Exception):
+    """El recorrido se canceló antes de terminar"""
+
+
+def scan_directory(path, skip_hidden=False, device=None, skip_dirs=None, errors=None):
+    """Listar una carpeta: archivos regulares con su stat y subcarpetas
+    
+    Los enlaces simbólicos no se siguen. Si se indica device, las
+    subcarpetas de otros sistemas de archivos (puntos de montaje) se omiten;
+    las subcarpetas cuyo nombre está en skip_dirs no se recorren. Lo que no
+    se puede leer se omite y, si se pasa la lista errors, se anota en ella
+    como (ruta, OSError).
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if skip_hidden and entry.name.startswith('.'):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if skip_dirs and entry.name in skip_dirs:
+                            continue
+                        if device is None or entry.stat(follow_symlinks=False).st_dev == device:
+                            subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        files.append((entry.path, entry.stat(follow_symlinks=False)))
+                except OSError as e:
+                    if errors is not None:
+                        errors.append((entry.path, e))
+                    continue
+    except OSError as e:
+        if errors is not None:
+            errors.append((path, e))
+    return path, files, subdirs
+
+
+def walk_directories(root, cancel_event=None, max_workers=8, skip_hidden=False,
+                     one_file_system=False, skip_dirs=None, errors=None):
+    """Recorrer un árbol listando varias carpetas a la vez
+    
+    Genera (carpeta, [(ruta, stat), ...], [subcarpetas]) en el orden en que
+    terminan los listados, no en orden alfabético. Lanza WalkCancelled si
+    cancel_event se activa. Los errores de listado se anotan en errors
+    (ver scan_directory).
+    """
+    root = str(root)
+    device = os.stat(root).st_dev if one_file_system else None
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    pending = {pool.submit(scan_directory, root, skip_hidden, device, skip_dirs, errors)}
+    try:
+        while pending:
+            if cancel_event is not None and cancel_event.is_set():
+                raise WalkCancelled(root)
+            done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+            for future in done:
+                directory, files, subdirs = future.result()
+                for subdir in subdirs:
+                    pending.add(pool.submit(scan_directory, subdir, skip_hidden, device, skip_dirs,
+                                            errors))
+                yield directory, files, subdirs
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def walk_files(root, cancel_event=None, max_workers=8, skip_hidden=False,
+               one_file_system=False, skip_dirs=None):
+    """Recorrer un árbol en paralelo generando (ruta, stat) de cada archivo regular"""
+    for _, files, _ in walk_directories(root, cancel_event, max_workers,
+                                        skip_hidden, one_file_system, skip_dirs):
+        yield from files
@@ -13,6 +13,9 @@ from PyQt6.QtGui import QFont, QKeySequence, QShortcut
 from styles import ThemeManager, get_general_menu_styles, get_menu_styles
 from components import MenuWidget, TerminalWidget, EasyWidget, DependenciesWidget, FileExplorerWidget
 from components.easy_mode import ScriptsWidget, PlayWidget
+from components.duplicates import DuplicatesWidget
+from components.disk_usage import DiskUsageWidget
+from components.folder_sync import FolderSyncWidget
 
 
 class MainWindow(QMainWindow):
@@ -75,6 +78,9 @@ class MainWindow(QMainWindow):
         self.stacked_widget.addWidget(self.easy_files_page)
         self.stacked_widget.addWidget(self.easy_scripts_page)
         self.stacked_widget.addWidget(self.easy_play_page)
+        self.stacked_widget.addWidget(self.easy_duplicates_page)
+        self.stacked_widget.addWidget(self.easy_disk_usage_page)
+        self.stacked_widget.addWidget(self.easy_sync_page)
         self.stacked_widget.addWidget(self.dependencies_page)
         
         # Barra superior con tema
@@ -101,6 +107,9 @@ class MainWindow(QMainWindow):
         self.easy_files_page = FileExplorerWidget(self.theme_manager, self.current_theme, None, self)
         self.easy_scripts_page = ScriptsWidget(self.theme_manager, self.current_theme, self)
         self.easy_play_page = PlayWidget(self.theme_manager, self.current_theme, self)
+        self.easy_duplicates_page = DuplicatesWidget(self.theme_manager, self.current_theme, self)
+        self.easy_disk_usage_page = DiskUsageWidget(self.theme_manager, self.current_theme, self)
+        self.easy_sync_page = FolderSyncWidget(self.theme_manager, self.current_theme, self)
         
         # Página Dependencies
         self.dependencies_page = DependenciesWidget(self.theme_manager, self.current_theme, self)
@@ -162,6 +171,24 @@ class MainWindow(QMainWindow):
         self.back_button.setVisible(True)
         self.setWindowTitle("🐧 Linux GUI - Play")
     
+    def show_easy_duplicates(self):
+        """Mostrar la herramienta de duplicados del Easy Mode"""
+        self.stacked_widget.setCurrentWidget(self.easy_duplicates_page)
+        self.back_button.setVisible(True)
+        self.setWindowTitle("🐧 Linux GUI - Duplicates")
+    
+    def show_easy_disk_usage(self):
+        """Mostrar la herramienta de uso de disco del Easy Mode"""
+        self.stacked_widget.setCurrentWidget(self.easy_disk_usage_page)
+        self.back_button.setVisible(True)
+        self.setWindowTitle("🐧 Linux GUI - Disk usage")
+    
+    def show_easy_sync(self):
+        """Mostrar la herramienta de sincronización de carpetas del Easy Mode"""
+        self.stacked_widget.setCurrentWidget(self.easy_sync_page)
+        self.back_button.setVisible(True)
+        self.setWindowTitle("🐧 Linux GUI - Sync folders")
+    
     def show_menu(self):
         """Mostrar el menú principal (usado por el botón regresar en Easy Mode)"""
         self.go_back_to_menu()
@@ -197,7 +224,11 @@ class MainWindow(QMainWindow):
         if hasattr(self.easy_play_page, 'theme_manager'):
             self.easy_play_page.theme_manager = self.theme_manager
             self.easy_play_page.current_theme = theme_name
-            
+        
+        self.easy_duplicates_page.change_theme(theme_name)
+        self.easy_disk_usage_page.change_theme(theme_name)
+        self.easy_sync_page.change_theme(theme_name)
+        
         self.dependencies_page.change_theme(theme_name)
         
         # Aplicar tema general
@@ -223,5 +254,20 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'terminal_page'):
             self.terminal_page.closeEvent(event)
         
+        if hasattr(self, 'easy_files_page'):
+            self.easy_files_page.cleanup()
+        
+        if hasattr(self, 'easy_duplicates_page'):
+            self.easy_duplicates_page.cleanup()
+        
+        if hasattr(self, 'easy_disk_usage_page'):
+            self.easy_disk_usage_page.cleanup()
+        
+        if hasattr(self, 'easy_sync_page'):
+            self.easy_sync_page.cleanup()
+        
+        if hasattr(self, 'easy_scripts_page'):
+            self.easy_scripts_page.cleanup()
+        
         # Aceptar el evento de cierre
         event.accept()
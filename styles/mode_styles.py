@@ -308,7 +308,7 @@ def get_mode_styles(theme, mode_name="default"):
         }}
         
         QLabel#sectionTitle {{
-            color: {theme['fg']};
+            color: {theme['text']};
             background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
                                        stop:0 transparent,
                                        stop:0.5 {theme['accent']},
@@ -330,7 +330,7 @@ def get_mode_styles(theme, mode_name="default"):
         mode_specific = f"""
         /* Estilos específicos para Dependencies Mode */
         QLabel#depsTitle {{
-            color: {theme['fg']};
+            color: {theme['text']};
             font-size: 24px;
             font-weight: bold;
         }}
@@ -519,12 +519,30 @@ def get_file_explorer_styles(theme):
         padding: 8px;
     }}
     
-    QLabel#pathLabel {{
+    QLineEdit#pathEdit {{
         color: {theme['accent']};
         font-family: "JetBrains Mono", monospace;
         font-weight: bold;
         font-size: 12px;
         background-color: transparent;
+        border: 1px solid transparent;
+        border-radius: 6px;
+        padding: 2px 6px;
+    }}
+    
+    QLineEdit#pathEdit:focus {{
+        background-color: {theme['terminal_bg']};
+        border: 1px solid {theme['accent']};
+    }}
+    
+    QListView#pathCompletions {{
+        background-color: {theme['terminal_bg']};
+        color: {theme['text']};
+        border: 1px solid {theme['accent']};
+        font-family: "JetBrains Mono", monospace;
+        font-size: 12px;
+        selection-background-color: {theme['accent']};
+        selection-color: {theme['bg']};
     }}
     
     QFrame#filesContainer {{
@@ -536,6 +554,62 @@ def get_file_explorer_styles(theme):
         padding: 15px;
     }}
     
+    /* Vista previa de archivos */
+    QFrame#previewFrame {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                   stop:0 {theme['bg']},
+                                   stop:1 {theme['terminal_bg']});
+        border: 2px solid {theme['accent']};
+        border-radius: 15px;
+    }}
+    
+    QLabel#previewInfo {{
+        color: {theme['status_fg']};
+        background-color: transparent;
+    }}
+    
+    QPlainTextEdit#previewText {{
+        background-color: {theme['terminal_bg']};
+        color: {theme['text']};
+        border: 1px solid {theme['border_color']};
+        border-radius: 8px;
+        padding: 6px;
+    }}
+    
+    QSpinBox#previewLineSpin {{
+        background-color: {theme['terminal_bg']};
+        color: {theme['accent']};
+        border: 1px solid {theme['accent']};
+        border-radius: 6px;
+        padding: 2px 6px;
+        min-width: 80px;
+    }}
+    
+    /* Aviso de carpeta lenta o unidad que no responde */
+    QFrame#mountBanner {{
+        background-color: {theme['terminal_bg']};
+        border: 1px solid {theme['accent']};
+        border-radius: 8px;
+    }}
+    
+    QLabel#mountBannerLabel {{
+        color: {theme['status_fg']};
+        background-color: transparent;
+    }}
+    
+    QPushButton#retryButton {{
+        background-color: {theme['button_bg']};
+        color: {theme['button_fg']};
+        border: 1px solid {theme['accent']};
+        border-radius: 6px;
+        padding: 2px 10px;
+        font-weight: bold;
+    }}
+    
+    QPushButton#retryButton:hover {{
+        background-color: {theme['accent']};
+    }}
+    
     QFrame#actionsFrame {{
         background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
                                    stop:0 {theme['bg']},
@@ -574,6 +648,16 @@ def get_file_explorer_styles(theme):
         color: white;
     }}
     
+    /* Selector de orden */
+    QComboBox#sortCombo {{
+        background-color: {theme['terminal_bg']};
+        color: {theme['accent']};
+        border: 1px solid {theme['accent']};
+        border-radius: 8px;
+        padding: 4px 8px;
+        font-weight: bold;
+    }}
+    
     /* Botones de acción */
     QPushButton#explorerActionButton {{
         background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
@@ -640,7 +724,7 @@ def get_file_explorer_styles(theme):
     # Lista de archivos
     file_list_styles = f"""
     /* Lista de archivos */
-    QListWidget#fileList {{
+    QListView#fileList {{
         background-color: {theme['terminal_bg']};
         border: 2px solid {theme['accent']};
         border-radius: 10px;
@@ -648,7 +732,7 @@ def get_file_explorer_styles(theme):
         outline: none;
     }}
     
-    QListWidget#fileList::item {{
+    QListView#fileList::item {{
         height: 45px;
         padding: 10px 15px;
         margin: 8px 2px;
@@ -660,8 +744,17 @@ def get_file_explorer_styles(theme):
         font-weight: bold;
     }}
     
+    /* Vista de cuadrícula con miniaturas */
+    QListView#fileList[viewMode="grid"]::item {{
+        height: 160px;
+        width: 140px;
+        padding: 4px;
+        margin: 4px;
+        font-size: 12px;
+    }}
+    
     /* Estilos específicos para carpetas */
-    QListWidget#fileList::item[type="folder"] {{
+    QListView#fileList::item[type="folder"] {{
         background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
                                   stop:0 {theme['bg']},
                                   stop:1 {theme['button_grad_1']});
@@ -670,26 +763,26 @@ def get_file_explorer_styles(theme):
         font-weight: bold;
     }}
     
-    QListWidget#fileList::item[type="folder"]:hover {{
+    QListView#fileList::item[type="folder"]:hover {{
         background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
                                   stop:0 {theme['selection_bg']},
                                   stop:1 {theme['button_grad_2']});
         border-color: {theme['fg']};
     }}
     
-    QListWidget#fileList::item[type="folder"]:selected {{
+    QListView#fileList::item[type="folder"]:selected {{
         background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
                                   stop:0 {theme['accent']},
                                   stop:1 {theme['fg']});
         color: white;
     }}
     
-    QListWidget#fileList::item:hover {{
+    QListView#fileList::item:hover {{
         background-color: {theme['selection_bg']};
         border-color: {theme['accent']};
     }}
     
-    QListWidget#fileList::item:selected {{
+    QListView#fileList::item:selected {{
         background-color: {theme['accent']};
         border-color: {theme['fg']};
         color: white;
@@ -743,4 +836,380 @@ def get_file_explorer_styles(theme):
     """
     
     # Combinar todos los estilos
-    return basic_styles + frame_styles + button_styles + file_list_styles + info_styles
\ No newline at end of file
+    return (basic_styles + frame_styles + button_styles + file_list_styles + info_styles
+            + get_operations_panel_styles(theme) + get_places_sidebar_styles(theme)
+            + get_content_search_styles(theme))
+
+
+def get_operations_panel_styles(theme):
+    """Estilos del panel de progreso de operaciones en segundo plano"""
+    return f"""
+    /* Panel de operaciones en segundo plano */
+    QFrame#operationsFrame {{
+        background-color: {theme['terminal_bg']};
+        border: 1px solid {theme['accent']};
+        border-radius: 10px;
+    }}
+    
+    QLabel#operationTitle {{
+        color: {theme['accent']};
+        background-color: transparent;
+    }}
+    
+    QLabel#operationStats {{
+        color: {theme['status_fg']};
+        background-color: transparent;
+    }}
+    
+    QProgressBar#operationProgress {{
+        background-color: {theme['bg']};
+        border: 1px solid {theme['border_color']};
+        border-radius: 5px;
+    }}
+    
+    QProgressBar#operationProgress::chunk {{
+        background-color: {theme['accent']};
+        border-radius: 5px;
+    }}
+    """
+
+
+def get_open_with_styles(theme):
+    """Estilos del diálogo Abrir con…"""
+    return f"""
+    QDialog#openWithDialog {{
+        background-color: {theme['bg']};
+        color: {theme['text']};
+    }}
+    
+    QLabel#openWithTitle {{
+        color: {theme['accent']};
+        background-color: transparent;
+        font-weight: bold;
+    }}
+    
+    QListWidget#openWithList {{
+        background-color: {theme['terminal_bg']};
+        color: {theme['text']};
+        border: 1px solid {theme['border_color']};
+        border-radius: 5px;
+        outline: none;
+    }}
+    
+    QListWidget#openWithList::item {{
+        padding: 4px;
+    }}
+    
+    QListWidget#openWithList::item:disabled {{
+        color: {theme['accent']};
+        font-weight: bold;
+    }}
+    
+    QListWidget#openWithList::item:selected {{
+        background-color: {theme['accent']};
+        color: white;
+    }}
+    
+    QPushButton#actionButton, QPushButton#primaryButton {{
+        padding: 8px 16px;
+        border-radius: 5px;
+        font-weight: bold;
+    }}
+    
+    QPushButton#actionButton {{
+        background-color: {theme['button_bg']};
+        color: {theme['button_fg']};
+        border: 1px solid {theme['border_color']};
+    }}
+    
+    QPushButton#primaryButton {{
+        background-color: {theme['accent']};
+        color: {theme['button_fg']};
+    }}
+    
+    QPushButton#primaryButton:disabled {{
+        background-color: #555555;
+        color: #aaaaaa;
+    }}
+    """
+
+
+def get_places_sidebar_styles(theme):
+    """Estilos del panel de lugares del explorador"""
+    return f"""
+    /* Panel de lugares */
+    QFrame#placesFrame {{
+        background-color: {theme['terminal_bg']};
+        border: 1px solid {theme['accent']};
+        border-radius: 10px;
+    }}
+    
+    QLabel#placesTitle {{
+        color: white;
+        background: {theme['accent']};
+        padding: 6px;
+        border-radius: 8px;
+    }}
+    
+    QListWidget#placesList {{
+        background: transparent;
+        border: none;
+        outline: none;
+        color: {theme['text']};
+        font-size: 12px;
+    }}
+    
+    QListWidget#placesList::item {{
+        padding: 4px 6px;
+        border-radius: 6px;
+    }}
+    
+    QListWidget#placesList::item:disabled {{
+        color: {theme['accent']};
+        font-weight: bold;
+        padding-top: 8px;
+    }}
+    
+    QListWidget#placesList::item:hover {{
+        background-color: {theme['selection_bg']};
+    }}
+    
+    QListWidget#placesList::item:selected {{
+        background-color: {theme['accent']};
+        color: white;
+    }}
+    """
+
+
+def get_content_search_styles(theme):
+    """Estilos del panel de búsqueda en el contenido de los archivos"""
+    return f"""
+    /* Búsqueda en el contenido */
+    QFrame#contentSearchFrame {{
+        background-color: {theme['terminal_bg']};
+        border: 1px solid {theme['accent']};
+        border-radius: 10px;
+    }}
+    
+    QLineEdit#contentSearchEdit {{
+        background-color: {theme['bg']};
+        color: {theme['text']};
+        border: 1px solid {theme['border_color']};
+        border-radius: 6px;
+        padding: 4px 8px;
+    }}
+    
+    QLineEdit#contentSearchEdit:focus {{
+        border: 1px solid {theme['accent']};
+    }}
+    
+    QLabel#contentSearchStatus {{
+        color: {theme['status_fg']};
+        background: transparent;
+    }}
+    
+    QTreeWidget#contentSearchResults {{
+        background: transparent;
+        border: none;
+        outline: none;
+        color: {theme['text']};
+    }}
+    
+    QTreeWidget#contentSearchResults::item {{
+        padding: 2px 4px;
+    }}
+    
+    QTreeWidget#contentSearchResults::item:hover {{
+        background-color: {theme['selection_bg']};
+    }}
+    
+    QTreeWidget#contentSearchResults::item:selected {{
+        background-color: {theme['accent']};
+        color: white;
+    }}
+    """
+
+
+def get_tool_page_styles(theme):
+    """Estilos comunes de las herramientas del modo Easy (duplicados, uso de disco...)"""
+    tool_styles = f"""
+    QWidget#modeWidget {{
+        background-color: {theme['bg']};
+        color: {theme['text']};
+    }}
+    
+    QFrame#titleFrame, QFrame#toolPanel {{
+        background-color: {theme['terminal_bg']};
+        color: {theme['text']};
+        border-radius: 10px;
+        border: 1px solid {theme['border_color']};
+    }}
+    
+    QLabel#easyTitle, QLabel#sectionTitle {{
+        color: {theme['accent']};
+        background-color: transparent;
+    }}
+    
+    QLabel#subtitle, QLabel#toolStatus {{
+        color: {theme['status_fg']};
+        background-color: transparent;
+    }}
+    
+    QLabel#toolPath {{
+        color: {theme['accent']};
+        font-family: "JetBrains Mono", monospace;
+        font-weight: bold;
+        background-color: transparent;
+    }}
+    
+    QCheckBox#toolOption {{
+        color: {theme['text']};
+        background-color: transparent;
+    }}
+    
+    QTreeWidget#toolTree {{
+        background-color: {theme['terminal_bg']};
+        color: {theme['text']};
+        border-radius: 5px;
+        padding: 6px;
+        border: 1px solid {theme['border_color']};
+    }}
+    
+    QTreeWidget#toolTree::item {{
+        padding: 4px;
+    }}
+    
+    QTreeWidget#toolTree::item:selected {{
+        background-color: {theme['selection_bg']};
+        color: {theme['text']};
+    }}
+    
+    QProgressBar#toolProgress {{
+        background-color: {theme['bg']};
+        border: 1px solid {theme['border_color']};
+        border-radius: 5px;
+    }}
+    
+    QProgressBar#toolProgress::chunk {{
+        background-color: {theme['accent']};
+        border-radius: 5px;
+    }}
+    
+    QPushButton#actionButton, QPushButton#primaryButton {{
+        padding: 10px;
+        border-radius: 5px;
+        font-weight: bold;
+    }}
+    
+    QPushButton#actionButton {{
+        background-color: {theme['button_bg']};
+        color: {theme['button_fg']};
+        border: 1px solid {theme['border_color']};
+    }}
+    
+    QPushButton#actionButton:hover {{
+        background-color: {theme['button_grad_2']};
+    }}
+    
+    QPushButton#primaryButton {{
+        background-color: {theme['accent']};
+        color: {theme['button_fg']};
+    }}
+    
+    QPushButton#primaryButton:hover {{
+        background-color: {theme['button_grad_1']};
+    }}
+    
+    QPushButton#actionButton:disabled, QPushButton#primaryButton:disabled {{
+        background-color: #555555;
+        color: #aaaaaa;
+    }}
+    """
+    return tool_styles + get_operations_panel_styles(theme)
+
+def get_bulk_rename_styles(theme):
+    """Estilos del diálogo de renombrado masivo"""
+    return f"""
+    QDialog#bulkRenameDialog {{
+        background-color: {theme['bg']};
+        color: {theme['text']};
+    }}
+    
+    QDialog#bulkRenameDialog QLabel {{
+        color: {theme['text']};
+        background-color: transparent;
+    }}
+    
+    QLabel#renameStatus {{
+        color: {theme['status_fg']};
+    }}
+    
+    QSpinBox {{
+        background-color: {theme['terminal_bg']};
+        color: {theme['text']};
+        border: 1px solid {theme['border_color']};
+        border-radius: 4px;
+        padding: 4px;
+    }}
+    
+    QTableView#renamePreview {{
+        background-color: {theme['terminal_bg']};
+        color: {theme['text']};
+        border: 1px solid {theme['border_color']};
+        border-radius: 5px;
+        gridline-color: {theme['border_color']};
+        font-family: "JetBrains Mono", monospace;
+    }}
+    
+    QTableView#renamePreview QHeaderView::section {{
+        background-color: {theme['button_bg']};
+        color: {theme['button_fg']};
+        border: none;
+        padding: 4px;
+        font-weight: bold;
+    }}
+    
+    QPushButton#actionButton, QPushButton#primaryButton {{
+        padding: 8px 16px;
+        border-radius: 5px;
+        font-weight: bold;
+    }}
+    
+    QPushButton#actionButton {{
+        background-color: {theme['button_bg']};
+        color: {theme['button_fg']};
+        border: 1px solid {theme['border_color']};
+    }}
+    
+    QPushButton#primaryButton {{
+        background-color: {theme['accent']};
+        color: {theme['button_fg']};
+    }}
+    
+    QPushButton#primaryButton:disabled {{
+        background-color: #555555;
+        color: #aaaaaa;
+    }}
+    """
+
+def get_checksum_styles(theme):
+    """Estilos del diálogo de sumas de comprobación"""
+    return f"""
+    QDialog#checksumDialog {{
+        background-color: {theme['bg']};
+        color: {theme['text']};
+    }}
+    
+    QDialog#checksumDialog QComboBox {{
+        background-color: {theme['terminal_bg']};
+        color: {theme['text']};
+        border: 1px solid {theme['border_color']};
+        border-radius: 5px;
+        padding: 6px 10px;
+    }}
+    
+    QDialog#checksumDialog QTreeWidget#toolTree {{
+        selection-background-color: {theme['accent']};
+        selection-color: {theme['bg']};
+    }}
+    """